@@ -72,6 +72,7 @@ from roscoe.agents.paralegal.tools import (
     list_sent_mail,  # List sent mail history
     # Knowledge graph tools (Direct Cypher)
     write_entity,  # Create entities and relationships using direct Cypher
+    write_entities,  # Create many entities and relationships in one atomic write
     query_case_graph,  # Search episodes/notes with natural language (semantic search)
     get_case_structure,  # Get structured case data (parties, insurance, providers, status)
     graph_query,  # Direct Cypher queries for structural lookups
@@ -203,6 +204,7 @@ personal_assistant_agent = create_deep_agent(
         load_skill,  # Load a specific skill by name
         # Knowledge graph tools (Direct Cypher)
         write_entity,  # Create entities and relationships (universal write tool)
+        write_entities,  # Bulk entity entry (intake forms) in one atomic write
         query_case_graph,  # Search episodes/notes with natural language (semantic search)
         get_case_structure,  # Get structured case data (parties, insurance, providers, status)
         graph_query,  # Direct Cypher queries (cases_by_provider, provider_stats, custom_cypher)
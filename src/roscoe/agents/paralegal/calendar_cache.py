@@ -0,0 +1,429 @@
+"""
+Calendar Sync Cache and Local Free/Busy Engine
+
+Keeps a local copy of each calendar, synced with Google's incremental
+`syncToken` model, so scheduling questions are answered without listing the
+whole window on every tool call:
+
+- First sync: full `events().list` (singleEvents, showDeleted), paged, ending
+  in a nextSyncToken. It starts SYNC_LOOKBACK_DAYS in the past (timeMin)
+  rather than pulling the calendar's whole history; later incremental
+  syncs with that token still report every change
+- Later syncs: only events changed since the token; deleted/cancelled events
+  are dropped. An expired token (HTTP 410) triggers a full resync
+- Syncs are skipped for SYNC_TTL_SECONDS after the last one, so the repeated
+  list/get/free-time calls of one scheduling conversation hit memory
+- Writes made through the calendar tools are applied to the cache directly
+
+Each calendar's events and token are persisted as JSON under
+CALENDAR_CACHE_DIR, so a restart resumes incrementally.
+
+Sources:
+- GoogleCalendarSource: the Calendar API
+- FileCalendarSource: local JSON stand-in with the same sync semantics
+  (used in tests and for offline development)
+
+Free/busy runs over an IntervalTree of busy periods built from the cache.
+Several calendars are intersected by merging their busy periods, and many
+candidate slots can be checked against one tree.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LOCAL_WORKSPACE = Path(os.environ.get("LOCAL_WORKSPACE", "/home/aaronwhaley/workspace_local"))
+CALENDAR_CACHE_DIR = Path(os.environ.get(
+    "CALENDAR_CACHE_DIR", str(LOCAL_WORKSPACE / ".sync_metadata" / "calendar_cache")
+))
+SYNC_TTL_SECONDS = float(os.environ.get("CALENDAR_SYNC_TTL", "60"))
+SYNC_LOOKBACK_DAYS = int(os.environ.get("CALENDAR_SYNC_LOOKBACK_DAYS", "90"))
+
+
+class SyncTokenExpired(Exception):
+    """The source no longer accepts the stored sync token (full resync needed)."""
+
+
+# =============================================================================
+# Sources
+# =============================================================================
+
+class GoogleCalendarSource:
+    """Google Calendar API events().list with syncToken support."""
+
+    def fetch(self, calendar_id: str, sync_token: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+        """
+        Return (changed events, next sync token).
+
+        Without a token this is a full sync of events ending after
+        SYNC_LOOKBACK_DAYS ago (older events are read from the API directly).
+        """
+        from googleapiclient.errors import HttpError
+        from roscoe.core.google_auth import get_calendar_service
+
+        service = get_calendar_service()
+        if not service:
+            raise RuntimeError("Google Calendar not configured")
+
+        # timeMin can't be combined with syncToken; the token from a bounded
+        # full sync stays valid for incremental syncs
+        time_min = (datetime.now(timezone.utc) - timedelta(days=SYNC_LOOKBACK_DAYS)).isoformat()
+        items: List[dict] = []
+        page_token = None
+        while True:
+            params = {
+                "calendarId": calendar_id,
+                "singleEvents": True,
+                "showDeleted": True,
+                "maxResults": 2500,
+            }
+            if sync_token:
+                params["syncToken"] = sync_token
+            else:
+                params["timeMin"] = time_min
+            if page_token:
+                params["pageToken"] = page_token
+            try:
+                result = service.events().list(**params).execute()
+            except HttpError as e:
+                if getattr(e, "resp", None) is not None and e.resp.status == 410:
+                    raise SyncTokenExpired(str(e))
+                raise
+            items.extend(result.get("items", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return items, result.get("nextSyncToken")
+
+
+class FileCalendarSource:
+    """
+    Local stand-in for the Calendar API.
+
+    The file is {"calendars": {calendar_id: [event, ...]}} where each event
+    has an integer "version". The sync token is the highest version returned,
+    and an incremental fetch returns events with a higher version. Deletions
+    are events with status "cancelled", as in the real API.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _events(self, calendar_id: str) -> List[dict]:
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return []
+        return data.get("calendars", {}).get(calendar_id, [])
+
+    def fetch(self, calendar_id: str, sync_token: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+        events = self._events(calendar_id)
+        latest = max((e.get("version", 0) for e in events), default=0)
+        if sync_token is None:
+            return [e for e in events if e.get("status") != "cancelled"], str(latest)
+        if int(sync_token) > latest:
+            raise SyncTokenExpired(f"Unknown sync token {sync_token}")
+        return [e for e in events if e.get("version", 0) > int(sync_token)], str(latest)
+
+    def upsert(self, calendar_id: str, event: dict):
+        """Write an event (bumping its version), as the API would on insert/update."""
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            data = {}
+        events = data.setdefault("calendars", {}).setdefault(calendar_id, [])
+        event = {**event, "version": max((e.get("version", 0) for e in events), default=0) + 1}
+        events[:] = [e for e in events if e.get("id") != event.get("id")] + [event]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data))
+
+
+# =============================================================================
+# Event times
+# =============================================================================
+
+def _parse_event_time(value: dict, tz: tzinfo) -> Optional[datetime]:
+    if "dateTime" in value:
+        return datetime.fromisoformat(value["dateTime"].replace("Z", "+00:00")).astimezone(tz)
+    if "date" in value:
+        d = date.fromisoformat(value["date"])
+        return datetime(d.year, d.month, d.day, tzinfo=tz)
+    return None
+
+
+def event_bounds(event: dict, tz: tzinfo) -> Optional[Tuple[datetime, datetime]]:
+    """(start, end) of an event in tz (all-day events span whole days)."""
+    start = _parse_event_time(event.get("start", {}), tz)
+    end = _parse_event_time(event.get("end", {}), tz)
+    if start is None or end is None:
+        return None
+    return start, end
+
+
+def is_timed(event: dict) -> bool:
+    return "dateTime" in event.get("start", {})
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+class CalendarCache:
+    """
+    Per-calendar event cache kept current with incremental sync.
+
+    Args:
+        source: Object with fetch(calendar_id, sync_token) -> (events, token)
+        cache_dir: Directory for the persisted per-calendar JSON files
+        ttl: Seconds after a sync during which reads don't sync again
+    """
+
+    def __init__(self, source, cache_dir: Path = CALENDAR_CACHE_DIR, ttl: float = SYNC_TTL_SECONDS):
+        self.source = source
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self._calendars: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+
+    def _path(self, calendar_id: str) -> Path:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in calendar_id)
+        return self.cache_dir / f"{safe}.json"
+
+    def _load(self, calendar_id: str) -> dict:
+        state = self._calendars.get(calendar_id)
+        if state is None:
+            try:
+                state = json.loads(self._path(calendar_id).read_text())
+            except (OSError, json.JSONDecodeError):
+                state = {"sync_token": None, "events": {}}
+            state["synced_at"] = 0.0  # Always check the source once per process
+            self._calendars[calendar_id] = state
+        return state
+
+    def _save(self, calendar_id: str, state: dict):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(calendar_id)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"sync_token": state["sync_token"], "events": state["events"]}))
+        os.replace(tmp, path)
+
+    def sync(self, calendar_id: str = "primary", force: bool = False) -> dict:
+        """Bring a calendar up to date (no-op within the TTL unless forced)."""
+        with self._lock:
+            state = self._load(calendar_id)
+            if not force and time.monotonic() - state["synced_at"] < self.ttl:
+                return state
+
+            try:
+                changes, token = self.source.fetch(calendar_id, state["sync_token"])
+                full = state["sync_token"] is None
+            except SyncTokenExpired:
+                logger.info(f"[CALENDAR] Sync token expired for {calendar_id} - full resync")
+                changes, token = self.source.fetch(calendar_id, None)
+                full = True
+
+            events = {} if full else state["events"]
+            for event in changes:
+                if event.get("status") == "cancelled":
+                    events.pop(event.get("id"), None)
+                else:
+                    events[event["id"]] = event
+
+            state.update(events=events, sync_token=token, synced_at=time.monotonic())
+            if changes or full:
+                self._save(calendar_id, state)
+            return state
+
+    def events(
+        self,
+        calendar_id: str,
+        start: datetime,
+        end: datetime,
+        query: Optional[str] = None,
+    ) -> List[dict]:
+        """Events overlapping [start, end), ordered by start time."""
+        state = self.sync(calendar_id)
+        tz = start.tzinfo
+        needle = query.lower() if query else None
+        matched = []
+        for event in list(state["events"].values()):
+            bounds = event_bounds(event, tz)
+            if bounds is None or bounds[1] <= start or bounds[0] >= end:
+                continue
+            if needle and needle not in _search_text(event):
+                continue
+            matched.append((bounds[0], event))
+        matched.sort(key=lambda item: item[0])
+        return [event for _, event in matched]
+
+    def get(self, calendar_id: str, event_id: str) -> Optional[dict]:
+        return self.sync(calendar_id)["events"].get(event_id)
+
+    def apply(self, calendar_id: str, event: dict):
+        """Record an event returned by an insert/update call."""
+        with self._lock:
+            state = self._load(calendar_id)
+            state["events"][event["id"]] = event
+            self._save(calendar_id, state)
+
+    def remove(self, calendar_id: str, event_id: str):
+        """Drop an event deleted through the API."""
+        with self._lock:
+            state = self._load(calendar_id)
+            if state["events"].pop(event_id, None) is not None:
+                self._save(calendar_id, state)
+
+    def busy_tree(self, calendar_ids: Sequence[str], start: datetime, end: datetime) -> "IntervalTree":
+        """Busy periods (timed events) of all calendars in [start, end), as one tree."""
+        intervals = []
+        for calendar_id in calendar_ids:
+            for event in self.events(calendar_id, start, end):
+                if is_timed(event):
+                    intervals.append(event_bounds(event, start.tzinfo))
+        return IntervalTree(merge_intervals(intervals))
+
+
+def _search_text(event: dict) -> str:
+    parts = [event.get("summary", ""), event.get("description", ""), event.get("location", "")]
+    parts += [a.get("email", "") for a in event.get("attendees", [])]
+    return " ".join(parts).lower()
+
+
+# =============================================================================
+# Interval tree / free-busy
+# =============================================================================
+
+def merge_intervals(intervals: Iterable[Tuple]) -> List[Tuple]:
+    """Sort and merge overlapping/touching intervals (union of busy time)."""
+    merged: List[list] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(i) for i in merged]
+
+
+class IntervalTree:
+    """
+    Static interval tree: intervals sorted by start, laid out as an implicit
+    balanced BST where each node also stores the maximum end in its subtree.
+    Overlap queries prune any subtree whose max end is before the query start.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple]):
+        self._intervals = sorted(intervals)
+        self._max_end: List = [None] * len(self._intervals)
+        self._build(0, len(self._intervals))
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __iter__(self):
+        return iter(self._intervals)
+
+    def _build(self, lo: int, hi: int):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        best = self._intervals[mid][1]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > best:
+                best = child
+        self._max_end[mid] = best
+        return best
+
+    def overlapping(self, start, end) -> List[Tuple]:
+        """All intervals overlapping [start, end)."""
+        found: List[Tuple] = []
+        self._query(0, len(self._intervals), start, end, found)
+        return found
+
+    def _query(self, lo: int, hi: int, start, end, found: List[Tuple]):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        if self._max_end[mid] <= start:
+            return
+        self._query(lo, mid, start, end, found)
+        s, e = self._intervals[mid]
+        if s >= end:
+            return  # This node and everything to its right start too late
+        if e > start:
+            found.append((s, e))
+        self._query(mid + 1, hi, start, end, found)
+
+    def is_free(self, start, end) -> bool:
+        return not self.overlapping(start, end)
+
+    def check_slots(self, slots: Iterable[Tuple]) -> List[Tuple[Tuple, bool]]:
+        """(slot, is_free) for many candidate slots against the same tree."""
+        return [(slot, self.is_free(*slot)) for slot in slots]
+
+
+def find_free_slots(
+    busy: IntervalTree,
+    now: datetime,
+    days_ahead: int,
+    duration: timedelta,
+    start_hour: int,
+    end_hour: int,
+    limit: int = 10,
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Free slots of `duration` within weekday business hours.
+
+    Walks each day from the start of business hours; a slot that overlaps a
+    busy period jumps to the end of that period.
+    """
+    tz = now.tzinfo
+    free_slots: List[Tuple[datetime, datetime]] = []
+
+    for day_offset in range(days_ahead):
+        check_date = now.date() + timedelta(days=day_offset)
+
+        # Skip weekends
+        if check_date.weekday() >= 5:
+            continue
+
+        day_start = datetime(check_date.year, check_date.month, check_date.day, start_hour, 0, tzinfo=tz)
+        day_end = datetime(check_date.year, check_date.month, check_date.day, end_hour, 0, tzinfo=tz)
+
+        # Skip if in the past
+        if day_start < now:
+            day_start = now + timedelta(minutes=30 - now.minute % 30)  # Round up to next 30 min
+
+        current_time = day_start
+        while current_time + duration <= day_end and len(free_slots) < limit:
+            slot_end = current_time + duration
+            conflicts = busy.overlapping(current_time, slot_end)
+            if conflicts:
+                # Jump to end of the busy period
+                current_time = max(e for _, e in conflicts)
+            else:
+                free_slots.append((current_time, slot_end))
+                current_time = slot_end
+
+        if len(free_slots) >= limit:
+            break
+
+    return free_slots
+
+
+_cache: Optional[CalendarCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_calendar_cache() -> CalendarCache:
+    """Process-wide cache backed by the Google Calendar API."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CalendarCache(GoogleCalendarSource())
+        return _cache
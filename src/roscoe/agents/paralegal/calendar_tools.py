@@ -8,14 +8,21 @@ Provides calendar functionality for case management:
 - Delete events
 - Find free time slots
 
+Reads (list/get/free time) are served from the incrementally synced
+calendar cache (calendar_cache.py); writes go to the API and are applied to
+the cache.
+
 All tools use lazy initialization to avoid pickle issues with LangGraph checkpointing.
 """
 
 import os
+import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Literal
 from zoneinfo import ZoneInfo
 
+logger = logging.getLogger(__name__)
+
 
 def _get_calendar_service():
     """Lazily get Google Calendar API service."""
@@ -23,6 +30,23 @@ def _get_calendar_service():
     return get_calendar_service()
 
 
+def _get_calendar_cache():
+    """Lazily get the synced calendar cache."""
+    from roscoe.agents.paralegal.calendar_cache import get_calendar_cache
+    return get_calendar_cache()
+
+
+def _cache_write(calendar_id: str, event: Optional[dict] = None, deleted_id: Optional[str] = None):
+    """Apply an API write to the cache (the next sync corrects it if this fails)."""
+    try:
+        if event is not None:
+            _get_calendar_cache().apply(calendar_id, event)
+        elif deleted_id is not None:
+            _get_calendar_cache().remove(calendar_id, deleted_id)
+    except Exception as e:
+        logger.warning(f"[CALENDAR] Cache update failed for {calendar_id} (next sync corrects it): {e}")
+
+
 def _get_default_timezone() -> str:
     """Get default timezone from environment or use America/New_York (Eastern)."""
     return os.environ.get("DEFAULT_TIMEZONE", "America/New_York")
@@ -110,24 +134,11 @@ def list_events(
     try:
         max_results = min(max_results, 100)
         
-        now = datetime.utcnow().isoformat() + 'Z'
-        time_max = (datetime.utcnow() + timedelta(days=days)).isoformat() + 'Z'
-        
-        # Build request
-        request_params = {
-            'calendarId': calendar_id,
-            'timeMin': now,
-            'timeMax': time_max,
-            'maxResults': max_results,
-            'singleEvents': True,
-            'orderBy': 'startTime',
-        }
-        
-        if query:
-            request_params['q'] = query
+        now = datetime.now(ZoneInfo("UTC"))
+        time_max = now + timedelta(days=days)
         
-        events_result = service.events().list(**request_params).execute()
-        events = events_result.get('items', [])
+        # Served from the synced cache (incremental sync, no full window list)
+        events = _get_calendar_cache().events(calendar_id, now, time_max, query=query)[:max_results]
         
         if not events:
             return f"No events found in the next {days} days."
@@ -264,6 +275,7 @@ def create_event(
             body=event,
             sendUpdates='all' if send_notifications and attendees else 'none'
         ).execute()
+        _cache_write(calendar_id, event=created)
         
         output_lines = [
             "✅ Event created successfully!",
@@ -358,6 +370,7 @@ def update_event(
             eventId=event_id,
             body=event
         ).execute()
+        _cache_write(calendar_id, event=updated)
         
         formatted = _format_event(updated)
         
@@ -406,6 +419,7 @@ def delete_event(
             eventId=event_id,
             sendUpdates='all' if send_notifications else 'none'
         ).execute()
+        _cache_write(calendar_id, deleted_id=event_id)
         
         return f"✅ Event deleted: **{event_summary}**\n\nEvent ID: {event_id}"
         
@@ -420,11 +434,13 @@ def find_free_time(
     end_hour: int = 17,
     calendar_id: str = "primary",
     timezone: Optional[str] = None,
+    calendar_ids: Optional[List[str]] = None,
 ) -> str:
     """
     Find available time slots for scheduling.
     
-    Searches for gaps in the calendar within business hours.
+    Searches for gaps in the calendar within business hours. With several
+    calendars, only times free on all of them are returned.
     
     Args:
         duration_minutes: Required meeting length (default: 60)
@@ -433,6 +449,7 @@ def find_free_time(
         end_hour: Business hours end (default: 5 PM)
         calendar_id: Calendar to check
         timezone: Timezone for results
+        calendar_ids: Check several calendars at once (overrides calendar_id)
     
     Returns:
         List of available time slots
@@ -440,7 +457,10 @@ def find_free_time(
     Examples:
         find_free_time(duration_minutes=30)  # 30-minute slots this week
         find_free_time(duration_minutes=120, days_ahead=14)  # 2-hour slots, 2 weeks
+        find_free_time(calendar_ids=["primary", "paralegal@firm.com"])  # Free for both
     """
+    from roscoe.agents.paralegal.calendar_cache import find_free_slots
+    
     service = _get_calendar_service()
     if not service:
         return "Error: Google Calendar not configured. Set up Google OAuth credentials first."
@@ -449,75 +469,14 @@ def find_free_time(
         tz = ZoneInfo(timezone or _get_default_timezone())
         now = datetime.now(tz)
         
-        # Get all events in the range
-        time_min = now.isoformat()
-        time_max = (now + timedelta(days=days_ahead)).isoformat()
+        # Busy periods of every calendar in the range, merged into one tree
+        busy = _get_calendar_cache().busy_tree(
+            calendar_ids or [calendar_id], now, now + timedelta(days=days_ahead)
+        )
         
-        events_result = service.events().list(
-            calendarId=calendar_id,
-            timeMin=time_min,
-            timeMax=time_max,
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
-        
-        events = events_result.get('items', [])
-        
-        # Build list of busy times
-        busy_times = []
-        for event in events:
-            start = event.get('start', {})
-            end = event.get('end', {})
-            
-            if 'dateTime' in start:
-                start_dt = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00')).astimezone(tz)
-                end_dt = datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00')).astimezone(tz)
-                busy_times.append((start_dt, end_dt))
-        
-        # Find free slots
-        free_slots = []
-        current_date = now.date()
-        
-        for day_offset in range(days_ahead):
-            check_date = current_date + timedelta(days=day_offset)
-            
-            # Skip weekends
-            if check_date.weekday() >= 5:
-                continue
-            
-            day_start = datetime(check_date.year, check_date.month, check_date.day, 
-                               start_hour, 0, tzinfo=tz)
-            day_end = datetime(check_date.year, check_date.month, check_date.day,
-                             end_hour, 0, tzinfo=tz)
-            
-            # Skip if in the past
-            if day_start < now:
-                day_start = now + timedelta(minutes=30 - now.minute % 30)  # Round up to next 30 min
-            
-            current_time = day_start
-            
-            while current_time + timedelta(minutes=duration_minutes) <= day_end:
-                slot_end = current_time + timedelta(minutes=duration_minutes)
-                
-                # Check if slot conflicts with any busy time
-                is_free = True
-                for busy_start, busy_end in busy_times:
-                    if not (slot_end <= busy_start or current_time >= busy_end):
-                        is_free = False
-                        # Jump to end of this busy period
-                        current_time = busy_end
-                        break
-                
-                if is_free:
-                    free_slots.append((current_time, slot_end))
-                    current_time = slot_end
-                
-                # Limit results
-                if len(free_slots) >= 10:
-                    break
-            
-            if len(free_slots) >= 10:
-                break
+        free_slots = find_free_slots(
+            busy, now, days_ahead, timedelta(minutes=duration_minutes), start_hour, end_hour
+        )
         
         if not free_slots:
             return f"No available {duration_minutes}-minute slots found in the next {days_ahead} days."
@@ -561,10 +520,12 @@ def get_event(
         return "Error: Google Calendar not configured. Set up Google OAuth credentials first."
     
     try:
-        event = service.events().get(
-            calendarId=calendar_id,
-            eventId=event_id
-        ).execute()
+        event = _get_calendar_cache().get(calendar_id, event_id)
+        if event is None:
+            event = service.events().get(
+                calendarId=calendar_id,
+                eventId=event_id
+            ).execute()
         
         formatted = _format_event(event)
         
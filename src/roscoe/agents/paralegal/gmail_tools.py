@@ -12,19 +12,110 @@ All tools use lazy initialization to avoid pickle issues with LangGraph checkpoi
 """
 
 import os
+import re
+import time
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, List, Literal
+from typing import Dict, Optional, List, Literal
 from datetime import datetime
 
+# Gmail HTTP batch sizes (API max is 100 per batch; raw messages carry
+# attachments, so they go in smaller batches spread over a worker pool)
+METADATA_BATCH_SIZE = 50
+RAW_BATCH_SIZE = 10
+FETCH_WORKERS = 4
+# Sub-requests rejected inside a batch (429 / rate limit / 5xx) are retried
+BATCH_RETRIES = 3
+BATCH_RETRY_BACKOFF = 1.0  # Seconds, doubled per retry
+
 
 def _get_gmail_service():
-    """Lazily get Gmail API service."""
+    """Lazily get Gmail API service (cached per thread)."""
     from roscoe.core.google_auth import get_gmail_service
     return get_gmail_service()
 
 
+def _is_retryable(exception: Exception) -> bool:
+    """Rate-limit and server errors that Gmail returns per sub-request in a batch."""
+    status = getattr(getattr(exception, "resp", None), "status", None)
+    if status is None:
+        return False
+    status = int(status)
+    return status == 429 or status >= 500 or (status == 403 and "rateLimitExceeded" in str(exception))
+
+
+def _batch_get_messages(service, message_ids: List[str], batch_size: int, **get_kwargs) -> Dict[str, object]:
+    """
+    Fetch many messages with Gmail HTTP batch requests.
+
+    Sub-requests that fail with a rate-limit or server error are retried
+    (up to BATCH_RETRIES times, with exponential backoff).
+
+    Args:
+        service: Gmail service client
+        message_ids: Message IDs to fetch
+        batch_size: Messages per HTTP batch
+        **get_kwargs: Arguments for messages().get (format, metadataHeaders, ...)
+
+    Returns:
+        Dict of message_id -> message dict, or the exception for that message
+    """
+    results: Dict[str, object] = {}
+
+    def callback(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+
+    pending = list(message_ids)
+    for attempt in range(BATCH_RETRIES + 1):
+        if attempt:
+            time.sleep(BATCH_RETRY_BACKOFF * 2 ** (attempt - 1))
+        for start in range(0, len(pending), batch_size):
+            batch = service.new_batch_http_request(callback=callback)
+            for message_id in pending[start:start + batch_size]:
+                batch.add(
+                    service.users().messages().get(userId='me', id=message_id, **get_kwargs),
+                    request_id=message_id,
+                )
+            batch.execute()
+
+        pending = [
+            message_id for message_id in pending
+            if isinstance(results.get(message_id), Exception) and _is_retryable(results[message_id])
+        ]
+        if not pending:
+            break
+
+    return results
+
+
+def _fetch_raw_messages(message_ids: List[str]) -> Dict[str, object]:
+    """
+    Fetch raw (RFC 2822) messages: batches of RAW_BATCH_SIZE run concurrently
+    on up to FETCH_WORKERS threads, each with its own Gmail client.
+
+    Returns:
+        Dict of message_id -> message dict, or the exception for that message
+    """
+    chunks = [message_ids[i:i + RAW_BATCH_SIZE] for i in range(0, len(message_ids), RAW_BATCH_SIZE)]
+
+    def fetch(chunk):
+        service = _get_gmail_service()
+        if not service:
+            raise RuntimeError("Gmail not configured")
+        return _batch_get_messages(service, chunk, RAW_BATCH_SIZE, format='raw')
+
+    results: Dict[str, object] = {}
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(chunks)) or 1) as pool:
+        for chunk, future in [(chunk, pool.submit(fetch, chunk)) for chunk in chunks]:
+            try:
+                results.update(future.result())
+            except Exception as e:
+                results.update({message_id: e for message_id in chunk})
+    return results
+
+
 def _decode_message_body(payload: dict) -> str:
     """
     Decode email body from Gmail API payload.
@@ -129,20 +220,28 @@ def search_emails(
         if not messages:
             return f"No emails found matching: {query}"
         
-        # Get details for each message
-        email_summaries = []
-        for msg in messages:
-            full_msg = service.users().messages().get(
-                userId='me',
-                id=msg['id'],
-                format='metadata',
-                metadataHeaders=['From', 'To', 'Subject', 'Date']
-            ).execute()
-            
-            email_summaries.append(_format_email_summary(full_msg))
+        # Get details for all messages in one batch request (list order kept)
+        fetched = _batch_get_messages(
+            service,
+            [msg['id'] for msg in messages],
+            METADATA_BATCH_SIZE,
+            format='metadata',
+            metadataHeaders=['From', 'To', 'Subject', 'Date'],
+        )
+        email_summaries = [
+            _format_email_summary(fetched[msg['id']])
+            for msg in messages
+            if isinstance(fetched.get(msg['id']), dict)
+        ]
+        missing = len(messages) - len(email_summaries)
         
         # Format output
-        output_lines = [f"Found {len(email_summaries)} emails matching: {query}\n"]
+        output_lines = [f"Found {len(messages)} emails matching: {query}\n"]
+        if missing:
+            output_lines.append(
+                f"⚠️ {missing} of {len(messages)} emails could not be fetched (Gmail errors); "
+                "retry the search to see them.\n"
+            )
         
         for i, email in enumerate(email_summaries, 1):
             output_lines.append(f"**{i}. {email['subject']}**")
@@ -477,18 +576,10 @@ def save_email_to_case(
         save_email_to_case("18abc123def", "Wilson-MVA-2024", subfolder="Loan Documents")
         save_email_to_case("18abc123def", "McCay-Case", custom_filename="settlement_offer.eml")
     """
-    import re
-    from pathlib import Path
-    from email import policy
-    from email.parser import BytesParser
-    
     service = _get_gmail_service()
     if not service:
         return "Error: Gmail not configured. Set up Google OAuth credentials first."
     
-    # Get workspace directory
-    workspace_dir = os.environ.get('WORKSPACE_DIR', '/mnt/workspace')
-    
     try:
         # Get the raw email (RFC 2822 format)
         msg = service.users().messages().get(
@@ -497,118 +588,115 @@ def save_email_to_case(
             format='raw'
         ).execute()
         
-        # Decode the raw message
-        raw_email = base64.urlsafe_b64decode(msg['raw'])
+        return _write_email_to_case(msg, case_folder, subfolder, include_attachments, custom_filename)
         
-        # Parse to get metadata for filename
-        parsed = BytesParser(policy=policy.default).parsebytes(raw_email)
-        subject = parsed.get('subject', 'no_subject')
-        date_str = parsed.get('date', '')
-        from_addr = parsed.get('from', 'unknown')
-        
-        # Parse date for filename
-        try:
-            # Try to parse the email date
-            from email.utils import parsedate_to_datetime
-            email_date = parsedate_to_datetime(date_str)
-            date_prefix = email_date.strftime('%Y-%m-%d')
-        except Exception:
-            date_prefix = datetime.now().strftime('%Y-%m-%d')
-        
-        # Sanitize subject for filename
-        safe_subject = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', subject)
-        safe_subject = safe_subject[:50].strip()  # Limit length
-        
-        # Generate filename
-        if custom_filename:
-            if not custom_filename.endswith('.eml'):
-                custom_filename += '.eml'
-            eml_filename = custom_filename
-        else:
-            eml_filename = f"{date_prefix}_{safe_subject}.eml"
-        
-        # Build save path
-        save_dir = Path(workspace_dir) / "projects" / case_folder / subfolder
-        save_dir.mkdir(parents=True, exist_ok=True)
-        
-        eml_path = save_dir / eml_filename
-        
-        # Save the raw .eml file
-        with open(eml_path, 'wb') as f:
-            f.write(raw_email)
-        
-        saved_files = [f"📧 Email: {eml_path.relative_to(workspace_dir)}"]
-        
-        # Extract and save attachments if requested
-        if include_attachments:
-            # Get full message to find attachments
-            full_msg = service.users().messages().get(
-                userId='me',
-                id=message_id,
-                format='full'
-            ).execute()
+    except Exception as e:
+        return f"Error saving email: {str(e)}"
+
+
+def _write_email_to_case(
+    msg: dict,
+    case_folder: str,
+    subfolder: str,
+    include_attachments: bool,
+    custom_filename: Optional[str] = None,
+) -> str:
+    """
+    Write a fetched raw message (.eml) and its attachments into the case folder.
+
+    Attachments are decoded from the raw MIME message already in hand, so no
+    per-attachment API calls are needed.
+    """
+    from pathlib import Path
+    from email import policy
+    from email.parser import BytesParser
+    
+    # Get workspace directory
+    workspace_dir = os.environ.get('WORKSPACE_DIR', '/mnt/workspace')
+    
+    # Decode the raw message
+    raw_email = base64.urlsafe_b64decode(msg['raw'])
+    
+    # Parse to get metadata for filename
+    parsed = BytesParser(policy=policy.default).parsebytes(raw_email)
+    subject = parsed.get('subject', 'no_subject')
+    date_str = parsed.get('date', '')
+    from_addr = parsed.get('from', 'unknown')
+    
+    # Parse date for filename
+    try:
+        # Try to parse the email date
+        from email.utils import parsedate_to_datetime
+        email_date = parsedate_to_datetime(date_str)
+        date_prefix = email_date.strftime('%Y-%m-%d')
+    except Exception:
+        date_prefix = datetime.now().strftime('%Y-%m-%d')
+    
+    # Sanitize subject for filename
+    safe_subject = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', subject)
+    safe_subject = safe_subject[:50].strip()  # Limit length
+    
+    # Generate filename
+    if custom_filename:
+        if not custom_filename.endswith('.eml'):
+            custom_filename += '.eml'
+        eml_filename = custom_filename
+    else:
+        eml_filename = f"{date_prefix}_{safe_subject}.eml"
+    
+    # Build save path
+    save_dir = Path(workspace_dir) / "projects" / case_folder / subfolder
+    save_dir.mkdir(parents=True, exist_ok=True)
+    
+    eml_path = save_dir / eml_filename
+    
+    # Save the raw .eml file
+    with open(eml_path, 'wb') as f:
+        f.write(raw_email)
+    
+    saved_files = [f"📧 Email: {eml_path.relative_to(workspace_dir)}"]
+    
+    # Extract and save attachments if requested
+    if include_attachments:
+        attachments_dir = save_dir / "attachments"
+        
+        for part in parsed.walk():
+            if part.is_multipart():
+                continue
+            filename = part.get_filename()
+            if not filename:
+                continue
+            data = part.get_payload(decode=True)
+            if data is None:
+                continue
             
-            attachments_dir = save_dir / "attachments"
+            # Create attachments directory if needed
+            attachments_dir.mkdir(parents=True, exist_ok=True)
             
-            def extract_attachments(payload, msg_id):
-                """Recursively extract attachments from message parts."""
-                attachments = []
-                
-                if 'parts' in payload:
-                    for part in payload['parts']:
-                        filename = part.get('filename')
-                        if filename and part.get('body', {}).get('attachmentId'):
-                            # Get the attachment data
-                            att = service.users().messages().attachments().get(
-                                userId='me',
-                                messageId=msg_id,
-                                id=part['body']['attachmentId']
-                            ).execute()
-                            
-                            # Decode and save
-                            data = base64.urlsafe_b64decode(att['data'])
-                            
-                            # Create attachments directory if needed
-                            attachments_dir.mkdir(parents=True, exist_ok=True)
-                            
-                            # Sanitize filename
-                            safe_filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
-                            att_path = attachments_dir / f"{date_prefix}_{safe_filename}"
-                            
-                            with open(att_path, 'wb') as f:
-                                f.write(data)
-                            
-                            attachments.append(str(att_path.relative_to(workspace_dir)))
-                        
-                        # Recurse for nested parts
-                        if 'parts' in part:
-                            attachments.extend(extract_attachments(part, msg_id))
-                
-                return attachments
+            # Sanitize filename
+            safe_filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
+            att_path = attachments_dir / f"{date_prefix}_{safe_filename}"
             
-            attachment_paths = extract_attachments(full_msg.get('payload', {}), message_id)
+            with open(att_path, 'wb') as f:
+                f.write(data)
             
-            for att_path in attachment_paths:
-                saved_files.append(f"📎 Attachment: {att_path}")
-        
-        # Build result message
-        result_lines = [
-            f"✅ Email saved to case folder!",
-            f"",
-            f"**Case:** {case_folder}",
-            f"**Subfolder:** {subfolder}",
-            f"**From:** {from_addr}",
-            f"**Subject:** {subject}",
-            f"**Date:** {date_str}",
-            f"",
-            f"**Saved Files:**"
-        ]
-        result_lines.extend([f"  - {f}" for f in saved_files])
-        
-        return "\n".join(result_lines)
-        
-    except Exception as e:
-        return f"Error saving email: {str(e)}"
+            saved_files.append(f"📎 Attachment: {att_path.relative_to(workspace_dir)}")
+    
+    # Build result message
+    result_lines = [
+        f"✅ Email saved to case folder!",
+        f"",
+        f"**Case:** {case_folder}",
+        f"**Subfolder:** {subfolder}",
+        f"**From:** {from_addr}",
+        f"**Subject:** {subject}",
+        f"**Date:** {date_str}",
+        f"",
+        f"**Saved Files:**"
+    ]
+    result_lines.extend([f"  - {f}" for f in saved_files])
+    
+    return "\n".join(result_lines)
 
 
 def save_emails_batch(
@@ -620,8 +708,9 @@ def save_emails_batch(
     """
     Save multiple emails to a case folder in batch.
     
-    Efficiently downloads and saves multiple emails at once.
-    Use this after search_emails to save all matching emails to a case.
+    Efficiently downloads and saves multiple emails at once (batched,
+    concurrent fetches). Use this after search_emails to save all matching
+    emails to a case.
     
     Args:
         message_ids: List of Gmail message IDs to save
@@ -638,14 +727,23 @@ def save_emails_batch(
     if not message_ids:
         return "Error: No message IDs provided."
     
+    if not _get_gmail_service():
+        return "Error: Gmail not configured. Set up Google OAuth credentials first."
+    
+    # Fetch every raw message up front (batched, concurrent)
+    fetched = _fetch_raw_messages(list(dict.fromkeys(message_ids)))
+    
     results = []
     success_count = 0
     error_count = 0
     
     for i, msg_id in enumerate(message_ids, 1):
         try:
-            result = save_email_to_case(
-                message_id=msg_id,
+            msg = fetched.get(msg_id)
+            if not isinstance(msg, dict):
+                raise msg if isinstance(msg, Exception) else RuntimeError("Message not returned")
+            result = _write_email_to_case(
+                msg,
                 case_folder=case_folder,
                 subfolder=subfolder,
                 include_attachments=include_attachments
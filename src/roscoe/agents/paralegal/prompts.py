@@ -222,6 +222,7 @@ Each case progresses through phases, with landmarks as checkpoints.
 | Tool | When to Use | Example |
 |------|-------------|---------|
 | `write_entity(entity_type, properties, relationships)` | Create any entity with relationships | Create BIClaim, Facility, InsurancePolicy |
+| `write_entities(entities)` | Create many entities at once (one atomic write) | Enter all providers, claims and parties from an intake form |
 
 **Schema Reference Required:** Before using `write_entity()`, read `KNOWLEDGE_GRAPH_SCHEMA.md` to understand:
 - Valid entity types (52 types available)
@@ -14,7 +14,6 @@ import os
 import json
 import re
 import logging
-import asyncio
 from typing import Literal, Optional, Any, List, Dict
 from pathlib import Path
 from tavily import TavilyClient
@@ -1681,138 +1680,210 @@ def write_entity(
             ]
         )
     """
-    import asyncio
-
     try:
-        from roscoe.core.graphiti_client import run_cypher_query
-
-        async def _create_entity():
-            # Build property string for Cypher CREATE
-            prop_items = []
-            for key, value in properties.items():
-                if isinstance(value, str):
-                    # Escape quotes in strings
-                    escaped_value = value.replace("'", "\\'")
-                    prop_items.append(f"{key}: '{escaped_value}'")
-                elif isinstance(value, (int, float)):
-                    prop_items.append(f"{key}: {value}")
-                elif isinstance(value, bool):
-                    prop_items.append(f"{key}: {str(value).lower()}")
-                elif value is None:
-                    continue  # Skip null values
-                else:
-                    # For complex types, convert to string
-                    prop_items.append(f"{key}: '{str(value)}'")
+        result = _run_async(_write_entities([{
+            "entity_type": entity_type,
+            "properties": properties,
+            "relationships": relationships,
+        }]))[0]
 
-            props_str = ", ".join(prop_items)
+        return "\n".join(_format_written_entity(result))
 
-            # Create the entity
-            create_query = f"""
-                CREATE (e:{entity_type} {{{props_str}}})
-                RETURN e.name as name, labels(e)[0] as type
-            """
+    except Exception as e:
+        return f"❌ Error creating entity: {str(e)}"
 
-            result = await run_cypher_query(create_query)
 
-            if not result:
-                return {"error": "Entity creation failed - no result returned"}
+def write_entities(entities: List[Dict[str, Any]]) -> str:
+    """
+    Create many entities (with their relationships) in one atomic graph write.
 
-            created_entity = result[0]
-            entity_name = created_entity.get("name")
+    Use this instead of repeated write_entity calls for bulk entry, e.g. every
+    provider, claim and party from an intake form. Valid entities are written
+    in one atomic query; invalid entities (no type, no non-null properties)
+    and relationships whose target is not found are reported individually.
 
-            # Create relationships if specified
-            created_relationships = []
-            if relationships:
-                for rel in relationships:
-                    rel_type = rel.get("rel_type")
-                    target_type = rel.get("target_entity_type")
-                    target_props = rel.get("target_properties", {})
-                    direction = rel.get("direction", "outgoing")
+    Args:
+        entities: List of dicts, each with the write_entity arguments:
+            - entity_type: Entity type to create (see KNOWLEDGE_GRAPH_SCHEMA.md)
+            - properties: Entity properties (name REQUIRED for most entities)
+            - relationships: Optional relationships (same format as write_entity);
+              targets may be other entities in the same list
 
-                    if not rel_type or not target_type or not target_props:
-                        continue
+    Returns:
+        Per-entity confirmation with created relationships and any errors.
+
+    Example:
+        write_entities([
+            {
+                "entity_type": "Facility",
+                "properties": {"name": "Norton Orthopedic Institute"},
+                "relationships": [{
+                    "rel_type": "TREATED_AT",
+                    "target_entity_type": "Client",
+                    "target_properties": {"name": "Christopher Lanier"},
+                    "direction": "incoming"
+                }]
+            },
+            {
+                "entity_type": "Bill",
+                "properties": {"name": "Norton Bill 2025-07-01", "amount": 1250.00},
+                "relationships": [{
+                    "rel_type": "BILLED_BY",
+                    "target_entity_type": "Facility",
+                    "target_properties": {"name": "Norton Orthopedic Institute"}
+                }]
+            }
+        ])
+    """
+    if not entities:
+        return "❌ No entities provided"
 
-                    # Build match condition for target
-                    target_match_items = []
-                    for key, value in target_props.items():
-                        if isinstance(value, str):
-                            escaped = value.replace("'", "\\'")
-                            target_match_items.append(f"{key}: '{escaped}'")
-                        else:
-                            target_match_items.append(f"{key}: {value}")
-
-                    target_match_str = ", ".join(target_match_items)
-
-                    # Create relationship query
-                    if direction == "incoming":
-                        # Target -> Created Entity
-                        rel_query = f"""
-                            MATCH (source:{entity_type} {{name: '{entity_name}'}})
-                            MATCH (target:{target_type} {{{target_match_str}}})
-                            CREATE (target)-[r:{rel_type}]->(source)
-                            RETURN type(r) as rel_type
-                        """
-                    else:
-                        # Created Entity -> Target
-                        rel_query = f"""
-                            MATCH (source:{entity_type} {{name: '{entity_name}'}})
-                            MATCH (target:{target_type} {{{target_match_str}}})
-                            CREATE (source)-[r:{rel_type}]->(target)
-                            RETURN type(r) as rel_created
-                        """
+    try:
+        results = _run_async(_write_entities(entities))
+
+        created = sum(1 for result in results if "error" not in result)
+        output = [f"✅ {created} entities created in knowledge graph", ""]
+        if created < len(results):
+            output[0] += f" ({len(results) - created} not created)"
+        for result in results:
+            output.extend(_format_written_entity(result)[2:])
+        return "\n".join(output)
 
-                    try:
-                        rel_result = await run_cypher_query(rel_query)
-                        if rel_result:
-                            created_relationships.append({
-                                "type": rel_type,
-                                "target": target_type,
-                                "direction": direction
-                            })
-                    except Exception as e:
-                        # Log error but continue with other relationships
-                        created_relationships.append({
-                            "type": rel_type,
-                            "error": str(e)[:100]
-                        })
+    except Exception as e:
+        return f"❌ Error creating entities: {str(e)}"
 
-            return {
-                "success": True,
-                "entity": {
-                    "type": entity_type,
-                    "name": entity_name,
-                    "properties": properties
-                },
-                "relationships_created": created_relationships
-            }
 
-        result = _run_async(_create_entity())
+async def _write_entities(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Compile write_entity specs into one parameterized batch and apply it.
 
-        if result.get("error"):
-            return f"❌ Entity creation failed: {result['error']}"
+    Returns one result per spec with the entity and its relationship outcomes.
+    """
+    from roscoe.core.case_cache import invalidate_case
+    from roscoe.core.graph_writer import EntityWrite, NodeRef, RelationshipWrite, execute_write_batch
 
-        # Format success response
-        output = [
-            f"✅ Entity created in knowledge graph",
+    results = [
+        {
+            "entity": {
+                "type": spec.get("entity_type"),
+                "name": (spec.get("properties") or {}).get("name"),
+                "properties": spec.get("properties") or {}
+            },
+            "relationships_created": []
+        }
+        for spec in specs
+    ]
+
+    entity_writes = []
+    rel_writes = []
+    rel_owners = []  # (spec index, relationship summary) per rel_write
+    for n, spec in enumerate(specs):
+        entity_type = spec.get("entity_type")
+        properties = spec.get("properties") or {}
+        # Relationships find the new entity by name (or all its properties if unnamed)
+        if properties.get("name") is not None:
+            identity = {"name": properties["name"]}
+        else:
+            identity = {k: v for k, v in properties.items() if v is not None}
+        if not identity:
+            results[n]["error"] = "needs a name (or at least one non-null property)"
+            continue
+        node = NodeRef(entity_type, identity)
+        entity_write = EntityWrite(node, properties)
+        try:
+            entity_write.validate()
+        except ValueError as e:
+            # Report this entity and write the rest of the batch
+            results[n]["error"] = str(e)
+            continue
+        entity_writes.append(entity_write)
+
+        for rel in spec.get("relationships") or []:
+            rel_type = rel.get("rel_type")
+            target_type = rel.get("target_entity_type")
+            target_props = {k: v for k, v in (rel.get("target_properties") or {}).items() if v is not None}
+            direction = rel.get("direction", "outgoing")
+
+            if not rel_type or not target_type or not target_props:
+                continue
+
+            target = NodeRef(target_type, target_props)
+            if direction == "incoming":
+                # Target -> Created Entity
+                rel_write = RelationshipWrite(rel_type, target, node)
+            else:
+                # Created Entity -> Target
+                rel_write = RelationshipWrite(rel_type, node, target)
+            try:
+                rel_write.validate()
+            except ValueError as e:
+                results[n]["relationships_created"].append({"type": rel_type, "error": str(e)})
+                continue
+            rel_writes.append(rel_write)
+            rel_owners.append((n, {"type": rel_type, "target": target_type, "direction": direction}))
+
+    write_results = await execute_write_batch(entity_writes, rel_writes)
+
+    for write_result in write_results[len(entity_writes):]:
+        n, summary = rel_owners[write_result.index - len(entity_writes)]
+        if write_result.ok:
+            results[n]["relationships_created"].append(summary)
+        else:
+            results[n]["relationships_created"].append({"type": summary["type"], "error": write_result.error})
+
+    # Invalidate cached case data. Only Case entities/targets can be attributed
+    # to a single case; anything else (e.g. a Facility) clears all cases.
+    touched_cases = set()
+    for spec, result in zip(specs, results):
+        if "error" in result:
+            continue
+        spec_cases = set()
+        if spec.get("entity_type") == "Case":
+            spec_cases.add((spec.get("properties") or {}).get("name"))
+        for rel in spec.get("relationships") or []:
+            if rel.get("target_entity_type") == "Case":
+                spec_cases.add((rel.get("target_properties") or {}).get("name"))
+        if not spec_cases or None in spec_cases:
+            invalidate_case()
+            break
+        touched_cases |= spec_cases
+    else:
+        for touched in touched_cases:
+            invalidate_case(touched)
+
+    return results
+
+
+def _format_written_entity(result: Dict[str, Any]) -> List[str]:
+    """Confirmation lines for one created entity (or why it was not created) and its relationships."""
+    if "error" in result:
+        return [
+            "❌ Entity not created",
             "",
             f"**Type**: {result['entity']['type']}",
             f"**Name**: {result['entity']['name']}",
+            f"**Error**: {result['error']}",
             ""
         ]
 
-        if result.get("relationships_created"):
-            output.append(f"**Relationships** ({len(result['relationships_created'])} created):")
-            for rel in result['relationships_created']:
-                if "error" in rel:
-                    output.append(f"  ❌ {rel['type']}: {rel['error']}")
-                else:
-                    arrow = "<-" if rel['direction'] == "incoming" else "->"
-                    output.append(f"  ✅ {arrow}[:{rel['type']}]{arrow} {rel['target']}")
-
-        return "\n".join(output)
+    output = [
+        "✅ Entity created in knowledge graph",
+        "",
+        f"**Type**: {result['entity']['type']}",
+        f"**Name**: {result['entity']['name']}",
+        ""
+    ]
+
+    if result.get("relationships_created"):
+        output.append(f"**Relationships** ({len(result['relationships_created'])} created):")
+        for rel in result['relationships_created']:
+            if "error" in rel:
+                output.append(f"  ❌ {rel['type']}: {rel['error']}")
+            else:
+                arrow = "<-" if rel['direction'] == "incoming" else "->"
+                output.append(f"  ✅ {arrow}[:{rel['type']}]{arrow} {rel['target']}")
 
-    except Exception as e:
-        return f"❌ Error creating entity: {str(e)}"
+    return output
 
 
 # =============================================================================
@@ -1851,8 +1922,6 @@ def query_case_graph(
         query_case_graph("Which cases have Progressive insurance?")
         query_case_graph("What treatments did the client receive?", case_name="Wilson-MVA-2024")
     """
-    import asyncio
-    
     graphiti_enabled = os.environ.get("GRAPHITI_ENABLED", "true").lower() == "true"
     
     if not graphiti_enabled:
@@ -1869,17 +1938,8 @@ def query_case_graph(
             )
         
         # Run async in sync context
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, _search())
-                    results = future.result(timeout=60)
-            else:
-                results = asyncio.run(_search())
-        except RuntimeError:
-            results = asyncio.run(_search())
+        from roscoe.core.async_bridge import run_sync
+        results = run_sync(_search(), timeout=60)
         
         if not results:
             scope = f" for case {case_name}" if case_name else ""
@@ -1954,8 +2014,6 @@ def graph_query(
         # Get full graph for a case
         graph_query("case_graph", case_name="Christopher-Lanier-MVA-6-28-2025")
     """
-    import asyncio
-    
     graphiti_enabled = os.environ.get("GRAPHITI_ENABLED", "true").lower() == "true"
     
     if not graphiti_enabled:
@@ -2008,17 +2066,8 @@ def graph_query(
                 return {"error": f"Unknown query_type: {query_type}"}
         
         # Run async
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, _run_query())
-                    results = future.result(timeout=60)
-            else:
-                results = asyncio.run(_run_query())
-        except RuntimeError:
-            results = asyncio.run(_run_query())
+        from roscoe.core.async_bridge import run_sync
+        results = run_sync(_run_query(), timeout=60)
         
         # Helper to filter out large/noisy fields from results
         def _clean_value(v):
@@ -2125,8 +2174,6 @@ def get_case_structure(
         get_case_structure("Abby-Sitgraves-MVA-7-13-2024")  # All info
         get_case_structure("Abby-Sitgraves-MVA-7-13-2024", info_type="Insurance")  # Just insurance
     """
-    import asyncio
-
     graphiti_enabled = os.environ.get("GRAPHITI_ENABLED", "true").lower() == "true"
 
     if not graphiti_enabled:
@@ -2252,8 +2299,6 @@ def get_workflow_resources(
         # Get resources for a specific workflow step
         get_workflow_resources(workflow="intake", step_id="collect_client_info")
     """
-    import asyncio
-    
     graphiti_enabled = os.environ.get("GRAPHITI_ENABLED", "true").lower() == "true"
     
     if not graphiti_enabled:
@@ -2446,17 +2491,8 @@ def get_workflow_resources(
             return "\n".join(output)
         
         # Run async
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, _get_resources())
-                    result = future.result(timeout=60)
-            else:
-                result = asyncio.run(_get_resources())
-        except RuntimeError:
-            result = asyncio.run(_get_resources())
+        from roscoe.core.async_bridge import run_sync
+        result = run_sync(_get_resources(), timeout=60)
         
         return result
         
@@ -2472,31 +2508,9 @@ def get_workflow_resources(
 # These tools update the deterministic workflow state stored in the graph.
 
 def _run_async(coro):
-    """Helper to run async code from sync context."""
-    import asyncio
-    try:
-        # Try to get existing loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # We're in an async context, need to use thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result(timeout=120)
-        elif loop.is_closed():
-            # Loop is closed, create a new one and don't close it
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop.run_until_complete(coro)
-            # Don't close - let it persist for subsequent calls
-        else:
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        # No event loop at all, create one
-        return asyncio.run(coro)
-    except Exception as e:
-        # Fallback: always use asyncio.run
-        return asyncio.run(coro)
+    """Helper to run async code from sync context (on the shared background loop)."""
+    from roscoe.core.async_bridge import run_sync
+    return run_sync(coro, timeout=120)
 
 
 def update_landmark(
@@ -2816,18 +2830,8 @@ def advance_phase(
             else:
                 # No current phase AND no target - can't determine where to go
                 # Check if case exists at all first
-                from roscoe.core.graphiti_client import run_cypher_query
-                case_check = await run_cypher_query(
-                    """
-                    OPTIONAL MATCH (c1:Case {name: $case_name})
-                    OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-                    WITH COALESCE(c1, c2) as c
-                    WHERE c IS NOT NULL
-                    RETURN c.name as name
-                    """,
-                    {"case_name": case_name}
-                )
-                if not case_check:
+                from roscoe.core.case_identity import resolve_case_id
+                if await resolve_case_id(case_name) is None:
                     return {"error": f"Case '{case_name}' not found."}
                 else:
                     return {"error": f"Case '{case_name}' has no phase set. Use target_phase to initialize it (e.g., target_phase='onboarding' or target_phase='file_setup')."}
@@ -3489,10 +3493,8 @@ def list_analysis_jobs() -> str:
 
 def _run_calendar_async(coro):
     """Run an async coroutine from a sync context (for calendar tools)."""
-    import concurrent.futures
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future = executor.submit(asyncio.run, coro)
-        return future.result(timeout=30)
+    from roscoe.core.async_bridge import run_sync
+    return run_sync(coro, timeout=30)
 
 
 def create_calendar_event(
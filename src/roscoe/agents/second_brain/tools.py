@@ -427,7 +427,7 @@ async def search_captures(
     Example:
         search_captures("Dr. Smith", capture_type="interaction")
     """
-    from roscoe.core.graphiti_client import run_cypher_query
+    from roscoe.core.fulltext_search import search_nodes
 
     type_to_label = {
         "task": ["PersonalAssistant_Task"],
@@ -441,34 +441,17 @@ async def search_captures(
     }
 
     labels = type_to_label.get(capture_type, type_to_label["all"])
-    results = []
-    search_term = _escape_cypher_string(query.lower())
 
-    for label in labels:
-        cypher = f"""
-            MATCH (n:{label})
-            WHERE toLower(n.name) CONTAINS '{search_term}'
-               OR toLower(coalesce(n.notes, '')) CONTAINS '{search_term}'
-               OR toLower(coalesce(n.context, '')) CONTAINS '{search_term}'
-               OR toLower(coalesce(n.note_content, '')) CONTAINS '{search_term}'
-            RETURN n.id as id, n.name as name, n.created_at as created_at,
-                   labels(n)[0] as type
-            ORDER BY n.created_at DESC
-            LIMIT {limit}
-        """
-        try:
-            result = await run_cypher_query(cypher)
-            if result:
-                results.extend(result)
-        except Exception as e:
-            logger.warning(f"Error searching {label}: {e}")
+    # One full-text query across all labels, ranked by relevance
+    try:
+        results = await search_nodes(labels, query, limit=limit)
+    except Exception as e:
+        logger.warning(f"Error searching captures: {e}")
+        results = []
 
     if not results:
         return f"No captures found matching: \"{query}\""
 
-    results.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-    results = results[:limit]
-
     output = [f"**Search results for \"{query}\":**\n"]
     for r in results:
         type_name = r.get('type', '').replace('PersonalAssistant_', '').replace('Case_', '')
@@ -619,6 +602,7 @@ async def get_morning_brief() -> str:
     Returns a summary of:
     - Top 3 priorities for today
     - Pending tasks with due dates
+    - Cases with SOL deadlines approaching or blocked phases
     - Recent interactions to follow up
 
     Returns:
@@ -649,6 +633,18 @@ async def get_morning_brief() -> str:
 
     output.append("")
 
+    # Case deadlines and blockers across the firm
+    from roscoe.workflow_engine.orchestrator.firm_dashboard import (
+        compute_firm_dashboard,
+        format_firm_dashboard,
+    )
+    try:
+        output.append(format_firm_dashboard(await compute_firm_dashboard()))
+    except Exception as e:
+        output.append(f"## ⚖️ Case Deadlines\nUnavailable: {e}")
+
+    output.append("")
+
     # Recent interactions
     interactions_query = """
         MATCH (i:PersonalAssistant_Interaction)
@@ -12,6 +12,7 @@ This module provides:
 __all__ = [
     "get_graphiti",
     "close_graphiti",
+    "get_graphiti_stats",
     "add_case_episode",
     "search_case",
     "get_case_context",
@@ -25,6 +26,7 @@ def __getattr__(name):
         from roscoe.core.graphiti_client import (
             get_graphiti,
             close_graphiti,
+            get_graphiti_stats,
             add_case_episode,
             search_case,
             get_case_context,
@@ -0,0 +1,184 @@
+"""
+Persistent Sync → Async Bridge
+
+Runs coroutines from synchronous code (LangChain sync tools, middleware,
+workflow helpers) on ONE long-lived event loop in a daemon thread.
+
+Replaces the old per-call pattern of ThreadPoolExecutor + asyncio.run, which
+paid a thread spin-up and a fresh event loop on every call - and, because
+Graphiti clients and FalkorDB pools are per event loop, a fresh client stack
+and TCP connections too. With one bridge loop those are created once and reused.
+
+Features:
+- Lazy start on first use, daemon thread (never blocks interpreter exit)
+- Per-call timeout; the coroutine is cancelled on the loop if it expires
+- Cancellation if the calling thread is interrupted while waiting
+- Exceptions re-raised in the caller with their original traceback
+
+Usage:
+    from roscoe.core.async_bridge import run_sync
+
+    result = run_sync(get_case_state_from_graph(case_name), timeout=60)
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 120.0
+
+
+class BackgroundLoop:
+    """A dedicated event loop running forever in a daemon thread."""
+
+    def __init__(self, name: str = "roscoe-async-bridge"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The bridge loop, starting the thread on first use."""
+        if self._loop is None or self._loop.is_closed():
+            with self._lock:
+                if self._loop is None or self._loop.is_closed():
+                    self._start()
+        return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def _run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=_run, name=self.name, daemon=True)
+        thread.start()
+        started.wait()
+        self._loop = loop
+        self._thread = thread
+        logger.info(f"[ASYNC BRIDGE] Started background event loop ({self.name})")
+
+    def in_bridge_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = DEFAULT_TIMEOUT) -> Any:
+        """
+        Run a coroutine on the bridge loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None = no limit)
+
+        Raises:
+            TimeoutError: If the coroutine doesn't finish in time (it is cancelled)
+            RuntimeError: If called from the bridge loop itself (would deadlock)
+            Any exception raised by the coroutine, with its original traceback
+        """
+        if self.in_bridge_thread():
+            coro.close()
+            raise RuntimeError(
+                "run_sync() called from the async bridge loop - await the coroutine instead"
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Async bridge call timed out after {timeout}s") from None
+        except BaseException:
+            # Caller interrupted (or coroutine failed) - make sure nothing keeps running
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 5.0):
+        """Close per-loop graph clients, then stop the loop."""
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            from roscoe.core.graphiti_client import close_graphiti
+            self.run(close_graphiti(), timeout=timeout)
+        except Exception as e:
+            logger.debug(f"[ASYNC BRIDGE] Error closing graph clients: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+
+_bridge = BackgroundLoop()
+atexit.register(_bridge.shutdown)
+
+
+def get_bridge() -> BackgroundLoop:
+    """Get the process-wide background loop."""
+    return _bridge
+
+
+def run_sync(coro: Awaitable, timeout: Optional[float] = DEFAULT_TIMEOUT) -> Any:
+    """Run a coroutine to completion from sync code on the shared background loop."""
+    return _bridge.run(coro, timeout=timeout)
+
+
+class AsyncOnce:
+    """
+    Run an async one-time setup (index creation, schema backfill) once per process.
+
+    Concurrent callers await the same in-flight run, so nobody proceeds before
+    the setup has finished. The setup returns True on success; on False or an
+    exception it is retried by the first caller after `retry_interval` seconds
+    instead of being marked done.
+    """
+
+    def __init__(self, setup, retry_interval: float = 60.0):
+        self._setup = setup
+        self.retry_interval = retry_interval
+        self._done = False
+        self._failed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    async def _run(self) -> bool:
+        try:
+            self._done = bool(await self._setup())
+        finally:
+            self._failed_at = None if self._done else time.monotonic()
+        return self._done
+
+    async def __call__(self) -> bool:
+        """Run (or join) the setup; returns whether it has succeeded."""
+        if self._done:
+            return True
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._task
+            if task is not None and task.done() and self._failed_at is not None \
+                    and time.monotonic() - self._failed_at < self.retry_interval:
+                return False
+            # A failed run (or one on another event loop) starts over
+            if task is None or task.done() or task.get_loop() is not loop:
+                task = self._task = loop.create_task(self._run())
+        # Shielded so one cancelled caller doesn't abort the setup for the rest
+        return await asyncio.shield(task)
+
+    def reset(self):
+        """Force the setup to run again on the next call."""
+        self._done = False
+        self._failed_at = None
+        self._task = None
@@ -3,12 +3,22 @@ CaptureMiddleware - Automatic capture detection and classification.
 
 Detects tasks, ideas, interactions, and notes from user messages.
 Creates CaptureLog audit trail and entity nodes in FalkorDB.
+
+Capture detection runs off the critical path: awrap_model_call only enqueues
+the latest human message (keyed by message id, or a content hash when there
+is none) and goes straight to the model. Each message is classified once,
+however many model calls its tool loop makes. Background workers classify
+from a bounded queue, and the resulting entities + CaptureLogs are written
+to the graph in batches (one round trip per batch).
 """
 import json
 import re
+import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain.agents.middleware import AgentMiddleware
 from langchain_anthropic import ChatAnthropic
@@ -56,6 +66,13 @@ Return ONLY valid JSON:
   }}
 }}'''
 
+# Background pipeline limits
+CLASSIFY_QUEUE_SIZE = 100      # Pending messages; new ones are skipped when full
+CLASSIFY_WORKERS = 2           # Concurrent LLM classifications
+WRITE_BATCH_SIZE = 20          # Captures per graph round trip
+WRITE_BATCH_WAIT = 0.5         # Seconds to gather more captures into a batch
+SEEN_MESSAGES_MAX = 2048       # Message keys remembered for de-duplication
+
 
 class CaptureMiddleware(AgentMiddleware):
     """
@@ -81,6 +98,12 @@ class CaptureMiddleware(AgentMiddleware):
         """
         self.confidence_threshold = confidence_threshold
         self._llm = None  # Lazy init to avoid pickle issues
+        # Background pipeline, also created lazily (bound to the running loop)
+        self._loop = None
+        self._classify_queue = None
+        self._write_queue = None
+        self._workers = []
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
         logger.info(f"[CAPTURE] Initialized with threshold={confidence_threshold}")
         print("📥 CAPTURE MIDDLEWARE INITIALIZED", flush=True)
 
@@ -94,22 +117,37 @@ class CaptureMiddleware(AgentMiddleware):
             )
         return self._llm
 
+    @staticmethod
+    def _message_text(msg: HumanMessage) -> str:
+        content = msg.content
+        if isinstance(content, str):
+            return content
+        # Handle multimodal messages
+        text_parts = []
+        for block in content or []:
+            if isinstance(block, dict) and block.get('type') == 'text':
+                text_parts.append(block.get('text', ''))
+            elif isinstance(block, str):
+                text_parts.append(block)
+        return ' '.join(text_parts)
+
     def _extract_user_message(self, messages: List) -> Optional[str]:
         """Extract the latest user message content."""
+        latest = self._latest_user_message(messages)
+        return latest[1] if latest else None
+
+    def _latest_user_message(self, messages: List) -> Optional[Tuple[str, str]]:
+        """
+        Latest user message as (key, text).
+
+        The key is the message id when set, otherwise a hash of the text, so
+        the same human message seen again in a tool loop has the same key.
+        """
         for msg in reversed(messages):
             if isinstance(msg, HumanMessage):
-                content = msg.content
-                if isinstance(content, str):
-                    return content
-                elif isinstance(content, list):
-                    # Handle multimodal messages
-                    text_parts = []
-                    for block in content:
-                        if isinstance(block, dict) and block.get('type') == 'text':
-                            text_parts.append(block.get('text', ''))
-                        elif isinstance(block, str):
-                            text_parts.append(block)
-                    return ' '.join(text_parts)
+                text = self._message_text(msg)
+                key = msg.id or hashlib.sha1(text.encode('utf-8')).hexdigest()
+                return key, text
         return None
 
     async def _classify_message(self, message: str) -> Optional[Dict]:
@@ -169,8 +207,20 @@ class CaptureMiddleware(AgentMiddleware):
         Returns:
             Entity ID if created, None on failure
         """
-        from roscoe.core.graphiti_client import run_cypher_query
+        category, props = self._build_entity(classification, raw_text)
+        entity_id = props["id"]
 
+        try:
+            await self._write_batch([(category, props)], [])
+            logger.info(f"[CAPTURE] Created entity: {entity_id}")
+            return entity_id
+        except Exception as e:
+            logger.error(f"[CAPTURE] Failed to create entity: {e}", exc_info=True)
+            return None
+
+    @staticmethod
+    def _build_entity(classification: Dict, raw_text: str) -> Tuple[str, Dict]:
+        """Build (label, properties) for the entity node of a classification."""
         category = classification['category']
         data = classification.get('extracted_data', {}) or {}
         entity_id = f"{category}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
@@ -215,38 +265,54 @@ class CaptureMiddleware(AgentMiddleware):
                 "context": data.get("context", raw_text[:200])
             })
 
-        # Remove None values
-        props = {k: v for k, v in props.items() if v is not None}
-
-        # Build property string for Cypher CREATE (FalkorDB doesn't support $props map)
-        prop_items = []
-        for key, value in props.items():
-            if isinstance(value, str):
-                # Escape quotes in strings
-                escaped_value = value.replace("'", "\\'").replace("\n", "\\n")
-                prop_items.append(f"{key}: '{escaped_value}'")
-            elif isinstance(value, (int, float)):
-                prop_items.append(f"{key}: {value}")
-            elif isinstance(value, bool):
-                prop_items.append(f"{key}: {str(value).lower()}")
-            else:
-                # For complex types, convert to string
-                escaped_value = str(value).replace("'", "\\'")
-                prop_items.append(f"{key}: '{escaped_value}'")
-
-        props_str = ", ".join(prop_items)
-
-        # Create entity node
-        query = f"CREATE (e:{category} {{{props_str}}}) RETURN e.id as id"
-        try:
-            result = await run_cypher_query(query)
-            if result and len(result) > 0:
-                logger.info(f"[CAPTURE] Created entity: {entity_id}")
-                return entity_id
-            return None
-        except Exception as e:
-            logger.error(f"[CAPTURE] Failed to create entity: {e}", exc_info=True)
-            return None
+        # Remove None values; complex types are stored as strings
+        return category, {
+            k: v if isinstance(v, (str, int, float, bool)) else str(v)
+            for k, v in props.items() if v is not None
+        }
+
+    @staticmethod
+    async def _write_batch(entities: List[Tuple[str, Dict]], logs: List[Dict]) -> None:
+        """
+        Create capture entities and CaptureLogs in one parameterized query.
+
+        Entities are grouped by label and property keys (FalkorDB doesn't
+        support a $props map in CREATE), and each group is one UNWIND/CREATE
+        clause. The groups are chained with WITH so the whole batch is a
+        single round trip.
+        """
+        from roscoe.core.graphiti_client import run_cypher_query
+
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[Dict]] = {}
+        for category, props in entities:
+            groups.setdefault((category, tuple(sorted(props))), []).append(props)
+
+        clauses = []
+        params: Dict[str, Any] = {}
+        for i, ((category, keys), rows) in enumerate(groups.items()):
+            props_str = ", ".join(f"{k}: row.{k}" for k in keys)
+            clauses.append(f"UNWIND $entities_{i} AS row CREATE (:{category} {{{props_str}}})")
+            params[f"entities_{i}"] = rows
+        if logs:
+            clauses.append("""
+        UNWIND $logs AS row
+        CREATE (:CaptureLog {
+            id: row.log_id,
+            raw_text: row.raw_text,
+            category: row.category,
+            confidence: row.confidence,
+            confidence_reason: row.confidence_reason,
+            status: row.status,
+            entity_id: row.entity_id,
+            correction_count: 0,
+            captured_at: timestamp()
+        })""")
+            params["logs"] = logs
+        if not clauses:
+            return
+
+        query = "\nWITH count(*) AS _\n".join(clauses) + "\nRETURN count(*) AS created"
+        await run_cypher_query(query, params)
 
     async def _create_capture_log(
         self,
@@ -265,87 +331,157 @@ class CaptureMiddleware(AgentMiddleware):
         Returns:
             CaptureLog ID
         """
-        from roscoe.core.graphiti_client import run_cypher_query
-
-        log_id = f"CaptureLog_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-        confidence = classification.get('confidence', 0.5)
-        status = 'filed' if confidence >= self.confidence_threshold else 'needs_review'
-
-        query = """
-        CREATE (log:CaptureLog {
-            id: $log_id,
-            raw_text: $raw_text,
-            category: $category,
-            confidence: $confidence,
-            confidence_reason: $confidence_reason,
-            status: $status,
-            entity_id: $entity_id,
-            correction_count: 0,
-            captured_at: timestamp()
-        })
-        RETURN log.id as id
-        """
+        row = self._build_capture_log(raw_text, classification, entity_id)
 
         try:
-            await run_cypher_query(query, {
-                "log_id": log_id,
-                "raw_text": raw_text[:1000],
-                "category": classification.get('category', 'NONE'),
-                "confidence": confidence,
-                "confidence_reason": classification.get('confidence_reason', ''),
-                "status": status,
-                "entity_id": entity_id
-            })
-            logger.info(f"[CAPTURE] Created log: {log_id} (status={status})")
-            return log_id
+            await self._write_batch([], [row])
+            logger.info(f"[CAPTURE] Created log: {row['log_id']} (status={row['status']})")
+            return row['log_id']
         except Exception as e:
             logger.error(f"[CAPTURE] Failed to create log: {e}", exc_info=True)
             return None
 
-    def wrap_model_call(self, request, handler):
-        """Synchronous passthrough - captures handled in async mode."""
-        return handler(request)
+    def _build_capture_log(self, raw_text: str, classification: Dict, entity_id: Optional[str]) -> Dict:
+        """Build the CaptureLog row written by _write_batch."""
+        confidence = classification.get('confidence', 0.5)
+        return {
+            "log_id": f"CaptureLog_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
+            "raw_text": raw_text[:1000],
+            "category": classification.get('category', 'NONE'),
+            "confidence": confidence,
+            "confidence_reason": classification.get('confidence_reason', ''),
+            "status": 'filed' if confidence >= self.confidence_threshold else 'needs_review',
+            "entity_id": entity_id,
+        }
 
-    async def awrap_model_call(self, request, handler):
+    # =========================================================================
+    # Background pipeline
+    # =========================================================================
+
+    def _ensure_pipeline(self):
+        """Start the queues and worker tasks on the running event loop (once per loop)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._classify_queue = asyncio.Queue(maxsize=CLASSIFY_QUEUE_SIZE)
+        self._write_queue = asyncio.Queue()
+        self._workers = [
+            loop.create_task(self._classify_worker()) for _ in range(CLASSIFY_WORKERS)
+        ]
+        self._workers.append(loop.create_task(self._write_worker()))
+
+    def _submit(self, key: str, message: str) -> bool:
         """
-        Check for captures in user message before model call.
+        Queue a message for classification unless it was already submitted.
 
-        This runs on every model invocation. It:
-        1. Extracts the latest user message
-        2. Classifies it via LLM
-        3. If capture detected, creates entity + audit log
-        4. Continues to next middleware (does not short-circuit)
+        Returns:
+            True if queued, False if a duplicate or the queue is full
         """
-        try:
-            message = self._extract_user_message(list(request.messages))
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return False
 
-            if message and len(message.strip()) >= 10:
+        self._ensure_pipeline()
+        try:
+            self._classify_queue.put_nowait((key, message))
+        except asyncio.QueueFull:
+            # Not marked as seen, so a later model call can retry it
+            logger.warning("[CAPTURE] Classification queue full - skipping message for now")
+            return False
+
+        self._seen[key] = None
+        while len(self._seen) > SEEN_MESSAGES_MAX:
+            self._seen.popitem(last=False)
+        return True
+
+    async def _classify_worker(self):
+        while True:
+            key, message = await self._classify_queue.get()
+            try:
                 classification = await self._classify_message(message)
-
                 if (classification and
                     classification.get('is_capture') and
-                    classification.get('category') not in ['NONE', None]):
-
-                    category = classification['category']
-                    confidence = classification.get('confidence', 0)
+                    classification.get('category') in CAPTURE_CATEGORIES):
 
                     logger.info(
-                        f"[CAPTURE] Detected: {category} "
-                        f"(confidence: {confidence:.2f})"
+                        f"[CAPTURE] Detected: {classification['category']} "
+                        f"(confidence: {classification.get('confidence', 0):.2f})"
                     )
+                    self._write_queue.put_nowait((message, classification))
+            except Exception as e:
+                logger.error(f"[CAPTURE] Error in capture detection: {e}", exc_info=True)
+            finally:
+                self._classify_queue.task_done()
+
+    async def _write_worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_queue.get()]
+
+            # Gather whatever else arrives shortly into the same round trip
+            deadline = loop.time() + WRITE_BATCH_WAIT
+            while len(batch) < WRITE_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._write_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush_captures(batch)
+            except Exception as e:
+                logger.error(f"[CAPTURE] Failed to write {len(batch)} captures: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    async def _flush_captures(self, batch: List[Tuple[str, Dict]]):
+        """Write a batch of (message, classification) captures in one query."""
+        entities = []
+        logs = []
+        for message, classification in batch:
+            category, props = self._build_entity(classification, message)
+            entities.append((category, props))
+            logs.append(self._build_capture_log(message, classification, props["id"]))
+
+        await self._write_batch(entities, logs)
+
+        for log in logs:
+            print(f"📥 [CAPTURE] {log['category']} ({log['status']})", flush=True)
+        logger.info(f"[CAPTURE] Wrote {len(batch)} captures")
+
+    async def drain(self):
+        """Wait until every queued message is classified and written (tests, shutdown)."""
+        if self._classify_queue is not None:
+            await self._classify_queue.join()
+            await self._write_queue.join()
 
-                    # Create entity in graph
-                    entity_id = await self._write_to_graph(classification, message)
+    def wrap_model_call(self, request, handler):
+        """Synchronous passthrough - captures handled in async mode."""
+        return handler(request)
+
+    async def awrap_model_call(self, request, handler):
+        """
+        Queue the latest user message for capture detection, then call the model.
 
-                    # Create audit log
-                    await self._create_capture_log(message, classification, entity_id)
+        This runs on every model invocation but never waits on classification:
+        1. Extracts the latest user message and its key (id or content hash)
+        2. Queues it for background classification if not seen before
+        3. Workers classify it and batch-write entity + audit log to the graph
+        4. Continues to next middleware immediately (does not short-circuit)
+        """
+        try:
+            latest = self._latest_user_message(list(request.messages))
 
-                    status = 'filed' if confidence >= self.confidence_threshold else 'needs_review'
-                    print(f"📥 [CAPTURE] {category} ({status})", flush=True)
+            if latest and len(latest[1].strip()) >= 10:
+                self._submit(*latest)
 
         except Exception as e:
             # Don't fail the request if capture detection fails
             logger.error(f"[CAPTURE] Error in capture detection: {e}", exc_info=True)
 
         # Always continue to next handler
-        return await handler(request)
\ No newline at end of file
+        return await handler(request)
@@ -0,0 +1,199 @@
+"""
+Case-Scoped Caches with Write-Through Invalidation
+
+Small in-process caches for data derived from one case's subgraph (case
+context, workflow state, ...), plus a single invalidation entry point that
+graph write paths call after mutating a case.
+
+CaseCache:
+- Keyed by case name, so every thread/conversation discussing the same case
+  shares one entry
+- LRU size bound and per-entry TTL, so a long-lived server never grows
+  without limit and stale data eventually ages out
+- Hit/miss/eviction/invalidation counters for diagnostics
+- Fill tokens: take fill_token() before reading the graph and pass it to
+  set(); the value is dropped if the case was invalidated in between, so a
+  read racing a write can't cache stale data for the whole TTL
+
+Write paths (graph_manager, write_entity, workflow updates) call
+invalidate_case(case_name) - or invalidate_case() when the affected case
+can't be determined - which clears the case from every registered cache.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class CaseCache:
+    """Thread-safe LRU + TTL cache keyed by case name."""
+
+    def __init__(self, name: str, maxsize: int = 256, ttl: float = 600.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # case -> (stored_at, value)
+        self._lock = threading.Lock()
+        # Invalidation sequence for fill tokens: last invalidation per case
+        # (bounded to maxsize), and a floor below which tokens are stale
+        self._write_seq = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._stale_floor = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, case_name: str, default: Any = None) -> Any:
+        """Return the cached value for a case, or default if missing/expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(case_name, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            stored_at, value = entry
+            if now - stored_at >= self.ttl:
+                del self._entries[case_name]
+                self.misses += 1
+                self.evictions += 1
+                return default
+            self._entries.move_to_end(case_name)
+            self.hits += 1
+            return value
+
+    def fill_token(self) -> int:
+        """Token to take before loading a value from the graph (see set)."""
+        with self._lock:
+            return self._write_seq
+
+    def set(self, case_name: str, value: Any, token: Optional[int] = None) -> bool:
+        """
+        Store a value for a case, evicting the least recently used entries.
+
+        With a fill token, the value is only stored if the case was not
+        invalidated since the token was taken.
+
+        Returns:
+            True if stored
+        """
+        with self._lock:
+            if token is not None and (
+                token < self._stale_floor or self._invalidated.get(case_name, 0) > token
+            ):
+                return False
+            self._entries[case_name] = (time.monotonic(), value)
+            self._entries.move_to_end(case_name)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, case_name: Optional[str] = None) -> None:
+        """Drop one case (or everything when case_name is None)."""
+        with self._lock:
+            self._write_seq += 1
+            if case_name is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._invalidated.clear()
+                self._stale_floor = self._write_seq
+                return
+            if self._entries.pop(case_name, None) is not None:
+                self.invalidations += 1
+            self._invalidated[case_name] = self._write_seq
+            self._invalidated.move_to_end(case_name)
+            while len(self._invalidated) > self.maxsize:
+                # Forgotten invalidations make every older token stale
+                _, seq = self._invalidated.popitem(last=False)
+                self._stale_floor = max(self._stale_floor, seq)
+
+    def __contains__(self, case_name: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(case_name)
+            return entry is not None and time.monotonic() - entry[0] < self.ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# =============================================================================
+# Registry + invalidation hooks
+# =============================================================================
+
+_registry: Dict[str, CaseCache] = {}
+_listeners: List[Callable[[Optional[str]], None]] = []
+_registry_lock = threading.Lock()
+
+
+def get_case_cache(name: str, maxsize: int = 256, ttl: float = 600.0) -> CaseCache:
+    """Get (or create) the named process-wide case cache."""
+    with _registry_lock:
+        cache = _registry.get(name)
+        if cache is None:
+            cache = CaseCache(name, maxsize=maxsize, ttl=ttl)
+            _registry[name] = cache
+        return cache
+
+
+def on_case_invalidated(listener: Callable[[Optional[str]], None]) -> None:
+    """Register a callback run by invalidate_case (for caches not built on CaseCache)."""
+    with _registry_lock:
+        _listeners.append(listener)
+
+
+def remove_case_invalidated_listener(listener: Callable[[Optional[str]], None]) -> None:
+    """Unregister a callback added with on_case_invalidated (no-op if absent)."""
+    with _registry_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+def invalidate_case(case_name: Optional[str] = None) -> None:
+    """
+    Invalidate cached data for a case after a graph write.
+
+    Args:
+        case_name: Case that was mutated, or None to clear every case
+            (use when the write can't be attributed to a single case)
+    """
+    with _registry_lock:
+        caches = list(_registry.values())
+        listeners = list(_listeners)
+    for cache in caches:
+        cache.invalidate(case_name)
+    for listener in listeners:
+        try:
+            listener(case_name)
+        except Exception as e:
+            logger.warning(f"[CASE CACHE] Invalidation listener failed: {e}")
+    logger.debug(f"[CASE CACHE] Invalidated {case_name or 'all cases'}")
+
+
+def get_case_cache_stats() -> List[Dict[str, Any]]:
+    """Stats for every registered case cache."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return [cache.stats() for cache in caches]
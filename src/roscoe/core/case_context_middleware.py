@@ -33,15 +33,13 @@ import asyncio
 import re
 import pytz
 import os
-
-try:
-    from rapidfuzz import fuzz, process
-except ImportError:
-    # Fallback to fuzzywuzzy if rapidfuzz not available
-    from fuzzywuzzy import fuzz, process
+import threading
+import time
 
 from langchain.agents.middleware import AgentMiddleware
 
+from roscoe.core.case_matcher import CaseMatcher
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
@@ -72,6 +70,12 @@ class CaseContextMiddleware(AgentMiddleware):
         workspace_dir: Path to workspace directory containing projects/ and Database/
         fuzzy_threshold: Minimum fuzzy match score (0-100) to consider a match (default: 80)
         max_cases: Maximum number of cases to inject context for (default: 1)
+        calendar_cache_ttl: Max seconds to reuse the calendar overview without a
+            local calendar write (default: 300)
+        context_cache_size: Max cases kept in the shared case context cache (default: 256)
+        context_cache_ttl: Seconds a cached case context stays fresh (default: 600)
+        caselist_refresh_interval: Seconds between background checks for new cases
+            (default: 60, 0 disables polling; case writes still trigger a refresh)
     """
 
     name: str = "case_context"  # Unique name required by LangChain middleware framework
@@ -84,6 +88,10 @@ class CaseContextMiddleware(AgentMiddleware):
         max_cases: int = 1,
         max_chunks: int = 2,
         chunk_threshold: float = 0.35,
+        calendar_cache_ttl: float = 300.0,
+        context_cache_size: int = 256,
+        context_cache_ttl: float = 600.0,
+        caselist_refresh_interval: float = 60.0,
     ):
         self.workspace_dir = Path(workspace_dir)
         self.projects_dir = self.workspace_dir / "projects"
@@ -93,17 +101,39 @@ class CaseContextMiddleware(AgentMiddleware):
         self.max_cases = max_cases
         self.max_chunks = max_chunks
         self.chunk_threshold = chunk_threshold
+        self.calendar_cache_ttl = calendar_cache_ttl
 
-        # Load caselist and build name mappings
-        self.caselist = self._load_caselist()
-        self.name_to_project = self._build_name_mapping()
+        # Load caselist and build name mappings + compiled matcher.
+        # Held as one tuple so a refresh swaps everything atomically.
+        self._case_index = self._build_case_index(self._load_caselist())
+        self._caselist_signature = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_pending = threading.Event()
+        self._closed = threading.Event()
 
         # Load context chunks manifest
         self.chunks_manifest = self._load_chunks_manifest()
 
-        # Cache for loaded case contexts per thread
-        # Key: (thread_id, case_name), Value: context dict
-        self._context_cache = {}
+        # Case context cache shared across threads (keyed by case name).
+        # Bounded LRU + TTL; graph writes call case_cache.invalidate_case().
+        from roscoe.core.case_cache import get_case_cache
+        self._context_cache = get_case_cache(
+            "case_context", maxsize=context_cache_size, ttl=context_cache_ttl
+        )
+
+        # Cached calendar overview: (key, loaded_at, text) - see _load_calendar_context
+        self._calendar_cache = None
+        self._calendar_lock = threading.Lock()
+
+        # Live caselist refresh: one worker thread serves pushes from case
+        # writes and the background poll until close()
+        from roscoe.core.case_cache import on_case_invalidated
+        on_case_invalidated(self._on_case_written)
+        self.caselist_refresh_interval = caselist_refresh_interval
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_worker, name="caselist-refresh", daemon=True
+        )
+        self._refresh_thread.start()
 
         print(f"🔥🔥🔥 CASE CONTEXT MIDDLEWARE INITIALIZED - {len(self.caselist)} cases from graph, {len(self.chunks_manifest.get('chunks', []))} chunks loaded 🔥🔥🔥", flush=True)
         logger.info(f"[CASE CONTEXT] Initialized with {len(self.caselist)} cases from graph and {len(self.chunks_manifest.get('chunks', []))} context chunks")
@@ -129,6 +159,33 @@ class CaseContextMiddleware(AgentMiddleware):
 """
 
     def _load_calendar_context(self) -> str:
+        """
+        Calendar overview for the system prompt, cached across model calls.
+
+        The cached text is keyed by (today's date, calendar write generation),
+        so it is rebuilt only when the day rolls over or graph_manager writes a
+        calendar event. A TTL backstop covers writes from other processes.
+        """
+        from roscoe.core.graph_manager import get_calendar_generation
+
+        eastern = pytz.timezone('America/New_York')
+        key = (datetime.now(eastern).strftime("%Y-%m-%d"), get_calendar_generation())
+        now = time.monotonic()
+
+        with self._calendar_lock:
+            cached = self._calendar_cache
+            if cached and cached[0] == key and now - cached[1] < self.calendar_cache_ttl:
+                return cached[2]
+
+        text = self._query_calendar_context()
+        if text is None:
+            return ""  # Don't cache failures
+
+        with self._calendar_lock:
+            self._calendar_cache = (key, now, text)
+        return text
+
+    def _query_calendar_context(self) -> Optional[str]:
         """
         Load today's tasks and overdue items from the knowledge graph.
 
@@ -136,7 +193,8 @@ class CaseContextMiddleware(AgentMiddleware):
         - Today's tasks: date == today AND status == "pending"
         - Overdue: date < today AND status == "pending"
 
-        Returns formatted markdown for injection into system prompt.
+        Returns formatted markdown for injection into system prompt,
+        or None if the graph query failed.
         """
         try:
             from roscoe.core.graph_manager import get_overdue_and_today_events_sync
@@ -208,7 +266,7 @@ class CaseContextMiddleware(AgentMiddleware):
 
         except Exception as e:
             logger.error(f"[CALENDAR] Error loading calendar from graph: {e}")
-            return ""
+            return None
 
     def _inject_datetime(self, request) -> Any:
         """Inject current datetime and calendar context at the start of the system message."""
@@ -232,31 +290,46 @@ class CaseContextMiddleware(AgentMiddleware):
         
         return request.override(messages=messages)
 
+    # Cases created by graph_manager.create_case use :Entity {entity_type: 'Case'},
+    # older ingests use the :Case label - the caselist covers both.
+    _CASELIST_QUERY = """
+        MATCH (c:Case)
+        OPTIONAL MATCH (c)-[:HAS_CLIENT]->(client:Client)
+        RETURN c.name as project_name, client.name as client_name
+        UNION
+        MATCH (c:Entity {entity_type: 'Case'})
+        OPTIONAL MATCH (c)-[:HAS_CLIENT]->(client:Entity {entity_type: 'Client'})
+        RETURN c.name as project_name, client.name as client_name
+    """
+
+    _CASELIST_SIGNATURE_QUERY = """
+        MATCH (c:Case) RETURN count(c) as n
+        UNION ALL
+        MATCH (c:Entity {entity_type: 'Case'}) RETURN count(c) as n
+    """
+
+    def _query_caselist(self) -> List[Dict]:
+        """Query cases from FalkorDB (raises on failure)."""
+        from roscoe.core.async_bridge import run_sync
+        from roscoe.core.graphiti_client import run_cypher_query
+
+        # Run async query synchronously on the shared background loop
+        results = run_sync(run_cypher_query(self._CASELIST_QUERY, {}), timeout=30)
+
+        # A case with both labels shows up in both halves of the UNION
+        cases = []
+        seen = set()
+        for r in results:
+            key = (r.get("project_name"), r.get("client_name"))
+            if r.get("project_name") and key not in seen:
+                seen.add(key)
+                cases.append({"project_name": key[0], "client_name": key[1]})
+        return cases
+
     def _load_caselist(self) -> List[Dict]:
         """Load cases from FalkorDB knowledge graph."""
         try:
-            import concurrent.futures
-
-            async def _query_cases():
-                from roscoe.core.graphiti_client import run_cypher_query
-
-                query = """
-                    MATCH (c:Case)
-                    OPTIONAL MATCH (c)-[:HAS_CLIENT]->(client:Client)
-                    RETURN c.name as project_name, client.name as client_name
-                """
-                results = await run_cypher_query(query, {})
-                return [
-                    {"project_name": r.get("project_name"), "client_name": r.get("client_name")}
-                    for r in results
-                    if r.get("project_name")
-                ]
-
-            # Run async query synchronously
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, _query_cases())
-                cases = future.result(timeout=30)
-
+            cases = self._query_caselist()
             logger.info(f"[CASE CONTEXT] Loaded {len(cases)} cases from knowledge graph")
             return cases
 
@@ -273,7 +346,106 @@ class CaseContextMiddleware(AgentMiddleware):
                     pass
             return []
 
-    def _build_name_mapping(self) -> Dict[str, str]:
+    def _build_case_index(self, caselist: List[Dict]) -> tuple:
+        """Build (caselist, name_to_project, matcher) for an atomic swap."""
+        name_to_project = self._build_name_mapping(caselist)
+        return (caselist, name_to_project, CaseMatcher(caselist, name_to_project))
+
+    @property
+    def caselist(self) -> List[Dict]:
+        return self._case_index[0]
+
+    @property
+    def name_to_project(self) -> Dict[str, str]:
+        return self._case_index[1]
+
+    @property
+    def _matcher(self) -> CaseMatcher:
+        return self._case_index[2]
+
+    def refresh_caselist(self) -> int:
+        """
+        Reload the caselist from the graph and swap in a new name index.
+
+        Model calls keep using the previous index until the new one is fully
+        built. On a graph error the current index is kept.
+
+        Returns:
+            Number of cases now known
+        """
+        with self._refresh_lock:
+            try:
+                caselist = self._query_caselist()
+            except Exception as e:
+                logger.error(f"[CASE CONTEXT] Caselist refresh failed, keeping current index: {e}")
+                return len(self.caselist)
+
+            previous = len(self.caselist)
+            self._case_index = self._build_case_index(caselist)
+            if len(caselist) != previous:
+                logger.info(f"[CASE CONTEXT] Caselist refreshed: {previous} -> {len(caselist)} cases")
+            return len(caselist)
+
+    def request_caselist_refresh(self):
+        """Refresh the caselist in the background (coalesces concurrent requests)."""
+        self._refresh_pending.set()
+
+    def close(self):
+        """Stop the refresh worker and unregister the case write listener."""
+        from roscoe.core.case_cache import remove_case_invalidated_listener
+        remove_case_invalidated_listener(self._on_case_written)
+        self._closed.set()
+        self._refresh_pending.set()  # Wake the worker so it exits
+        if self._refresh_thread is not threading.current_thread():
+            self._refresh_thread.join(timeout=5)
+
+    def _on_case_written(self, case_name: Optional[str]):
+        """case_cache listener: a write to an unknown case means a new case exists."""
+        if case_name and self._matcher.get_case(case_name) is None:
+            self.request_caselist_refresh()
+
+    def _refresh_worker(self):
+        """
+        Background loop: refresh on request, and poll the graph's case counts
+        every caselist_refresh_interval seconds (0 disables polling).
+
+        The pending flag is cleared before each refresh, so a request arriving
+        mid-refresh triggers another pass instead of being lost.
+        """
+        interval = self.caselist_refresh_interval
+        next_poll = time.monotonic() + interval if interval > 0 else None
+
+        while not self._closed.is_set():
+            timeout = None if next_poll is None else max(0.0, next_poll - time.monotonic())
+            requested = self._refresh_pending.wait(timeout=timeout)
+            if self._closed.is_set():
+                break
+
+            if requested:
+                self._refresh_pending.clear()
+                self.refresh_caselist()
+            elif next_poll is not None:
+                self._poll_caselist()
+                next_poll = time.monotonic() + interval
+
+    def _poll_caselist(self):
+        """Refresh when the graph's case counts changed since the last poll."""
+        from roscoe.core.async_bridge import run_sync
+        from roscoe.core.graphiti_client import run_cypher_query
+
+        try:
+            rows = run_sync(run_cypher_query(self._CASELIST_SIGNATURE_QUERY, {}), timeout=10)
+            signature = tuple(r.get("n") for r in rows)
+        except Exception as e:
+            logger.debug(f"[CASE CONTEXT] Caselist poll failed: {e}")
+            return
+
+        # First poll also refreshes, covering cases created since startup
+        if signature != self._caselist_signature:
+            self.refresh_caselist()
+        self._caselist_signature = signature
+
+    def _build_name_mapping(self, caselist: Optional[List[Dict]] = None) -> Dict[str, str]:
         """
         Build mapping from client names to project names.
 
@@ -284,7 +456,7 @@ class CaseContextMiddleware(AgentMiddleware):
         - Extracted from project_name if client_name missing
         """
         mapping = {}
-        for case in self.caselist:
+        for case in (self.caselist if caselist is None else caselist):
             project_name = case.get("project_name", "")
             client_name = case.get("client_name", "")
 
@@ -489,100 +661,24 @@ class CaseContextMiddleware(AgentMiddleware):
         """
         Detect client/case mentions in user query using fuzzy matching.
 
+        Uses the CaseMatcher compiled from the caselist, so cost doesn't grow
+        with the number of cases.
+
         Returns list of detected cases with match info.
         """
-        if not user_query or not self.caselist:
+        # Read the index once so a concurrent refresh can't swap it mid-detection
+        caselist, _, matcher = self._case_index
+        if not user_query or not caselist:
             return []
 
-        detected_cases = []
         query_lower = user_query.lower()
 
         # Remove common punctuation for matching
         query_cleaned = re.sub(r"['\"]s?\b", "", query_lower)  # Remove possessives
         query_cleaned = re.sub(r"[.,!?;:]", " ", query_cleaned)
 
-        # Build list of all searchable names
-        all_names = list(self.name_to_project.keys())
-
-        # Try exact substring match first
-        for name, project in self.name_to_project.items():
-            if name in query_cleaned:
-                # Avoid matching very short names unless exact
-                if len(name) < 4 and name not in query_cleaned.split():
-                    continue
-
-                case_info = self._get_case_info(project)
-                if case_info and project not in [c.get('project_name') for c in detected_cases]:
-                    detected_cases.append({
-                        'project_name': project,
-                        'client_name': case_info.get('client_name', ''),
-                        'match_type': 'exact',
-                        'match_score': 100,
-                        'matched_term': name,
-                    })
-                    logger.info(f"[CASE CONTEXT] Exact match: '{name}' -> {project}")
-
-        # If no exact matches, try fuzzy matching on full client names
-        if not detected_cases:
-            # Extract potential name-like tokens from query (2+ words together)
-            words = query_cleaned.split()
-            potential_names = []
-
-            # Single words that might be last names
-            for word in words:
-                if len(word) >= 4:
-                    potential_names.append(word)
-
-            # Pairs of words that might be full names
-            for i in range(len(words) - 1):
-                potential_names.append(f"{words[i]} {words[i+1]}")
-
-            # Get all client full names for fuzzy matching
-            client_names = [(c.get('client_name') or '').lower() for c in self.caselist if c.get('client_name')]
-
-            for potential in potential_names:
-                if len(potential) < 4:
-                    continue
-
-                # Fuzzy match against client names
-                matches = process.extract(potential, client_names, scorer=fuzz.ratio, limit=3)
-
-                for match_name, score, _ in matches:
-                    if score >= self.fuzzy_threshold:
-                        # Find the project for this client
-                        for case in self.caselist:
-                            client_name = case.get('client_name') or ''
-                            if client_name.lower() == match_name:
-                                project = case.get('project_name')
-                                if project and project not in [c.get('project_name') for c in detected_cases]:
-                                    detected_cases.append({
-                                        'project_name': project,
-                                        'client_name': client_name,
-                                        'match_type': 'fuzzy',
-                                        'match_score': score,
-                                        'matched_term': potential,
-                                    })
-                                    logger.info(f"[CASE CONTEXT] Fuzzy match: '{potential}' -> {project} (score: {score})")
-                                break
-
-        # Also check for project name patterns (e.g., "Wilson MVA", "Caryn-McCay-MVA-7-30-2023")
-        for case in self.caselist:
-            project = case.get('project_name', '')
-            if not project:
-                continue
-
-            # Check if project name or parts appear in query
-            project_lower = project.lower()
-            if project_lower in query_cleaned.replace('-', ' ').replace('_', ' '):
-                if project not in [c.get('project_name') for c in detected_cases]:
-                    detected_cases.append({
-                        'project_name': project,
-                        'client_name': case.get('client_name', ''),
-                        'match_type': 'project_name',
-                        'match_score': 100,
-                        'matched_term': project,
-                    })
-                    logger.info(f"[CASE CONTEXT] Project name match: {project}")
+        # Exact names, fuzzy fallback and project names via the compiled matcher
+        detected_cases = matcher.match(query_cleaned, self.fuzzy_threshold)
 
         # Sort by match score and limit
         detected_cases.sort(key=lambda x: x['match_score'], reverse=True)
@@ -590,21 +686,19 @@ class CaseContextMiddleware(AgentMiddleware):
 
     def _get_case_info(self, project_name: str) -> Optional[Dict]:
         """Get basic case info from caselist."""
-        for case in self.caselist:
-            if case.get('project_name') == project_name:
-                return case
-        return None
+        return self._matcher.get_case(project_name)
 
     async def _load_case_context_from_graph(self, project_name: str) -> Dict[str, Any]:
         """
-        Load case context from FalkorDB knowledge graph using direct Cypher queries.
+        Load case context from FalkorDB knowledge graph in a single round trip.
 
-        Uses relationship-based queries to get structured case data from the unified graph.
+        Uses get_case_snapshot (one composite Cypher query) to fetch the case,
+        client, insurance, providers, liens and litigation at once.
         Returns a structured dict with case overview, insurance, providers, liens, etc.
         """
         
         try:
-            from roscoe.core.graphiti_client import run_cypher_query
+            from roscoe.core.graphiti_client import get_case_snapshot
             
             context = {
                 'overview': {},
@@ -616,53 +710,34 @@ class CaseContextMiddleware(AgentMiddleware):
                 'litigation': [],
             }
             
-            # Get case and client info
-            case_query = """
-                MATCH (case:Case {name: $case_name})
-                OPTIONAL MATCH (case)-[:HAS_CLIENT]->(client:Client)
-                RETURN case.name as case_name, case.case_type as case_type,
-                       client.name as client_name, client.phone as client_phone, client.email as client_email
-                LIMIT 1
-            """
-            case_results = await run_cypher_query(case_query, {"case_name": project_name})
-            if case_results:
-                r = case_results[0]
-                context['overview'] = {
-                    'case_name': r.get('case_name'),
-                    'case_type': r.get('case_type'),
-                }
-                context['client'] = {
-                    'name': r.get('client_name'),
-                    'phone': r.get('client_phone'),
-                    'email': r.get('client_email'),
-                }
+            snapshot = await get_case_snapshot(
+                project_name,
+                sections=["client", "claims", "providers", "liens", "litigation"],
+            )
+            if not snapshot:
+                logger.info(f"[GRAPHITI] No case node found for {project_name}")
+                return context
+
+            # Case and client info
+            context['overview'] = {
+                'case_name': snapshot.get('case_name'),
+                'case_type': snapshot.get('case_type'),
+            }
+            client = snapshot.get('client') or {}
+            context['client'] = {
+                'name': client.get('name'),
+                'phone': client.get('phone'),
+                'email': client.get('email'),
+            }
             
-            # Get insurance claims with policies, insurers and adjusters
-            insurance_query = """
-                MATCH (case:Case {name: $case_name})-[:HAS_CLAIM]->(claim)
-                WHERE claim:BIClaim OR claim:PIPClaim OR claim:UMClaim OR claim:UIMClaim OR claim:WCClaim
-                OPTIONAL MATCH (claim)-[:UNDER_POLICY]->(policy:InsurancePolicy)
-                OPTIONAL MATCH (policy)-[:WITH_INSURER]->(insurer:Insurer)
-                OPTIONAL MATCH (claim)-[:HANDLED_BY]->(adjuster:Adjuster)
-                RETURN claim.claim_number as claim_number,
-                       labels(claim)[0] as claim_type,
-                       policy.policy_number as policy_number,
-                       insurer.name as insurer_name,
-                       adjuster.name as adjuster_name,
-                       adjuster.phone as adjuster_phone,
-                       adjuster.email as adjuster_email,
-                       policy.bi_limit as bi_limit,
-                       policy.pip_limit as pip_limit,
-                       policy.um_limit as um_limit,
-                       claim.status as claim_status,
-                       claim.amount_demanded as demand_amount,
-                       claim.amount_offered as current_offer
-            """
-            insurance_results = await run_cypher_query(insurance_query, {"case_name": project_name})
-            for r in insurance_results:
+            # Insurance claims with policies, insurers and adjusters
+            for r in snapshot.get('claims') or []:
+                labels = r.get('labels') or []
+                if 'MedPayClaim' in labels:
+                    continue
                 context['insurance'].append({
                     'claim_number': r.get('claim_number'),
-                    'claim_type': r.get('claim_type'),
+                    'claim_type': labels[0] if labels else None,
                     'policy_number': r.get('policy_number'),
                     'insurer': r.get('insurer_name'),
                     'adjuster': r.get('adjuster_name'),
@@ -671,29 +746,13 @@ class CaseContextMiddleware(AgentMiddleware):
                     'bi_limit': r.get('bi_limit'),
                     'pip_limit': r.get('pip_limit'),
                     'um_limit': r.get('um_limit'),
-                    'status': r.get('claim_status'),
-                    'demand_amount': r.get('demand_amount'),
-                    'current_offer': r.get('current_offer'),
+                    'status': r.get('status'),
+                    'demand_amount': r.get('amount_demanded'),
+                    'current_offer': r.get('amount_offered'),
                 })
             
-            # Get medical providers using three-tier hierarchy (Client -TREATED_AT-> Facility/Location)
-            provider_query = """
-                MATCH (case:Case {name: $case_name})-[:HAS_CLIENT]->(client:Client)-[:TREATED_AT]->(provider)
-                WHERE provider:Facility OR provider:Location
-                OPTIONAL MATCH (provider)-[:PART_OF]->(parent)
-                WHERE parent:Facility OR parent:HealthSystem
-                OPTIONAL MATCH (parent)-[:PART_OF]->(grandparent:HealthSystem)
-                RETURN provider.name as name,
-                       labels(provider)[0] as provider_type,
-                       provider.specialty as specialty,
-                       provider.phone as phone,
-                       provider.fax as fax,
-                       provider.address as address,
-                       parent.name as parent_name,
-                       grandparent.name as health_system
-            """
-            provider_results = await run_cypher_query(provider_query, {"case_name": project_name})
-            for r in provider_results:
+            # Medical providers using three-tier hierarchy (Client -TREATED_AT-> Facility/Location)
+            for r in snapshot.get('providers') or []:
                 context['medical_providers'].append({
                     'name': r.get('name'),
                     'type': r.get('provider_type'),
@@ -705,30 +764,16 @@ class CaseContextMiddleware(AgentMiddleware):
                     'health_system': r.get('health_system') or (r.get('parent_name') if r.get('parent_name') and not r.get('health_system') else None),
                 })
             
-            # Get liens
-            lien_query = """
-                MATCH (case:Case {name: $case_name})-[:HAS_LIEN]->(lien:Lien)
-                OPTIONAL MATCH (lien)-[:HELD_BY]->(holder:LienHolder)
-                RETURN lien.name as lien_name, holder.name as holder_name,
-                       lien.lien_type as lien_type, lien.amount as amount
-            """
-            lien_results = await run_cypher_query(lien_query, {"case_name": project_name})
-            for r in lien_results:
+            # Liens
+            for r in snapshot.get('liens') or []:
                 context['liens'].append({
                     'holder': r.get('holder_name') or r.get('lien_name'),
                     'lien_type': r.get('lien_type'),
                     'amount': r.get('amount'),
                 })
             
-            # Get litigation contacts (attorneys, defendants)
-            litigation_query = """
-                MATCH (case:Case {name: $case_name})-[r]->(entity:Entity)
-                WHERE entity:Attorney OR entity:Defendant OR entity:Court
-                RETURN entity.name as name, entity.entity_type as entity_type,
-                       entity.role as role, entity.phone as phone, entity.email as email
-            """
-            litigation_results = await run_cypher_query(litigation_query, {"case_name": project_name})
-            for r in litigation_results:
+            # Litigation contacts (attorneys, defendants)
+            for r in snapshot.get('litigation') or []:
                 context['litigation'].append({
                     'name': r.get('name'),
                     'type': r.get('entity_type'),
@@ -1158,11 +1203,6 @@ class CaseContextMiddleware(AgentMiddleware):
             print("🧠 [GRAPH] Loading case context from FalkorDB...", flush=True)
             logger.info("[GRAPH] Loading case context from knowledge graph")
 
-            # Get thread_id from request config/state for caching
-            thread_id = None
-            if hasattr(request, 'config') and isinstance(request.config, dict):
-                thread_id = request.config.get('configurable', {}).get('thread_id')
-
             for case_info in detected_cases:
                 project_name = case_info['project_name']
                 client_name = case_info['client_name']
@@ -1170,12 +1210,10 @@ class CaseContextMiddleware(AgentMiddleware):
                 print(f"   📂 Processing case: {project_name} ({client_name})", flush=True)
                 logger.info(f"[GRAPH] Processing case: {project_name}")
 
-                # Check cache first
-                cache_key = (thread_id, project_name) if thread_id else None
-                graph_context = None
+                # Check cache first (shared across threads discussing the same case)
+                graph_context = self._context_cache.get(project_name)
 
-                if cache_key and cache_key in self._context_cache:
-                    graph_context = self._context_cache[cache_key]
+                if graph_context is not None:
                     print(f"   ✅ Using CACHED context for {project_name}", flush=True)
                     logger.info(f"[GRAPH] Using cached context for {project_name}")
                 else:
@@ -1184,11 +1222,11 @@ class CaseContextMiddleware(AgentMiddleware):
                         print(f"   🔄 Querying graph for {project_name}...", flush=True)
                         logger.info(f"[GRAPH] Querying graph: {project_name}")
 
+                        # Not cached if a write invalidates the case mid-load
+                        token = self._context_cache.fill_token()
                         graph_context = await self._load_case_context_from_graph(project_name)
 
-                        # Cache it if we have a thread_id
-                        if cache_key and graph_context:
-                            self._context_cache[cache_key] = graph_context
+                        if graph_context and self._context_cache.set(project_name, graph_context, token=token):
                             print(f"   💾 Cached context for future calls", flush=True)
 
                     except Exception as e:
@@ -0,0 +1,124 @@
+"""
+Case Identity: Name -> Node ID Resolution
+
+Case-scoped queries used to find their case with
+
+    OPTIONAL MATCH (c1:Case {name: $case_name})
+    OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
+    WITH COALESCE(c1, c2) as c
+
+which costs two lookups per query, and the COALESCE prevents a plan that
+starts from a single node. This module resolves the name once to FalkorDB's
+internal node id, and queries then start from an O(1) id seek:
+
+    MATCH (c) WHERE id(c) = $case_id AND c.name = $case_name
+
+- ensure_case_indexes(): indexes on Case(name) and Entity(entity_type, name)
+  so the one resolution per case is an index lookup (once per process)
+- resolve_case_id(case_name): cached in a CaseCache, so every graph write
+  path that calls invalidate_case() also drops the cached id
+- The name check in CASE_ANCHOR guards against FalkorDB reusing the id of a
+  deleted node
+"""
+
+import logging
+from typing import Optional
+
+from roscoe.core.async_bridge import AsyncOnce
+from roscoe.core.case_cache import get_case_cache
+
+logger = logging.getLogger(__name__)
+
+# Index statements (idempotent; "already indexed" errors are ignored)
+CASE_IDENTITY_INDEXES = [
+    "CREATE INDEX ON :Case(name)",
+    "CREATE INDEX ON :Entity(entity_type, name)",
+]
+
+# Anchor clauses for case-scoped queries (params: $case_id, $case_name)
+CASE_ANCHOR = "MATCH (c) WHERE id(c) = $case_id AND c.name = $case_name"
+OPTIONAL_CASE_ANCHOR = "OPTIONAL MATCH (c) WHERE id(c) = $case_id AND c.name = $case_name WITH c"
+
+# id(c) never matches a negative value, so unknown cases can still use the anchors
+MISSING_CASE_ID = -1
+
+_case_ids = get_case_cache("case_node_id", maxsize=4096, ttl=3600.0)
+
+
+async def _create_case_indexes() -> bool:
+    """Create CASE_IDENTITY_INDEXES; False if any could not be created."""
+    from roscoe.core.graphiti_client import is_already_indexed, run_cypher_query
+
+    ok = True
+    for statement in CASE_IDENTITY_INDEXES:
+        try:
+            await run_cypher_query(statement)
+            logger.info(f"[CASE ID] {statement}")
+        except Exception as e:
+            if not is_already_indexed(e):
+                logger.warning(f"[CASE ID] Could not run '{statement}': {e}")
+                ok = False
+    return ok
+
+
+_case_indexes = AsyncOnce(_create_case_indexes)
+
+
+async def ensure_case_indexes() -> None:
+    """Create the case lookup indexes (once per process; retried if creation failed)."""
+    await _case_indexes()
+
+
+async def resolve_case_id(case_name: str) -> Optional[int]:
+    """
+    Internal node id of a case (:Case label first, then :Entity {entity_type: 'Case'}).
+
+    Returns:
+        Node id, or None if the case does not exist (misses are not cached,
+        so a case created later is found on the next call)
+    """
+    case_id = _case_ids.get(case_name)
+    if case_id is not None:
+        return case_id
+
+    from roscoe.core.graphiti_client import run_cypher_query
+
+    await ensure_case_indexes()
+
+    results = await run_cypher_query("""
+    MATCH (c:Case {name: $case_name})
+    RETURN id(c) as id
+    LIMIT 1
+    """, {"case_name": case_name})
+    if not results:
+        results = await run_cypher_query("""
+        MATCH (c:Entity {entity_type: 'Case', name: $case_name})
+        RETURN id(c) as id
+        LIMIT 1
+        """, {"case_name": case_name})
+    if not results or results[0].get("id") is None:
+        return None
+
+    case_id = results[0]["id"]
+    _case_ids.set(case_name, case_id)
+    return case_id
+
+
+async def case_params(case_name: str, **params) -> dict:
+    """
+    Query parameters for the case anchors: case_name, case_id plus extras.
+
+    case_id is MISSING_CASE_ID for an unknown case, so CASE_ANCHOR matches
+    nothing and OPTIONAL_CASE_ANCHOR yields a null case.
+    """
+    case_id = await resolve_case_id(case_name)
+    return {
+        **params,
+        "case_name": case_name,
+        "case_id": MISSING_CASE_ID if case_id is None else case_id,
+    }
+
+
+def forget_case(case_name: Optional[str] = None) -> None:
+    """Drop a cached id (e.g. after deleting or renaming a case node)."""
+    _case_ids.invalidate(case_name)
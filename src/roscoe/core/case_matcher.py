@@ -0,0 +1,218 @@
+"""
+Precompiled Case Mention Matcher
+
+Compiled once per caselist (re)load and used by CaseContextMiddleware to find
+client/case mentions in a user message. Detection cost stays flat as the
+number of cases grows:
+
+- Exact names: an Aho-Corasick automaton over every client name key finds all
+  names occurring in the query in a single pass (same substring semantics as
+  checking `name in query` for each name, without the per-name scan)
+- Project names: a second automaton over normalized project names
+  ("Caryn-McCay-MVA-7-30-2023" -> "caryn mccay mva 7 30 2023")
+- Fuzzy fallback: every candidate word/bigram is scored against all client
+  names in ONE rapidfuzz process.cdist batch
+- Case lookup: dict index from project name to caselist entry
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+try:
+    from rapidfuzz import fuzz, process
+    _HAS_CDIST = hasattr(process, "cdist")
+    if _HAS_CDIST:
+        import numpy as np  # cdist returns a numpy score matrix
+except ImportError:
+    # Fallback to fuzzywuzzy if rapidfuzz not available (no batch scoring)
+    from fuzzywuzzy import fuzz, process
+    _HAS_CDIST = False
+
+logger = logging.getLogger(__name__)
+
+
+class AhoCorasick:
+    """Minimal Aho-Corasick automaton returning the ids of patterns found in a text."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pattern_id)
+
+        # Breadth-first pass to set failure links and merge outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+    def find(self, text: str) -> Set[int]:
+        """Return the ids of all patterns occurring anywhere in text."""
+        found: Set[int] = set()
+        state = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+def _normalize_project(name: str) -> str:
+    return name.lower().replace("-", " ").replace("_", " ")
+
+
+class CaseMatcher:
+    """
+    Case mention detector compiled from a caselist and its name mapping.
+
+    Args:
+        caselist: List of {"project_name", "client_name"} dicts
+        name_to_project: Lowercased name key -> project_name (insertion order = priority)
+    """
+
+    def __init__(self, caselist: List[Dict], name_to_project: Dict[str, str]):
+        self.case_by_project: Dict[str, Dict] = {}
+        for case in caselist:
+            project = case.get("project_name")
+            if project and project not in self.case_by_project:
+                self.case_by_project[project] = case
+
+        # Exact name automaton (pattern id = priority order of name_to_project)
+        self._names = list(name_to_project.keys())
+        self._name_projects = [name_to_project[n] for n in self._names]
+        self._name_automaton = AhoCorasick(self._names)
+
+        # Project name automaton over normalized project names
+        self._projects = list(self.case_by_project.keys())
+        self._project_automaton = AhoCorasick(_normalize_project(p) for p in self._projects)
+
+        # Fuzzy candidates: unique lowercased client names -> first matching case
+        self._client_cases: Dict[str, Dict] = {}
+        for case in caselist:
+            client_name = (case.get("client_name") or "").lower()
+            if client_name and client_name not in self._client_cases:
+                self._client_cases[client_name] = case
+        self._client_names = list(self._client_cases.keys())
+
+    def get_case(self, project_name: str) -> Optional[Dict]:
+        """O(1) caselist lookup by project name."""
+        return self.case_by_project.get(project_name)
+
+    def match(self, query_cleaned: str, fuzzy_threshold: int) -> List[Dict]:
+        """
+        Detect case mentions in a cleaned (lowercased, punctuation-stripped) query.
+
+        Returns detected cases (unsorted, unlimited) with match info.
+        """
+        detected: List[Dict] = []
+        seen: Set[str] = set()
+        words = query_cleaned.split()
+        word_set = set(words)
+
+        # Exact substring matches, in name priority order
+        for name_id in sorted(self._name_automaton.find(query_cleaned)):
+            name = self._names[name_id]
+            # Avoid matching very short names unless exact
+            if len(name) < 4 and name not in word_set:
+                continue
+            project = self._name_projects[name_id]
+            case_info = self.get_case(project)
+            if case_info and project not in seen:
+                seen.add(project)
+                detected.append({
+                    'project_name': project,
+                    'client_name': case_info.get('client_name', ''),
+                    'match_type': 'exact',
+                    'match_score': 100,
+                    'matched_term': name,
+                })
+                logger.info(f"[CASE CONTEXT] Exact match: '{name}' -> {project}")
+
+        # If no exact matches, try fuzzy matching on full client names
+        if not detected and self._client_names:
+            # Single words that might be last names, pairs that might be full names
+            potential_names = [w for w in words if len(w) >= 4]
+            potential_names += [f"{words[i]} {words[i + 1]}" for i in range(len(words) - 1)]
+            potential_names = [p for p in potential_names if len(p) >= 4]
+
+            for potential, match_name, score in self._fuzzy_candidates(potential_names, fuzzy_threshold):
+                case = self._client_cases[match_name]
+                project = case.get('project_name')
+                if project and project not in seen:
+                    seen.add(project)
+                    detected.append({
+                        'project_name': project,
+                        'client_name': case.get('client_name') or '',
+                        'match_type': 'fuzzy',
+                        'match_score': score,
+                        'matched_term': potential,
+                    })
+                    logger.info(f"[CASE CONTEXT] Fuzzy match: '{potential}' -> {project} (score: {score})")
+
+        # Project name patterns (e.g., "Caryn-McCay-MVA-7-30-2023")
+        normalized_query = query_cleaned.replace('-', ' ').replace('_', ' ')
+        for project_id in sorted(self._project_automaton.find(normalized_query)):
+            project = self._projects[project_id]
+            if project not in seen:
+                seen.add(project)
+                detected.append({
+                    'project_name': project,
+                    'client_name': self.case_by_project[project].get('client_name', ''),
+                    'match_type': 'project_name',
+                    'match_score': 100,
+                    'matched_term': project,
+                })
+                logger.info(f"[CASE CONTEXT] Project name match: {project}")
+
+        return detected
+
+    def _fuzzy_candidates(self, potential_names: List[str], threshold: int):
+        """Yield (potential, client_name, score) for the top 3 client names per candidate."""
+        if not potential_names:
+            return
+
+        if _HAS_CDIST:
+            # One batched score matrix: candidates x client names
+            scores = process.cdist(
+                potential_names, self._client_names, scorer=fuzz.ratio,
+                score_cutoff=threshold, workers=1,
+            )
+            for row, potential in enumerate(potential_names):
+                # Hits selected in numpy; only they (at most 3) reach Python
+                row_scores = scores[row]
+                hits = np.nonzero(row_scores >= threshold)[0]
+                if len(hits) > 3:
+                    hits = hits[np.argpartition(row_scores[hits], -3)[-3:]]
+                ranked = sorted(((float(row_scores[col]), int(col)) for col in hits), reverse=True)
+                for score, col in ranked:
+                    yield potential, self._client_names[col], score
+            return
+
+        for potential in potential_names:
+            for match_name, score, *_ in process.extract(potential, self._client_names, scorer=fuzz.ratio, limit=3):
+                if score >= threshold:
+                    yield potential, match_name, score
@@ -0,0 +1,230 @@
+"""
+Per-Case Episode Vector Index
+
+Batched semantic search over a case's Episode notes.
+
+Each case's episode embeddings are loaded once into a row-normalized float32
+matrix and scored against a query with a single matrix-vector product, instead
+of pulling every vector into Python on each search and scoring them one at a
+time.
+
+Freshness:
+- A cheap signature query (no vectors) is checked on every search: episode
+  count, newest created_at, newest updated_at and total content length, so
+  added, deleted and edited episodes reload the matrix (re-embedding writers
+  must stamp updated_at)
+- invalidate_case_episodes() is registered with case_cache, so any in-process
+  invalidate_case() after a graph write drops the case's matrix too
+
+Embeddings:
+- Episode vectors are written by scripts/ingest_episodes_with_embeddings.py
+  with sentence-transformers all-MiniLM-L6-v2 (384 dims), so queries are
+  encoded with the same model. If a case's vectors have another dimension,
+  the Graphiti embedder is used instead.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from roscoe.core.case_cache import on_case_invalidated
+from roscoe.core.case_identity import CASE_ANCHOR, case_params
+
+logger = logging.getLogger(__name__)
+
+EPISODE_EMBEDDING_MODEL = os.getenv("EPISODE_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+EPISODE_INDEX_MAX_CASES = int(os.getenv("EPISODE_INDEX_MAX_CASES", "64"))
+EPISODE_MIN_SIMILARITY = 0.3  # Relaxed from 0.5 for better recall
+
+
+_SIGNATURE_QUERY = f"""
+{CASE_ANCHOR}
+MATCH (e:Episode)-[:RELATES_TO]->(c)
+WHERE e.embedding IS NOT NULL
+RETURN count(e) as count,
+       max(e.created_at) as latest,
+       max(COALESCE(e.updated_at, e.created_at)) as updated,
+       sum(size(COALESCE(e.content, ''))) as content_size
+"""
+
+_EPISODES_QUERY = f"""
+{CASE_ANCHOR}
+MATCH (e:Episode)-[:RELATES_TO]->(c)
+WHERE e.embedding IS NOT NULL
+RETURN e.uuid as uuid, e.name as name, e.content as content, e.embedding as embedding, e.valid_at as valid_at
+"""
+
+
+@dataclass
+class CaseEpisodeMatrix:
+    """Normalized embedding matrix plus row metadata for one case."""
+
+    signature: tuple
+    matrix: np.ndarray  # (n_episodes, dim) float32, rows L2-normalized
+    rows: List[Dict[str, Any]]  # uuid/name/content/valid_at per matrix row
+
+    @property
+    def dim(self) -> int:
+        return self.matrix.shape[1] if self.matrix.size else 0
+
+    def top_k(self, query_vec: np.ndarray, k: int, min_similarity: float) -> List[Dict[str, Any]]:
+        """Score every episode in one matmul and return the best k above the threshold."""
+        if not self.rows or k <= 0:
+            return []
+
+        q = np.asarray(query_vec, dtype=np.float32).ravel()
+        norm = np.linalg.norm(q)
+        if norm == 0 or q.shape[0] != self.dim:
+            return []
+        scores = self.matrix @ (q / norm)
+
+        k = min(k, len(scores))
+        # argpartition is O(n); only the k winners get fully sorted
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for i in top:
+            similarity = float(scores[i])
+            if similarity < min_similarity:
+                break
+            row = self.rows[i]
+            results.append({
+                "similarity": similarity,
+                "fact": row.get("content") or "",
+                "name": row.get("name") or "",
+                "uuid": row.get("uuid"),
+                "valid_at": row.get("valid_at"),
+            })
+        return results
+
+
+def _build_matrix(signature: tuple, episodes: List[Dict[str, Any]]) -> CaseEpisodeMatrix:
+    """Stack episode vectors into a normalized float32 matrix (skipping malformed rows)."""
+    vectors = []
+    rows = []
+    dim = None
+    for ep in episodes:
+        emb = ep.get("embedding")
+        if emb is None or len(emb) == 0:
+            continue
+        vec = np.asarray(emb, dtype=np.float32)
+        if dim is None:
+            dim = vec.shape[0]
+        elif vec.shape[0] != dim:
+            logger.warning(f"[EPISODE INDEX] Skipping episode {ep.get('uuid')} with {vec.shape[0]}-dim embedding (expected {dim})")
+            continue
+        vectors.append(vec)
+        rows.append({k: ep.get(k) for k in ("uuid", "name", "content", "valid_at")})
+
+    if not vectors:
+        return CaseEpisodeMatrix(signature, np.zeros((0, 0), dtype=np.float32), [])
+
+    matrix = np.vstack(vectors)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return CaseEpisodeMatrix(signature, matrix, rows)
+
+
+# LRU of case_name -> CaseEpisodeMatrix (numpy arrays are loop-independent)
+_case_matrices: "OrderedDict[str, CaseEpisodeMatrix]" = OrderedDict()
+_case_matrices_lock = threading.Lock()
+
+_local_model = None
+_local_model_lock = threading.Lock()
+
+
+def _get_local_model():
+    """Lazily load the sentence-transformers model used for Episode embeddings."""
+    global _local_model
+    if _local_model is None:
+        with _local_model_lock:
+            if _local_model is None:
+                from sentence_transformers import SentenceTransformer
+                _local_model = SentenceTransformer(EPISODE_EMBEDDING_MODEL)
+                logger.info(f"[EPISODE INDEX] Loaded query embedding model {EPISODE_EMBEDDING_MODEL}")
+    return _local_model
+
+
+async def _embed_query(query: str, dim: int) -> Optional[np.ndarray]:
+    """Embed the query with whichever model produced vectors of this dimension."""
+    model = await asyncio.to_thread(_get_local_model)
+    if model.get_sentence_embedding_dimension() == dim:
+        return await asyncio.to_thread(model.encode, query, convert_to_numpy=True)
+
+    from roscoe.core.graphiti_client import get_graphiti
+    graphiti = await get_graphiti()
+    vec = np.asarray(await graphiti.embedder.create(query), dtype=np.float32)
+    if vec.shape[0] != dim:
+        logger.warning(f"[EPISODE INDEX] No query embedder matches {dim}-dim episode vectors")
+        return None
+    return vec
+
+
+async def get_case_episode_matrix(case_name: str) -> CaseEpisodeMatrix:
+    """Return the cached matrix for a case, reloading it if the signature changed."""
+    from roscoe.core.graphiti_client import run_cypher_query
+
+    params = await case_params(case_name)
+    sig_rows = await run_cypher_query(_SIGNATURE_QUERY, params)
+    signature = (
+        tuple(sig_rows[0].get(key) for key in ("count", "latest", "updated", "content_size"))
+        if sig_rows else (0, None, None, 0)
+    )
+
+    with _case_matrices_lock:
+        cached = _case_matrices.get(case_name)
+        if cached is not None and cached.signature == signature:
+            _case_matrices.move_to_end(case_name)
+            return cached
+
+    episodes = []
+    if signature[0]:
+        episodes = await run_cypher_query(
+            _EPISODES_QUERY, params, include_embeddings=True
+        )
+    entry = await asyncio.to_thread(_build_matrix, signature, episodes)
+    logger.info(f"[EPISODE INDEX] Loaded {len(entry.rows)} episode vectors for {case_name}")
+
+    with _case_matrices_lock:
+        _case_matrices[case_name] = entry
+        _case_matrices.move_to_end(case_name)
+        while len(_case_matrices) > EPISODE_INDEX_MAX_CASES:
+            _case_matrices.popitem(last=False)
+    return entry
+
+
+async def search_episodes_in_case(
+    query: str,
+    case_name: str,
+    num_results: int = 20,
+    min_similarity: float = EPISODE_MIN_SIMILARITY,
+) -> List[Dict[str, Any]]:
+    """Semantic search over one case's episodes, ranked by cosine similarity."""
+    entry = await get_case_episode_matrix(case_name)
+    if not entry.rows:
+        return []
+
+    query_vec = await _embed_query(query, entry.dim)
+    if query_vec is None:
+        return []
+    return entry.top_k(query_vec, num_results, min_similarity)
+
+
+def invalidate_case_episodes(case_name: Optional[str] = None) -> None:
+    """Drop the cached matrix for one case (or all cases if case_name is None)."""
+    with _case_matrices_lock:
+        if case_name is None:
+            _case_matrices.clear()
+        else:
+            _case_matrices.pop(case_name, None)
+
+
+on_case_invalidated(invalidate_case_episodes)
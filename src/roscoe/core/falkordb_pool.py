@@ -0,0 +1,259 @@
+"""
+Pooled Async FalkorDB Query Engine
+
+Provides a connection-pooled, non-blocking query path to FalkorDB for all
+direct Cypher queries (run_cypher_query and everything built on it).
+
+Replaces the old pattern of building a brand-new synchronous FalkorDB client
+inside an async function for every query, which blocked the event loop and
+paid a full TCP connect per query.
+
+Features:
+- Bounded pool (BlockingConnectionPool) - callers wait for a free connection
+  instead of opening unbounded sockets under concurrent Slack/UI traffic
+- Health checks on idle connections (PING before reuse)
+- Per-query timeout
+- Graceful reconnect - a dropped connection disconnects the idle ones
+  (in-flight queries are left alone); read-only queries are retried once.
+  Writes are not retried: the error may have come after the server applied
+  them, and a replay would apply them twice
+
+NOTE: redis.asyncio connections are bound to the event loop that created
+them, so one pool is kept per running event loop.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import weakref
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# FalkorDB connection config
+FALKORDB_HOST = os.getenv("FALKORDB_HOST", "roscoe-graphdb")
+FALKORDB_PORT = int(os.getenv("FALKORDB_PORT", "6379"))
+FALKORDB_GRAPH = os.getenv("FALKORDB_GRAPH", "roscoe_graph")
+
+# Pool config
+FALKORDB_POOL_SIZE = int(os.getenv("FALKORDB_POOL_SIZE", "16"))
+FALKORDB_POOL_ACQUIRE_TIMEOUT = float(os.getenv("FALKORDB_POOL_ACQUIRE_TIMEOUT", "10"))
+FALKORDB_HEALTH_CHECK_INTERVAL = int(os.getenv("FALKORDB_HEALTH_CHECK_INTERVAL", "30"))
+FALKORDB_CONNECT_TIMEOUT = float(os.getenv("FALKORDB_CONNECT_TIMEOUT", "5"))
+FALKORDB_QUERY_TIMEOUT = float(os.getenv("FALKORDB_QUERY_TIMEOUT", "30"))
+
+# Clauses / procedures that modify the graph (conservative: a false match only
+# means a query is not retried)
+_WRITE_CLAUSE = re.compile(
+    r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP)\b|\bdb\.idx\.\w+\.(create|drop)",
+    re.IGNORECASE,
+)
+
+
+def is_read_only(query: str) -> bool:
+    """True if a Cypher query has no write clauses (safe to replay after a connection error)."""
+    return not _WRITE_CLAUSE.search(query)
+
+
+class FalkorDBPool:
+    """
+    Connection-pooled async query engine for a single event loop.
+
+    Usage:
+        pool = get_falkordb_pool()
+        records = await pool.query("MATCH (c:Case) RETURN c.name as name")
+    """
+
+    def __init__(
+        self,
+        host: str = FALKORDB_HOST,
+        port: int = FALKORDB_PORT,
+        graph_name: str = FALKORDB_GRAPH,
+        max_connections: int = FALKORDB_POOL_SIZE,
+        query_timeout: float = FALKORDB_QUERY_TIMEOUT,
+    ):
+        self.host = host
+        self.port = port
+        self.graph_name = graph_name
+        self.max_connections = max_connections
+        self.query_timeout = query_timeout
+
+        self._pool = None
+        self._db = None
+        self._graph = None
+
+        # Simple counters for diagnostics
+        self.queries = 0
+        self.timeouts = 0
+        self.reconnects = 0
+
+    def _connect(self):
+        """Build the bounded connection pool and graph handle (lazy)."""
+        from redis.asyncio import BlockingConnectionPool
+        from falkordb.asyncio import FalkorDB
+
+        self._pool = BlockingConnectionPool(
+            host=self.host,
+            port=self.port,
+            max_connections=self.max_connections,
+            timeout=FALKORDB_POOL_ACQUIRE_TIMEOUT,
+            health_check_interval=FALKORDB_HEALTH_CHECK_INTERVAL,
+            socket_connect_timeout=FALKORDB_CONNECT_TIMEOUT,
+            socket_keepalive=True,
+        )
+        self._db = FalkorDB(connection_pool=self._pool)
+        self._graph = self._db.select_graph(self.graph_name)
+        logger.info(
+            f"[FALKORDB POOL] Connected to {self.host}:{self.port}/{self.graph_name} "
+            f"(max {self.max_connections} connections)"
+        )
+
+    @property
+    def graph(self):
+        """Async graph handle, connecting on first use."""
+        if self._graph is None:
+            self._connect()
+        return self._graph
+
+    @property
+    def db(self):
+        """Async FalkorDB client on this pool (shared with the Graphiti driver)."""
+        if self._db is None:
+            self._connect()
+        return self._db
+
+    async def _reset(self):
+        """
+        Drop idle pooled connections so the next query reconnects cleanly.
+
+        In-flight queries on this loop (including Graphiti's) keep their
+        connections: redis-py already disconnected the one that failed, and
+        health_check_interval recycles any other dead socket before reuse.
+        """
+        self.reconnects += 1
+        if self._pool is not None:
+            try:
+                await self._pool.disconnect(inuse_connections=False)
+            except Exception as e:
+                logger.debug(f"[FALKORDB POOL] Error while disconnecting pool: {e}")
+
+    async def query_raw(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Execute a Cypher query and return the raw FalkorDB QueryResult.
+
+        Args:
+            query: Cypher query string
+            parameters: Optional query parameters
+            timeout: Seconds before the query is abandoned (defaults to FALKORDB_QUERY_TIMEOUT)
+
+        Read-only queries are retried once after a connection error; writes
+        are not (the server may already have applied them).
+
+        Raises:
+            asyncio.TimeoutError: If the query exceeds the timeout
+        """
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        from redis.exceptions import TimeoutError as RedisTimeoutError
+
+        timeout = timeout or self.query_timeout
+        self.queries += 1
+        attempts = 2 if is_read_only(query) else 1
+
+        for attempt in range(attempts):
+            try:
+                return await asyncio.wait_for(
+                    self.graph.query(query, parameters or {}),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                logger.warning(f"[FALKORDB POOL] Query timed out after {timeout}s: {query[:120]}")
+                raise
+            except (RedisConnectionError, RedisTimeoutError, ConnectionResetError) as e:
+                # Graceful reconnect - server restarted or idle socket dropped
+                logger.warning(f"[FALKORDB POOL] Connection error, reconnecting: {e}")
+                await self._reset()
+                if attempt + 1 == attempts:
+                    raise
+
+    async def query(
+        self,
+        query: str,
+        parameters: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a Cypher query and return records as a list of dicts.
+
+        Column names come from the query's RETURN aliases.
+        """
+        result = await self.query_raw(query, parameters, timeout)
+
+        records = []
+        if result.result_set:
+            headers = [h[1] if isinstance(h, (list, tuple)) else str(h) for h in result.header]
+            for row in result.result_set:
+                records.append({headers[i]: row[i] for i in range(len(headers))})
+        return records
+
+    async def ping(self) -> bool:
+        """Health check - True if FalkorDB answers a PING."""
+        try:
+            self.graph  # ensure connected
+            return bool(await asyncio.wait_for(self._db.connection.ping(), timeout=FALKORDB_CONNECT_TIMEOUT))
+        except Exception as e:
+            logger.warning(f"[FALKORDB POOL] Health check failed: {e}")
+            return False
+
+    async def close(self):
+        """Close all pooled connections."""
+        if self._pool is not None:
+            await self._pool.disconnect()
+        self._pool = None
+        self._db = None
+        self._graph = None
+
+
+# One pool per event loop (weak keys - pools go away with their loop)
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FalkorDBPool]" = weakref.WeakKeyDictionary()
+
+
+def get_falkordb_pool() -> FalkorDBPool:
+    """
+    Get the FalkorDB pool for the current event loop, creating it on first use.
+
+    Must be called from inside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = FalkorDBPool()
+        _pools[loop] = pool
+    return pool
+
+
+def evict_closed_loop_pools() -> int:
+    """
+    Drop pools whose event loop has been closed.
+
+    Their sockets belong to a dead loop and can't be awaited any more, so they
+    are simply released. Returns the number of pools evicted.
+    """
+    closed = [loop for loop in list(_pools.keys()) if loop.is_closed()]
+    for loop in closed:
+        _pools.pop(loop, None)
+    return len(closed)
+
+
+async def close_falkordb_pool():
+    """Close the FalkorDB pool for the current event loop (if any)."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.pop(loop, None)
+    if pool is not None:
+        await pool.close()
@@ -0,0 +1,172 @@
+"""
+Full-Text Search over Captures and Calendar Events
+
+FalkorDB full-text indexes (RediSearch-backed) over the text fields of
+second-brain captures and calendar events, with one search entry point:
+
+- ensure_fulltext_indexes(): creates the per-label indexes once per process
+  (idempotent; existing indexes are left alone)
+- search_nodes(labels, text, limit): ONE round trip for any number of labels.
+  Each label is a UNION ALL branch over db.idx.fulltext.queryNodes with its
+  own ORDER BY score / LIMIT, so ranking and the limit run inside the index
+  rather than after a full scan. Branches are merged by relevance score.
+
+If the full-text procedures are unavailable (index missing, older server),
+search_nodes falls back to the previous case-insensitive CONTAINS scan so
+keyword search keeps working, just without ranking.
+"""
+
+import re
+import logging
+from typing import Dict, List, Optional
+
+from roscoe.core.async_bridge import AsyncOnce
+
+logger = logging.getLogger(__name__)
+
+# Capture labels and the text fields each capture type stores
+CAPTURE_TEXT_FIELDS = ["name", "notes", "context", "note_content", "one_liner", "subject"]
+
+CAPTURE_LABELS = [
+    "PersonalAssistant_Task",
+    "PersonalAssistant_Idea",
+    "PersonalAssistant_Interaction",
+    "PersonalAssistant_Attorney",
+    "PersonalAssistant_Judge",
+    "PersonalAssistant_OpposingCounsel",
+    "Case_Note",
+]
+
+FULLTEXT_INDEXES: Dict[str, List[str]] = {
+    **{label: CAPTURE_TEXT_FIELDS for label in CAPTURE_LABELS},
+    "CalendarEvent": ["title", "notes", "description"],
+}
+
+# Words kept from free text; everything else is punctuation or query syntax
+_TOKEN_RE = re.compile(r"[\w']+", re.UNICODE)
+
+
+async def _create_fulltext_indexes() -> bool:
+    """Create every index in FULLTEXT_INDEXES; False if any could not be created."""
+    from roscoe.core.graphiti_client import is_already_indexed, run_cypher_query
+
+    ok = True
+    for label, fields in FULLTEXT_INDEXES.items():
+        field_args = ", ".join(f"'{f}'" for f in fields)
+        try:
+            await run_cypher_query(f"CALL db.idx.fulltext.createNodeIndex('{label}', {field_args})")
+            logger.info(f"[FULLTEXT] Created index on :{label}({', '.join(fields)})")
+        except Exception as e:
+            if not is_already_indexed(e):
+                logger.warning(f"[FULLTEXT] Could not create index on :{label}: {e}")
+                ok = False
+    return ok
+
+
+_ensure_fulltext = AsyncOnce(_create_fulltext_indexes)
+
+
+async def ensure_fulltext_indexes() -> None:
+    """
+    Create the full-text indexes in FULLTEXT_INDEXES (once per process).
+
+    Concurrent callers wait for the same run; if an index could not be
+    created the next call tries again (searches fall back to the scan).
+    """
+    await _ensure_fulltext()
+
+
+def build_fulltext_query(text: str) -> Optional[str]:
+    """
+    Turn free text into a RediSearch query.
+
+    Every word must match (AND); words of 3+ characters also match as a
+    prefix ("smi" finds "Smith"). Syntax characters are dropped.
+    """
+    terms = [t.replace("'", "") for t in _TOKEN_RE.findall(text.lower())]
+    terms = [t for t in terms if t]
+    if not terms:
+        return None
+    return " ".join(f"{t}*" if len(t) >= 3 else t for t in terms)
+
+
+async def search_nodes(
+    labels: List[str],
+    text: str,
+    limit: int = 10,
+    returns: str = "n.id as id, n.name as name, n.created_at as created_at, labels(n)[0] as type",
+    where: Optional[str] = None,
+    params: Optional[dict] = None,
+) -> List[Dict]:
+    """
+    Keyword search across one or more indexed labels in a single query.
+
+    Args:
+        labels: Labels to search (each must be in FULLTEXT_INDEXES)
+        text: Free-text search terms
+        limit: Maximum results overall (also pushed down into every label)
+        returns: RETURN projection over the matched node `n`
+        where: Optional extra predicate on `n` (e.g. "n.status = $status")
+        params: Parameters referenced by `where`
+
+    Returns:
+        Records (with a `score` field, highest first)
+    """
+    from roscoe.core.graphiti_client import run_cypher_query
+
+    ft_query = build_fulltext_query(text)
+    if not ft_query or not labels:
+        return []
+
+    await ensure_fulltext_indexes()
+
+    query_params = {**(params or {}), "ft_query": ft_query, "limit": limit}
+    where_str = f"WHERE {where}" if where else ""
+    branches = [
+        f"""
+        CALL db.idx.fulltext.queryNodes('{label}', $ft_query) YIELD node AS n, score
+        {where_str}
+        RETURN {returns}, score
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+        for label in labels
+    ]
+
+    try:
+        results = await run_cypher_query(" UNION ALL ".join(branches), query_params)
+    except Exception as e:
+        logger.warning(f"[FULLTEXT] Index search failed, falling back to scan: {e}")
+        return await _scan_nodes(labels, text, limit, returns, where, params)
+
+    results = results or []
+    results.sort(key=lambda r: r.get("score") or 0, reverse=True)
+    return results[:limit]
+
+
+async def _scan_nodes(
+    labels: List[str],
+    text: str,
+    limit: int,
+    returns: str,
+    where: Optional[str],
+    params: Optional[dict],
+) -> List[Dict]:
+    """Unranked substring fallback (same single-query shape, one branch per label)."""
+    from roscoe.core.graphiti_client import run_cypher_query
+
+    query_params = {**(params or {}), "text": text.lower(), "limit": limit}
+    branches = []
+    for label in labels:
+        fields = FULLTEXT_INDEXES.get(label, ["name"])
+        predicate = " OR ".join(f"toLower(coalesce(n.{f}, '')) CONTAINS $text" for f in fields)
+        extra = f" AND ({where})" if where else ""
+        branches.append(f"""
+        MATCH (n:{label})
+        WHERE ({predicate}){extra}
+        RETURN {returns}, 0.0 as score
+        LIMIT $limit
+        """)
+
+    results = await run_cypher_query(" UNION ALL ".join(branches), query_params)
+    return (results or [])[:limit]
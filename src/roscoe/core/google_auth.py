@@ -28,6 +28,7 @@ Setup:
 """
 
 import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -43,6 +44,13 @@ SCOPES = [
 DEFAULT_CREDENTIALS_FILE = "credentials.json"
 DEFAULT_TOKEN_FILE = "token.json"
 
+# Credentials are loaded once per process; service clients are built once per
+# thread (httplib2 transports are not thread-safe, so worker pools each get
+# their own client instead of sharing one).
+_credentials = None
+_credentials_lock = threading.Lock()
+_thread_services = threading.local()
+
 
 def _get_credentials_path() -> Path:
     """Get path to OAuth client credentials file."""
@@ -68,6 +76,16 @@ def get_google_credentials():
     Returns:
         google.oauth2.credentials.Credentials or None if not configured
     """
+    global _credentials
+    with _credentials_lock:
+        if _credentials is not None and _credentials.valid:
+            return _credentials
+        _credentials = _load_google_credentials()
+        return _credentials
+
+
+def _load_google_credentials():
+    """Load, refresh, or obtain credentials (uncached; see get_google_credentials)."""
     credentials_path = _get_credentials_path()
     token_path = _get_token_path()
     
@@ -131,20 +149,33 @@ def get_google_credentials():
         return None
 
 
+def _get_service(api: str, version: str):
+    """Build (or reuse this thread's) API client for the current credentials."""
+    creds = get_google_credentials()
+    if not creds:
+        return None
+
+    cached = getattr(_thread_services, api, None)
+    if cached is not None and cached[0] is creds:
+        return cached[1]
+
+    from googleapiclient.discovery import build
+    service = build(api, version, credentials=creds, cache_discovery=False)
+    setattr(_thread_services, api, (creds, service))
+    return service
+
+
 def get_gmail_service():
     """
     Lazily initialize and return Gmail API service client.
+
+    The client is cached per thread and rebuilt only when credentials change.
     
     Returns:
         googleapiclient.discovery.Resource or None if not configured
     """
-    creds = get_google_credentials()
-    if not creds:
-        return None
-    
     try:
-        from googleapiclient.discovery import build
-        return build('gmail', 'v1', credentials=creds)
+        return _get_service('gmail', 'v1')
     except ImportError:
         print("Warning: google-api-python-client not installed")
         print("Run: pip install google-api-python-client")
@@ -157,17 +188,14 @@ def get_gmail_service():
 def get_calendar_service():
     """
     Lazily initialize and return Google Calendar API service client.
+
+    The client is cached per thread and rebuilt only when credentials change.
     
     Returns:
         googleapiclient.discovery.Resource or None if not configured
     """
-    creds = get_google_credentials()
-    if not creds:
-        return None
-    
     try:
-        from googleapiclient.discovery import build
-        return build('calendar', 'v3', credentials=creds)
+        return _get_service('calendar', 'v3')
     except ImportError:
         print("Warning: google-api-python-client not installed")
         print("Run: pip install google-api-python-client")
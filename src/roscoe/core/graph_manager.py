@@ -8,6 +8,34 @@ DO NOT use for: Notes, unstructured updates (use graphiti_client.py)
 
 from typing import Optional, Dict, List
 from datetime import datetime, date
+import logging
+import threading
+
+from roscoe.core.async_bridge import AsyncOnce
+from roscoe.core.case_cache import invalidate_case
+from roscoe.core.graph_writer import EntityWrite, NodeRef, RelationshipWrite, execute_write_batch
+
+logger = logging.getLogger(__name__)
+
+
+def _entity_ref(entity_type: str, name: str, **match) -> NodeRef:
+    """:Entity node identified by entity_type + name (plus optional extra keys)."""
+    return NodeRef("Entity", {"name": name, "entity_type": entity_type, **match})
+
+
+async def _write_batch(
+    entities: List[EntityWrite],
+    relationships: List[RelationshipWrite]
+) -> None:
+    """Apply a write batch in one round trip; log relationships whose endpoints were missing."""
+    results = await execute_write_batch(entities, relationships)
+    for result in results:
+        if not result.ok:
+            rel = relationships[result.index - len(entities)] if result.kind == "relationship" else None
+            logger.warning(
+                f"[GRAPH WRITE] {rel.rel_type if rel else 'entity'} "
+                f"{result.index} not written: {result.error}"
+            )
 
 
 async def create_case(
@@ -30,51 +58,32 @@ async def create_case(
     Returns:
         case_name: Generated case folder name
     """
-    from roscoe.core.graphiti_client import run_cypher_query, CASE_DATA_GROUP_ID
+    from roscoe.core.graphiti_client import CASE_DATA_GROUP_ID
 
     # Generate case name
     case_name = f"{client_name.replace(' ', '-')}-{case_type}-{accident_date}"
 
-    # Create Case entity
-    await run_cypher_query('''
-        CREATE (c:Entity {
-            name: $case_name,
-            entity_type: 'Case',
-            case_type: $case_type,
-            accident_date: $accident_date,
-            sol_date: $sol_date,
-            group_id: $group_id,
-            created_at: $now
-        })
-    ''', {
-        "case_name": case_name,
-        "case_type": case_type,
-        "accident_date": accident_date,
-        "sol_date": sol_date,
-        "group_id": CASE_DATA_GROUP_ID,
-        "now": datetime.now().isoformat()
-    })
-
-    # Create or find Client entity
-    await run_cypher_query('''
-        MERGE (client:Entity {
-            name: $client_name,
-            entity_type: 'Client',
-            group_id: $group_id
-        })
-    ''', {
-        "client_name": client_name,
-        "group_id": CASE_DATA_GROUP_ID
-    })
-
-    # Create HAS_CLIENT relationship
-    await run_cypher_query('''
-        MATCH (case:Entity {entity_type: 'Case', name: $case_name})
-        MATCH (client:Entity {entity_type: 'Client', name: $client_name})
-        CREATE (case)-[:HAS_CLIENT]->(client)
-        CREATE (client)-[:PLAINTIFF_IN]->(case)
-    ''', {"case_name": case_name, "client_name": client_name})
-
+    # Case, Client (merged) and both relationships in one atomic write
+    case = _entity_ref("Case", case_name)
+    client = _entity_ref("Client", client_name)
+    await _write_batch(
+        entities=[
+            EntityWrite(case, {
+                "case_type": case_type,
+                "accident_date": accident_date,
+                "sol_date": sol_date,
+                "group_id": CASE_DATA_GROUP_ID,
+                "created_at": datetime.now().isoformat()
+            }),
+            EntityWrite(_entity_ref("Client", client_name, group_id=CASE_DATA_GROUP_ID), merge=True),
+        ],
+        relationships=[
+            RelationshipWrite("HAS_CLIENT", case, client),
+            RelationshipWrite("PLAINTIFF_IN", client, case),
+        ],
+    )
+
+    invalidate_case(case_name)
     return case_name
 
 
@@ -106,91 +115,45 @@ async def create_biclaim(
     Returns:
         claim_name: Generated claim identifier
     """
-    from roscoe.core.graphiti_client import run_cypher_query, CASE_DATA_GROUP_ID
+    from roscoe.core.graphiti_client import CASE_DATA_GROUP_ID
 
     # Generate claim name
     claim_name = f"BIClaim-{claim_number}"
 
-    # Create BIClaim entity
-    await run_cypher_query('''
-        CREATE (claim:Entity {
-            name: $claim_name,
-            entity_type: 'BIClaim',
-            claim_number: $claim_number,
-            insurer_name: $insurer_name,
-            policy_limit: $policy_limit,
-            coverage_confirmation: $coverage_confirmation,
-            group_id: $group_id,
-            created_at: $now
-        })
-    ''', {
-        "claim_name": claim_name,
-        "claim_number": claim_number,
-        "insurer_name": insurer_name,
-        "policy_limit": policy_limit,
-        "coverage_confirmation": coverage_confirmation,
-        "group_id": CASE_DATA_GROUP_ID,
-        "now": datetime.now().isoformat()
-    })
-
-    # MERGE insurer entity
-    await run_cypher_query('''
-        MERGE (insurer:Entity {
-            name: $insurer_name,
-            entity_type: 'Insurer',
-            group_id: $group_id
-        })
-    ''', {
-        "insurer_name": insurer_name,
-        "group_id": CASE_DATA_GROUP_ID
-    })
-
-    # Create HAS_CLAIM relationship (Case -> Claim)
-    await run_cypher_query('''
-        MATCH (case:Entity {entity_type: 'Case', name: $case_name})
-        MATCH (claim:Entity {entity_type: 'BIClaim', claim_number: $claim_number})
-        CREATE (case)-[:HAS_CLAIM]->(claim)
-    ''', {"case_name": case_name, "claim_number": claim_number})
-
-    # Create INSURED_BY relationship (Claim -> Insurer)
-    await run_cypher_query('''
-        MATCH (claim:Entity {entity_type: 'BIClaim', claim_number: $claim_number})
-        MATCH (insurer:Entity {entity_type: 'Insurer', name: $insurer_name})
-        CREATE (claim)-[:INSURED_BY]->(insurer)
-    ''', {"claim_number": claim_number, "insurer_name": insurer_name})
-
-    # If adjuster provided, create adjuster entity and relationships
+    claim = _entity_ref("BIClaim", claim_name)
+    insurer = _entity_ref("Insurer", insurer_name)
+    entities = [
+        EntityWrite(claim, {
+            "claim_number": claim_number,
+            "insurer_name": insurer_name,
+            "policy_limit": policy_limit,
+            "coverage_confirmation": coverage_confirmation,
+            "group_id": CASE_DATA_GROUP_ID,
+            "created_at": datetime.now().isoformat()
+        }),
+        EntityWrite(_entity_ref("Insurer", insurer_name, group_id=CASE_DATA_GROUP_ID), merge=True),
+    ]
+    relationships = [
+        RelationshipWrite("HAS_CLAIM", _entity_ref("Case", case_name), claim),
+        RelationshipWrite("INSURED_BY", claim, insurer),
+    ]
+
+    # If adjuster provided, merge adjuster entity and relationships
     if adjuster_name:
-        await run_cypher_query('''
-            MERGE (adjuster:Entity {
-                name: $adjuster_name,
-                entity_type: 'Adjuster',
-                group_id: $group_id
-            })
-            ON CREATE SET
-                adjuster.email = $adjuster_email,
-                adjuster.phone = $adjuster_phone
-        ''', {
-            "adjuster_name": adjuster_name,
-            "adjuster_email": adjuster_email,
-            "adjuster_phone": adjuster_phone,
-            "group_id": CASE_DATA_GROUP_ID
-        })
-
-        # Create ASSIGNED_ADJUSTER relationship (Claim -> Adjuster)
-        await run_cypher_query('''
-            MATCH (claim:Entity {entity_type: 'BIClaim', claim_number: $claim_number})
-            MATCH (adjuster:Entity {entity_type: 'Adjuster', name: $adjuster_name})
-            CREATE (claim)-[:ASSIGNED_ADJUSTER]->(adjuster)
-        ''', {"claim_number": claim_number, "adjuster_name": adjuster_name})
-
-        # Create HANDLES_INSURANCE_CLAIM relationship (Adjuster -> Claim)
-        await run_cypher_query('''
-            MATCH (adjuster:Entity {entity_type: 'Adjuster', name: $adjuster_name})
-            MATCH (claim:Entity {entity_type: 'BIClaim', claim_number: $claim_number})
-            CREATE (adjuster)-[:HANDLES_INSURANCE_CLAIM]->(claim)
-        ''', {"adjuster_name": adjuster_name, "claim_number": claim_number})
-
+        adjuster = _entity_ref("Adjuster", adjuster_name)
+        entities.append(EntityWrite(
+            _entity_ref("Adjuster", adjuster_name, group_id=CASE_DATA_GROUP_ID),
+            on_create={"email": adjuster_email, "phone": adjuster_phone},
+            merge=True,
+        ))
+        relationships += [
+            RelationshipWrite("ASSIGNED_ADJUSTER", claim, adjuster),
+            RelationshipWrite("HANDLES_INSURANCE_CLAIM", adjuster, claim),
+        ]
+
+    await _write_batch(entities, relationships)
+
+    invalidate_case(case_name)
     return claim_name
 
 
@@ -218,61 +181,32 @@ async def create_pipclaim(
     Returns:
         claim_name: Generated claim identifier
     """
-    from roscoe.core.graphiti_client import run_cypher_query, CASE_DATA_GROUP_ID
+    from roscoe.core.graphiti_client import CASE_DATA_GROUP_ID
 
     # Generate claim name
     claim_name = f"PIPClaim-{claim_number}"
 
-    # Create PIPClaim entity
-    await run_cypher_query('''
-        CREATE (claim:Entity {
-            name: $claim_name,
-            entity_type: 'PIPClaim',
-            claim_number: $claim_number,
-            insurer_name: $insurer_name,
-            policy_limit: $policy_limit,
-            exhausted: $exhausted,
-            amount_paid: $amount_paid,
-            group_id: $group_id,
-            created_at: $now
-        })
-    ''', {
-        "claim_name": claim_name,
-        "claim_number": claim_number,
-        "insurer_name": insurer_name,
-        "policy_limit": policy_limit,
-        "exhausted": exhausted,
-        "amount_paid": amount_paid,
-        "group_id": CASE_DATA_GROUP_ID,
-        "now": datetime.now().isoformat()
-    })
-
-    # MERGE insurer entity
-    await run_cypher_query('''
-        MERGE (insurer:Entity {
-            name: $insurer_name,
-            entity_type: 'Insurer',
-            group_id: $group_id
-        })
-    ''', {
-        "insurer_name": insurer_name,
-        "group_id": CASE_DATA_GROUP_ID
-    })
-
-    # Create HAS_CLAIM relationship (Case -> Claim)
-    await run_cypher_query('''
-        MATCH (case:Entity {entity_type: 'Case', name: $case_name})
-        MATCH (claim:Entity {entity_type: 'PIPClaim', claim_number: $claim_number})
-        CREATE (case)-[:HAS_CLAIM]->(claim)
-    ''', {"case_name": case_name, "claim_number": claim_number})
-
-    # Create INSURED_BY relationship (Claim -> Insurer)
-    await run_cypher_query('''
-        MATCH (claim:Entity {entity_type: 'PIPClaim', claim_number: $claim_number})
-        MATCH (insurer:Entity {entity_type: 'Insurer', name: $insurer_name})
-        CREATE (claim)-[:INSURED_BY]->(insurer)
-    ''', {"claim_number": claim_number, "insurer_name": insurer_name})
-
+    claim = _entity_ref("PIPClaim", claim_name)
+    await _write_batch(
+        entities=[
+            EntityWrite(claim, {
+                "claim_number": claim_number,
+                "insurer_name": insurer_name,
+                "policy_limit": policy_limit,
+                "exhausted": exhausted,
+                "amount_paid": amount_paid,
+                "group_id": CASE_DATA_GROUP_ID,
+                "created_at": datetime.now().isoformat()
+            }),
+            EntityWrite(_entity_ref("Insurer", insurer_name, group_id=CASE_DATA_GROUP_ID), merge=True),
+        ],
+        relationships=[
+            RelationshipWrite("HAS_CLAIM", _entity_ref("Case", case_name), claim),
+            RelationshipWrite("INSURED_BY", claim, _entity_ref("Insurer", insurer_name)),
+        ],
+    )
+
+    invalidate_case(case_name)
     return claim_name
 
 
@@ -317,6 +251,7 @@ async def set_case_phase(
         "now": datetime.now().isoformat()
     })
 
+    invalidate_case(case_name)
     return len(result) > 0
 
 
@@ -388,6 +323,7 @@ async def update_landmark_status(
         }
 
     result = await run_cypher_query(query, params)
+    invalidate_case(case_name)
     return len(result) > 0
 
 
@@ -464,6 +400,7 @@ async def initialize_phase_landmarks(case_name: str, phase_name: str) -> int:
         "now": datetime.now().isoformat()
     })
 
+    invalidate_case(case_name)
     return result[0]["landmark_count"] if result else 0
 
 
@@ -522,6 +459,71 @@ async def auto_verify_all_landmarks(case_name: str) -> List[str]:
 # Calendar Event Management
 # =============================================================================
 
+# Bumped by every calendar write so readers (e.g. the calendar overview in
+# CaseContextMiddleware) can cache by (date, generation) and rebuild only
+# after tasks actually change.
+_calendar_generation = 0
+_calendar_generation_lock = threading.Lock()
+
+
+def invalidate_calendar_cache() -> None:
+    """Mark cached calendar views stale (call after any CalendarEvent write)."""
+    global _calendar_generation
+    with _calendar_generation_lock:
+        _calendar_generation += 1
+
+
+def get_calendar_generation() -> int:
+    """Current calendar write generation (changes whenever events are written)."""
+    return _calendar_generation
+
+
+# Calendar events carry a dedicated :CalendarEvent label (in addition to
+# :Entity) so lookups hit these range indexes instead of scanning every
+# Entity node. The migration lives in
+# second_brain_implementation/migrations/add_calendar_event_indexes.py;
+# ensure_calendar_schema() applies the same (idempotent) steps once per
+# process so an unmigrated graph never hides events.
+CALENDAR_EVENT_INDEXES = ["name", "event_date", "status", "case_name"]
+
+async def _apply_calendar_schema() -> bool:
+    """Backfill the :CalendarEvent label, then create its indexes; False on failure."""
+    from roscoe.core.graphiti_client import is_already_indexed, run_cypher_query
+
+    try:
+        await run_cypher_query('''
+            MATCH (e:Entity)
+            WHERE e.entity_type = 'CalendarEvent' AND NOT e:CalendarEvent
+            SET e:CalendarEvent
+        ''')
+    except Exception as e:
+        logger.warning(f"Could not backfill :CalendarEvent label: {e}")
+        return False
+
+    ok = True
+    for prop in CALENDAR_EVENT_INDEXES:
+        try:
+            await run_cypher_query(f"CREATE INDEX ON :CalendarEvent({prop})")
+        except Exception as e:
+            if not is_already_indexed(e):
+                logger.warning(f"Could not create :CalendarEvent({prop}) index: {e}")
+                ok = False
+    return ok
+
+
+_calendar_schema = AsyncOnce(_apply_calendar_schema)
+
+
+async def ensure_calendar_schema() -> None:
+    """
+    Backfill the :CalendarEvent label and create its indexes (once per process).
+
+    Concurrent callers wait until the backfill has finished, so no one queries
+    :CalendarEvent before events are relabeled.
+    """
+    await _calendar_schema()
+
+
 async def create_calendar_event(
     title: str,
     event_date: str,
@@ -553,12 +555,14 @@ async def create_calendar_event(
     from roscoe.core.graphiti_client import run_cypher_query, CASE_DATA_GROUP_ID
     import uuid
 
+    await ensure_calendar_schema()
+
     event_id = f"cal_{uuid.uuid4().hex[:12]}"
     now = datetime.now().isoformat()
 
     # Create the CalendarEvent entity
     await run_cypher_query('''
-        CREATE (e:Entity {
+        CREATE (e:Entity:CalendarEvent {
             name: $event_id,
             entity_type: 'CalendarEvent',
             title: $title,
@@ -593,10 +597,12 @@ async def create_calendar_event(
     if case_name:
         await run_cypher_query('''
             MATCH (case:Entity {entity_type: 'Case', name: $case_name})
-            MATCH (event:Entity {entity_type: 'CalendarEvent', name: $event_id})
+            MATCH (event:CalendarEvent {name: $event_id})
             CREATE (case)-[:HasEvent]->(event)
         ''', {"case_name": case_name, "event_id": event_id})
 
+    invalidate_calendar_cache()
+
     return {
         "event_id": event_id,
         "title": title,
@@ -631,8 +637,10 @@ async def get_calendar_events(
     """
     from roscoe.core.graphiti_client import run_cypher_query
 
+    await ensure_calendar_schema()
+
     # Build dynamic WHERE clauses
-    where_clauses = ["e.entity_type = 'CalendarEvent'"]
+    where_clauses = []
     params = {}
 
     if status != "all":
@@ -657,11 +665,11 @@ async def get_calendar_events(
         where_clauses.append("e.event_type = $event_type")
         params["event_type"] = event_type
 
-    where_str = " AND ".join(where_clauses)
+    where_str = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
     query = f'''
-        MATCH (e:Entity)
-        WHERE {where_str}
+        MATCH (e:CalendarEvent)
+        {where_str}
         RETURN e.name as event_id, e.title as title, e.event_date as event_date,
                e.event_time as event_time, e.event_type as event_type,
                e.status as status, e.priority as priority,
@@ -685,13 +693,14 @@ async def get_overdue_and_today_events() -> Dict[str, List[Dict]]:
     import pytz
     from roscoe.core.graphiti_client import run_cypher_query
 
+    await ensure_calendar_schema()
+
     eastern = pytz.timezone('America/New_York')
     today = datetime.now(eastern).strftime('%Y-%m-%d')
 
     query = '''
-        MATCH (e:Entity)
-        WHERE e.entity_type = 'CalendarEvent'
-          AND e.status = 'pending'
+        MATCH (e:CalendarEvent)
+        WHERE e.status = 'pending'
           AND e.event_date <= $today
         RETURN e.title as title, e.event_date as date, e.priority as priority,
                e.case_name as project_name, e.notes as notes, e.event_time as time,
@@ -723,20 +732,9 @@ def get_overdue_and_today_events_sync() -> Dict[str, List[Dict]]:
     Synchronous wrapper for get_overdue_and_today_events.
     For use in middleware that runs synchronously.
     """
-    import asyncio
+    from roscoe.core.async_bridge import run_sync
 
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're in an async context, run in thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, get_overdue_and_today_events())
-                return future.result(timeout=10)
-        else:
-            return loop.run_until_complete(get_overdue_and_today_events())
-    except RuntimeError:
-        return asyncio.run(get_overdue_and_today_events())
+    return run_sync(get_overdue_and_today_events(), timeout=10)
 
 
 async def complete_calendar_event(
@@ -759,18 +757,20 @@ async def complete_calendar_event(
     """
     from roscoe.core.graphiti_client import run_cypher_query
 
+    await ensure_calendar_schema()
+
     now = datetime.now().isoformat()
 
     if event_id:
         # Direct lookup by ID
         result = await run_cypher_query('''
-            MATCH (e:Entity {entity_type: 'CalendarEvent', name: $event_id})
+            MATCH (e:CalendarEvent {name: $event_id})
             SET e.status = 'completed', e.completed_at = $now
             RETURN e.name as event_id
         ''', {"event_id": event_id, "now": now})
     else:
         # Lookup by title (and optionally date/case)
-        where_clauses = ["e.entity_type = 'CalendarEvent'", "e.title = $title", "e.status = 'pending'"]
+        where_clauses = ["e.title = $title", "e.status = 'pending'"]
         params = {"title": title, "now": now}
 
         if event_date:
@@ -784,12 +784,14 @@ async def complete_calendar_event(
         where_str = " AND ".join(where_clauses)
 
         result = await run_cypher_query(f'''
-            MATCH (e:Entity)
+            MATCH (e:CalendarEvent)
             WHERE {where_str}
             SET e.status = 'completed', e.completed_at = $now
             RETURN e.name as event_id
         ''', params)
 
+    if result:
+        invalidate_calendar_cache()
     return bool(result)
 
 
@@ -854,16 +856,18 @@ async def update_calendar_event(
 
     set_str = ", ".join(set_clauses)
 
+    await ensure_calendar_schema()
+
     if event_id:
         params["event_id"] = event_id
         result = await run_cypher_query(f'''
-            MATCH (e:Entity {{entity_type: 'CalendarEvent', name: $event_id}})
+            MATCH (e:CalendarEvent {{name: $event_id}})
             SET {set_str}
             RETURN e.name as event_id
         ''', params)
     else:
         params["title"] = title
-        where_clauses = ["e.entity_type = 'CalendarEvent'", "e.title = $title"]
+        where_clauses = ["e.title = $title"]
 
         if event_date:
             where_clauses.append("e.event_date = $event_date")
@@ -872,12 +876,14 @@ async def update_calendar_event(
         where_str = " AND ".join(where_clauses)
 
         result = await run_cypher_query(f'''
-            MATCH (e:Entity)
+            MATCH (e:CalendarEvent)
             WHERE {where_str}
             SET {set_str}
             RETURN e.name as event_id
         ''', params)
 
+    if result:
+        invalidate_calendar_cache()
     return bool(result)
 
 
@@ -893,8 +899,12 @@ async def search_calendar_events(
     """
     Search calendar events with text matching.
 
+    With a query, matching uses the CalendarEvent full-text index (title,
+    notes, description) and results are ordered by relevance; without one,
+    events are filtered on the indexed properties and ordered by date.
+
     Args:
-        query: Text to search in title and notes
+        query: Text to search in title, notes and description
         start_date: Events on/after this date
         end_date: Events on/before this date
         case_name: Filter to specific case
@@ -906,44 +916,59 @@ async def search_calendar_events(
         List of matching events
     """
     from roscoe.core.graphiti_client import run_cypher_query
+    from roscoe.core.fulltext_search import search_nodes
 
-    where_clauses = ["e.entity_type = 'CalendarEvent'"]
-    params = {"limit": limit}
+    await ensure_calendar_schema()
 
-    if query:
-        # Case-insensitive search in title and notes
-        where_clauses.append("(toLower(e.title) CONTAINS toLower($query) OR toLower(e.notes) CONTAINS toLower($query))")
-        params["query"] = query
+    # Full-text search binds the matched node as `n`
+    v = "n" if query else "e"
+    where_clauses = []
+    params = {"limit": limit}
 
     if status != "all":
-        where_clauses.append("e.status = $status")
+        where_clauses.append(f"{v}.status = $status")
         params["status"] = status
 
     if start_date:
-        where_clauses.append("e.event_date >= $start_date")
+        where_clauses.append(f"{v}.event_date >= $start_date")
         params["start_date"] = start_date
 
     if end_date:
-        where_clauses.append("e.event_date <= $end_date")
+        where_clauses.append(f"{v}.event_date <= $end_date")
         params["end_date"] = end_date
 
     if case_name:
-        where_clauses.append("e.case_name = $case_name")
+        where_clauses.append(f"{v}.case_name = $case_name")
         params["case_name"] = case_name
 
     if event_type:
-        where_clauses.append("e.event_type = $event_type")
+        where_clauses.append(f"{v}.event_type = $event_type")
         params["event_type"] = event_type
 
-    where_str = " AND ".join(where_clauses)
+    returns = f'''{v}.name as event_id, {v}.title as title, {v}.event_date as event_date,
+               {v}.event_time as event_time, {v}.event_type as event_type,
+               {v}.status as status, {v}.priority as priority,
+               {v}.case_name as case_name, {v}.notes as notes'''
+
+    if query:
+        results = await search_nodes(
+            ["CalendarEvent"],
+            query,
+            limit=limit,
+            returns=returns,
+            where=" AND ".join(where_clauses) or None,
+            params=params,
+        )
+        for r in results:
+            r.pop("score", None)
+        return results
+
+    where_str = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
     results = await run_cypher_query(f'''
-        MATCH (e:Entity)
-        WHERE {where_str}
-        RETURN e.name as event_id, e.title as title, e.event_date as event_date,
-               e.event_time as event_time, e.event_type as event_type,
-               e.status as status, e.priority as priority,
-               e.case_name as case_name, e.notes as notes
+        MATCH (e:CalendarEvent)
+        {where_str}
+        RETURN {returns}
         ORDER BY e.event_date ASC
         LIMIT $limit
     ''', params)
@@ -1021,6 +1046,7 @@ async def update_case_sol_status(
         ''', params)
 
     if result:
+        invalidate_case(case_name)
         return {
             "success": True,
             "case_name": result[0].get("case_name"),
@@ -1040,23 +1066,15 @@ async def get_case_sol_status(case_name: str) -> Dict:
         Dict with sol_status, complaint_filed_date, sol_notes, accident_date, case_type
     """
     from roscoe.core.graphiti_client import run_cypher_query
+    from roscoe.core.case_identity import CASE_ANCHOR, case_params
 
-    # Try Case node first
-    result = await run_cypher_query('''
-        MATCH (c:Case {name: $case_name})
+    # Case node (:Case first, then :Entity) resolved to its id once, then cached
+    result = await run_cypher_query(f'''
+        {CASE_ANCHOR}
         RETURN c.name as case_name, c.sol_status as sol_status,
                c.complaint_filed_date as complaint_filed_date, c.sol_notes as sol_notes,
                c.accident_date as accident_date, c.case_type as case_type
-    ''', {"case_name": case_name})
-
-    # Fallback to Entity
-    if not result:
-        result = await run_cypher_query('''
-            MATCH (c:Entity {entity_type: 'Case', name: $case_name})
-            RETURN c.name as case_name, c.sol_status as sol_status,
-                   c.complaint_filed_date as complaint_filed_date, c.sol_notes as sol_notes,
-                   c.accident_date as accident_date, c.case_type as case_type
-        ''', {"case_name": case_name})
+    ''', await case_params(case_name))
 
     if result:
         return result[0]
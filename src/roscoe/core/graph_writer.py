@@ -0,0 +1,271 @@
+"""
+Batched, Parameterized Graph Writes
+
+Write paths used to build one CREATE per entity by interpolating escaped
+values into the query text (so FalkorDB compiled a new plan for every
+write) and then run one MATCH/CREATE round trip per relationship. This
+module compiles a set of entity and relationship writes into ONE query:
+
+- Writes are grouped by shape (label, identity keys, relationship type,
+  endpoint shapes); each group becomes an UNWIND over a parameter list,
+  so the query text depends only on the shapes and its plan is cached
+- All values travel as parameters - labels, relationship types and
+  property keys are validated identifiers, never escaped strings
+- The whole batch is a single query, so FalkorDB applies it atomically
+  (a failing query leaves the graph unchanged)
+- Each item reports its own result: node id for entities; whether both
+  endpoints were found (and how many relationships were created) for
+  relationships
+
+Relationship endpoints are matched by label + identity properties, so an
+endpoint may be a node created earlier in the same batch.
+
+Any invalid item (bad identifier, empty or null identity) makes the whole
+batch raise ValueError; callers taking untrusted input check each item with
+validate() first. Callers remain responsible for invalidate_case() after a
+successful write.
+
+Usage:
+    case = NodeRef("Entity", {"entity_type": "Case", "name": case_name})
+    claim = NodeRef("Entity", {"entity_type": "BIClaim", "name": claim_name})
+    results = await execute_write_batch(
+        entities=[EntityWrite(claim, {"claim_number": "17-87C986K"})],
+        relationships=[RelationshipWrite("HAS_CLAIM", case, claim)],
+    )
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _identifier(value: str, what: str) -> str:
+    """Validate a label / relationship type / property key for use in query text."""
+    if not isinstance(value, str) or not _IDENTIFIER.match(value):
+        raise ValueError(f"Invalid {what}: {value!r}")
+    return value
+
+
+def _param_value(value: Any) -> Any:
+    """Property value as a query parameter (primitives and lists of primitives; else str)."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (list, tuple)) and all(isinstance(v, (str, bool, int, float)) for v in value):
+        return list(value)
+    return str(value)
+
+
+def _param_props(props: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Validated, parameter-safe properties (None values are skipped)."""
+    return {
+        _identifier(key, "property key"): _param_value(value)
+        for key, value in (props or {}).items()
+        if value is not None
+    }
+
+
+@dataclass(frozen=True)
+class NodeRef:
+    """A node identified by one label and its identity properties."""
+
+    label: str
+    match: Dict[str, Any]
+
+    def shape(self) -> Tuple[str, Tuple[str, ...]]:
+        if not self.match:
+            raise ValueError(f"NodeRef({self.label}) needs at least one identity property")
+        missing = [k for k, v in self.match.items() if v is None]
+        if missing:
+            # A null in the match pattern never matches (and MERGE rejects it)
+            raise ValueError(f"NodeRef({self.label}) has null identity properties: {', '.join(missing)}")
+        return _identifier(self.label, "label"), tuple(_identifier(k, "property key") for k in self.match)
+
+
+@dataclass
+class EntityWrite:
+    """
+    Create (or MERGE) a node.
+
+    CREATE sets node.match + properties. MERGE matches on node.match,
+    applies on_create only to a new node, then sets properties.
+    """
+
+    node: NodeRef
+    properties: Dict[str, Any] = field(default_factory=dict)
+    on_create: Dict[str, Any] = field(default_factory=dict)
+    merge: bool = False
+
+    def validate(self) -> None:
+        """Raise ValueError if this write cannot be compiled."""
+        self.node.shape()
+        _param_props(self.properties)
+        _param_props(self.on_create)
+
+
+@dataclass
+class RelationshipWrite:
+    """Create (or MERGE) source-[rel_type]->target between matched nodes."""
+
+    rel_type: str
+    source: NodeRef
+    target: NodeRef
+    properties: Dict[str, Any] = field(default_factory=dict)
+    merge: bool = False
+
+    def validate(self) -> None:
+        """Raise ValueError if this write cannot be compiled."""
+        _identifier(self.rel_type, "relationship type")
+        self.source.shape()
+        self.target.shape()
+        _param_props(self.properties)
+
+
+@dataclass
+class WriteResult:
+    """Outcome of one batch item (index = position in entities, then relationships)."""
+
+    index: int
+    kind: str  # "entity" or "relationship"
+    ok: bool
+    node_id: Optional[int] = None
+    created: int = 0
+    error: Optional[str] = None
+
+
+def _pattern(var: str, ref_var: str, keys: Sequence[str], label: str) -> str:
+    props = ", ".join(f"{k}: {ref_var}.{k}" for k in keys)
+    return f"({var}:{label} {{{props}}})"
+
+
+def compile_write_batch(
+    entities: Sequence[EntityWrite] = (),
+    relationships: Sequence[RelationshipWrite] = (),
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Compile writes into one parameterized query.
+
+    Entity groups run before relationship groups, so relationships can
+    reference entities created in the same batch.
+
+    Returns:
+        (query, params); the query returns a single row with "results"
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+
+    for index, write in enumerate(entities):
+        label, keys = write.node.shape()
+        item = {
+            "i": index,
+            "key": {k: _param_value(v) for k, v in write.node.match.items()},
+            "props": _param_props(write.properties),
+        }
+        if write.merge:
+            item["on_create"] = _param_props(write.on_create)
+        groups.setdefault(("entity", write.merge, label, keys), []).append(item)
+
+    for offset, write in enumerate(relationships):
+        rel_type = _identifier(write.rel_type, "relationship type")
+        item = {
+            "i": len(entities) + offset,
+            "source": {k: _param_value(v) for k, v in write.source.match.items()},
+            "target": {k: _param_value(v) for k, v in write.target.match.items()},
+            "props": _param_props(write.properties),
+        }
+        shape = ("relationship", write.merge, rel_type, write.source.shape(), write.target.shape())
+        groups.setdefault(shape, []).append(item)
+
+    clauses = []
+    params: Dict[str, Any] = {}
+    for n, (shape, items) in enumerate(groups.items()):
+        batch = f"batch{n}"
+        params[batch] = items
+        clauses.append(f"UNWIND ${batch} AS item" if n == 0 else f"WITH results UNWIND ${batch} AS item")
+
+        if shape[0] == "entity":
+            _, merge, label, keys = shape
+            node = _pattern("n", "item.key", keys, label)
+            if merge:
+                clauses.append(f"MERGE {node} ON CREATE SET n += item.on_create SET n += item.props")
+            else:
+                clauses.append(f"CREATE {node} SET n += item.props")
+            row = "{i: item.i, id: id(n)}"
+        else:
+            _, merge, rel_type, (source_label, source_keys), (target_label, target_keys) = shape
+            verb = "MERGE" if merge else "CREATE"
+            clauses.append(f"OPTIONAL MATCH {_pattern('s', 'item.source', source_keys, source_label)}")
+            clauses.append(f"OPTIONAL MATCH {_pattern('t', 'item.target', target_keys, target_label)}")
+            clauses.append(
+                "FOREACH (_ IN CASE WHEN s IS NULL OR t IS NULL THEN [] ELSE [1] END | "
+                f"{verb} (s)-[r:{rel_type}]->(t) SET r += item.props)"
+            )
+            row = "{i: item.i, s: s IS NOT NULL, t: t IS NOT NULL}"
+
+        if n == 0:
+            clauses.append(f"WITH collect({row}) AS results")
+        else:
+            clauses.append(f"WITH results, collect({row}) AS added")
+            clauses.append("WITH results + added AS results")
+
+    clauses.append("RETURN results" if groups else "RETURN [] AS results")
+    return "\n".join(clauses), params
+
+
+def _collect_results(
+    rows: List[Dict[str, Any]],
+    entity_count: int,
+    relationship_count: int,
+) -> List[WriteResult]:
+    """Per-item results from the query's result rows (a matched endpoint pair per row)."""
+    results = [WriteResult(i, "entity", False, error="not written") for i in range(entity_count)]
+    results += [
+        WriteResult(entity_count + i, "relationship", False) for i in range(relationship_count)
+    ]
+    missing: Dict[int, set] = {}
+
+    for row in rows:
+        result = results[row["i"]]
+        if result.kind == "entity":
+            result.ok, result.node_id, result.error = True, row.get("id"), None
+        elif row.get("s") and row.get("t"):
+            result.created += 1
+        else:
+            gone = missing.setdefault(result.index, set())
+            if not row.get("s"):
+                gone.add("source")
+            if not row.get("t"):
+                gone.add("target")
+
+    for result in results:
+        if result.kind == "relationship":
+            result.ok = result.created > 0
+            if not result.ok:
+                gone = sorted(missing.get(result.index, ()), reverse=True)
+                result.error = f"{' and '.join(gone) or 'endpoint'} not found"
+    return results
+
+
+async def execute_write_batch(
+    entities: Sequence[EntityWrite] = (),
+    relationships: Sequence[RelationshipWrite] = (),
+) -> List[WriteResult]:
+    """
+    Apply entity and relationship writes in a single atomic round trip.
+
+    Returns:
+        One WriteResult per item: entities first (in order), then relationships
+
+    Raises:
+        ValueError: invalid label, relationship type or property key
+        Exception: the query failed (nothing was written)
+    """
+    from roscoe.core.graphiti_client import run_cypher_query
+
+    if not entities and not relationships:
+        return []
+
+    query, params = compile_write_batch(entities, relationships)
+    rows = await run_cypher_query(query, params)
+    results = (rows[0].get("results") if rows else None) or []
+    return _collect_results(results, len(entities), len(relationships))
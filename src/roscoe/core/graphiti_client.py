@@ -7,7 +7,9 @@ Provides a singleton Graphiti client for the Roscoe platform, configured with:
 - Custom entity types for legal case management
 """
 
+import logging
 import os
+import threading
 from typing import Optional
 from datetime import date, datetime, timezone
 from pydantic import BaseModel, Field
@@ -17,9 +19,11 @@ from graphiti_core import Graphiti
 from graphiti_core.driver.falkordb_driver import FalkorDriver
 from graphiti_core.nodes import EpisodeType
 
-# FalkorDB connection config
-FALKORDB_HOST = os.getenv("FALKORDB_HOST", "roscoe-graphdb")
-FALKORDB_PORT = int(os.getenv("FALKORDB_PORT", "6379"))
+from roscoe.core.case_cache import invalidate_case
+from roscoe.core.case_identity import CASE_ANCHOR, OPTIONAL_CASE_ANCHOR, case_params
+from roscoe.core.workflow_catalog import WorkflowCatalog, get_workflow_catalog
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # SCOPE: This module is for UNSTRUCTURED data operations only
@@ -1738,22 +1742,65 @@ EDGE_TYPE_MAP = {
 
 
 # =============================================================================
-# Graphiti Client Factory (NOT Singleton - Creates per event loop)
+# Graphiti Client Registry (one client per live event loop)
 # =============================================================================
+# Graphiti's asyncio locks and the redis.asyncio sockets under FalkorDriver are
+# bound to the loop that created them, so a client can't be shared across loops.
+# The registry:
+# - keys clients by the loop object itself (id(loop) gets reused after GC)
+# - builds each FalkorDriver on that loop's FalkorDBPool, so Graphiti and
+#   run_cypher_query share one bounded set of connections per loop
+# - evicts clients whose loop has closed (asyncio.run bridges) on every lookup
+# - counts created/evicted/closed clients for get_graphiti_stats()
 
-# Store clients per event loop to avoid "Lock bound to different event loop" errors
 _graphiti_instances: dict = {}
+_graphiti_lock = threading.Lock()
+_graphiti_stats = {"created": 0, "evicted": 0, "closed": 0}
+_llm_config = None
+
+
+def _evict_closed_loops() -> None:
+    """Drop clients (and pools) whose event loop has been closed."""
+    from roscoe.core.falkordb_pool import evict_closed_loop_pools
+
+    with _graphiti_lock:
+        closed = [loop for loop in _graphiti_instances if loop.is_closed()]
+        for loop in closed:
+            # The loop is gone, so there is nothing left to await - just release it
+            del _graphiti_instances[loop]
+        _graphiti_stats["evicted"] += len(closed)
+    evict_closed_loop_pools()
+
+
+def _get_llm_config():
+    """LLM config is loop-independent, so it is built once per process."""
+    global _llm_config
+    from graphiti_core.llm_client.config import LLMConfig
+
+    if _llm_config is None:
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not openai_api_key:
+            raise ValueError("OPENAI_API_KEY environment variable is required for Graphiti")
+
+        # Configure GPT-5 Mini for entity extraction (reasoning model)
+        _llm_config = LLMConfig(
+            api_key=openai_api_key,
+            model="gpt-5-mini",          # Fast reasoning model for entity extraction
+            small_model="gpt-5-nano",    # Smallest reasoning model for simple tasks
+        )
+    return _llm_config
 
 
 async def get_graphiti() -> Graphiti:
     """
-    Get or create a Graphiti client for the current event loop.
+    Get or create the Graphiti client for the current event loop.
 
-    IMPORTANT: Not a global singleton! Each event loop gets its own instance
-    to avoid asyncio.Lock errors when tools run in different contexts.
+    IMPORTANT: Not a global singleton! Each live event loop gets its own instance
+    to avoid asyncio.Lock errors when tools run in different contexts. Clients
+    for closed loops are evicted automatically.
 
     Configured with:
-    - FalkorDB backend (Redis-compatible graph database)
+    - FalkorDB backend (Redis-compatible graph database), sharing the loop's pool
     - GPT-5 Mini for LLM entity extraction (reasoning model, Dec 2025)
     - GPT-5 Nano for small model tasks
     - OpenAI text-embedding-3-small for embeddings
@@ -1761,45 +1808,26 @@ async def get_graphiti() -> Graphiti:
     """
     import asyncio
     from graphiti_core.llm_client.openai_client import OpenAIClient
-    from graphiti_core.llm_client.config import LLMConfig
+    from roscoe.core.falkordb_pool import FALKORDB_GRAPH, get_falkordb_pool
 
-    # Get current event loop ID
-    try:
-        loop = asyncio.get_running_loop()
-        loop_id = id(loop)
-    except RuntimeError:
-        # No running loop - create a unique key
-        loop_id = "no_loop"
+    loop = asyncio.get_running_loop()
 
     # Return existing instance for this loop
-    if loop_id in _graphiti_instances:
-        return _graphiti_instances[loop_id]
+    instance = _graphiti_instances.get(loop)
+    if instance is not None:
+        return instance
 
-    # Get configuration from environment
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
-        raise ValueError("OPENAI_API_KEY environment variable is required for Graphiti")
+    _evict_closed_loops()
 
-    falkordb_host = os.getenv("FALKORDB_HOST", "roscoe-graphdb")
-    falkordb_port = int(os.getenv("FALKORDB_PORT", "6379"))
-
-    # Initialize FalkorDB driver
+    # Initialize FalkorDB driver on this loop's connection pool
     falkor_driver = FalkorDriver(
-        host=falkordb_host,
-        port=falkordb_port,
-        database="roscoe_graph",
-    )
-
-    # Configure GPT-5 Mini for entity extraction (reasoning model)
-    llm_config = LLMConfig(
-        api_key=openai_api_key,
-        model="gpt-5-mini",          # Fast reasoning model for entity extraction
-        small_model="gpt-5-nano",    # Smallest reasoning model for simple tasks
+        falkor_db=get_falkordb_pool().db,
+        database=FALKORDB_GRAPH,
     )
 
     # Create OpenAI client with reasoning parameters for GPT-5 family
     llm_client = OpenAIClient(
-        config=llm_config,
+        config=_get_llm_config(),
         reasoning='minimal',  # GPT-5 reasoning effort
         verbosity='low'       # GPT-5 verbosity level
     )
@@ -1815,18 +1843,46 @@ async def get_graphiti() -> Graphiti:
     # Building takes 6+ minutes and was causing massive delays on every tool call!
     # Only build indices manually via management scripts when needed
 
-    # Store instance for this event loop
-    _graphiti_instances[loop_id] = graphiti_instance
+    with _graphiti_lock:
+        # Another task on this loop may have won the race while we were building
+        existing = _graphiti_instances.get(loop)
+        if existing is not None:
+            return existing
+        _graphiti_instances[loop] = graphiti_instance
+        _graphiti_stats["created"] += 1
 
     return graphiti_instance
 
 
 async def close_graphiti():
-    """Close the Graphiti client connection."""
-    global _graphiti_instance
-    if _graphiti_instance is not None:
-        await _graphiti_instance.close()
-        _graphiti_instance = None
+    """
+    Close the Graphiti client and FalkorDB pool for the current event loop.
+
+    Call this before the loop shuts down (e.g., at the end of an asyncio.run
+    bridge or a test). Clients of loops that are already closed are evicted.
+    """
+    import asyncio
+    from roscoe.core.falkordb_pool import close_falkordb_pool
+
+    loop = asyncio.get_running_loop()
+    with _graphiti_lock:
+        instance = _graphiti_instances.pop(loop, None)
+        if instance is not None:
+            _graphiti_stats["closed"] += 1
+
+    if instance is not None:
+        try:
+            await instance.close()
+        except Exception as e:
+            logger.debug(f"[GRAPHITI] Error closing client: {e}")
+    await close_falkordb_pool()
+    _evict_closed_loops()
+
+
+def get_graphiti_stats() -> dict:
+    """Registry metrics: live clients plus lifetime created/evicted/closed counts."""
+    with _graphiti_lock:
+        return {"live": len(_graphiti_instances), **_graphiti_stats}
 
 
 # =============================================================================
@@ -1912,56 +1968,13 @@ async def search_case_episodes(
         search_case_episodes("Why was coverage denied?", case_name="Abby-Sitgraves-MVA-7-13-2024")
         search_case_episodes("What did the adjuster say about the offer?", case_name="Wilson-MVA-2024")
     """
-    graphiti = await get_graphiti()
-
-    # CASE-SPECIFIC SEARCH: Use Case entity as focal node
+    # CASE-SPECIFIC SEARCH: batched cosine similarity over the case's Episode vectors
+    # Our episodes use Episode label (not Episodic) and RELATES_TO (not MENTIONS)
     if case_name:
-        # Direct query: Get Episode nodes that RELATE_TO this Case
-        # Our episodes use Episode label (not Episodic) and RELATES_TO (not MENTIONS)
-        case_episodes_query = """
-        MATCH (e:Episode)-[:RELATES_TO]->(c:Case {name: $case_name})
-        WHERE e.embedding IS NOT NULL
-        RETURN e.uuid as uuid, e.name as name, e.content as content, e.embedding as embedding, e.valid_at as valid_at
-        """
-        episodes = await run_cypher_query(case_episodes_query, {"case_name": case_name})
-
-        if not episodes:
-            return []  # No episodes for this case
-
-        # Embed query and compute similarity
-        query_embedding = await graphiti.embedder.create(query)
-
-        import numpy as np
-        q_vec = np.array(query_embedding)
-
-        scored = []
-        for ep in episodes:
-            emb = ep.get("embedding")
-            if not emb:
-                continue
+        from roscoe.core.episode_index import search_episodes_in_case
+        return await search_episodes_in_case(query, case_name, num_results=num_results)
 
-            # Convert embedding to numpy array (handle list or array)
-            if isinstance(emb, list):
-                ep_vec = np.array(emb)
-            else:
-                ep_vec = emb
-
-            # Calculate cosine similarity
-            similarity = np.dot(q_vec, ep_vec) / (np.linalg.norm(q_vec) * np.linalg.norm(ep_vec))
-
-            # Apply minimum similarity threshold (lower threshold for better recall)
-            if similarity >= 0.3:  # Relaxed from 0.5 for better results
-                scored.append({
-                    "similarity": float(similarity),
-                    "fact": ep.get("content", ""),
-                    "name": ep.get("name", ""),
-                    "uuid": ep.get("uuid"),
-                    "valid_at": ep.get("valid_at"),
-                })
-
-        # Sort by similarity (highest first)
-        scored.sort(key=lambda x: x["similarity"], reverse=True)
-        return scored[:num_results]
+    graphiti = await get_graphiti()
 
     # No case filter: standard hybrid search
     results = await graphiti.search(
@@ -1973,6 +1986,170 @@ async def search_case_episodes(
     return results
 
 
+# =============================================================================
+# Case Snapshot (single round trip)
+# =============================================================================
+# One composite Cypher query that fetches the whole structured neighbourhood of
+# a case. Each section is an OPTIONAL MATCH collapsed back to one row with
+# collect(), so sections never multiply each other's rows. A section with
+# several sub-matches per item (a claim's policies and adjusters) collapses
+# each of them per item first, so the item is collected once; its match text
+# uses {carried} for the variables already in scope.
+#
+# Both schema generations are covered so every caller can map its own shape:
+# - Claims: UNDER_POLICY/WITH_INSURER/HANDLED_BY and legacy INSURED_BY/ASSIGNED_ADJUSTER
+# - Providers: Client -TREATED_AT-> Facility/Location and legacy Case -TREATING_AT-> MedicalProvider
+
+_CASE_SNAPSHOT_SECTIONS = {
+    "client": (
+        """
+        OPTIONAL MATCH (case)-[:HAS_CLIENT]->(cl:Client)""",
+        """collect(CASE WHEN cl IS NULL THEN NULL ELSE {
+            name: cl.name, phone: cl.phone, email: cl.email, address: cl.address
+        } END)[0]""",
+    ),
+    "claims": (
+        """
+        OPTIONAL MATCH (case)-[:HAS_CLAIM]->(claim)
+        WHERE claim:BIClaim OR claim:PIPClaim OR claim:UMClaim OR claim:UIMClaim OR claim:WCClaim OR claim:MedPayClaim
+        OPTIONAL MATCH (claim)-[:UNDER_POLICY]->(policy:InsurancePolicy)
+        OPTIONAL MATCH (policy)-[:WITH_INSURER]->(insurer:Insurer)
+        WITH {carried}, claim, collect([policy, insurer])[0] as coverage
+        OPTIONAL MATCH (claim)-[:HANDLED_BY]->(adjuster:Adjuster)
+        WITH {carried}, claim, coverage, collect(adjuster)[0] as adjuster
+        OPTIONAL MATCH (claim)-[:INSURED_BY]->(legacy_insurer:Insurer)
+        WITH {carried}, claim, coverage, adjuster, collect(legacy_insurer)[0] as legacy_insurer
+        OPTIONAL MATCH (claim)-[:ASSIGNED_ADJUSTER]->(legacy_adjuster:Adjuster)
+        WITH {carried}, claim, coverage[0] as policy, coverage[1] as insurer, adjuster,
+             legacy_insurer, collect(legacy_adjuster)[0] as legacy_adjuster""",
+        """collect(CASE WHEN claim IS NULL THEN NULL ELSE {
+            name: claim.name, claim_number: claim.claim_number, labels: labels(claim),
+            status: claim.status, amount_demanded: claim.amount_demanded,
+            amount_offered: claim.amount_offered, policy_limit: claim.policy_limit,
+            current_offer: claim.current_offer, settlement_amount: claim.settlement_amount,
+            policy_number: policy.policy_number, bi_limit: policy.bi_limit,
+            pip_limit: policy.pip_limit, um_limit: policy.um_limit, uim_limit: policy.uim_limit,
+            insurer_name: insurer.name, adjuster_name: adjuster.name,
+            adjuster_phone: adjuster.phone, adjuster_email: adjuster.email,
+            legacy_insurer_name: legacy_insurer.name, legacy_adjuster_name: legacy_adjuster.name,
+            legacy_adjuster_phone: legacy_adjuster.phone
+        } END)""",
+    ),
+    "providers": (
+        """
+        OPTIONAL MATCH (case)-[:HAS_CLIENT]->(:Client)-[:TREATED_AT]->(provider)
+        WHERE provider:Facility OR provider:Location
+        OPTIONAL MATCH (provider)-[:PART_OF]->(parent)
+        WHERE parent:Facility OR parent:HealthSystem
+        OPTIONAL MATCH (parent)-[:PART_OF]->(grandparent:HealthSystem)""",
+        """collect(CASE WHEN provider IS NULL THEN NULL ELSE {
+            name: provider.name, provider_type: labels(provider)[0],
+            specialty: provider.specialty, phone: provider.phone, fax: provider.fax,
+            address: provider.address, parent_name: parent.name,
+            parent_type: labels(parent)[0], health_system: grandparent.name
+        } END)""",
+    ),
+    "treating_providers": (
+        """
+        OPTIONAL MATCH (case)-[:TREATING_AT]->(mp:MedicalProvider)
+        OPTIONAL MATCH (mp)-[:PART_OF]->(org:Organization)""",
+        """collect(CASE WHEN mp IS NULL THEN NULL ELSE {
+            name: mp.name, specialty: mp.specialty, phone: mp.phone, fax: mp.fax,
+            parent_org: org.name
+        } END)""",
+    ),
+    "liens": (
+        """
+        OPTIONAL MATCH (case)-[:HAS_LIEN]->(lien:Lien)
+        OPTIONAL MATCH (lien)-[:HELD_BY]->(holder:LienHolder)""",
+        """collect(CASE WHEN lien IS NULL THEN NULL ELSE {
+            lien_name: lien.name, holder_name: holder.name, lien_type: lien.lien_type,
+            amount: lien.amount, account_number: lien.account_number
+        } END)""",
+    ),
+    "litigation": (
+        """
+        OPTIONAL MATCH (case)-->(lit:Entity)
+        WHERE lit:Attorney OR lit:Defendant OR lit:Court""",
+        """collect(CASE WHEN lit IS NULL THEN NULL ELSE {
+            name: lit.name, entity_type: lit.entity_type, role: lit.role,
+            phone: lit.phone, email: lit.email
+        } END)""",
+    ),
+    "phase": (
+        """
+        OPTIONAL MATCH (case)-[:IN_PHASE]->(ph:Phase)""",
+        """collect(CASE WHEN ph IS NULL THEN NULL ELSE {
+            name: ph.name, display_name: ph.display_name
+        } END)[0]""",
+    ),
+}
+
+CASE_SNAPSHOT_SECTIONS = tuple(_CASE_SNAPSHOT_SECTIONS)
+
+
+def _case_snapshot_clauses(sections: tuple, carried: list) -> list:
+    """
+    MATCH/WITH clauses for the requested sections (in canonical order).
+
+    `carried` holds the variables already in scope (starting with `case`);
+    each section's name is appended to it as its WITH is emitted.
+    """
+    lines = []
+    for section in CASE_SNAPSHOT_SECTIONS:
+        if section not in sections:
+            continue
+        match, projection = _CASE_SNAPSHOT_SECTIONS[section]
+        lines.append(match.replace("{carried}", ", ".join(carried)))
+        lines.append(f"        WITH {', '.join(carried)}, {projection} as {section}")
+        carried.append(section)
+    return lines
+
+
+def _build_case_snapshot_query(sections: tuple) -> str:
+    """Compose the snapshot query from the requested sections (in canonical order)."""
+    lines = [CASE_ANCHOR, "        WITH c as case"]
+    carried = ["case"]
+    lines.extend(_case_snapshot_clauses(sections, carried))
+
+    returns = [
+        "case.name as case_name",
+        "case.case_type as case_type",
+        "case.accident_date as accident_date",
+        "case.sol_date as sol_date",
+    ] + carried[1:]
+    lines.append("        RETURN " + ", ".join(returns))
+    return "\n".join(lines)
+
+
+async def get_case_snapshot(
+    case_name: str,
+    sections: Optional[list[str]] = None,
+) -> Optional[dict]:
+    """
+    Fetch a case's structured neighbourhood in ONE graph round trip.
+
+    Args:
+        case_name: Case folder name (e.g., "Abby-Sitgraves-MVA-7-13-2024")
+        sections: Optional subset of CASE_SNAPSHOT_SECTIONS to fetch
+            (client, claims, providers, treating_providers, liens, litigation, phase).
+            None (default) fetches everything.
+
+    Returns:
+        Dict with case_name, case_type, accident_date, sol_date plus one key per
+        requested section (client/phase are a dict or None, the rest are lists).
+        None if the case does not exist.
+    """
+    requested = tuple(sections) if sections else CASE_SNAPSHOT_SECTIONS
+    unknown = set(requested) - set(CASE_SNAPSHOT_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown case snapshot sections: {sorted(unknown)}")
+
+    query = _build_case_snapshot_query(requested)
+    results = await run_cypher_query(query, await case_params(case_name))
+    return results[0] if results else None
+
+
 async def get_case_entities(
     case_name: str,
     entity_types: Optional[list[str]] = None,
@@ -2014,6 +2191,26 @@ async def get_case_entities(
         # Get providers and liens
         get_case_entities("Abby-Sitgraves-MVA-7-13-2024", entity_types=["Provider", "Lien"])
     """
+    fetch_all = entity_types is None
+    entity_set = set(entity_types) if entity_types else set()
+
+    # Map entity_types to snapshot sections - one round trip for all of them
+    section_map = {
+        "Client": "client",
+        "Insurance": "claims",
+        "Provider": "treating_providers",
+        "Lien": "liens",
+        "Phase": "phase",
+    }
+    sections = [
+        section for etype, section in section_map.items()
+        if fetch_all or etype in entity_set
+    ]
+    snapshot = await get_case_snapshot(case_name, sections or ["phase"])
+
+    if not snapshot:
+        return {"error": f"Case '{case_name}' not found in graph"}
+
     result = {
         "case_name": case_name,
         "client": None,
@@ -2026,75 +2223,44 @@ async def get_case_entities(
         "phase": None,
     }
 
-    # Determine which queries to run
-    fetch_all = entity_types is None
-    entity_set = set(entity_types) if entity_types else set()
-
-    # Get Case entity (always needed for relationships)
-    case_query = "MATCH (c:Case {name: $case_name}) RETURN c.uuid as uuid"
-    case_results = await run_cypher_query(case_query, {"case_name": case_name})
-
-    if not case_results:
-        return {"error": f"Case '{case_name}' not found in graph"}
-
     # Client
     if fetch_all or "Client" in entity_set:
-        client_query = """
-        MATCH (c:Case {name: $case_name})-[:HAS_CLIENT]->(client:Client)
-        RETURN client.name as name, client.phone as phone, client.email as email, client.address as address
-        LIMIT 1
-        """
-        client_results = await run_cypher_query(client_query, {"case_name": case_name})
-        if client_results:
-            result["client"] = client_results[0]
+        result["client"] = snapshot.get("client")
 
     # Insurance
     if fetch_all or "Insurance" in entity_set:
-        insurance_query = """
-        MATCH (c:Case {name: $case_name})-[:HAS_CLAIM]->(claim)
-        WHERE claim:BIClaim OR claim:PIPClaim OR claim:UMClaim OR claim:UIMClaim OR claim:WCClaim OR claim:MedPayClaim
-        OPTIONAL MATCH (claim)-[:INSURED_BY]->(insurer:Insurer)
-        OPTIONAL MATCH (claim)-[:ASSIGNED_ADJUSTER]->(adjuster:Adjuster)
-        RETURN claim.name as claim_number, labels(claim) as claim_labels,
-               insurer.name as insurer_name, adjuster.name as adjuster_name,
-               adjuster.phone as adjuster_phone, claim.policy_limit as policy_limit,
-               claim.current_offer as current_offer, claim.settlement_amount as settlement_amount
-        """
-        insurance_results = await run_cypher_query(insurance_query, {"case_name": case_name})
-        result["insurance"] = insurance_results
+        result["insurance"] = [{
+            "claim_number": c.get("name"),
+            "claim_labels": c.get("labels"),
+            "insurer_name": c.get("legacy_insurer_name"),
+            "adjuster_name": c.get("legacy_adjuster_name"),
+            "adjuster_phone": c.get("legacy_adjuster_phone"),
+            "policy_limit": c.get("policy_limit"),
+            "current_offer": c.get("current_offer"),
+            "settlement_amount": c.get("settlement_amount"),
+        } for c in snapshot.get("claims") or []]
 
     # Medical Providers
     if fetch_all or "Provider" in entity_set:
-        provider_query = """
-        MATCH (c:Case {name: $case_name})-[:TREATING_AT]->(provider:MedicalProvider)
-        OPTIONAL MATCH (provider)-[:PART_OF]->(org:Organization)
-        RETURN provider.name as name, provider.specialty as specialty,
-               provider.phone as phone, provider.fax as fax, org.name as parent_org
-        """
-        provider_results = await run_cypher_query(provider_query, {"case_name": case_name})
-        result["providers"] = provider_results
+        result["providers"] = snapshot.get("treating_providers") or []
 
     # Liens
     if fetch_all or "Lien" in entity_set:
-        lien_query = """
-        MATCH (c:Case {name: $case_name})-[:HAS_LIEN]->(lien:Lien)
-        OPTIONAL MATCH (lien)-[:HELD_BY]->(holder:LienHolder)
-        RETURN lien.name as lien_name, holder.name as holder_name,
-               lien.amount as amount, lien.account_number as account_number
-        """
-        lien_results = await run_cypher_query(lien_query, {"case_name": case_name})
-        result["liens"] = lien_results
+        result["liens"] = [{
+            "lien_name": l.get("lien_name"),
+            "holder_name": l.get("holder_name"),
+            "amount": l.get("amount"),
+            "account_number": l.get("account_number"),
+        } for l in snapshot.get("liens") or []]
 
     # Phase/Workflow
     if fetch_all or "Phase" in entity_set:
-        phase_query = """
-        MATCH (c:Case {name: $case_name})-[:IN_PHASE]->(phase:Phase)
-        RETURN phase.name as phase_name, phase.display_name as phase_display
-        LIMIT 1
-        """
-        phase_results = await run_cypher_query(phase_query, {"case_name": case_name})
-        if phase_results:
-            result["phase"] = phase_results[0]
+        phase = snapshot.get("phase")
+        if phase:
+            result["phase"] = {
+                "phase_name": phase.get("name"),
+                "phase_display": phase.get("display_name"),
+            }
 
     return result
 
@@ -2362,42 +2528,53 @@ def _filter_embeddings_from_record(record):
     return filtered
 
 
-async def run_cypher_query_direct(query: str, parameters: Optional[dict] = None) -> list:
+def is_already_indexed(error: Exception) -> bool:
+    """True for FalkorDB's error when an index being created already exists."""
+    message = str(error).lower()
+    return "already indexed" in message or "already exists" in message
+
+
+async def run_cypher_query_direct(
+    query: str,
+    parameters: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    include_embeddings: bool = False,
+) -> list:
     """
-    Execute a raw Cypher query directly against FalkorDB (sync client, no Graphiti).
+    Execute a raw Cypher query directly against FalkorDB (pooled async client, no Graphiti).
 
     This is a lightweight query function that bypasses Graphiti initialization,
     avoiding index building and event loop issues. Use for simple structural queries.
 
+    Queries run on the per-event-loop connection pool (see falkordb_pool.py),
+    so they never block the event loop and don't pay a TCP connect per call.
+
     Args:
         query: Cypher query string
         parameters: Optional query parameters (for parameterized queries)
+        timeout: Optional per-query timeout in seconds (defaults to FALKORDB_QUERY_TIMEOUT)
+        include_embeddings: Return embedding vectors as-is (for vector search code,
+            never for results passed to the agent)
 
     Returns:
         List of result records
     """
-    from falkordb import FalkorDB
-
-    # Direct FalkorDB connection (sync client)
-    db = FalkorDB(host=FALKORDB_HOST, port=FALKORDB_PORT)
-    graph = db.select_graph("roscoe_graph")
+    from roscoe.core.falkordb_pool import get_falkordb_pool
 
-    # Execute query (sync)
-    result = graph.query(query, parameters or {})
+    records = await get_falkordb_pool().query(query, parameters, timeout=timeout)
+    if include_embeddings:
+        return records
 
-    # Convert to list of dicts, filtering out embedding vectors
-    records = []
-    if result.result_set:
-        headers = [h[1] if isinstance(h, (list, tuple)) else str(h) for h in result.header]
-        for row in result.result_set:
-            record = {headers[i]: row[i] for i in range(len(headers))}
-            # Filter out embedding vectors before returning to agent
-            records.append(_filter_embeddings_from_record(record))
+    # Filter out embedding vectors before returning to agent
+    return [_filter_embeddings_from_record(record) for record in records]
 
-    return records
 
-
-async def run_cypher_query(query: str, parameters: Optional[dict] = None) -> list:
+async def run_cypher_query(
+    query: str,
+    parameters: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    include_embeddings: bool = False,
+) -> list:
     """
     Execute a raw Cypher query against FalkorDB.
 
@@ -2408,6 +2585,8 @@ async def run_cypher_query(query: str, parameters: Optional[dict] = None) -> lis
     Args:
         query: Cypher query string
         parameters: Optional query parameters (for parameterized queries)
+        timeout: Optional per-query timeout in seconds
+        include_embeddings: Keep embedding vectors in the records (default: filtered out)
 
     Returns:
         List of result records
@@ -2421,7 +2600,9 @@ async def run_cypher_query(query: str, parameters: Optional[dict] = None) -> lis
         ''')
     """
     # Use the direct query function to avoid Graphiti initialization
-    return await run_cypher_query_direct(query, parameters)
+    return await run_cypher_query_direct(
+        query, parameters, timeout=timeout, include_embeddings=include_embeddings
+    )
 
 
 async def get_cases_by_provider(provider_name: str) -> list:
@@ -2606,11 +2787,11 @@ async def find_common_providers(case_names: list = None) -> list:
 # =============================================================================
 # Workflow Definition Queries
 # =============================================================================
-# These functions query the workflow structure (phases, workflows, steps, 
+# These functions read the workflow structure (phases, workflows, steps, 
 # landmarks, skills, templates) that was ingested from workflow_engine/ 
-# and workflows/ folders.
-
-WORKFLOW_GROUP_ID = "__workflow_definitions__"
+# and workflows/ folders. They are served from the in-memory workflow
+# catalog (see workflow_catalog.py), which reloads when the ingest scripts
+# stamp a new definitions version. WORKFLOW_GROUP_ID is defined there.
 
 # Group ID for all case data - using a single group enables:
 # - Entity deduplication across cases (e.g., one "Jewish Hospital" node linked to many cases)
@@ -2626,18 +2807,7 @@ async def get_all_phases() -> list:
     Returns:
         List of phases with name, display_name, description, track
     """
-    query = """
-        MATCH (p:Entity)
-        WHERE p.entity_type = 'Phase' AND p.group_id = $group_id
-        RETURN p.name as name, 
-               p.display_name as display_name, 
-               p.description as description,
-               p.track as track,
-               p.order as order,
-               p.next_phase as next_phase
-        ORDER BY p.order
-    """
-    return await run_cypher_query(query, {"group_id": WORKFLOW_GROUP_ID})
+    return (await get_workflow_catalog()).all_phases()
 
 
 async def get_phase_info(phase_name: str) -> dict:
@@ -2650,37 +2820,15 @@ async def get_phase_info(phase_name: str) -> dict:
     Returns:
         Phase information including workflows and landmarks
     """
-    # Get phase details
-    phase_query = """
-        MATCH (p:Entity)
-        WHERE p.name = $phase_name AND p.entity_type = 'Phase' AND p.group_id = $group_id
-        RETURN p.name as name,
-               p.display_name as display_name,
-               p.description as description,
-               p.track as track,
-               p.order as order,
-               p.next_phase as next_phase
-    """
-    phase_results = await run_cypher_query(phase_query, {
-        "phase_name": phase_name, 
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    if not phase_results:
+    catalog = await get_workflow_catalog()
+    phase = catalog.phase(phase_name)
+    if not phase:
         return None
     
-    phase = phase_results[0]
-    
-    # Get workflows for this phase
-    workflows = await get_phase_workflows(phase_name)
-    
-    # Get landmarks for this phase
-    landmarks = await get_phase_landmarks(phase_name)
-    
     return {
         **phase,
-        "workflows": workflows,
-        "landmarks": landmarks,
+        "workflows": catalog.phase_workflows(phase_name),
+        "landmarks": catalog.phase_landmarks(phase_name),
     }
 
 
@@ -2694,21 +2842,7 @@ async def get_phase_workflows(phase_name: str) -> list:
     Returns:
         List of workflows with name, description, instructions_path
     """
-    query = """
-        MATCH (p:Entity)-[:HAS_WORKFLOW]->(w:Entity)
-        WHERE p.name = $phase_name AND p.entity_type = 'Phase' AND p.group_id = $group_id
-              AND w.entity_type = 'WorkflowDef'
-        RETURN w.name as name,
-               w.display_name as display_name,
-               w.description as description,
-               w.instructions_path as instructions_path,
-               w.trigger as trigger
-        ORDER BY w.name
-    """
-    return await run_cypher_query(query, {
-        "phase_name": phase_name,
-        "group_id": WORKFLOW_GROUP_ID
-    })
+    return (await get_workflow_catalog()).phase_workflows(phase_name)
 
 
 async def get_phase_landmarks(phase_name: str) -> list:
@@ -2721,25 +2855,7 @@ async def get_phase_landmarks(phase_name: str) -> list:
     Returns:
         List of landmarks with sub-landmarks
     """
-    query = """
-        MATCH (p:Entity)-[:HAS_LANDMARK]->(l:Entity)
-        WHERE p.name = $phase_name AND p.entity_type = 'Phase' AND p.group_id = $group_id
-              AND l.entity_type = 'Landmark' AND l.parent_landmark IS NULL
-        OPTIONAL MATCH (l)-[:HAS_SUB_LANDMARK]->(sub:Entity)
-        WHERE sub.entity_type = 'Landmark'
-        RETURN l.landmark_id as landmark_id,
-               l.name as name,
-               l.description as description,
-               l.mandatory as mandatory,
-               l.verification_fields as verification_fields,
-               l.order as order,
-               COLLECT(CASE WHEN sub IS NOT NULL THEN sub.name END) as sub_landmarks
-        ORDER BY l.order
-    """
-    return await run_cypher_query(query, {
-        "phase_name": phase_name,
-        "group_id": WORKFLOW_GROUP_ID
-    })
+    return (await get_workflow_catalog()).phase_landmarks(phase_name)
 
 
 async def get_workflow_info(workflow_name: str) -> dict:
@@ -2752,60 +2868,16 @@ async def get_workflow_info(workflow_name: str) -> dict:
     Returns:
         Workflow information including steps, skills, templates
     """
-    # Get workflow details
-    wf_query = """
-        MATCH (w:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-        RETURN w.name as name,
-               w.display_name as display_name,
-               w.description as description,
-               w.phase as phase,
-               w.instructions_path as instructions_path,
-               w.trigger as trigger,
-               w.prerequisites as prerequisites
-    """
-    wf_results = await run_cypher_query(wf_query, {
-        "workflow_name": workflow_name,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    if not wf_results:
+    catalog = await get_workflow_catalog()
+    workflow = catalog.workflow(workflow_name)
+    if not workflow:
         return None
     
-    workflow = wf_results[0]
-    
-    # Get steps
-    steps = await get_workflow_steps(workflow_name)
-    
-    # Get skills
-    skills_query = """
-        MATCH (w:Entity)-[:USES_SKILL]->(s:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-              AND s.entity_type = 'WorkflowSkill'
-        RETURN s.name as name, s.path as path, s.agent_ready as agent_ready
-    """
-    skills = await run_cypher_query(skills_query, {
-        "workflow_name": workflow_name,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    # Get templates
-    templates_query = """
-        MATCH (w:Entity)-[:USES_TEMPLATE]->(t:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-              AND t.entity_type = 'WorkflowTemplate'
-        RETURN t.name as name, t.path as path, t.file_type as file_type
-    """
-    templates = await run_cypher_query(templates_query, {
-        "workflow_name": workflow_name,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
     return {
         **workflow,
-        "steps": steps,
-        "skills": skills,
-        "templates": templates,
+        "steps": catalog.workflow_steps(workflow_name),
+        "skills": catalog.workflow_skills(workflow_name),
+        "templates": catalog.workflow_templates(workflow_name),
     }
 
 
@@ -2819,24 +2891,7 @@ async def get_workflow_steps(workflow_name: str) -> list:
     Returns:
         List of steps with name, owner, can_automate, prompt_user
     """
-    query = """
-        MATCH (w:Entity)-[r:HAS_STEP]->(s:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-              AND s.entity_type = 'WorkflowStep'
-        RETURN s.step_id as step_id,
-               s.name as name,
-               s.description as description,
-               s.owner as owner,
-               s.can_automate as can_automate,
-               s.prompt_user as prompt_user,
-               s.completion_check as completion_check,
-               s.order as order
-        ORDER BY s.order
-    """
-    return await run_cypher_query(query, {
-        "workflow_name": workflow_name,
-        "group_id": WORKFLOW_GROUP_ID
-    })
+    return (await get_workflow_catalog()).workflow_steps(workflow_name)
 
 
 async def get_step_resources(workflow_name: str, step_id: str) -> dict:
@@ -2850,64 +2905,7 @@ async def get_step_resources(workflow_name: str, step_id: str) -> dict:
     Returns:
         Dictionary with skills, checklists, templates, tools
     """
-    # Get skills
-    skills_query = """
-        MATCH (w:Entity)-[:HAS_STEP]->(s:Entity)-[:USES_SKILL]->(sk:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-              AND s.step_id = $step_id AND s.entity_type = 'WorkflowStep'
-        RETURN sk.name as name, sk.path as path
-    """
-    skills = await run_cypher_query(skills_query, {
-        "workflow_name": workflow_name,
-        "step_id": step_id,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    # Get checklists
-    checklists_query = """
-        MATCH (w:Entity)-[:HAS_STEP]->(s:Entity)-[:USES_CHECKLIST]->(c:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-              AND s.step_id = $step_id AND s.entity_type = 'WorkflowStep'
-        RETURN c.name as name, c.path as path
-    """
-    checklists = await run_cypher_query(checklists_query, {
-        "workflow_name": workflow_name,
-        "step_id": step_id,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    # Get templates
-    templates_query = """
-        MATCH (w:Entity)-[:HAS_STEP]->(s:Entity)-[:USES_TEMPLATE]->(t:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-              AND s.step_id = $step_id AND s.entity_type = 'WorkflowStep'
-        RETURN t.name as name, t.path as path
-    """
-    templates = await run_cypher_query(templates_query, {
-        "workflow_name": workflow_name,
-        "step_id": step_id,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    # Get tools
-    tools_query = """
-        MATCH (w:Entity)-[:HAS_STEP]->(s:Entity)-[:USES_TOOL]->(t:Entity)
-        WHERE w.name = $workflow_name AND w.entity_type = 'WorkflowDef' AND w.group_id = $group_id
-              AND s.step_id = $step_id AND s.entity_type = 'WorkflowStep'
-        RETURN t.name as name, t.path as path
-    """
-    tools = await run_cypher_query(tools_query, {
-        "workflow_name": workflow_name,
-        "step_id": step_id,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    return {
-        "skills": skills,
-        "checklists": checklists,
-        "templates": templates,
-        "tools": tools,
-    }
+    return (await get_workflow_catalog()).step_resources(workflow_name, step_id)
 
 
 async def get_applicable_skills(phase_name: str) -> list:
@@ -2920,22 +2918,7 @@ async def get_applicable_skills(phase_name: str) -> list:
     Returns:
         List of skills with capabilities
     """
-    query = """
-        MATCH (s:Entity)-[:APPLIES_TO_PHASE]->(p:Entity)
-        WHERE s.entity_type = 'WorkflowSkill' AND s.group_id = $group_id
-              AND p.name = $phase_name
-        RETURN s.name as name,
-               s.path as path,
-               s.description as description,
-               s.capabilities as capabilities,
-               s.agent_ready as agent_ready,
-               s.quality_score as quality_score
-        ORDER BY s.quality_score DESC
-    """
-    return await run_cypher_query(query, {
-        "phase_name": phase_name,
-        "group_id": WORKFLOW_GROUP_ID
-    })
+    return (await get_workflow_catalog()).applicable_skills(phase_name)
 
 
 async def get_all_checklists() -> list:
@@ -2945,15 +2928,7 @@ async def get_all_checklists() -> list:
     Returns:
         List of checklists with name, path, when_to_use
     """
-    query = """
-        MATCH (c:Entity)
-        WHERE c.entity_type = 'WorkflowChecklist' AND c.group_id = $group_id
-        RETURN c.name as name,
-               c.path as path,
-               c.when_to_use as when_to_use
-        ORDER BY c.name
-    """
-    return await run_cypher_query(query, {"group_id": WORKFLOW_GROUP_ID})
+    return (await get_workflow_catalog()).all_checklists()
 
 
 async def get_workflow_by_landmark(landmark_id: str) -> list:
@@ -2966,24 +2941,13 @@ async def get_workflow_by_landmark(landmark_id: str) -> list:
     Returns:
         List of related workflows
     """
-    # First get the phase for this landmark
-    phase_query = """
-        MATCH (l:Entity)
-        WHERE l.landmark_id = $landmark_id AND l.entity_type = 'Landmark' AND l.group_id = $group_id
-        RETURN l.phase as phase
-    """
-    phase_results = await run_cypher_query(phase_query, {
-        "landmark_id": landmark_id,
-        "group_id": WORKFLOW_GROUP_ID
-    })
-    
-    if not phase_results:
+    catalog = await get_workflow_catalog()
+    phase = catalog.landmark_phase(landmark_id)
+    if not phase:
         return []
     
-    phase = phase_results[0].get('phase')
-    
     # Get workflows for that phase
-    return await get_phase_workflows(phase)
+    return catalog.phase_workflows(phase)
 
 
 # =============================================================================
@@ -3011,12 +2975,9 @@ async def get_case_phase(case_name: str) -> dict:
         Dictionary with phase info: {name, display_name, order, track, entered_at, subphase_name, subphase_display}
         Returns None if case not found or no phase set.
     """
-    query = """
-    // Find case (supports both :Case label and :Entity with entity_type)
-    OPTIONAL MATCH (c1:Case {name: $case_name})
-    OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-    WITH COALESCE(c1, c2) as c
-    WHERE c IS NOT NULL
+    query = f"""
+    // Find case by resolved node id (supports both :Case and :Entity case nodes)
+    {CASE_ANCHOR}
 
     // Find phase
     MATCH (c)-[r:IN_PHASE]->(p)
@@ -3037,7 +2998,7 @@ async def get_case_phase(case_name: str) -> dict:
            sp.order as subphase_order,
            sr.entered_at as subphase_entered_at
     """
-    results = await run_cypher_query(query, {"case_name": case_name})
+    results = await run_cypher_query(query, await case_params(case_name))
     return results[0] if results else None
 
 
@@ -3059,18 +3020,16 @@ async def get_case_landmark_statuses(case_name: str, phase_name: str = None) ->
     """
     if phase_name:
         # Get ALL landmarks for the phase, LEFT JOIN with status via LandmarkStatus nodes
-        query = """
+        query = f"""
+        // Find case by resolved node id (null if the case doesn't exist)
+        {OPTIONAL_CASE_ANCHOR}
+
         // Find phase (supports both :Phase label and :Entity with entity_type)
         MATCH (p)-[:HAS_LANDMARK]->(l)
         WHERE (p:Phase OR (p:Entity AND p.entity_type = 'Phase'))
           AND p.name = $phase_name
           AND (l:Landmark OR (l:Entity AND l.entity_type = 'Landmark'))
 
-        // Find case (supports both :Case label and :Entity with entity_type)
-        OPTIONAL MATCH (c1:Case {name: $case_name})
-        OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-        WITH p, l, COALESCE(c1, c2) as c
-
         // Find status for this landmark
         OPTIONAL MATCH (c)-[:HAS_STATUS]->(ls)-[:FOR_LANDMARK]->(l)
         WHERE (ls:LandmarkStatus OR (ls:Entity AND ls.entity_type = 'LandmarkStatus'))
@@ -3093,20 +3052,18 @@ async def get_case_landmark_statuses(case_name: str, phase_name: str = None) ->
                l.order as order
         ORDER BY l.order, COALESCE(l.landmark_id, l.name)
         """
-        return await run_cypher_query(query, {"case_name": case_name, "phase_name": phase_name})
+        return await run_cypher_query(query, await case_params(case_name, phase_name=phase_name))
     else:
         # Get ALL landmarks, LEFT JOIN with case's status via LandmarkStatus nodes
-        query = """
+        query = f"""
+        // Find case by resolved node id (null if the case doesn't exist)
+        {OPTIONAL_CASE_ANCHOR}
+
         // Find all landmarks (supports both :Landmark label and :Entity with entity_type)
         MATCH (l)
         WHERE (l:Landmark OR (l:Entity AND l.entity_type = 'Landmark'))
           AND l.group_id = '__workflow_definitions__'
 
-        // Find case (supports both :Case label and :Entity with entity_type)
-        OPTIONAL MATCH (c1:Case {name: $case_name})
-        OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-        WITH l, COALESCE(c1, c2) as c
-
         // Find status for this landmark
         OPTIONAL MATCH (c)-[:HAS_STATUS]->(ls)-[:FOR_LANDMARK]->(l)
         WHERE (ls:LandmarkStatus OR (ls:Entity AND ls.entity_type = 'LandmarkStatus'))
@@ -3129,7 +3086,7 @@ async def get_case_landmark_statuses(case_name: str, phase_name: str = None) ->
                l.order as order
         ORDER BY l.phase, l.order, COALESCE(l.landmark_id, l.name)
         """
-        return await run_cypher_query(query, {"case_name": case_name})
+        return await run_cypher_query(query, await case_params(case_name))
 
 
 async def get_landmark_status(case_name: str, landmark_id: str) -> dict:
@@ -3143,12 +3100,9 @@ async def get_landmark_status(case_name: str, landmark_id: str) -> dict:
     Returns:
         Landmark status info or None if not found
     """
-    query = """
-    // Find case (supports both :Case label and :Entity with entity_type)
-    OPTIONAL MATCH (c1:Case {name: $case_name})
-    OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-    WITH COALESCE(c1, c2) as c
-    WHERE c IS NOT NULL
+    query = f"""
+    // Find case by resolved node id
+    {CASE_ANCHOR}
 
     // Find landmark status chain
     MATCH (c)-[:HAS_STATUS]->(ls)-[:FOR_LANDMARK]->(l)
@@ -3170,7 +3124,7 @@ async def get_landmark_status(case_name: str, landmark_id: str) -> dict:
            ls.version as version,
            ls.updated_by as updated_by
     """
-    results = await run_cypher_query(query, {"case_name": case_name, "landmark_id": landmark_id})
+    results = await run_cypher_query(query, await case_params(case_name, landmark_id=landmark_id))
     return results[0] if results else None
 
 
@@ -3211,12 +3165,9 @@ async def update_case_landmark_status(
     status_hash = hashlib.md5(status_key.encode()).hexdigest()
     status_uuid = str(uuid_lib.UUID(status_hash))
 
-    query = """
-    // Find case (try both :Case label and :Entity with entity_type for schema flexibility)
-    OPTIONAL MATCH (c1:Case {name: $case_name})
-    OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-    WITH COALESCE(c1, c2) as c
-    WHERE c IS NOT NULL
+    query = f"""
+    // Find case by resolved node id (:Case label or :Entity with entity_type)
+    {CASE_ANCHOR}
 
     // Find landmark (match by landmark_id OR name property, supports both label patterns)
     MATCH (l)
@@ -3232,7 +3183,7 @@ async def update_case_landmark_status(
     WITH c, l, old_ls, COALESCE(old_ls.version, 0) as current_version
 
     // Create new LandmarkStatus node (with both labels for compatibility)
-    CREATE (new_ls:Entity:LandmarkStatus {
+    CREATE (new_ls:Entity:LandmarkStatus {{
       entity_type: 'LandmarkStatus',
       group_id: 'roscoe_graph',
       uuid: $uuid,
@@ -3246,7 +3197,7 @@ async def update_case_landmark_status(
       updated_at: $now,
       updated_by: $updated_by,
       version: current_version + 1
-    })
+    }})
 
     // Link new status
     MERGE (c)-[:HAS_STATUS]->(new_ls)
@@ -3260,19 +3211,20 @@ async def update_case_landmark_status(
     RETURN new_ls.version as new_version
     """
 
-    params = {
-        "case_name": case_name,
-        "landmark_id": landmark_id,
-        "uuid": status_uuid,
-        "status": status,
-        "sub_steps": sub_steps_json,
-        "notes": notes,
-        "completed_at": completed_at,
-        "now": now,
-        "updated_by": updated_by
-    }
+    params = await case_params(
+        case_name,
+        landmark_id=landmark_id,
+        uuid=status_uuid,
+        status=status,
+        sub_steps=sub_steps_json,
+        notes=notes,
+        completed_at=completed_at,
+        now=now,
+        updated_by=updated_by,
+    )
 
     results = await run_cypher_query(query, params)
+    invalidate_case(case_name)
     return len(results) > 0
 
 
@@ -3311,7 +3263,10 @@ async def check_phase_can_advance(case_name: str, current_phase: str = None) ->
         next_phase = results[0].get("next_phase") if results else None
     
     # Find all hard blockers that are not complete (via LandmarkStatus nodes)
-    blocker_query = """
+    blocker_query = f"""
+    // Find case by resolved node id (null if the case doesn't exist)
+    {OPTIONAL_CASE_ANCHOR}
+
     // Find phase (supports both label patterns)
     MATCH (p)-[:HAS_LANDMARK]->(l)
     WHERE (p:Phase OR (p:Entity AND p.entity_type = 'Phase'))
@@ -3319,11 +3274,6 @@ async def check_phase_can_advance(case_name: str, current_phase: str = None) ->
       AND (l:Landmark OR (l:Entity AND l.entity_type = 'Landmark'))
       AND l.is_hard_blocker = true
 
-    // Find case (supports both label patterns)
-    OPTIONAL MATCH (c1:Case {name: $case_name})
-    OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-    WITH l, COALESCE(c1, c2) as c
-
     // Find status for this landmark
     OPTIONAL MATCH (c)-[:HAS_STATUS]->(ls)-[:FOR_LANDMARK]->(l)
     WHERE (ls:LandmarkStatus OR (ls:Entity AND ls.entity_type = 'LandmarkStatus'))
@@ -3335,10 +3285,7 @@ async def check_phase_can_advance(case_name: str, current_phase: str = None) ->
            COALESCE(l.display_name, l.name) as display_name,
            COALESCE(ls.status, 'not_started') as current_status
     """
-    blocking = await run_cypher_query(blocker_query, {
-        "case_name": case_name,
-        "phase_name": current_phase
-    })
+    blocking = await run_cypher_query(blocker_query, await case_params(case_name, phase_name=current_phase))
     
     return {
         "can_advance": len(blocking) == 0,
@@ -3383,12 +3330,9 @@ async def advance_case_to_phase(case_name: str, target_phase: str, force: bool =
 
     # Remove old IN_PHASE relationship and create new one
     # Support both :Case label and :Entity {entity_type: 'Case'} for schema flexibility
-    query = """
-    // Find case (try both :Case label and :Entity with entity_type)
-    OPTIONAL MATCH (c1:Case {name: $case_name})
-    OPTIONAL MATCH (c2:Entity {entity_type: 'Case', name: $case_name})
-    WITH COALESCE(c1, c2) as c
-    WHERE c IS NOT NULL
+    query = f"""
+    // Find case by resolved node id (:Case label or :Entity with entity_type)
+    {CASE_ANCHOR}
 
     // Remove old IN_PHASE relationship
     OPTIONAL MATCH (c)-[old:IN_PHASE]->()
@@ -3396,8 +3340,8 @@ async def advance_case_to_phase(case_name: str, target_phase: str, force: bool =
     WITH c
 
     // Find target phase (try both :Phase label and :Entity with entity_type)
-    OPTIONAL MATCH (p1:Phase {name: $target_phase})
-    OPTIONAL MATCH (p2:Entity {entity_type: 'Phase', name: $target_phase})
+    OPTIONAL MATCH (p1:Phase {{name: $target_phase}})
+    OPTIONAL MATCH (p2:Entity {{entity_type: 'Phase', name: $target_phase}})
     WITH c, COALESCE(p1, p2) as p
     WHERE p IS NOT NULL
 
@@ -3408,12 +3352,13 @@ async def advance_case_to_phase(case_name: str, target_phase: str, force: bool =
     RETURN c.name as case_name, p.name as new_phase
     """
     
-    results = await run_cypher_query(query, {
-        "case_name": case_name,
-        "target_phase": target_phase,
-        "entered_at": now,
-        "previous_phase": current_phase
-    })
+    results = await run_cypher_query(query, await case_params(
+        case_name,
+        target_phase=target_phase,
+        entered_at=now,
+        previous_phase=current_phase,
+    ))
+    invalidate_case(case_name)
     
     if results:
         return {
@@ -3430,86 +3375,124 @@ async def advance_case_to_phase(case_name: str, target_phase: str, force: bool =
         }
 
 
-async def get_case_workflow_state(case_name: str) -> dict:
-    """
-    Get the complete deterministic workflow state for a case.
-    
-    This is the main query function for the GraphWorkflowStateComputer.
-    
-    Args:
-        case_name: Case name/identifier
-    
-    Returns:
-        Complete state dictionary including:
-        - current_phase with metadata
-        - all landmark statuses grouped by phase
-        - blocking landmarks
-        - next actions
-    """
-    # Get current phase
-    phase = await get_case_phase(case_name)
-    if not phase:
-        return {
-            "case_name": case_name,
-            "error": "Case not found or no phase set",
-            "current_phase": None,
-            "landmarks": {},
-            "blocking_landmarks": [],
-            "can_advance": False
-        }
-    
-    current_phase = phase.get("name")
-    
-    # Get all landmark statuses
-    all_landmarks = await get_case_landmark_statuses(case_name)
-    
-    # Group landmarks by phase
+# Workflow state in ONE round trip: only the case-specific data (phase and the
+# active LandmarkStatus nodes) is queried. Landmark definitions, phase
+# membership (for hard blockers) and ACHIEVED_BY workflows come from the
+# workflow catalog, and can_advance / blocking_landmarks / workflows_needed
+# are derived in memory. Case fields and optional snapshot sections ride
+# along in the same query.
+
+_WORKFLOW_STATE_QUERY = f"""
+    // Find case by resolved node id (:Case label or :Entity with entity_type)
+    {CASE_ANCHOR}
+    WITH c as case
+
+    // Current phase and sub-phase (optional so an uninitialized case still returns its data)
+    OPTIONAL MATCH (case)-[r:IN_PHASE]->(p)
+    WHERE p:Phase OR (p:Entity AND p.entity_type = 'Phase')
+    OPTIONAL MATCH (case)-[sr:IN_SUBPHASE]->(sp)
+    WHERE sp:SubPhase OR (sp:Entity AND sp.entity_type = 'SubPhase')
+    WITH case, r, p, sr, sp
+
+    // The case's active landmark statuses
+    OPTIONAL MATCH (case)-[:HAS_STATUS]->(ls)-[:FOR_LANDMARK]->(l)
+    WHERE (ls:LandmarkStatus OR (ls:Entity AND ls.entity_type = 'LandmarkStatus'))
+      AND ls.archived_at IS NULL
+    WITH case, r, p, sr, sp,
+         collect(CASE WHEN ls IS NULL THEN NULL ELSE {{
+             landmark_id: COALESCE(l.landmark_id, l.name),
+             status: ls.status, case_sub_steps: ls.sub_steps, notes: ls.notes,
+             completed_at: ls.completed_at, updated_at: ls.updated_at,
+             version: ls.version, updated_by: ls.updated_by
+         }} END) as statuses"""
+
+_WORKFLOW_STATE_RETURNS = [
+    "case.name as case_name",
+    "case.case_type as case_type",
+    "case.accident_date as accident_date",
+    "case.sol_status as sol_status",
+    "case.complaint_filed_date as complaint_filed_date",
+    "case.sol_notes as sol_notes",
+    "p.name as phase_name",
+    "p.display_name as phase_display_name",
+    "p.track as phase_track",
+    "COALESCE(p.next_phase_name, p.next_phase) as next_phase",
+    "r.entered_at as phase_entered_at",
+    "sp.name as subphase_name",
+    "sp.display_name as subphase_display",
+    "sr.entered_at as subphase_entered_at",
+]
+
+
+def _build_workflow_state_query(sections: tuple) -> str:
+    """Compose the workflow state query plus the requested case snapshot sections."""
+    carried = ["case", "r", "p", "sr", "sp", "statuses"]
+    lines = [_WORKFLOW_STATE_QUERY]
+    lines.extend(_case_snapshot_clauses(sections, carried))
+    lines.append("        RETURN " + ", ".join(_WORKFLOW_STATE_RETURNS + carried[5:]))
+    return "\n".join(lines)
+
+
+def _derive_workflow_state(case_name: str, row: dict, catalog: WorkflowCatalog) -> dict:
+    """Join the case's statuses onto the catalog landmarks and derive blockers and next actions."""
+    statuses = {s.get("landmark_id"): s for s in row.get("statuses") or []}
+    current_phase = row.get("phase_name")
+
+    # Hard blockers follow the phase's HAS_LANDMARK edges (grouped or not)
+    blocking_landmarks = catalog.blocking_landmarks(
+        current_phase, {landmark_id: s.get("status") for landmark_id, s in statuses.items()}
+    )
+
     landmarks_by_phase = {}
-    for lm in all_landmarks:
-        phase_name = lm.get("phase")
-        if phase_name not in landmarks_by_phase:
-            landmarks_by_phase[phase_name] = []
-        landmarks_by_phase[phase_name].append(lm)
-    
-    # Check if can advance
-    advance_check = await check_phase_can_advance(case_name, current_phase)
-    
-    # Get incomplete landmarks for current phase
+    workflows_needed = []
+    for definition in catalog.landmark_definitions():
+        landmark_id = definition.get("landmark_id") or definition.get("name")
+        status = statuses.get(landmark_id, {})
+        lm = {
+            "landmark_id": landmark_id,
+            "display_name": definition.get("display_name") or definition.get("name"),
+            "phase": definition.get("phase"),
+            "landmark_type": definition.get("landmark_type"),
+            "is_hard_blocker": definition.get("is_hard_blocker"),
+            "can_override": definition.get("can_override"),
+            "landmark_sub_steps": definition.get("sub_steps"),
+            "status": status.get("status") or "not_started",
+            "case_sub_steps": status.get("case_sub_steps"),
+            "notes": status.get("notes"),
+            "completed_at": status.get("completed_at"),
+            "updated_at": status.get("updated_at"),
+            "version": status.get("version"),
+            "updated_by": status.get("updated_by"),
+            "order": definition.get("order"),
+        }
+        landmarks_by_phase.setdefault(lm["phase"], []).append(lm)
+
+        if lm["phase"] == current_phase and lm["status"] not in ["complete", "not_applicable"]:
+            workflows = catalog.achieved_by(landmark_id)
+            if workflows:
+                workflows_needed.append({
+                    "landmark": landmark_id,
+                    "landmark_display": lm["display_name"],
+                    "workflows": workflows
+                })
+
     current_phase_landmarks = landmarks_by_phase.get(current_phase, [])
     incomplete_landmarks = [
-        lm for lm in current_phase_landmarks 
+        lm for lm in current_phase_landmarks
         if lm.get("status") not in ["complete", "not_applicable"]
     ]
-    
-    # Find workflows to complete incomplete landmarks
-    workflows_needed = []
-    for lm in incomplete_landmarks:
-        wf_query = """
-        MATCH (l)-[:ACHIEVED_BY]->(w)
-        WHERE (l:Landmark OR (l:Entity AND l.entity_type = 'Landmark'))
-          AND (l.landmark_id = $landmark_id OR l.name = $landmark_id)
-          AND (w:WorkflowDef OR (w:Entity AND w.entity_type = 'WorkflowDef'))
-        RETURN w.name as workflow_name, w.display_name as display_name, w.description as description
-        """
-        workflows = await run_cypher_query(wf_query, {"landmark_id": lm.get("landmark_id")})
-        if workflows:
-            workflows_needed.append({
-                "landmark": lm.get("landmark_id"),
-                "landmark_display": lm.get("display_name"),
-                "workflows": workflows
-            })
-    
+
     return {
         "case_name": case_name,
         "current_phase": {
             "name": current_phase,
-            "display_name": phase.get("display_name"),
-            "track": phase.get("track"),
-            "entered_at": phase.get("entered_at")
+            "display_name": row.get("phase_display_name"),
+            "track": row.get("phase_track"),
+            "entered_at": row.get("phase_entered_at")
         },
-        "next_phase": advance_check.get("next_phase"),
-        "can_advance": advance_check.get("can_advance"),
-        "blocking_landmarks": advance_check.get("blocking_landmarks", []),
+        "next_phase": row.get("next_phase"),
+        "can_advance": len(blocking_landmarks) == 0,
+        "blocking_landmarks": blocking_landmarks,
         "landmarks_by_phase": landmarks_by_phase,
         "current_phase_landmarks": {
             "total": len(current_phase_landmarks),
@@ -3519,3 +3502,62 @@ async def get_case_workflow_state(case_name: str) -> dict:
         },
         "workflows_needed": workflows_needed
     }
+
+
+async def get_case_workflow_state(case_name: str, case_sections: Optional[list[str]] = None) -> dict:
+    """
+    Get the complete deterministic workflow state for a case in ONE graph round trip.
+
+    This is the main query function for the GraphWorkflowStateComputer.
+
+    Args:
+        case_name: Case name/identifier
+        case_sections: Optional CASE_SNAPSHOT_SECTIONS (client, claims, providers,
+            liens, ...) fetched in the same query and returned under "case"
+
+    Returns:
+        Complete state dictionary including:
+        - current_phase with metadata
+        - all landmark statuses grouped by phase
+        - blocking landmarks
+        - next actions
+        - case: case_type, accident_date, SOL fields and the requested sections
+          (also set on the "no phase set" error when the case exists)
+    """
+    requested = tuple(case_sections or ())
+    unknown = set(requested) - set(CASE_SNAPSHOT_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown case snapshot sections: {sorted(unknown)}")
+
+    catalog = await get_workflow_catalog()
+    results = await run_cypher_query(
+        _build_workflow_state_query(requested),
+        await case_params(case_name),
+    )
+    row = results[0] if results else None
+
+    case = None
+    if row:
+        case = {
+            "case_type": row.get("case_type"),
+            "accident_date": row.get("accident_date"),
+            "sol_status": row.get("sol_status"),
+            "complaint_filed_date": row.get("complaint_filed_date"),
+            "sol_notes": row.get("sol_notes"),
+            **{section: row.get(section) for section in requested},
+        }
+
+    if not row or not row.get("phase_name"):
+        return {
+            "case_name": case_name,
+            "error": "Case not found or no phase set",
+            "current_phase": None,
+            "landmarks": {},
+            "blocking_landmarks": [],
+            "can_advance": False,
+            "case": case,
+        }
+
+    state = _derive_workflow_state(case_name, row, catalog)
+    state["case"] = case
+    return state
@@ -8,6 +8,11 @@ SkillSelectorMiddleware: Semantically matches user requests to relevant skills
 - Parses YAML frontmatter to extract name and description
 - Embeds skill descriptions using sentence-transformers
 - Computes cosine similarity between user query and skills
+- Persists skill embeddings next to the skills (Skills/.embeddings), keyed
+  by a content hash of each skill's description + triggers: only new or
+  edited skills are re-encoded, and the matrix is memory-mapped on load
+- Loads the embedding model lazily (first query or first changed skill),
+  so a restart with unchanged skills doesn't pay for model load + encoding
 - Injects top-matching skills into system prompt
 - Sets skill metadata in request state
 
@@ -20,17 +25,45 @@ This architecture enables:
 
 from typing import Any, Dict, List, Optional
 from pathlib import Path
+import os
 import json
+import hashlib
 import logging
 import asyncio
+import threading
 import re
 import yaml
-from sentence_transformers import SentenceTransformer, util
+import numpy as np
 from langchain.agents.middleware import AgentMiddleware, wrap_model_call
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# all-MiniLM-L6-v2: 384 dimensions, 80MB, optimized for semantic search
+SKILL_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SKILL_EMBEDDINGS_DIRNAME = ".embeddings"
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def _get_model():
+    """Lazily load the sentence-transformers model (shared by all instances)."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import SentenceTransformer
+                _model = SentenceTransformer(SKILL_EMBEDDING_MODEL)
+                logger.info(f"[SKILL SELECTOR] Loaded embedding model {SKILL_EMBEDDING_MODEL}")
+    return _model
+
+
+def _encode(texts) -> np.ndarray:
+    """Encode text(s) to L2-normalized float32 vectors."""
+    vectors = _get_model().encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+    return np.asarray(vectors, dtype=np.float32)
+
 
 def parse_yaml_frontmatter(content: str) -> tuple[Dict, str]:
     """
@@ -91,9 +124,8 @@ class SkillSelectorMiddleware(AgentMiddleware):
         self.max_skills = max_skills
         self.threshold = similarity_threshold
 
-        # Initialize lightweight embedding model (runs locally, no API calls)
-        # all-MiniLM-L6-v2: 384 dimensions, 80MB, optimized for semantic search
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Embeddings (model loaded lazily; see _get_model)
+        self.embeddings_dir = self.skills_dir / SKILL_EMBEDDINGS_DIRNAME
 
         # Scan skills directory and build manifest from SKILL.md files
         self.manifest = self._scan_and_build_manifest()
@@ -118,8 +150,8 @@ class SkillSelectorMiddleware(AgentMiddleware):
             return {"skills": []}
         
         # Scan for SKILL.md files in subdirectories
-        for skill_folder in self.skills_dir.iterdir():
-            if not skill_folder.is_dir():
+        for skill_folder in sorted(self.skills_dir.iterdir()):
+            if not skill_folder.is_dir() or skill_folder.name.startswith('.'):
                 continue
             
             # Check for SKILL.md (case-insensitive for flexibility)
@@ -242,25 +274,88 @@ class SkillSelectorMiddleware(AgentMiddleware):
                 return skill
         return None
 
-    def _embed_skills(self):
+    @staticmethod
+    def _skill_text(skill: Dict) -> str:
+        """Text embedded for a skill: description + triggers for better matching."""
+        desc = skill['description']
+        triggers = ' '.join(skill.get('triggers', []))
+        return f"{desc} {triggers}"
+
+    def _embed_skills(self) -> Optional[np.ndarray]:
         """
-        Pre-compute embeddings for all skill descriptions.
+        Load skill embeddings, re-encoding only new or edited skills.
 
-        Combines description + triggers for richer semantic matching.
-        Embeddings are cached to avoid recomputation on each request.
+        Rows are keyed by a hash of the model name and the embedded text. The
+        stored matrix is memory-mapped; if any key changed, the new matrix
+        (reused rows + newly encoded rows, in manifest order) is written back.
+
+        Returns:
+            (n_skills, dim) float32 matrix with L2-normalized rows, or None
         """
         if not self.manifest['skills']:
             return None
-            
-        skill_texts = []
-        for skill in self.manifest['skills']:
-            # Combine description and triggers for better matching
-            desc = skill['description']
-            triggers = ' '.join(skill.get('triggers', []))
-            text = f"{desc} {triggers}"
-            skill_texts.append(text)
 
-        return self.model.encode(skill_texts, convert_to_tensor=True)
+        texts = [self._skill_text(skill) for skill in self.manifest['skills']]
+        keys = [
+            hashlib.sha256(f"{SKILL_EMBEDDING_MODEL}\n{text}".encode('utf-8')).hexdigest()
+            for text in texts
+        ]
+
+        index_path = self.embeddings_dir / "index.json"
+
+        stored_keys: List[str] = []
+        stored = None
+        try:
+            index = json.loads(index_path.read_text())
+            stored_keys = index["keys"]
+            stored = np.load(self.embeddings_dir / index["matrix"], mmap_mode='r')
+            if stored.shape[0] != len(stored_keys):
+                stored_keys, stored = [], None
+        except (OSError, ValueError, KeyError):
+            stored_keys, stored = [], None
+
+        if keys == stored_keys:
+            logger.info(f"[SKILL SELECTOR] Loaded {len(keys)} skill embeddings from {self.embeddings_dir}")
+            return stored
+
+        row_of = {key: i for i, key in enumerate(stored_keys)}
+        missing = [i for i, key in enumerate(keys) if key not in row_of]
+        encoded = _encode([texts[i] for i in missing]) if missing else None
+
+        dim = encoded.shape[1] if encoded is not None else stored.shape[1]
+        if stored is not None and stored.shape[1] != dim:
+            # Model output changed shape: nothing stored is reusable
+            row_of, missing = {}, list(range(len(keys)))
+            encoded = _encode(texts)
+        matrix = np.empty((len(keys), dim), dtype=np.float32)
+        for i, key in enumerate(keys):
+            if key in row_of:
+                matrix[i] = stored[row_of[key]]
+        if missing:
+            matrix[missing] = encoded
+        logger.info(
+            f"[SKILL SELECTOR] Encoded {len(missing)} new/changed skills, "
+            f"reused {len(keys) - len(missing)}"
+        )
+
+        # Matrix files are named by their keys and written before the index
+        # that points at them, so a crash never pairs keys with the wrong rows
+        matrix_name = f"embeddings-{hashlib.sha256(''.join(keys).encode()).hexdigest()[:16]}.npy"
+        try:
+            self.embeddings_dir.mkdir(parents=True, exist_ok=True)
+            np.save(self.embeddings_dir / matrix_name, matrix)
+            tmp_index = self.embeddings_dir / "index.json.tmp"
+            tmp_index.write_text(json.dumps({
+                "model": SKILL_EMBEDDING_MODEL, "matrix": matrix_name, "keys": keys,
+            }))
+            os.replace(tmp_index, index_path)
+            for old in self.embeddings_dir.glob("embeddings-*.npy"):
+                if old.name != matrix_name:
+                    old.unlink(missing_ok=True)
+            return np.load(self.embeddings_dir / matrix_name, mmap_mode='r')
+        except OSError as e:
+            logger.warning(f"[SKILL SELECTOR] Could not persist skill embeddings: {e}")
+            return matrix
 
     def _select_and_inject_skills(self, request):
         """
@@ -316,21 +411,26 @@ class SkillSelectorMiddleware(AgentMiddleware):
             return request
 
         # Semantic search: encode query and compute cosine similarity
-        query_embedding = self.model.encode(user_query, convert_to_tensor=True)
-        scores = util.cos_sim(query_embedding, self.skill_embeddings)[0]
+        # (rows and query are L2-normalized, so a dot product is the cosine)
+        try:
+            query_embedding = _encode(user_query)
+        except Exception as e:
+            logger.error(f"[SKILL SELECTOR] Could not embed query: {e}")
+            return request
+        scores = self.skill_embeddings @ query_embedding
 
         # Log all scores for debugging
         logger.debug(f"[SKILL SELECTOR] Similarity scores:")
         for idx, skill in enumerate(self.manifest['skills']):
-            score = scores[idx].item()
+            score = float(scores[idx])
             logger.debug(f"  - {skill['name']}: {score:.3f} (threshold: {self.threshold})")
 
         # Get top-k skills above threshold
-        top_indices = scores.argsort(descending=True)[:self.max_skills]
+        top_indices = np.argsort(-scores, kind='stable')[:self.max_skills]
 
         selected_skills = []
         for idx in top_indices:
-            score = scores[idx].item()
+            score = float(scores[idx])
             if score > self.threshold:
                 skill = self.manifest['skills'][idx]
                 skill_content = self._load_skill_file(skill['file'])
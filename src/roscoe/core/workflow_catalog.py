@@ -0,0 +1,406 @@
+"""
+Workflow Definition Catalog
+
+Phases, landmarks, workflows, steps, checklists, skills and templates live
+under group_id '__workflow_definitions__' and only change when
+ingest_workflow_definitions or ingest_all_landmarks runs. Instead of
+re-querying them on every call, the whole definition subgraph is loaded once
+(one node query + one edge query) into an immutable WorkflowCatalog indexed
+by kind and name, so definition lookups are dict hits.
+
+Versioning:
+- The ingest scripts finish by stamping a DefinitionsVersion node with a new
+  version (STAMP_DEFINITIONS_VERSION with definitions_version_params())
+- get_workflow_catalog() re-reads that stamp at most every
+  WORKFLOW_CATALOG_CHECK_SECONDS and, when it changed, loads a new catalog
+  and swaps it in; readers holding the old catalog are unaffected
+- invalidate_workflow_catalog() forces a reload on the next call
+
+Catalog methods return fresh dicts in the same shape as the Cypher queries
+they replace, so callers may modify them.
+"""
+
+import logging
+import os
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_GROUP_ID = "__workflow_definitions__"
+
+WORKFLOW_CATALOG_CHECK_SECONDS = float(os.getenv("WORKFLOW_CATALOG_CHECK_SECONDS", "60"))
+
+# Definition kinds that may also appear without the group_id
+# (ingest_all_landmarks MERGEs landmarks by name only) or as labels
+DEFINITION_KINDS = ["Phase", "SubPhase", "Landmark", "WorkflowDef"]
+
+_DEFINITION_PREDICATE = (
+    "({n}.group_id = $group_id OR {n}.entity_type IN $kinds"
+    " OR {n}:Phase OR {n}:SubPhase OR {n}:Landmark OR {n}:WorkflowDef)"
+)
+
+_NODES_QUERY = f"""
+MATCH (n)
+WHERE {_DEFINITION_PREDICATE.format(n="n")}
+RETURN id(n) as id, labels(n) as labels, properties(n) as props
+"""
+
+_EDGES_QUERY = f"""
+MATCH (a)-[r]->(b)
+WHERE {_DEFINITION_PREDICATE.format(n="a")} AND {_DEFINITION_PREDICATE.format(n="b")}
+RETURN id(a) as src, type(r) as rel, id(b) as dst
+"""
+
+DEFINITIONS_VERSION_NAME = "workflow_definitions"
+
+_VERSION_QUERY = """
+MATCH (v:Entity {entity_type: 'DefinitionsVersion', name: $name})
+RETURN v.version as version
+LIMIT 1
+"""
+
+# Written by the ingest scripts once they finish (params: definitions_version_params())
+STAMP_DEFINITIONS_VERSION = """
+MERGE (v:Entity {entity_type: 'DefinitionsVersion', name: $name})
+SET v.group_id = $group_id, v.version = $version, v.updated_at = $updated_at
+RETURN v.version as version
+"""
+
+
+def _order_key(value) -> tuple:
+    """Sort key matching Cypher's ascending ORDER BY (nulls last)."""
+    return (value is None, value if value is not None else 0)
+
+
+@dataclass(frozen=True)
+class WorkflowCatalog:
+    """Immutable snapshot of the workflow definitions, indexed for lookups."""
+
+    version: Optional[str]
+    nodes: Mapping[int, Mapping[str, Any]]  # node id -> properties (+ "kind")
+    edges: Mapping[int, Mapping[str, Tuple[int, ...]]]  # node id -> rel type -> target ids
+    by_name: Mapping[Tuple[str, str], Tuple[int, ...]]  # (kind, name) -> node ids
+
+    @classmethod
+    def build(cls, version: Optional[str], node_rows: List[Dict], edge_rows: List[Dict]) -> "WorkflowCatalog":
+        """Index the raw node/edge rows of the definition subgraph."""
+        nodes = {}
+        by_name = defaultdict(list)
+        for row in node_rows:
+            props = dict(row.get("props") or {})
+            labels = row.get("labels") or []
+            kind = props.get("entity_type") or next(
+                (label for label in labels if label != "Entity"), None
+            )
+            props["kind"] = kind
+            nodes[row["id"]] = MappingProxyType(props)
+            by_name[(kind, props.get("name"))].append(row["id"])
+            if kind == "Landmark" and props.get("landmark_id") not in (None, props.get("name")):
+                by_name[(kind, props["landmark_id"])].append(row["id"])
+
+        edges = defaultdict(lambda: defaultdict(list))
+        for row in edge_rows:
+            if row["src"] in nodes and row["dst"] in nodes:
+                edges[row["src"]][row["rel"]].append(row["dst"])
+
+        return cls(
+            version=version,
+            nodes=MappingProxyType(nodes),
+            edges=MappingProxyType({
+                src: MappingProxyType({rel: tuple(dsts) for rel, dsts in rels.items()})
+                for src, rels in edges.items()
+            }),
+            by_name=MappingProxyType({key: tuple(ids) for key, ids in by_name.items()}),
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _find(self, kind: str, name: str, grouped: bool = True) -> List[int]:
+        """Node ids of a kind by name (optionally only inside the definitions group)."""
+        ids = self.by_name.get((kind, name), ())
+        if grouped:
+            return [i for i in ids if self.nodes[i].get("group_id") == WORKFLOW_GROUP_ID]
+        return list(ids)
+
+    def _target_ids(self, ids: List[int], rel: str, kind: Optional[str] = None) -> List[int]:
+        """Distinct targets of `rel` edges from any of the given nodes."""
+        targets = []
+        for node_id in ids:
+            for dst in self.edges.get(node_id, {}).get(rel, ()):
+                if dst not in targets and (not kind or self.nodes[dst]["kind"] == kind):
+                    targets.append(dst)
+        return targets
+
+    def _targets(self, ids: List[int], rel: str, kind: Optional[str] = None) -> List[Mapping[str, Any]]:
+        return [self.nodes[dst] for dst in self._target_ids(ids, rel, kind)]
+
+    @staticmethod
+    def _project(node: Mapping[str, Any], fields: List[str]) -> Dict[str, Any]:
+        return {field: node.get(field) for field in fields}
+
+    # ------------------------------------------------------------------
+    # Phases
+    # ------------------------------------------------------------------
+
+    _PHASE_FIELDS = ["name", "display_name", "description", "track", "order", "next_phase"]
+
+    def all_phases(self) -> List[Dict]:
+        """All phases in order."""
+        phases = [
+            node for node in self.nodes.values()
+            if node["kind"] == "Phase" and node.get("group_id") == WORKFLOW_GROUP_ID
+        ]
+        phases.sort(key=lambda p: _order_key(p.get("order")))
+        return [self._project(p, self._PHASE_FIELDS) for p in phases]
+
+    def phase(self, phase_name: str) -> Optional[Dict]:
+        """Phase details, or None."""
+        ids = self._find("Phase", phase_name)
+        return self._project(self.nodes[ids[0]], self._PHASE_FIELDS) if ids else None
+
+    def phase_workflows(self, phase_name: str) -> List[Dict]:
+        """Workflows of a phase (HAS_WORKFLOW), by name."""
+        workflows = self._targets(self._find("Phase", phase_name), "HAS_WORKFLOW", "WorkflowDef")
+        workflows.sort(key=lambda w: _order_key(w.get("name")))
+        fields = ["name", "display_name", "description", "instructions_path", "trigger"]
+        return [self._project(w, fields) for w in workflows]
+
+    def phase_landmarks(self, phase_name: str) -> List[Dict]:
+        """Top-level landmarks of a phase (HAS_LANDMARK) with their sub-landmark names."""
+        landmark_ids = [
+            node_id
+            for node_id in self._target_ids(self._find("Phase", phase_name), "HAS_LANDMARK", "Landmark")
+            if self.nodes[node_id].get("parent_landmark") is None
+        ]
+        landmark_ids.sort(key=lambda node_id: _order_key(self.nodes[node_id].get("order")))
+        fields = ["landmark_id", "name", "description", "mandatory", "verification_fields", "order"]
+        results = []
+        for node_id in landmark_ids:
+            record = self._project(self.nodes[node_id], fields)
+            record["sub_landmarks"] = [
+                sub.get("name") for sub in self._targets([node_id], "HAS_SUB_LANDMARK", "Landmark")
+            ]
+            results.append(record)
+        return results
+
+    def phase_landmark_keys(self, phase_name: str) -> frozenset:
+        """Landmark ids (landmark_id or name) linked to a phase by HAS_LANDMARK."""
+        return frozenset(l["landmark_id"] for l in self.phase_gate_landmarks(phase_name))
+
+    def phase_gate_landmarks(self, phase_name: str) -> List[Dict]:
+        """
+        Landmarks linked to a phase by HAS_LANDMARK, in any group.
+
+        These gate phase advancement: ingest_all_landmarks MERGEs landmarks
+        without a group_id, so landmark_definitions() alone misses them.
+        """
+        landmarks = []
+        seen = set()
+        for l in self._targets(self._find("Phase", phase_name, grouped=False), "HAS_LANDMARK", "Landmark"):
+            landmark_id = l.get("landmark_id") or l.get("name")
+            if landmark_id in seen:
+                continue
+            seen.add(landmark_id)
+            landmarks.append({
+                "landmark_id": landmark_id,
+                "display_name": l.get("display_name") or l.get("name"),
+                "is_hard_blocker": l.get("is_hard_blocker") is True,
+            })
+        return landmarks
+
+    def blocking_landmarks(self, phase_name: str, statuses: Mapping[str, Optional[str]]) -> List[Dict]:
+        """
+        Incomplete hard blockers of a phase.
+
+        Args:
+            phase_name: Phase to check
+            statuses: The case's LandmarkStatus status by landmark id
+        """
+        return [
+            {
+                "landmark_id": l["landmark_id"],
+                "display_name": l["display_name"],
+                "current_status": statuses.get(l["landmark_id"]) or "not_started",
+            }
+            for l in self.phase_gate_landmarks(phase_name)
+            if l["is_hard_blocker"] and statuses.get(l["landmark_id"]) != "complete"
+        ]
+
+    def applicable_skills(self, phase_name: str) -> List[Dict]:
+        """Skills that APPLIES_TO_PHASE the phase, best quality first."""
+        phase_ids = set(self.by_name.get(("Phase", phase_name), ()))
+        skills = [
+            node for node_id, node in self.nodes.items()
+            if node["kind"] == "WorkflowSkill" and node.get("group_id") == WORKFLOW_GROUP_ID
+            and phase_ids.intersection(self.edges.get(node_id, {}).get("APPLIES_TO_PHASE", ()))
+        ]
+        skills.sort(key=lambda s: (s.get("quality_score") is None, -(s.get("quality_score") or 0)))
+        fields = ["name", "path", "description", "capabilities", "agent_ready", "quality_score"]
+        return [self._project(s, fields) for s in skills]
+
+    # ------------------------------------------------------------------
+    # Landmarks
+    # ------------------------------------------------------------------
+
+    def landmark_definitions(self) -> List[Mapping[str, Any]]:
+        """Every landmark in the definitions group, by phase, order and id."""
+        landmarks = [
+            node for node in self.nodes.values()
+            if node["kind"] == "Landmark" and node.get("group_id") == WORKFLOW_GROUP_ID
+        ]
+        landmarks.sort(key=lambda l: (
+            _order_key(l.get("phase")),
+            _order_key(l.get("order")),
+            l.get("landmark_id") or l.get("name") or "",
+        ))
+        return landmarks
+
+    def landmark_phase(self, landmark_id: str) -> Optional[str]:
+        """Phase of a landmark (matched by landmark_id)."""
+        for node_id in self._find("Landmark", landmark_id):
+            if self.nodes[node_id].get("landmark_id") == landmark_id:
+                return self.nodes[node_id].get("phase")
+        return None
+
+    def achieved_by(self, landmark_id: str) -> List[Dict]:
+        """Workflows that complete a landmark (ACHIEVED_BY), matched by landmark_id or name."""
+        workflows = self._targets(self._find("Landmark", landmark_id, grouped=False), "ACHIEVED_BY", "WorkflowDef")
+        return [
+            {"workflow_name": w.get("name"), "display_name": w.get("display_name"), "description": w.get("description")}
+            for w in workflows
+        ]
+
+    # ------------------------------------------------------------------
+    # Workflows, steps and resources
+    # ------------------------------------------------------------------
+
+    def workflow(self, workflow_name: str) -> Optional[Dict]:
+        """Workflow details, or None."""
+        ids = self._find("WorkflowDef", workflow_name)
+        if not ids:
+            return None
+        fields = ["name", "display_name", "description", "phase", "instructions_path", "trigger", "prerequisites"]
+        return self._project(self.nodes[ids[0]], fields)
+
+    def workflow_steps(self, workflow_name: str) -> List[Dict]:
+        """Steps of a workflow (HAS_STEP) in order."""
+        steps = self._targets(self._find("WorkflowDef", workflow_name), "HAS_STEP", "WorkflowStep")
+        steps.sort(key=lambda s: _order_key(s.get("order")))
+        fields = ["step_id", "name", "description", "owner", "can_automate", "prompt_user", "completion_check", "order"]
+        return [self._project(s, fields) for s in steps]
+
+    def workflow_skills(self, workflow_name: str) -> List[Dict]:
+        """Skills a workflow uses (USES_SKILL)."""
+        skills = self._targets(self._find("WorkflowDef", workflow_name), "USES_SKILL", "WorkflowSkill")
+        return [self._project(s, ["name", "path", "agent_ready"]) for s in skills]
+
+    def workflow_templates(self, workflow_name: str) -> List[Dict]:
+        """Templates a workflow uses (USES_TEMPLATE)."""
+        templates = self._targets(self._find("WorkflowDef", workflow_name), "USES_TEMPLATE", "WorkflowTemplate")
+        return [self._project(t, ["name", "path", "file_type"]) for t in templates]
+
+    def step_resources(self, workflow_name: str, step_id: str) -> Dict[str, List[Dict]]:
+        """Skills, checklists, templates and tools used by one workflow step."""
+        step_ids = [
+            node_id
+            for wf_id in self._find("WorkflowDef", workflow_name)
+            for node_id in self.edges.get(wf_id, {}).get("HAS_STEP", ())
+            if self.nodes[node_id]["kind"] == "WorkflowStep" and self.nodes[node_id].get("step_id") == step_id
+        ]
+        return {
+            key: [self._project(r, ["name", "path"]) for r in self._targets(step_ids, rel)]
+            for key, rel in [
+                ("skills", "USES_SKILL"),
+                ("checklists", "USES_CHECKLIST"),
+                ("templates", "USES_TEMPLATE"),
+                ("tools", "USES_TOOL"),
+            ]
+        }
+
+    def all_checklists(self) -> List[Dict]:
+        """All checklists by name."""
+        checklists = [
+            node for node in self.nodes.values()
+            if node["kind"] == "WorkflowChecklist" and node.get("group_id") == WORKFLOW_GROUP_ID
+        ]
+        checklists.sort(key=lambda c: _order_key(c.get("name")))
+        return [self._project(c, ["name", "path", "when_to_use"]) for c in checklists]
+
+
+_catalog: Optional[WorkflowCatalog] = None
+_checked_at = 0.0
+
+
+async def _fetch_version() -> Optional[str]:
+    from roscoe.core.graphiti_client import run_cypher_query
+
+    results = await run_cypher_query(_VERSION_QUERY, {"name": DEFINITIONS_VERSION_NAME})
+    return results[0].get("version") if results else None
+
+
+async def load_workflow_catalog(version: Optional[str] = None) -> WorkflowCatalog:
+    """Load the definition subgraph (two queries) into a new catalog."""
+    from roscoe.core.graphiti_client import run_cypher_query
+
+    params = {"group_id": WORKFLOW_GROUP_ID, "kinds": DEFINITION_KINDS}
+    node_rows = await run_cypher_query(_NODES_QUERY, params)
+    edge_rows = await run_cypher_query(_EDGES_QUERY, params)
+    catalog = WorkflowCatalog.build(version, node_rows or [], edge_rows or [])
+    logger.info(
+        f"[WORKFLOW CATALOG] Loaded version {version}: "
+        f"{len(catalog.nodes)} definitions, {len(edge_rows or [])} relationships"
+    )
+    return catalog
+
+
+async def get_workflow_catalog() -> WorkflowCatalog:
+    """
+    The current workflow catalog.
+
+    The version stamp is checked at most every WORKFLOW_CATALOG_CHECK_SECONDS;
+    a changed stamp loads a new catalog and swaps it in.
+    """
+    global _catalog, _checked_at
+
+    catalog = _catalog
+    now = time.monotonic()
+    if catalog is not None and now - _checked_at < WORKFLOW_CATALOG_CHECK_SECONDS:
+        return catalog
+
+    version = await _fetch_version()
+    if catalog is None or version != catalog.version:
+        catalog = await load_workflow_catalog(version)
+        _catalog = catalog
+    _checked_at = now
+    return catalog
+
+
+def current_catalog_version() -> Optional[str]:
+    """Version of the loaded catalog, without touching the graph (None if not loaded)."""
+    catalog = _catalog
+    return catalog.version if catalog is not None else None
+
+
+def invalidate_workflow_catalog() -> None:
+    """Force a reload on the next get_workflow_catalog() call."""
+    global _catalog
+    _catalog = None
+
+
+def definitions_version_params() -> dict:
+    """Parameters for STAMP_DEFINITIONS_VERSION with a fresh version."""
+    return {
+        "name": DEFINITIONS_VERSION_NAME,
+        "group_id": WORKFLOW_GROUP_ID,
+        "version": uuid.uuid4().hex,
+        "updated_at": datetime.now().isoformat(),
+    }
+
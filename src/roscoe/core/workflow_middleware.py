@@ -19,12 +19,22 @@ The guidance includes:
 - SOL status alerts
 
 Data Source: FalkorDB knowledge graph ONLY (no JSON fallback)
+
+Caching: the computed state and guidance text are materialized per case, so
+steady-state turns skip the graph entirely. Entries are dropped by graph
+writes (case_cache.invalidate_case from the landmark/phase/SOL writers) and
+when a new workflow catalog is loaded (its stamp is re-checked on the
+get_workflow_catalog throttle). The SOL countdown is the only
+time-dependent part and is refreshed in memory when the Eastern day rolls
+over.
 """
 
 from typing import Any, Dict, List, Optional
+from datetime import datetime
 from pathlib import Path
 import logging
 import asyncio
+import pytz
 
 from langchain.agents.middleware import AgentMiddleware
 from langchain_core.messages import SystemMessage
@@ -49,8 +59,23 @@ class WorkflowMiddleware(AgentMiddleware):
     name: str = "workflow"
     tools: list = []
 
-    def __init__(self, workspace_dir: str):
+    def __init__(
+        self,
+        workspace_dir: str,
+        state_cache_size: int = 128,
+        state_cache_ttl: float = 86400.0,
+    ):
         self.workspace_dir = Path(workspace_dir)
+
+        # Materialized workflow state per case (see module docstring).
+        # The TTL is only a backstop for writes made by other processes.
+        # Fills use the cache's fill token, so a state computed while a
+        # write landed is not cached.
+        from roscoe.core.case_cache import get_case_cache
+        self._state_cache = get_case_cache(
+            "workflow_state", maxsize=state_cache_size, ttl=state_cache_ttl
+        )
+
         logger.info(f"[WORKFLOW] Middleware initialized with workspace: {workspace_dir}")
         logger.info(f"[WORKFLOW] Using GRAPH-BASED state computation (FalkorDB)")
     
@@ -81,18 +106,13 @@ class WorkflowMiddleware(AgentMiddleware):
         logger.info(f"[WORKFLOW] Computing workflow state for {project_name}")
 
         try:
-            # Compute workflow state from knowledge graph
-            state = self._compute_state_from_graph(project_name)
+            # Cached or freshly computed guidance for the case
+            guidance = self._get_guidance(project_name, case_info)
 
-            if state is None:
+            if guidance is None:
                 logger.warning(f"[WORKFLOW] No workflow state found in graph for {project_name}")
                 return request
 
-            logger.info(f"[WORKFLOW] State computed from knowledge graph")
-
-            # Format guidance
-            guidance = self._format_workflow_guidance(state, case_info)
-
             # Inject into system prompt
             return self._inject_guidance(request, guidance)
 
@@ -100,6 +120,66 @@ class WorkflowMiddleware(AgentMiddleware):
             logger.error(f"[WORKFLOW] Error computing workflow state: {e}", exc_info=True)
             return request
     
+    def _get_guidance(self, project_name: str, case_info: dict) -> Optional[str]:
+        """
+        Workflow guidance for a case, reusing the materialized state when valid.
+
+        Returns None if the case has no workflow state in the graph.
+        """
+        from roscoe.workflow_engine.orchestrator.graph_state_computer import refresh_sol_countdown
+
+        client_name = case_info.get('client_name', 'Unknown')
+        # Eastern Time day (Kentucky law firm), like the datetime header
+        today = datetime.now(pytz.timezone('America/New_York')).strftime("%Y-%m-%d")
+        catalog_version = self._catalog_version()
+
+        token = self._state_cache.fill_token()
+        entry = self._state_cache.get(project_name)
+        if entry is not None and entry["catalog_version"] == catalog_version:
+            if entry["day"] == today and entry["client_name"] == client_name:
+                logger.info(f"[WORKFLOW] Reusing cached workflow state for {project_name}")
+                return entry["guidance"]
+
+            state = entry["state"]
+            if entry["day"] != today:
+                # Day rolled over - only the SOL countdown changed
+                sol = refresh_sol_countdown(state.get("statute_of_limitations") or {})
+                state = {**state, "statute_of_limitations": sol}
+        else:
+            state = self._compute_state_from_graph(project_name)
+            if state is None:
+                return None
+            logger.info(f"[WORKFLOW] State computed from knowledge graph")
+
+        guidance = self._format_workflow_guidance(state, case_info)
+
+        # Not stored if a write for this case landed while we were computing
+        self._state_cache.set(project_name, {
+            "state": state,
+            "guidance": guidance,
+            "client_name": client_name,
+            "day": today,
+            "catalog_version": catalog_version,
+        }, token=token)
+        return guidance
+
+    @staticmethod
+    def _catalog_version() -> Optional[str]:
+        """
+        Version of the current workflow catalog.
+
+        get_workflow_catalog() re-reads the definitions stamp at most every
+        WORKFLOW_CATALOG_CHECK_SECONDS, so a re-ingest drops cached guidance.
+        """
+        from roscoe.core.async_bridge import run_sync
+        from roscoe.core.workflow_catalog import current_catalog_version, get_workflow_catalog
+
+        try:
+            return run_sync(get_workflow_catalog(), timeout=10).version
+        except Exception as e:
+            logger.warning(f"[WORKFLOW] Could not check workflow catalog version: {e}")
+            return current_catalog_version()
+
     def _compute_state_from_graph(self, project_name: str) -> Optional[Dict[str, Any]]:
         """
         Compute workflow state from FalkorDB knowledge graph.
@@ -864,6 +864,10 @@ async def ingest_all_landmarks():
                     stats["landmark_workflow_rels"] += 1
                     print(f"    -> achieved by: {workflow_name}")
     
+    # Stamp a new definitions version so running agents reload their workflow catalog
+    from roscoe.core.workflow_catalog import STAMP_DEFINITIONS_VERSION, definitions_version_params
+    await run_query(STAMP_DEFINITIONS_VERSION, definitions_version_params())
+
     # Summary
     print("\n" + "=" * 60)
     print("INGESTION COMPLETE")
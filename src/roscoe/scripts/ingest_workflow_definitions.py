@@ -820,6 +820,10 @@ async def main():
     logger.info("=" * 60)
     
     if not args.dry_run and graph:
+        # Stamp a new definitions version so running agents reload their workflow catalog
+        from roscoe.core.workflow_catalog import STAMP_DEFINITIONS_VERSION, definitions_version_params
+        execute_cypher(graph, STAMP_DEFINITIONS_VERSION, definitions_version_params())
+
         # Print summary
         result = execute_cypher(graph, """
             MATCH (n:Entity)
@@ -384,6 +384,17 @@ async def initialize_all_case_states():
         for lm in r.get('landmarks', [])[:3]:
             print(f"    - {lm.get('landmark')}: {lm.get('status')}")
     
+    # Firm-wide SOL / blocker overview (two queries for every case)
+    from roscoe.workflow_engine.orchestrator.firm_dashboard import (
+        compute_firm_dashboard,
+        format_firm_dashboard,
+    )
+    print("\n=== Firm Dashboard ===")
+    try:
+        print(format_firm_dashboard(await compute_firm_dashboard(), limit=10))
+    except Exception as e:
+        print(f"  Error: {e}")
+    
     return stats
 
 
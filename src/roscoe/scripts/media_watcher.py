@@ -22,8 +22,6 @@ Usage:
 
 import os
 import sys
-import time
-import json
 import logging
 import argparse
 import hashlib
@@ -31,6 +29,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Set, Literal
 
+from roscoe.scripts.scan_index import FileKey, ScanIndex, walk_files
+
 # Media file extensions
 IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.tiff', '.svg'}
 AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.webm', '.aac', '.flac', '.ogg'}
@@ -46,7 +46,8 @@ WATCH_DIRECTORIES = [
     "projects",  # Case folders
 ]
 
-# State tracking
+# State tracking (sqlite index; the JSON file is the legacy format, imported once)
+STATE_DB = LOCAL_WORKSPACE / ".sync_metadata" / "media_stubs.sqlite3"
 STATE_FILE = LOCAL_WORKSPACE / ".sync_metadata" / "media_stubs.json"
 LOG_FILE = LOCAL_WORKSPACE / ".sync_metadata" / "media_watcher.log"
 
@@ -75,20 +76,10 @@ def get_file_hash(file_path: Path) -> str:
     return hasher.hexdigest()
 
 
-def load_state() -> dict:
-    """Load state of previously processed media files."""
-    if STATE_FILE.exists():
-        try:
-            return json.loads(STATE_FILE.read_text())
-        except json.JSONDecodeError:
-            return {"processed": {}, "errors": {}}
-    return {"processed": {}, "errors": {}}
-
-
-def save_state(state: dict):
-    """Save state to file."""
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+def open_media_index() -> ScanIndex:
+    """Open the index of processed media files (imports the legacy JSON state once)."""
+    return ScanIndex(STATE_DB, legacy_json=STATE_FILE, legacy_key="processed",
+                     legacy_output_field="stub_path")
 
 
 def get_media_type(path: Path) -> Literal['image', 'audio', 'video', 'unknown']:
@@ -199,17 +190,71 @@ Use the `{tool_name}()` tool:
     return content
 
 
+def check_media(
+    media_path: Path,
+    st: os.stat_result,
+    gcs_workspace: Path,
+    local_workspace: Path,
+    index: ScanIndex,
+) -> tuple[str, Optional[str], Optional[FileKey]]:
+    """
+    Decide whether one media file needs a stub.
+
+    Returns (status, hash, file_key) where status is one of
+    "unchanged", "existing", "create" or "error".
+    """
+    # Get relative path for state tracking
+    try:
+        rel_path = str(media_path.relative_to(gcs_workspace))
+    except ValueError:
+        rel_path = media_path.name
+
+    # Unchanged since last pass - no read needed
+    file_key = FileKey.from_stat(st)
+    if index.is_unchanged(rel_path, file_key):
+        return "unchanged", None, file_key
+
+    try:
+        file_hash = get_file_hash(media_path)
+    except Exception as e:
+        logger.warning(f"Could not hash {rel_path}: {e}")
+        return "error", None, file_key
+
+    if rel_path in index and index.get_hash(rel_path) == file_hash:
+        index.touch(rel_path, file_key)
+        return "unchanged", file_hash, file_key
+
+    # Check if stub already exists locally
+    stub_path = get_stub_path(media_path, gcs_workspace, local_workspace)
+
+    if rel_path not in index and stub_path.exists():
+        # Stub already exists - add to index for tracking
+        logger.debug(f"Stub exists (skipping): {stub_path.name}")
+        index.record(
+            rel_path, file_key, file_hash,
+            str(stub_path.relative_to(local_workspace)),
+            source="existing_sync",
+            media_type=get_media_type(media_path),
+        )
+        return "existing", file_hash, file_key
+
+    return "create", file_hash, file_key
+
+
 def find_new_media(
     gcs_workspace: Path,
     local_workspace: Path,
-    state: dict,
+    index: ScanIndex,
     watch_dirs: list[str] = None
-) -> tuple[list[tuple[Path, str, str]], int]:
+) -> tuple[list[tuple[Path, str, str, FileKey]], int]:
     """
     Find media files that need stub creation.
 
+    Only files whose (size, mtime, generation) changed since the last pass
+    are read.
+
     Returns tuple of:
-    - List of (media_path, hash, media_type) tuples for files needing stubs
+    - List of (media_path, hash, media_type, file_key) tuples for files needing stubs
     - Count of files skipped because stub already exists
     """
     new_media = []
@@ -225,68 +270,45 @@ def find_new_media(
 
         logger.debug(f"Scanning: {watch_path}")
 
-        for media_path in watch_path.rglob("*"):
-            # Skip directories
-            if media_path.is_dir():
-                continue
-
-            # Check if it's a media file
-            ext = media_path.suffix.lower()
-            if ext not in MEDIA_EXTENSIONS:
-                continue
-
-            # Skip hidden directories
-            if any(part.startswith('.') for part in media_path.parts):
-                continue
-
-            # Get relative path for state tracking
-            try:
-                rel_path = str(media_path.relative_to(gcs_workspace))
-            except ValueError:
-                rel_path = media_path.name
-
-            media_type = get_media_type(media_path)
-
-            # Check if already in state file
-            if rel_path in state.get("processed", {}):
-                try:
-                    file_hash = get_file_hash(media_path)
-                except Exception as e:
-                    logger.warning(f"Could not hash {rel_path}: {e}")
-                    continue
-                if state["processed"][rel_path].get("hash") == file_hash:
-                    continue
-
-            # Check if stub already exists locally
-            stub_path = get_stub_path(media_path, gcs_workspace, local_workspace)
-
-            if stub_path.exists():
-                # Stub already exists - add to state for tracking
-                try:
-                    file_hash = get_file_hash(media_path)
-                except Exception as e:
-                    logger.warning(f"Could not hash {rel_path}: {e}")
-                    continue
-
-                logger.debug(f"Stub exists (skipping): {stub_path.name}")
-                state.setdefault("processed", {})[rel_path] = {
-                    "hash": file_hash,
-                    "stub_path": str(stub_path.relative_to(local_workspace)),
-                    "media_type": media_type,
-                    "timestamp": datetime.now().isoformat(),
-                    "source": "existing_sync"
-                }
+        for media_path, st in walk_files(watch_path, MEDIA_EXTENSIONS):
+            status, file_hash, file_key = check_media(media_path, st, gcs_workspace, local_workspace, index)
+            if status == "existing":
                 skipped_existing += 1
-                continue
+            elif status == "create":
+                new_media.append((media_path, file_hash, get_media_type(media_path), file_key))
 
-            # Media file needs stub creation
-            try:
-                file_hash = get_file_hash(media_path)
-            except Exception as e:
-                logger.warning(f"Could not hash {rel_path}: {e}")
-                continue
+    return new_media, skipped_existing
+
+
+def find_changed_media(
+    paths: list[Path],
+    gcs_workspace: Path,
+    local_workspace: Path,
+    index: ScanIndex,
+    watch_dirs: list[str] = None
+) -> tuple[list[tuple[Path, str, str, FileKey]], int]:
+    """Same as find_new_media, but only for the given paths (from a change event)."""
+    new_media = []
+    skipped_existing = 0
+    watch_paths = [gcs_workspace / d for d in (watch_dirs or WATCH_DIRECTORIES)]
+
+    for media_path in dict.fromkeys(paths):
+        if media_path.suffix.lower() not in MEDIA_EXTENSIONS:
+            continue
+        if not any(media_path.is_relative_to(w) for w in watch_paths):
+            continue
+        if any(part.startswith('.') for part in media_path.relative_to(gcs_workspace).parts):
+            continue
+        try:
+            st = media_path.stat()
+        except OSError:
+            continue
 
-            new_media.append((media_path, file_hash, media_type))
+        status, file_hash, file_key = check_media(media_path, st, gcs_workspace, local_workspace, index)
+        if status == "existing":
+            skipped_existing += 1
+        elif status == "create":
+            new_media.append((media_path, file_hash, get_media_type(media_path), file_key))
 
     return new_media, skipped_existing
 
@@ -295,9 +317,10 @@ def process_media_file(
     media_path: Path,
     file_hash: str,
     media_type: str,
+    file_key: FileKey,
     gcs_workspace: Path,
     local_workspace: Path,
-    state: dict,
+    index: ScanIndex,
     dry_run: bool = False
 ) -> bool:
     """
@@ -315,10 +338,8 @@ def process_media_file(
     logger.info(f"Creating stub: {rel_path}")
 
     try:
-        # Get file size
-        size_bytes = media_path.stat().st_size
-
         # Generate stub content
+        size_bytes = file_key.size
         stub_content = create_stub_content(
             media_path, gcs_workspace, media_type, size_bytes
         )
@@ -327,31 +348,32 @@ def process_media_file(
         stub_path.parent.mkdir(parents=True, exist_ok=True)
         stub_path.write_text(stub_content)
 
-        # Update state
-        state.setdefault("processed", {})[rel_path] = {
-            "hash": file_hash,
-            "stub_path": str(stub_path.relative_to(local_workspace)),
-            "media_type": media_type,
-            "timestamp": datetime.now().isoformat(),
-            "size_bytes": size_bytes
-        }
+        # Update index
+        index.record(
+            rel_path, file_key, file_hash,
+            str(stub_path.relative_to(local_workspace)),
+            media_type=media_type,
+            size_bytes=size_bytes,
+        )
 
         logger.info(f"Saved: {stub_path.relative_to(local_workspace)}")
         return True
 
     except Exception as e:
         logger.error(f"Failed to create stub for {rel_path}: {e}")
-        state.setdefault("errors", {})[rel_path] = {
-            "timestamp": datetime.now().isoformat(),
-            "error": str(e)
-        }
+        index.record_error(rel_path, str(e))
         return False
 
 
-def run_once(dry_run: bool = False) -> dict:
+def run_once(dry_run: bool = False, paths: Optional[list[Path]] = None) -> dict:
     """
     Run a single pass: find and create stubs for all new media files.
 
+    Args:
+        dry_run: Show what would be created without doing it
+        paths: Only check these files (change events) instead of walking
+            the watch directories
+
     Returns stats dict.
     """
     stats = {
@@ -362,49 +384,51 @@ def run_once(dry_run: bool = False) -> dict:
         "by_type": {"image": 0, "audio": 0, "video": 0}
     }
 
-    state = load_state()
-    new_media, skipped_existing = find_new_media(GCS_WORKSPACE, LOCAL_WORKSPACE, state)
-
-    # Save state immediately to persist "existing_sync" entries
-    if not dry_run and skipped_existing > 0:
-        save_state(state)
-        logger.info(f"Registered {skipped_existing} existing stubs in state")
-
-    stats["scanned"] = len(new_media) + skipped_existing
-    stats["skipped"] = skipped_existing
-
-    for media_path, file_hash, media_type in new_media:
-        if process_media_file(media_path, file_hash, media_type, GCS_WORKSPACE, LOCAL_WORKSPACE, state, dry_run):
-            stats["created"] += 1
-            stats["by_type"][media_type] += 1
+    index = open_media_index()
+    try:
+        if paths is None:
+            new_media, skipped_existing = find_new_media(GCS_WORKSPACE, LOCAL_WORKSPACE, index)
         else:
-            stats["failed"] += 1
-
-    if not dry_run:
-        save_state(state)
+            new_media, skipped_existing = find_changed_media(paths, GCS_WORKSPACE, LOCAL_WORKSPACE, index)
+
+        # Commit immediately to persist "existing_sync" entries
+        if not dry_run:
+            index.commit()
+            if skipped_existing > 0:
+                logger.info(f"Registered {skipped_existing} existing stubs in index")
+
+        stats["scanned"] = len(new_media) + skipped_existing
+        stats["skipped"] = skipped_existing
+
+        for media_path, file_hash, media_type, file_key in new_media:
+            if process_media_file(media_path, file_hash, media_type, file_key,
+                                  GCS_WORKSPACE, LOCAL_WORKSPACE, index, dry_run):
+                stats["created"] += 1
+                stats["by_type"][media_type] += 1
+            else:
+                stats["failed"] += 1
+
+        if not dry_run:
+            index.commit()
+    finally:
+        # Uncommitted (dry run) changes are discarded on close
+        index.close()
 
     return stats
 
 
-def run_daemon():
-    """
-    Run as daemon: continuously poll for new media files.
+def run_daemon(source: str = "auto"):
     """
-    logger.info("Starting media watcher daemon")
-    logger.info(f"  GCS workspace: {GCS_WORKSPACE}")
-    logger.info(f"  Local workspace: {LOCAL_WORKSPACE}")
-    logger.info(f"  Watch directories: {WATCH_DIRECTORIES}")
-    logger.info(f"  Poll interval: {POLL_INTERVAL}s")
+    Run as daemon: process media files as they change.
 
-    while True:
-        try:
-            stats = run_once()
-            if stats["created"] > 0 or stats["failed"] > 0:
-                logger.info(f"Cycle complete: {stats['created']} created, {stats['failed']} failed")
-        except Exception as e:
-            logger.error(f"Error in watch cycle: {e}")
+    Event-driven through workspace_watcher (inotify / notification queue),
+    polling every POLL_INTERVAL only when neither is available. One full
+    pass runs at startup.
+    """
+    from roscoe.scripts.workspace_watcher import WatchHandler, run_service
 
-        time.sleep(POLL_INTERVAL)
+    handler = WatchHandler("media", frozenset(MEDIA_EXTENSIONS), lambda paths: run_once(paths=paths))
+    run_service([handler], WATCH_DIRECTORIES, source=source, poll_interval=POLL_INTERVAL)
 
 
 def main():
@@ -421,6 +445,12 @@ def main():
         action="store_true",
         help="Show what would be created without doing it"
     )
+    parser.add_argument(
+        "--source",
+        choices=["auto", "inotify", "queue", "poll"],
+        default="auto",
+        help="Daemon change source (default: auto)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -448,7 +478,7 @@ def main():
         print(f"  Failed: {stats['failed']}")
         return 0 if stats["failed"] == 0 else 1
     else:
-        run_daemon()
+        run_daemon(source=args.source)
         return 0
 
 
@@ -21,14 +21,16 @@ Usage:
 import os
 import sys
 import time
-import json
 import logging
 import argparse
 import hashlib
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Set
 
+from roscoe.scripts.scan_index import FileKey, ScanIndex, walk_files
+
 # PDF processing
 try:
     import pdfplumber
@@ -42,6 +44,14 @@ try:
 except ImportError:
     HAS_MARKITDOWN = False
 
+# OCR for scanned pages without a text layer
+try:
+    import pytesseract
+    from pdf2image import convert_from_path
+    HAS_OCR = True
+except ImportError:
+    HAS_OCR = False
+
 # Workspace paths
 GCS_WORKSPACE = Path(os.environ.get("WORKSPACE_ROOT", "/mnt/workspace"))
 LOCAL_WORKSPACE = Path(os.environ.get("LOCAL_WORKSPACE", "/home/aaronwhaley/workspace_local"))
@@ -52,7 +62,8 @@ WATCH_DIRECTORIES = [
     "projects",         # Case folders (each case has Medical-Records, Discovery, etc.)
 ]
 
-# State tracking
+# State tracking (sqlite index; the JSON file is the legacy format, imported once)
+STATE_DB = LOCAL_WORKSPACE / ".sync_metadata" / "pdf_conversions.sqlite3"
 STATE_FILE = LOCAL_WORKSPACE / ".sync_metadata" / "pdf_conversions.json"
 LOG_FILE = LOCAL_WORKSPACE / ".sync_metadata" / "pdf_watcher.log"
 
@@ -70,6 +81,13 @@ logger = logging.getLogger(__name__)
 # Polling interval (seconds)
 POLL_INTERVAL = 60  # Check every minute
 
+# Conversion pipeline
+CONVERSION_WORKERS = int(os.environ.get("PDF_CONVERSION_WORKERS", os.cpu_count() or 1))
+CONVERSION_TIMEOUT = float(os.environ.get("PDF_CONVERSION_TIMEOUT", "900"))  # Per file (seconds)
+PAGE_CHUNK_SIZE = 20     # Pages per parallel chunk for large documents
+OCR_DPI = 300
+OCR_MIN_CHARS = 20       # Pages with less extracted text than this are OCR'd
+
 
 def get_pdf_hash(pdf_path: Path) -> str:
     """Get MD5 hash of PDF file for change detection."""
@@ -81,27 +99,109 @@ def get_pdf_hash(pdf_path: Path) -> str:
     return hasher.hexdigest()
 
 
-def load_conversion_state() -> dict:
-    """Load state of previously converted PDFs."""
-    if STATE_FILE.exists():
-        try:
-            return json.loads(STATE_FILE.read_text())
-        except json.JSONDecodeError:
-            return {"converted": {}, "errors": {}}
-    return {"converted": {}, "errors": {}}
+def open_conversion_index() -> ScanIndex:
+    """Open the index of previously converted PDFs (imports the legacy JSON state once)."""
+    return ScanIndex(STATE_DB, legacy_json=STATE_FILE, legacy_key="converted",
+                     legacy_output_field="markdown_path")
+
+
+def _ocr_page(pdf_path: str, page_number: int) -> str:
+    """OCR a single page (1-based) rendered at OCR_DPI."""
+    images = convert_from_path(pdf_path, dpi=OCR_DPI, first_page=page_number, last_page=page_number)
+    return "\n".join(pytesseract.image_to_string(image) for image in images).strip()
 
 
-def save_conversion_state(state: dict):
-    """Save conversion state to file."""
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+def count_pages(pdf_path: str) -> int:
+    """Number of pages in a PDF."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_pages(pdf_path: str, first_page: int, last_page: int) -> list[tuple[int, str, bool]]:
+    """
+    Extract text from pages first_page..last_page (1-based, inclusive).
+
+    Pages without a usable text layer (scanned records) go through OCR when
+    pytesseract/pdf2image are available.
+
+    Returns list of (page_number, text, ocr_used) for pages that yielded text.
+    """
+    pages = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_number in range(first_page, last_page + 1):
+            page_text = (pdf.pages[page_number - 1].extract_text() or "").strip()
+            ocr_used = False
+            if len(page_text) < OCR_MIN_CHARS and HAS_OCR:
+                try:
+                    ocr_text = _ocr_page(pdf_path, page_number)
+                    if len(ocr_text) > len(page_text):
+                        page_text, ocr_used = ocr_text, True
+                except Exception as e:
+                    logger.warning(f"OCR failed for {pdf_path} page {page_number}: {e}")
+            if page_text:
+                pages.append((page_number, page_text, ocr_used))
+    return pages
+
+
+def convert_with_markitdown(pdf_path: str) -> Optional[str]:
+    """Fallback conversion via markitdown (returns markdown with header, or None)."""
+    if not HAS_MARKITDOWN:
+        return None
+    path = Path(pdf_path)
+    try:
+        md = MarkItDown()
+        result = md.convert(pdf_path)
+        if result and result.text_content:
+            header = f"""---
+source: {path.name}
+converted: {datetime.now().isoformat()}
+converter: markitdown
+---
+
+# {path.stem}
+
+"""
+            return header + result.text_content
+    except Exception as e:
+        logger.error(f"markitdown failed for {pdf_path}: {e}")
+    return None
+
+
+def build_markdown(pdf_path: Path, pages: list[tuple[int, str, bool]]) -> Optional[str]:
+    """Assemble extracted pages (any order) into the markdown document."""
+    if not pages:
+        return None
+    pages = sorted(pages)
+    ocr_pages = sum(1 for _, _, ocr_used in pages if ocr_used)
+    header = f"""---
+source: {pdf_path.name}
+converted: {datetime.now().isoformat()}
+pages: {len(pages)}
+"""
+    if ocr_pages:
+        header += f"ocr_pages: {ocr_pages}\n"
+    header += f"""---
+
+# {pdf_path.stem}
+
+"""
+    return header + "\n\n".join(f"## Page {number}\n\n{text}" for number, text, _ in pages)
+
+
+def page_chunks(page_count: int, chunk_size: int = PAGE_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Split 1..page_count into inclusive (first, last) ranges."""
+    return [
+        (first, min(first + chunk_size - 1, page_count))
+        for first in range(1, page_count + 1, chunk_size)
+    ]
 
 
 def convert_pdf_to_markdown(pdf_path: Path) -> Optional[str]:
     """
-    Convert a PDF to markdown text.
+    Convert a PDF to markdown text (in-process, serial).
 
-    Uses pdfplumber for text extraction. Falls back to markitdown if available.
+    Uses pdfplumber for text extraction with OCR for pages that have no text
+    layer. Falls back to markitdown if available.
 
     Args:
         pdf_path: Path to PDF file
@@ -111,47 +211,105 @@ def convert_pdf_to_markdown(pdf_path: Path) -> Optional[str]:
     """
     if HAS_PDFPLUMBER:
         try:
-            text_parts = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for i, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(f"## Page {i}\n\n{page_text}")
-
-            if text_parts:
-                # Add metadata header
-                header = f"""---
-source: {pdf_path.name}
-converted: {datetime.now().isoformat()}
-pages: {len(text_parts)}
----
-
-# {pdf_path.stem}
-
-"""
-                return header + "\n\n".join(text_parts)
+            markdown = build_markdown(pdf_path, extract_pages(str(pdf_path), 1, count_pages(str(pdf_path))))
+            if markdown:
+                return markdown
         except Exception as e:
             logger.error(f"pdfplumber failed for {pdf_path}: {e}")
 
-    if HAS_MARKITDOWN:
-        try:
-            md = MarkItDown()
-            result = md.convert(str(pdf_path))
-            if result and result.text_content:
-                header = f"""---
-source: {pdf_path.name}
-converted: {datetime.now().isoformat()}
-converter: markitdown
----
+    return convert_with_markitdown(str(pdf_path))
 
-# {pdf_path.stem}
 
-"""
-                return header + result.text_content
+def _submit_conversions(pool, pdf_paths: list[Path], timeout: float) -> list[tuple]:
+    """
+    Queue page counts, then every page chunk of every file, on the pool.
+
+    Returns:
+        [(pdf_path, chunk results or None, error or None, stuck)] where stuck
+        means a worker is still busy with a timed-out task
+    """
+    counts = [(pdf_path, pool.apply_async(count_pages, (str(pdf_path),))) for pdf_path in pdf_paths]
+    jobs = []
+    for pdf_path, count_result in counts:
+        try:
+            page_count = count_result.get(timeout=timeout)
+        except multiprocessing.TimeoutError:
+            jobs.append((pdf_path, None, f"Timed out counting pages after {timeout:.0f}s", True))
+            # Files after this one are resubmitted on a fresh pool
+            break
         except Exception as e:
-            logger.error(f"markitdown failed for {pdf_path}: {e}")
+            jobs.append((pdf_path, [], f"pdfplumber failed: {e}", False))
+            continue
+        chunks = [
+            pool.apply_async(extract_pages, (str(pdf_path), first, last))
+            for first, last in page_chunks(page_count)
+        ]
+        jobs.append((pdf_path, chunks, None, False))
+    return jobs
+
+
+def convert_pdfs(
+    pdf_paths: list[Path],
+    workers: Optional[int] = None,
+    timeout: float = CONVERSION_TIMEOUT,
+):
+    """
+    Convert PDFs in a bounded process pool.
 
-    return None
+    Each PDF is split into PAGE_CHUNK_SIZE page chunks and all chunks are
+    queued on one pool of `workers` processes (default CONVERSION_WORKERS),
+    so a single large record set uses every core and many small files run
+    side by side. Results are yielded per file, in submission order, as soon
+    as that file is complete.
+
+    A file whose chunks don't finish within `timeout` seconds of being
+    awaited is reported as failed, and the pool is killed right away (its
+    workers may be stuck on that file); the remaining files are resubmitted
+    on a fresh pool so they don't time out behind it.
+
+    Yields:
+        (pdf_path, markdown or None, error or None)
+    """
+    workers = max(1, workers if workers is not None else CONVERSION_WORKERS)
+    remaining = list(pdf_paths)
+
+    while remaining:
+        pool = multiprocessing.Pool(processes=workers, maxtasksperchild=50)
+        try:
+            jobs = _submit_conversions(pool, remaining, timeout)
+            remaining = remaining[len(jobs):]
+
+            for n, (pdf_path, chunks, error, stuck) in enumerate(jobs):
+                if chunks is not None:
+                    pages = []
+                    deadline = time.monotonic() + timeout
+                    try:
+                        for chunk in chunks:
+                            pages.extend(chunk.get(timeout=max(0.0, deadline - time.monotonic())))
+                    except multiprocessing.TimeoutError:
+                        error, stuck = f"Timed out after {timeout:.0f}s", True
+                    except Exception as e:
+                        logger.error(f"pdfplumber failed for {pdf_path}: {e}")
+                        pages = []
+
+                if stuck:
+                    yield pdf_path, None, error
+                    remaining = [job[0] for job in jobs[n + 1:]] + remaining
+                    break
+
+                markdown = build_markdown(pdf_path, pages)
+                if markdown is None:
+                    fallback = pool.apply_async(convert_with_markitdown, (str(pdf_path),))
+                    try:
+                        markdown = fallback.get(timeout=timeout)
+                    except multiprocessing.TimeoutError:
+                        yield pdf_path, None, f"markitdown timed out after {timeout:.0f}s"
+                        remaining = [job[0] for job in jobs[n + 1:]] + remaining
+                        break
+                yield pdf_path, markdown, None if markdown else (error or "Conversion returned None")
+        finally:
+            pool.terminate()
+            pool.join()
 
 
 def get_markdown_path(pdf_path: Path, gcs_workspace: Path, local_workspace: Path) -> Path:
@@ -174,24 +332,87 @@ def get_markdown_path(pdf_path: Path, gcs_workspace: Path, local_workspace: Path
     return md_path
 
 
+def check_pdf(
+    pdf_path: Path,
+    st: os.stat_result,
+    gcs_workspace: Path,
+    local_workspace: Path,
+    index: ScanIndex,
+) -> tuple[str, Optional[str], Optional[FileKey]]:
+    """
+    Decide whether one PDF needs conversion.
+
+    Returns (status, hash, file_key) where status is one of:
+    - "unchanged": already converted, stat signature or hash matches
+    - "existing": markdown already on disk, registered in the index
+    - "convert": needs conversion
+    - "error": could not be read
+    """
+    # Get relative path for state tracking
+    try:
+        rel_path = str(pdf_path.relative_to(gcs_workspace))
+    except ValueError:
+        rel_path = pdf_path.name
+
+    # Unchanged since last pass - no read needed
+    file_key = FileKey.from_stat(st)
+    if index.is_unchanged(rel_path, file_key):
+        return "unchanged", None, file_key
+
+    try:
+        pdf_hash = get_pdf_hash(pdf_path)
+    except Exception as e:
+        logger.warning(f"Could not hash {rel_path}: {e}")
+        return "error", None, file_key
+
+    # Already converted, only the stat changed (touched/re-uploaded as-is)
+    if rel_path in index and index.get_hash(rel_path) == pdf_hash:
+        index.touch(rel_path, file_key)
+        return "unchanged", pdf_hash, file_key
+
+    # Check if markdown file already exists locally (either naming convention)
+    # NEW style: filename.pdf.md
+    new_style_md = get_markdown_path(pdf_path, gcs_workspace, local_workspace)
+    # OLD style: filename.md (replace .pdf with .md)
+    old_style_md = local_workspace / Path(rel_path).with_suffix('.md')
+
+    if rel_path not in index and (new_style_md.exists() or old_style_md.exists()):
+        # Markdown already exists - add to index for tracking but don't reconvert
+        existing_path = new_style_md if new_style_md.exists() else old_style_md
+        logger.debug(f"Markdown exists (skipping): {existing_path.name}")
+        index.record(
+            rel_path, file_key, pdf_hash,
+            str(existing_path.relative_to(local_workspace)),
+            source="existing_sync",  # Mark as pre-existing
+        )
+        return "existing", pdf_hash, file_key
+
+    return "convert", pdf_hash, file_key
+
+
 def find_new_pdfs(
     gcs_workspace: Path,
     local_workspace: Path,
-    state: dict,
+    index: ScanIndex,
     watch_dirs: list[str] = None
-) -> tuple[list[tuple[Path, str]], int]:
+) -> tuple[list[tuple[Path, str, FileKey]], int]:
     """
     Find PDFs that need conversion.
 
     Only searches specified directories to avoid scanning the entire workspace
     (which may have thousands of reference PDFs not relevant to active cases).
 
+    Change detection is incremental: a PDF whose (size, mtime, generation)
+    matches the index is skipped without being opened. Only new PDFs and PDFs
+    whose stat changed are hashed; if the hash is unchanged the stat is just
+    refreshed in the index.
+
     Checks for existing markdown files in BOTH naming conventions:
     - OLD style: filename.pdf -> filename.md
     - NEW style: filename.pdf -> filename.pdf.md
 
     Returns tuple of:
-    - List of (pdf_path, hash) tuples for PDFs that need conversion
+    - List of (pdf_path, hash, file_key) tuples for PDFs that need conversion
     - Count of PDFs skipped because markdown already exists
     """
     new_pdfs = []
@@ -208,61 +429,50 @@ def find_new_pdfs(
 
         logger.debug(f"Scanning: {watch_path}")
 
-        for pdf_path in watch_path.rglob("*.pdf"):
-            # Skip hidden directories
-            if any(part.startswith('.') for part in pdf_path.parts):
-                continue
+        for pdf_path, st in walk_files(watch_path, {".pdf"}):
+            status, pdf_hash, file_key = check_pdf(pdf_path, st, gcs_workspace, local_workspace, index)
+            if status == "existing":
+                skipped_existing += 1
+            elif status == "convert":
+                new_pdfs.append((pdf_path, pdf_hash, file_key))
 
-            # Get relative path for state tracking
-            try:
-                rel_path = str(pdf_path.relative_to(gcs_workspace))
-            except ValueError:
-                rel_path = pdf_path.name
+    return new_pdfs, skipped_existing
 
-            # Check if already in state file (already processed)
-            if rel_path in state.get("converted", {}):
-                try:
-                    pdf_hash = get_pdf_hash(pdf_path)
-                except Exception as e:
-                    logger.warning(f"Could not hash {rel_path}: {e}")
-                    continue
-                if state["converted"][rel_path].get("hash") == pdf_hash:
-                    # Already converted with same hash
-                    continue
-
-            # Check if markdown file already exists locally (either naming convention)
-            # NEW style: filename.pdf.md
-            new_style_md = get_markdown_path(pdf_path, gcs_workspace, local_workspace)
-            # OLD style: filename.md (replace .pdf with .md)
-            old_style_md = local_workspace / Path(rel_path).with_suffix('.md')
-
-            if new_style_md.exists() or old_style_md.exists():
-                # Markdown already exists - add to state for tracking but don't reconvert
-                existing_path = new_style_md if new_style_md.exists() else old_style_md
-                try:
-                    pdf_hash = get_pdf_hash(pdf_path)
-                except Exception as e:
-                    logger.warning(f"Could not hash {rel_path}: {e}")
-                    continue
-
-                logger.debug(f"Markdown exists (skipping): {existing_path.name}")
-                state.setdefault("converted", {})[rel_path] = {
-                    "hash": pdf_hash,
-                    "markdown_path": str(existing_path.relative_to(local_workspace)),
-                    "timestamp": datetime.now().isoformat(),
-                    "source": "existing_sync"  # Mark as pre-existing
-                }
-                skipped_existing += 1
-                continue
 
-            # PDF needs conversion - get hash if we haven't already
-            try:
-                pdf_hash = get_pdf_hash(pdf_path)
-            except Exception as e:
-                logger.warning(f"Could not hash {rel_path}: {e}")
-                continue
+def find_changed_pdfs(
+    paths: list[Path],
+    gcs_workspace: Path,
+    local_workspace: Path,
+    index: ScanIndex,
+    watch_dirs: list[str] = None
+) -> tuple[list[tuple[Path, str, FileKey]], int]:
+    """
+    Same as find_new_pdfs, but only for the given paths (from a change event).
 
-            new_pdfs.append((pdf_path, pdf_hash))
+    Paths outside the watch directories, hidden paths, non-PDFs and files
+    that no longer exist are ignored.
+    """
+    new_pdfs = []
+    skipped_existing = 0
+    watch_paths = [gcs_workspace / d for d in (watch_dirs or WATCH_DIRECTORIES)]
+
+    for pdf_path in dict.fromkeys(paths):
+        if pdf_path.suffix.lower() != ".pdf":
+            continue
+        if not any(pdf_path.is_relative_to(w) for w in watch_paths):
+            continue
+        if any(part.startswith('.') for part in pdf_path.relative_to(gcs_workspace).parts):
+            continue
+        try:
+            st = pdf_path.stat()
+        except OSError:
+            continue
+
+        status, pdf_hash, file_key = check_pdf(pdf_path, st, gcs_workspace, local_workspace, index)
+        if status == "existing":
+            skipped_existing += 1
+        elif status == "convert":
+            new_pdfs.append((pdf_path, pdf_hash, file_key))
 
     return new_pdfs, skipped_existing
 
@@ -270,14 +480,20 @@ def find_new_pdfs(
 def process_pdf(
     pdf_path: Path,
     pdf_hash: str,
+    file_key: FileKey,
     gcs_workspace: Path,
     local_workspace: Path,
-    state: dict,
-    dry_run: bool = False
+    index: ScanIndex,
+    dry_run: bool = False,
+    markdown: Optional[str] = None,
+    error: Optional[str] = None,
 ) -> bool:
     """
     Process a single PDF: convert to markdown and save.
 
+    When the pipeline already converted the file, pass its result as
+    markdown/error and only the save + index update happen here.
+
     Returns True if successful, False otherwise.
     """
     md_path = get_markdown_path(pdf_path, gcs_workspace, local_workspace)
@@ -287,17 +503,14 @@ def process_pdf(
         logger.info(f"[DRY RUN] Would convert: {rel_path} -> {md_path}")
         return True
 
-    logger.info(f"Converting: {rel_path}")
-
-    # Convert PDF
-    markdown = convert_pdf_to_markdown(pdf_path)
+    # Convert PDF (unless the pipeline already did)
+    if markdown is None and error is None:
+        logger.info(f"Converting: {rel_path}")
+        markdown = convert_pdf_to_markdown(pdf_path)
 
     if markdown is None:
-        logger.error(f"Failed to convert: {rel_path}")
-        state.setdefault("errors", {})[rel_path] = {
-            "timestamp": datetime.now().isoformat(),
-            "error": "Conversion returned None"
-        }
+        logger.error(f"Failed to convert: {rel_path} ({error or 'Conversion returned None'})")
+        index.record_error(rel_path, error or "Conversion returned None")
         return False
 
     # Save markdown
@@ -305,30 +518,31 @@ def process_pdf(
         md_path.parent.mkdir(parents=True, exist_ok=True)
         md_path.write_text(markdown)
 
-        # Update state
-        state.setdefault("converted", {})[rel_path] = {
-            "hash": pdf_hash,
-            "markdown_path": str(md_path.relative_to(local_workspace)),
-            "timestamp": datetime.now().isoformat(),
-            "size_bytes": len(markdown)
-        }
+        # Update index
+        index.record(
+            rel_path, file_key, pdf_hash,
+            str(md_path.relative_to(local_workspace)),
+            size_bytes=len(markdown),
+        )
 
         logger.info(f"Saved: {md_path.relative_to(local_workspace)}")
         return True
 
     except Exception as e:
         logger.error(f"Failed to save markdown for {rel_path}: {e}")
-        state.setdefault("errors", {})[rel_path] = {
-            "timestamp": datetime.now().isoformat(),
-            "error": str(e)
-        }
+        index.record_error(rel_path, str(e))
         return False
 
 
-def run_once(dry_run: bool = False) -> dict:
+def run_once(dry_run: bool = False, paths: Optional[list[Path]] = None) -> dict:
     """
     Run a single pass: find and convert all new PDFs.
 
+    Args:
+        dry_run: Show what would be converted without doing it
+        paths: Only check these files (change events) instead of walking
+            the watch directories
+
     Returns stats dict.
     """
     stats = {
@@ -338,51 +552,69 @@ def run_once(dry_run: bool = False) -> dict:
         "skipped": 0,
     }
 
-    state = load_conversion_state()
-    new_pdfs, skipped_existing = find_new_pdfs(GCS_WORKSPACE, LOCAL_WORKSPACE, state)
-
-    # Save state immediately to persist "existing_sync" entries found during scan
-    if not dry_run and skipped_existing > 0:
-        save_conversion_state(state)
-        logger.info(f"Registered {skipped_existing} existing markdown files in state")
-
-    stats["scanned"] = len(new_pdfs) + skipped_existing
-    stats["skipped"] = skipped_existing
-
-    for pdf_path, pdf_hash in new_pdfs:
-        if process_pdf(pdf_path, pdf_hash, GCS_WORKSPACE, LOCAL_WORKSPACE, state, dry_run):
-            stats["converted"] += 1
+    index = open_conversion_index()
+    try:
+        if paths is None:
+            new_pdfs, skipped_existing = find_new_pdfs(GCS_WORKSPACE, LOCAL_WORKSPACE, index)
         else:
-            stats["failed"] += 1
-
-    if not dry_run:
-        save_conversion_state(state)
+            new_pdfs, skipped_existing = find_changed_pdfs(paths, GCS_WORKSPACE, LOCAL_WORKSPACE, index)
+
+        # Commit immediately to persist "existing_sync" entries found during scan
+        if not dry_run:
+            index.commit()
+            if skipped_existing > 0:
+                logger.info(f"Registered {skipped_existing} existing markdown files in index")
+
+        stats["scanned"] = len(new_pdfs) + skipped_existing
+        stats["skipped"] = skipped_existing
+
+        # Even a single upload goes through the pool: its page chunks run in
+        # parallel and a hung conversion times out instead of blocking the daemon
+        if dry_run or not new_pdfs or not HAS_PDFPLUMBER:
+            for pdf_path, pdf_hash, file_key in new_pdfs:
+                if process_pdf(pdf_path, pdf_hash, file_key, GCS_WORKSPACE, LOCAL_WORKSPACE, index, dry_run):
+                    stats["converted"] += 1
+                else:
+                    stats["failed"] += 1
+        else:
+            logger.info(f"Converting {len(new_pdfs)} PDFs with {CONVERSION_WORKERS} workers")
+            pending = {pdf_path: (pdf_hash, file_key) for pdf_path, pdf_hash, file_key in new_pdfs}
+            for pdf_path, markdown, error in convert_pdfs(list(pending), workers=CONVERSION_WORKERS):
+                pdf_hash, file_key = pending[pdf_path]
+                if process_pdf(pdf_path, pdf_hash, file_key, GCS_WORKSPACE, LOCAL_WORKSPACE, index,
+                               markdown=markdown, error=error):
+                    stats["converted"] += 1
+                else:
+                    stats["failed"] += 1
+                # Persist progress as files land so an interrupted bulk intake resumes
+                index.commit()
+
+        if not dry_run:
+            index.commit()
+    finally:
+        # Uncommitted (dry run) changes are discarded on close
+        index.close()
 
     return stats
 
 
-def run_daemon():
-    """
-    Run as daemon: continuously poll for new PDFs.
+def run_daemon(source: str = "auto"):
     """
-    logger.info("Starting PDF watcher daemon")
-    logger.info(f"  GCS workspace: {GCS_WORKSPACE}")
-    logger.info(f"  Local workspace: {LOCAL_WORKSPACE}")
-    logger.info(f"  Watch directories: {WATCH_DIRECTORIES}")
-    logger.info(f"  Poll interval: {POLL_INTERVAL}s")
+    Run as daemon: process PDFs as they change.
 
-    while True:
-        try:
-            stats = run_once()
-            if stats["converted"] > 0 or stats["failed"] > 0:
-                logger.info(f"Cycle complete: {stats['converted']} converted, {stats['failed']} failed")
-        except Exception as e:
-            logger.error(f"Error in watch cycle: {e}")
+    Event-driven through workspace_watcher (inotify / notification queue),
+    polling every POLL_INTERVAL only when neither is available. One full
+    pass runs at startup.
+    """
+    from roscoe.scripts.workspace_watcher import WatchHandler, run_service
 
-        time.sleep(POLL_INTERVAL)
+    handler = WatchHandler("pdf", frozenset({".pdf"}), lambda paths: run_once(paths=paths))
+    run_service([handler], WATCH_DIRECTORIES, source=source, poll_interval=POLL_INTERVAL)
 
 
 def main():
+    global CONVERSION_WORKERS
+
     parser = argparse.ArgumentParser(
         description="Watch for new PDFs in GCS and convert to Markdown"
     )
@@ -396,6 +628,18 @@ def main():
         action="store_true",
         help="Show what would be converted without doing it"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Conversion processes (default: {CONVERSION_WORKERS})"
+    )
+    parser.add_argument(
+        "--source",
+        choices=["auto", "inotify", "queue", "poll"],
+        default="auto",
+        help="Daemon change source (default: auto)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -407,6 +651,9 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if args.workers is not None:
+        CONVERSION_WORKERS = args.workers
+
     # Ensure directories exist
     LOCAL_WORKSPACE.mkdir(parents=True, exist_ok=True)
     (LOCAL_WORKSPACE / ".sync_metadata").mkdir(parents=True, exist_ok=True)
@@ -424,7 +671,7 @@ def main():
         print(f"  Failed: {stats['failed']}")
         return 0 if stats["failed"] == 0 else 1
     else:
-        run_daemon()
+        run_daemon(source=args.source)
         return 0
 
 
@@ -0,0 +1,221 @@
+"""
+Incremental Scan Index for the Workspace Watchers
+
+Compact sqlite store of every source file a watcher has already handled,
+keyed by relative path and the file's stat signature:
+
+    (size, mtime_ns, generation)
+
+`generation` is the GCS object generation when the caller knows it (e.g.
+from a notification payload or object metadata), else 0 (unknown). The
+inode number is NOT used: gcsfuse assigns inodes per mount at lookup time,
+so they change on every remount and whenever the kernel drops them, which
+would force a full re-hash. With an unknown generation on either side,
+only (size, mtime_ns) are compared.
+
+A poll only stats each file (metadata from the directory walk). The content
+hash is computed only when the stat signature differs from the stored one,
+and if the hash still matches, only the signature is refreshed. An unchanged
+workspace therefore costs no file reads and no state rewrite.
+
+Writes are row-level upserts committed once per pass, replacing the old
+pattern of rewriting one large JSON file every cycle. A legacy JSON state
+file is imported on first open (entries without a stored signature are
+re-hashed once and then tracked by stat).
+"""
+
+import os
+import json
+import sqlite3
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Iterator, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FileKey(NamedTuple):
+    """Stat signature used for change detection (generation 0 = unknown)."""
+    size: int
+    mtime_ns: int
+    generation: int = 0
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result, generation: Optional[int] = None) -> "FileKey":
+        return cls(st.st_size, st.st_mtime_ns, generation or 0)
+
+    def matches(self, stored: Optional[tuple]) -> bool:
+        """True if a stored signature describes the same content version."""
+        if stored is None or (stored[0], stored[1]) != (self.size, self.mtime_ns):
+            return False
+        return not (stored[2] and self.generation) or stored[2] == self.generation
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    rel_path    TEXT PRIMARY KEY,
+    size        INTEGER,
+    mtime_ns    INTEGER,
+    generation  INTEGER,
+    hash        TEXT,
+    output_path TEXT,
+    source      TEXT,
+    timestamp   TEXT,
+    extra       TEXT
+);
+CREATE TABLE IF NOT EXISTS errors (
+    rel_path  TEXT PRIMARY KEY,
+    timestamp TEXT,
+    error     TEXT
+);
+"""
+
+
+class ScanIndex:
+    """
+    sqlite-backed record of processed files.
+
+    Args:
+        db_path: sqlite database file
+        legacy_json: Old JSON state file to import when the database is new
+        legacy_key: Top-level key of processed entries in the legacy JSON
+            ("converted" for pdf_watcher, "processed" for media_watcher)
+        legacy_output_field: Field holding the output path in legacy entries
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        legacy_json: Optional[Path] = None,
+        legacy_key: str = "converted",
+        legacy_output_field: str = "markdown_path",
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        if legacy_json is not None and self._is_empty() and Path(legacy_json).exists():
+            self._import_legacy(Path(legacy_json), legacy_key, legacy_output_field)
+
+        # Stat signatures are loaded once; lookups during a walk stay in memory
+        self._keys: dict[str, tuple] = {
+            rel_path: (size, mtime_ns, generation)
+            for rel_path, size, mtime_ns, generation in self._conn.execute(
+                "SELECT rel_path, size, mtime_ns, generation FROM files"
+            )
+        }
+
+    def _is_empty(self) -> bool:
+        return self._conn.execute("SELECT 1 FROM files LIMIT 1").fetchone() is None
+
+    def _import_legacy(self, path: Path, key: str, output_field: str):
+        try:
+            state = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not import legacy state {path}: {e}")
+            return
+
+        rows = [
+            (rel_path, entry.get("hash"), entry.get(output_field),
+             entry.get("source"), entry.get("timestamp"))
+            for rel_path, entry in state.get(key, {}).items()
+        ]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO files (rel_path, hash, output_path, source, timestamp) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._conn.commit()
+        logger.info(f"Imported {len(rows)} entries from legacy state {path.name}")
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def is_unchanged(self, rel_path: str, key: FileKey) -> bool:
+        """True if the file was processed and its stat signature still matches."""
+        return key.matches(self._keys.get(rel_path))
+
+    def get_hash(self, rel_path: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT hash FROM files WHERE rel_path = ?", (rel_path,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def touch(self, rel_path: str, key: FileKey):
+        """Refresh the stat signature of a file whose content hash is unchanged."""
+        self._conn.execute(
+            "UPDATE files SET size = ?, mtime_ns = ?, generation = ? WHERE rel_path = ?",
+            (*key, rel_path),
+        )
+        self._keys[rel_path] = tuple(key)
+
+    def record(
+        self,
+        rel_path: str,
+        key: FileKey,
+        file_hash: str,
+        output_path: Optional[str],
+        source: Optional[str] = None,
+        **extra,
+    ):
+        """Upsert a processed file and clear any previous error for it."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files "
+            "(rel_path, size, mtime_ns, generation, hash, output_path, source, timestamp, extra) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (rel_path, *key, file_hash, output_path, source,
+             datetime.now().isoformat(), json.dumps(extra) if extra else None),
+        )
+        self._conn.execute("DELETE FROM errors WHERE rel_path = ?", (rel_path,))
+        self._keys[rel_path] = tuple(key)
+
+    def record_error(self, rel_path: str, error: str):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO errors (rel_path, timestamp, error) VALUES (?, ?, ?)",
+            (rel_path, datetime.now().isoformat(), error),
+        )
+
+    def error_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM errors").fetchone()[0]
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        """Close the database; anything not committed is discarded."""
+        self._conn.close()
+
+
+def walk_files(root: Path, extensions: set[str]) -> Iterator[tuple[Path, os.stat_result]]:
+    """
+    Yield (path, stat) for files under root with one of the given suffixes.
+
+    Uses os.scandir so the walk costs one listing per directory plus one stat
+    per matching file, and prunes hidden directories instead of descending
+    into them and filtering afterwards.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError as e:
+            logger.warning(f"Could not list {current}: {e}")
+            continue
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in extensions:
+                    yield Path(entry.path), entry.stat()
+            except OSError as e:
+                logger.warning(f"Could not stat {entry.path}: {e}")
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Workspace Watcher Service
+
+One event-driven service for the workspace derivers (PDF -> markdown,
+media -> stub). Instead of each watcher sleeping and re-walking `projects/`,
+change sources feed one debounced event stream and each handler receives
+only the paths that changed.
+
+Change sources (pluggable):
+- InotifySource: kernel inotify on local paths (recursive, new directories
+  are picked up as they appear). Only sees writes made through this host.
+- NotificationQueueSource: consumes GCS object-change notifications. The
+  stand-in queue is a local spool directory of JSON messages shaped like
+  GCS Pub/Sub notifications ({"objectId": ..., "eventType": ...}); writers
+  on this host (upload service) publish with publish_notification(). As
+  with Pub/Sub, each service has its own subscription (a subdirectory per
+  handler set) and every subscription receives every message, so the PDF
+  and media daemons never consume each other's notifications.
+- PollingSource: fallback stat walk every N seconds, for filesystems that
+  support neither.
+
+On start each handler runs one full reconcile pass (catches changes made
+while the service was down); after that only changed paths are processed.
+An inotify queue overflow triggers another reconcile, and a long-interval
+safety-net reconcile (WATCHER_RECONCILE_INTERVAL, default 6 hours) catches
+anything no source reported. Polling already walks every interval, so it
+gets no safety-net reconcile.
+
+Usage:
+    # All handlers, best available source
+    python -m roscoe.scripts.workspace_watcher
+
+    # Force a source / handler
+    python -m roscoe.scripts.workspace_watcher --source poll --only pdf
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+import argparse
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional
+
+from roscoe.scripts.scan_index import walk_files
+
+logger = logging.getLogger(__name__)
+
+# Workspace paths
+GCS_WORKSPACE = Path(os.environ.get("WORKSPACE_ROOT", "/mnt/workspace"))
+LOCAL_WORKSPACE = Path(os.environ.get("LOCAL_WORKSPACE", "/home/aaronwhaley/workspace_local"))
+
+# Notification queue stand-in (one subdirectory per subscription, one JSON
+# file per message)
+NOTIFICATION_SPOOL = LOCAL_WORKSPACE / ".sync_metadata" / "notifications"
+
+# Directories to watch (relative to GCS_WORKSPACE)
+WATCH_DIRECTORIES = [
+    "projects",
+]
+
+DEBOUNCE_SECONDS = float(os.environ.get("WATCHER_DEBOUNCE", "1.0"))
+POLL_INTERVAL = float(os.environ.get("WATCHER_POLL_INTERVAL", "60"))
+# Safety-net full reconcile (seconds, 0 = only on start/overflow). Writes from
+# other hosts arrive through the notification queue; this only catches
+# anything that was never notified (inotify on gcsfuse sees local writes only).
+RECONCILE_INTERVAL = float(os.environ.get("WATCHER_RECONCILE_INTERVAL", str(6 * 3600)))
+
+# Sentinel queued by a source when it may have missed events
+RESCAN = None
+
+
+class WatchHandler(NamedTuple):
+    """
+    A deriver attached to the event stream.
+
+    process(paths) handles a batch of changed paths; process(None) runs a
+    full reconcile pass. Both return the watcher's stats dict.
+    """
+    name: str
+    extensions: frozenset
+    process: Callable[[Optional[list[Path]]], dict]
+
+    def matches(self, path: Path) -> bool:
+        return path.suffix.lower() in self.extensions
+
+
+# =============================================================================
+# Change sources
+# =============================================================================
+
+class ChangeSource(ABC):
+    """Base class: run() pushes changed paths (or RESCAN) into the event queue."""
+
+    name = "base"
+
+    def __init__(self, roots: list[Path], extensions: set[str]):
+        self.roots = roots
+        self.extensions = extensions
+
+    @abstractmethod
+    def run(self, events: "queue.Queue", stop: threading.Event):
+        """Push events until stop is set."""
+
+    def start(self, events: "queue.Queue", stop: threading.Event) -> threading.Thread:
+        def _run():
+            try:
+                self.run(events, stop)
+            except Exception as e:
+                logger.error(f"[WATCHER] {self.name} source stopped: {e}")
+                events.put(RESCAN)
+
+        thread = threading.Thread(target=_run, name=f"watcher-{self.name}", daemon=True)
+        thread.start()
+        return thread
+
+
+# inotify constants (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_ONLYDIR
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifySource(ChangeSource):
+    """Recursive inotify watch over the roots (Linux, via libc)."""
+
+    name = "inotify"
+
+    def __init__(self, roots: list[Path], extensions: set[str]):
+        super().__init__(roots, extensions)
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify not available")
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+        # Add watches up front so an unsupported mount fails at construction
+        for root in roots:
+            if root.exists():
+                self._watch_tree(root)
+
+    def _add_watch(self, directory: str):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {directory}: {os.strerror(errno)}")
+        self._dirs[wd] = directory
+
+    def _watch_tree(self, root: Path) -> list[Path]:
+        """Watch root and its subdirectories; return matching files already present."""
+        self._add_watch(str(root))
+        existing = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            for d in dirnames:
+                self._add_watch(os.path.join(dirpath, d))
+            existing.extend(
+                Path(dirpath, f) for f in filenames
+                if os.path.splitext(f)[1].lower() in self.extensions
+            )
+        return existing
+
+    def run(self, events: "queue.Queue", stop: threading.Event):
+        try:
+            while not stop.is_set():
+                ready, _, _ = select.select([self._fd], [], [], 0.5)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                for path, mask in self._parse(data):
+                    if mask & _IN_Q_OVERFLOW:
+                        logger.warning("[WATCHER] inotify queue overflow - scheduling reconcile")
+                        events.put(RESCAN)
+                    elif mask & _IN_ISDIR:
+                        if not path.name.startswith('.') and mask & (_IN_CREATE | _IN_MOVED_TO):
+                            # New (or moved-in) directory: watch it and pick up
+                            # files written before the watch existed
+                            try:
+                                for existing in self._watch_tree(path):
+                                    events.put(existing)
+                            except OSError as e:
+                                logger.warning(f"[WATCHER] {e} - scheduling reconcile")
+                                events.put(RESCAN)
+                    elif path.suffix.lower() in self.extensions and mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                        events.put(path)
+        finally:
+            os.close(self._fd)
+
+    def _parse(self, data: bytes) -> Iterable[tuple[Path, int]]:
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if mask & _IN_Q_OVERFLOW:
+                yield Path("."), mask
+            elif directory and name:
+                yield Path(directory, os.fsdecode(name)), mask
+
+
+class NotificationQueueSource(ChangeSource):
+    """
+    Consumer for GCS object-change notifications.
+
+    Stand-in transport: a spool directory with one subdirectory per
+    subscription; publish_notification writes each message (atomically, one
+    file each) into every subscription. This source consumes its own
+    subscription in name order and deletes messages once handled, so other
+    services' copies are untouched. OBJECT_FINALIZE/OBJECT_METADATA_UPDATE
+    events are forwarded; deletes are ignored (outputs are left in place).
+    """
+
+    name = "queue"
+
+    def __init__(self, roots: list[Path], extensions: set[str], subscription: str = "default",
+                 spool_dir: Path = NOTIFICATION_SPOOL, bucket_root: Path = GCS_WORKSPACE,
+                 interval: float = 0.25):
+        super().__init__(roots, extensions)
+        self.spool_dir = spool_dir / subscription
+        self.bucket_root = bucket_root
+        self.interval = interval
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+
+    def run(self, events: "queue.Queue", stop: threading.Event):
+        while not stop.is_set():
+            try:
+                names = sorted(n for n in os.listdir(self.spool_dir) if n.endswith(".json"))
+            except OSError as e:
+                logger.warning(f"[WATCHER] Could not read notification spool: {e}")
+                names = []
+            for name in names:
+                message_path = self.spool_dir / name
+                try:
+                    message = json.loads(message_path.read_text())
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"[WATCHER] Dropping unreadable notification {name}: {e}")
+                    message = {}
+                object_id = message.get("objectId") or message.get("name")
+                if object_id and message.get("eventType", "OBJECT_FINALIZE") != "OBJECT_DELETE":
+                    path = self.bucket_root / object_id
+                    if path.suffix.lower() in self.extensions:
+                        events.put(path)
+                try:
+                    message_path.unlink()
+                except OSError:
+                    pass
+            stop.wait(self.interval)
+
+
+def publish_notification(
+    object_id: str,
+    event_type: str = "OBJECT_FINALIZE",
+    spool_dir: Path = NOTIFICATION_SPOOL,
+):
+    """
+    Publish an object-change notification to every watcher subscription.
+
+    A service that is not running yet has no subscription and misses the
+    message; its startup reconcile picks the file up instead.
+
+    Args:
+        object_id: Object name relative to the bucket/workspace root
+            (e.g. "projects/Case-Name/uploads/file.pdf")
+        event_type: GCS notification event type
+    """
+    message = json.dumps({"objectId": object_id, "eventType": event_type, "timeCreated": time.time()})
+    name = f"{time.time_ns()}-{os.getpid()}-{threading.get_ident()}.json"
+    try:
+        subscriptions = [entry.path for entry in os.scandir(spool_dir) if entry.is_dir()]
+    except FileNotFoundError:
+        subscriptions = []
+    for subscription in subscriptions:
+        tmp_path = Path(subscription, f".{name}.tmp")
+        tmp_path.write_text(message)
+        os.replace(tmp_path, Path(subscription, name))
+
+
+class PollingSource(ChangeSource):
+    """Fallback: stat-walk the roots every interval and emit new/changed files."""
+
+    name = "poll"
+
+    def __init__(self, roots: list[Path], extensions: set[str], interval: float = POLL_INTERVAL):
+        super().__init__(roots, extensions)
+        self.interval = interval
+
+    def _snapshot(self) -> dict[Path, tuple]:
+        return {
+            path: (st.st_size, st.st_mtime_ns)
+            for root in self.roots if root.exists()
+            for path, st in walk_files(root, self.extensions)
+        }
+
+    def run(self, events: "queue.Queue", stop: threading.Event):
+        # Startup reconcile already covered the current state
+        previous = self._snapshot()
+        while not stop.wait(self.interval):
+            current = self._snapshot()
+            for path, key in current.items():
+                if previous.get(path) != key:
+                    events.put(path)
+            previous = current
+
+
+def build_sources(
+    kind: str,
+    roots: list[Path],
+    extensions: set[str],
+    poll_interval: float = POLL_INTERVAL,
+    subscription: str = "default",
+) -> list[ChangeSource]:
+    """
+    Build the change sources for --source.
+
+    auto = notification queue + inotify, falling back to polling when
+    inotify can't watch the roots (unsupported mount, watch limit).
+    """
+    if kind == "poll":
+        return [PollingSource(roots, extensions, poll_interval)]
+    if kind == "queue":
+        return [NotificationQueueSource(roots, extensions, subscription)]
+    if kind == "inotify":
+        return [InotifySource(roots, extensions)]
+
+    sources: list[ChangeSource] = [NotificationQueueSource(roots, extensions, subscription)]
+    try:
+        sources.append(InotifySource(roots, extensions))
+    except OSError as e:
+        logger.warning(f"[WATCHER] inotify unavailable ({e}) - falling back to polling")
+        sources.append(PollingSource(roots, extensions, poll_interval))
+    return sources
+
+
+# =============================================================================
+# Debounced dispatch
+# =============================================================================
+
+class DebouncedDispatcher:
+    """
+    Collects change events and hands each handler its batch of paths once
+    they have been quiet for `debounce` seconds (coalesces the burst of
+    events a single upload or copy produces).
+    """
+
+    def __init__(self, handlers: list[WatchHandler], debounce: float = DEBOUNCE_SECONDS,
+                 reconcile_interval: float = RECONCILE_INTERVAL):
+        self.handlers = handlers
+        self.debounce = debounce
+        self.reconcile_interval = reconcile_interval
+        self.events: "queue.Queue" = queue.Queue()
+        self._pending: dict[Path, float] = {}
+
+    def reconcile(self):
+        """Full pass for every handler."""
+        for handler in self.handlers:
+            self._run(handler, None)
+
+    def _run(self, handler: WatchHandler, paths: Optional[list[Path]]):
+        try:
+            stats = handler.process(paths)
+            label = "reconcile" if paths is None else f"{len(paths)} changed"
+            logger.info(f"[WATCHER] {handler.name} ({label}): {stats}")
+        except Exception as e:
+            logger.error(f"[WATCHER] {handler.name} handler failed: {e}")
+
+    def run(self, stop: threading.Event):
+        last_reconcile = time.monotonic()
+        while not stop.is_set():
+            timeout = self.debounce / 2 if self._pending else 1.0
+            try:
+                item = self.events.get(timeout=timeout)
+                # Drain everything queued so far, then flush whatever is ready,
+                # so a steady event stream can't starve the handlers
+                while True:
+                    if item is RESCAN:
+                        self._pending.clear()
+                        self.reconcile()
+                        last_reconcile = time.monotonic()
+                    else:
+                        self._pending[item] = time.monotonic()
+                    item = self.events.get_nowait()
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            ready = [p for p, seen in self._pending.items() if now - seen >= self.debounce]
+            if ready:
+                for path in ready:
+                    del self._pending[path]
+                for handler in self.handlers:
+                    batch = [p for p in ready if handler.matches(p)]
+                    if batch:
+                        self._run(handler, batch)
+
+            if self.reconcile_interval and now - last_reconcile >= self.reconcile_interval:
+                self.reconcile()
+                last_reconcile = time.monotonic()
+
+
+def run_service(
+    handlers: list[WatchHandler],
+    watch_dirs: list[str],
+    source: str = "auto",
+    debounce: float = DEBOUNCE_SECONDS,
+    poll_interval: float = POLL_INTERVAL,
+):
+    """Reconcile once, then process change events until interrupted."""
+    roots = [GCS_WORKSPACE / d for d in watch_dirs]
+    extensions = set().union(*(h.extensions for h in handlers))
+
+    logger.info("Starting workspace watcher")
+    logger.info(f"  GCS workspace: {GCS_WORKSPACE}")
+    logger.info(f"  Watch directories: {watch_dirs}")
+    logger.info(f"  Handlers: {[h.name for h in handlers]}")
+
+    # One notification subscription per handler set
+    subscription = "+".join(sorted(h.name for h in handlers))
+    sources = build_sources(source, roots, extensions, poll_interval, subscription)
+    # A polling source already walks everything each interval
+    polling = any(isinstance(s, PollingSource) for s in sources)
+    dispatcher = DebouncedDispatcher(
+        handlers, debounce=debounce, reconcile_interval=0 if polling else RECONCILE_INTERVAL
+    )
+    stop = threading.Event()
+
+    # Sources start first so nothing written during the reconcile is missed
+    for change_source in sources:
+        change_source.start(dispatcher.events, stop)
+    logger.info(f"  Sources: {[s.name for s in sources]}")
+
+    dispatcher.reconcile()
+    try:
+        dispatcher.run(stop)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+
+
+def default_handlers(only: Optional[str] = None) -> list[WatchHandler]:
+    """PDF converter and media stub handlers (imported lazily)."""
+    handlers = []
+    if only in (None, "pdf"):
+        from roscoe.scripts import pdf_watcher
+        handlers.append(WatchHandler("pdf", frozenset({".pdf"}),
+                                     lambda paths: pdf_watcher.run_once(paths=paths)))
+    if only in (None, "media"):
+        from roscoe.scripts import media_watcher
+        handlers.append(WatchHandler("media", frozenset(media_watcher.MEDIA_EXTENSIONS),
+                                     lambda paths: media_watcher.run_once(paths=paths)))
+    return handlers
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Event-driven watcher for PDF conversion and media stubs"
+    )
+    parser.add_argument(
+        "--source",
+        choices=["auto", "inotify", "queue", "poll"],
+        default="auto",
+        help="Change source (default: auto = notification queue + inotify, polling fallback)"
+    )
+    parser.add_argument(
+        "--only",
+        choices=["pdf", "media"],
+        default=None,
+        help="Run a single handler"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEBOUNCE_SECONDS,
+        help=f"Seconds a path must be quiet before processing (default: {DEBOUNCE_SECONDS})"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Verbose output"
+    )
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    run_service(default_handlers(args.only), WATCH_DIRECTORIES, source=args.source, debounce=args.debounce)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+"""
+CalendarEvent Label and Index Migration for FalkorDB
+
+Calendar events were stored as generic `:Entity {entity_type: 'CalendarEvent'}`
+nodes, so every calendar lookup (including the overdue/today query that runs on
+each model call) scanned every Entity node in the firm graph. This migration
+gives them a dedicated label with range indexes so lookups stay
+O(matching events).
+
+Changes:
+- Adds the :CalendarEvent label to existing calendar Entity nodes (the :Entity
+  label and entity_type property are kept for backward compatibility)
+- Indexes on :CalendarEvent name, event_date, status and case_name
+
+graph_manager writes new events with both labels and applies the same
+idempotent steps once per process (ensure_calendar_schema), so running this
+migration is safe before or after a deploy.
+
+Usage:
+    # Normal migration (executes changes)
+    python add_calendar_event_indexes.py
+
+    # Dry run (shows what would be done)
+    python add_calendar_event_indexes.py --dry-run
+
+    # Validate schema without changes
+    python add_calendar_event_indexes.py --validate
+
+    # Rollback (remove CalendarEvent indexes)
+    python add_calendar_event_indexes.py --rollback
+
+Requirements:
+    - FalkorDB running and accessible
+    - falkordb-py package installed
+    - FALKORDB_HOST and FALKORDB_PORT environment variables (or defaults)
+"""
+
+import os
+import sys
+import logging
+import argparse
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+
+try:
+    from falkordb import FalkorDB
+except ImportError:
+    print("ERROR: falkordb package not installed. Run: pip install falkordb")
+    sys.exit(1)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+FALKORDB_HOST = os.getenv("FALKORDB_HOST", "roscoe-graphdb")
+FALKORDB_PORT = int(os.getenv("FALKORDB_PORT", "6379"))
+GRAPH_NAME = "roscoe_graph"
+
+# Log file location
+LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
+LOG_FILE = os.path.join(LOG_DIR, f"migration_calendar_event_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+
+
+# =============================================================================
+# Index Definitions
+# =============================================================================
+
+@dataclass
+class IndexDefinition:
+    """Defines an index to be created"""
+    label: str
+    property: str
+
+    def create_query(self) -> str:
+        """Generate CREATE INDEX query (FalkorDB simple syntax)"""
+        return f"CREATE INDEX ON :{self.label}({self.property})"
+
+    def drop_query(self) -> str:
+        """Generate DROP INDEX query"""
+        return f"DROP INDEX ON :{self.label}({self.property})"
+
+    def __str__(self) -> str:
+        return f":{self.label}({self.property})"
+
+
+# CalendarEvent indexes (must match graph_manager.CALENDAR_EVENT_INDEXES)
+CALENDAR_EVENT_INDEXES = [
+    # Event ID lookups (complete/update by event_id, HasEvent linking)
+    IndexDefinition("CalendarEvent", "name"),
+
+    # Date ranges (overdue/today, upcoming, start/end filters)
+    IndexDefinition("CalendarEvent", "event_date"),
+
+    # pending/completed/cancelled filters
+    IndexDefinition("CalendarEvent", "status"),
+
+    # Per-case calendars
+    IndexDefinition("CalendarEvent", "case_name"),
+]
+
+# Adds the dedicated label to calendar events stored as generic Entity nodes
+BACKFILL_LABEL_QUERY = """
+MATCH (e:Entity)
+WHERE e.entity_type = 'CalendarEvent' AND NOT e:CalendarEvent
+SET e:CalendarEvent
+RETURN count(e) as labeled
+"""
+
+COUNT_UNLABELED_QUERY = """
+MATCH (e:Entity)
+WHERE e.entity_type = 'CalendarEvent' AND NOT e:CalendarEvent
+RETURN count(e) as unlabeled
+"""
+
+# Sample queries to validate CalendarEvent schema
+VALIDATION_QUERIES = [
+    "MATCH (e:Entity) WHERE e.entity_type = 'CalendarEvent' RETURN count(e) as calendar_entity_count",
+    "MATCH (e:CalendarEvent) RETURN count(e) as calendar_event_count",
+    "CALL db.indexes() YIELD label, properties RETURN label, properties",
+]
+
+
+# =============================================================================
+# Logging Setup
+# =============================================================================
+
+def setup_logging(verbose: bool = False) -> logging.Logger:
+    """Configure logging to file and console"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    logger = logging.getLogger("migration_calendar_event")
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+    # File handler (always DEBUG level)
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setLevel(logging.DEBUG)
+    file_formatter = logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    file_handler.setFormatter(file_formatter)
+    logger.addHandler(file_handler)
+
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
+    console_formatter = logging.Formatter('%(levelname)s - %(message)s')
+    console_handler.setFormatter(console_formatter)
+    logger.addHandler(console_handler)
+
+    return logger
+
+
+# =============================================================================
+# Database Operations
+# =============================================================================
+
+class MigrationManager:
+    """Manages CalendarEvent label/index migration"""
+
+    def __init__(self, dry_run: bool = False, verbose: bool = False):
+        self.dry_run = dry_run
+        self.logger = setup_logging(verbose)
+        self.db = None
+        self.graph = None
+        self.errors: List[str] = []
+
+    def connect(self) -> bool:
+        """Connect to FalkorDB"""
+        try:
+            self.logger.info(f"Connecting to FalkorDB at {FALKORDB_HOST}:{FALKORDB_PORT}")
+            self.db = FalkorDB(host=FALKORDB_HOST, port=FALKORDB_PORT)
+            self.graph = self.db.select_graph(GRAPH_NAME)
+            self.logger.info(f"Connected to graph: {GRAPH_NAME}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to connect to FalkorDB: {e}")
+            self.errors.append(f"Connection failed: {e}")
+            return False
+
+    def execute_query(self, query: str, params: Optional[Dict] = None, read_only: bool = False) -> Any:
+        """Execute a Cypher query (read-only queries also run in dry-run mode)"""
+        try:
+            self.logger.debug(f"Executing query: {query}")
+            if params:
+                self.logger.debug(f"Parameters: {params}")
+
+            if self.dry_run and not read_only:
+                self.logger.info(f"[DRY RUN] Would execute: {query.strip()}")
+                return None
+
+            result = self.graph.query(query, params or {})
+            self.logger.debug("Query executed successfully")
+            return result
+        except Exception as e:
+            self.logger.error(f"Query failed: {query}")
+            self.logger.error(f"Error: {e}")
+            self.errors.append(f"Query failed: {query} - {e}")
+            raise
+
+    def validate_existing_schema(self) -> bool:
+        """Validate that existing schema is intact"""
+        self.logger.info("=" * 80)
+        self.logger.info("Validating existing schema...")
+        self.logger.info("=" * 80)
+
+        try:
+            for query in VALIDATION_QUERIES:
+                self.logger.info(f"Running validation: {query}")
+                result = self.execute_query(query, read_only=True)
+
+                if result and hasattr(result, 'result_set'):
+                    for row in result.result_set:
+                        self.logger.info(f"  Result: {row}")
+
+            self.logger.info("Existing schema validation PASSED")
+            return True
+        except Exception as e:
+            self.logger.error(f"Schema validation FAILED: {e}")
+            return False
+
+    def count_unlabeled(self) -> int:
+        """Count calendar Entity nodes still missing the :CalendarEvent label"""
+        result = self.execute_query(COUNT_UNLABELED_QUERY, read_only=True)
+        if result and hasattr(result, 'result_set') and result.result_set:
+            return result.result_set[0][0]
+        return 0
+
+    def backfill_label(self) -> bool:
+        """Add the :CalendarEvent label to existing calendar events"""
+        self.logger.info("=" * 80)
+        self.logger.info("Labeling existing calendar events...")
+        self.logger.info("=" * 80)
+
+        try:
+            unlabeled = self.count_unlabeled()
+            self.logger.info(f"  Calendar events without :CalendarEvent label: {unlabeled}")
+            if unlabeled == 0:
+                self.logger.info("SKIP: All calendar events already labeled")
+                return True
+
+            result = self.execute_query(BACKFILL_LABEL_QUERY)
+            if result and hasattr(result, 'result_set') and result.result_set:
+                self.logger.info(f"  SUCCESS: Labeled {result.result_set[0][0]} calendar events")
+            return True
+        except Exception as e:
+            self.logger.error(f"Label backfill failed: {e}")
+            return False
+
+    def check_existing_indexes(self) -> List[str]:
+        """Check which CalendarEvent indexes already exist"""
+        self.logger.info("Checking for existing CalendarEvent indexes...")
+
+        try:
+            result = self.execute_query(
+                "CALL db.indexes() YIELD label, properties RETURN label, properties",
+                read_only=True,
+            )
+            existing = []
+
+            if result and hasattr(result, 'result_set'):
+                for row in result.result_set:
+                    label = row[0]
+                    props = row[1] if len(row) > 1 else []
+
+                    if label == "CalendarEvent":
+                        for prop in props:
+                            index_str = f":{label}({prop})"
+                            existing.append(index_str)
+                            self.logger.info(f"  Found existing index: {index_str}")
+
+            if not existing:
+                self.logger.info("  No existing CalendarEvent indexes found")
+
+            return existing
+        except Exception as e:
+            self.logger.warning(f"Could not check existing indexes: {e}")
+            return []
+
+    def create_indexes(self) -> bool:
+        """Create CalendarEvent indexes"""
+        self.logger.info("=" * 80)
+        self.logger.info("Creating CalendarEvent indexes...")
+        self.logger.info("=" * 80)
+
+        existing = self.check_existing_indexes()
+        created_count = 0
+        skipped_count = 0
+
+        for index_def in CALENDAR_EVENT_INDEXES:
+            index_str = str(index_def)
+
+            if index_str in existing:
+                self.logger.info(f"SKIP: Index already exists: {index_str}")
+                skipped_count += 1
+                continue
+
+            try:
+                self.logger.info(f"Creating index: {index_str}")
+                self.execute_query(index_def.create_query())
+                created_count += 1
+                self.logger.info(f"  SUCCESS: Created {index_str}")
+            except Exception as e:
+                self.logger.warning(f"  Could not create {index_str}: {e}")
+
+        self.logger.info(f"\nIndex creation summary: {created_count} created, {skipped_count} skipped")
+        return True
+
+    def drop_indexes(self) -> bool:
+        """Drop CalendarEvent indexes (rollback)"""
+        self.logger.info("=" * 80)
+        self.logger.info("Rolling back CalendarEvent indexes...")
+        self.logger.info("=" * 80)
+
+        dropped_count = 0
+
+        for index_def in CALENDAR_EVENT_INDEXES:
+            try:
+                self.logger.info(f"Dropping index: {index_def}")
+                self.execute_query(index_def.drop_query())
+                dropped_count += 1
+                self.logger.info(f"  SUCCESS: Dropped {index_def}")
+            except Exception as e:
+                # Index might not exist - log as warning
+                self.logger.warning(f"  Could not drop {index_def}: {e}")
+
+        self.logger.info(f"\nRollback summary: {dropped_count} indexes dropped")
+        return True
+
+    def run_migration(self) -> bool:
+        """Execute full migration"""
+        self.logger.info("=" * 80)
+        self.logger.info("STARTING CALENDAREVENT LABEL/INDEX MIGRATION")
+        self.logger.info("=" * 80)
+        self.logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
+        self.logger.info(f"Database: {FALKORDB_HOST}:{FALKORDB_PORT}")
+        self.logger.info(f"Graph: {GRAPH_NAME}")
+        self.logger.info(f"Log file: {LOG_FILE}")
+        self.logger.info("")
+
+        # Step 1: Connect
+        if not self.connect():
+            return False
+
+        # Step 2: Validate existing schema
+        if not self.validate_existing_schema():
+            self.logger.error("ABORT: Existing schema validation failed")
+            return False
+
+        # Step 3: Label existing events
+        if not self.backfill_label():
+            self.logger.error("ABORT: Label backfill failed")
+            return False
+
+        # Step 4: Create indexes
+        if not self.create_indexes():
+            self.logger.error("ABORT: Index creation failed")
+            return False
+
+        # Step 5: Final validation
+        self.logger.info("=" * 80)
+        self.logger.info("Running final validation...")
+        self.logger.info("=" * 80)
+
+        final_indexes = self.check_existing_indexes()
+        self.logger.info(f"Total CalendarEvent indexes: {len(final_indexes)}")
+        if not self.dry_run:
+            self.logger.info(f"Unlabeled calendar events remaining: {self.count_unlabeled()}")
+
+        # Success
+        self.logger.info("=" * 80)
+        self.logger.info("MIGRATION COMPLETED SUCCESSFULLY")
+        self.logger.info("=" * 80)
+
+        if self.dry_run:
+            self.logger.info("\nThis was a DRY RUN - no changes were made to the database")
+            self.logger.info("Run without --dry-run to execute the migration")
+
+        return True
+
+    def run_validate(self) -> bool:
+        """Validate schema without making changes"""
+        self.logger.info("=" * 80)
+        self.logger.info("SCHEMA VALIDATION (READ-ONLY)")
+        self.logger.info("=" * 80)
+
+        if not self.connect():
+            return False
+
+        if not self.validate_existing_schema():
+            return False
+
+        self.logger.info("")
+        existing = self.check_existing_indexes()
+        unlabeled = self.count_unlabeled()
+
+        self.logger.info("")
+        self.logger.info("=" * 80)
+        self.logger.info("VALIDATION COMPLETE")
+        self.logger.info("=" * 80)
+        self.logger.info(f"Existing CalendarEvent indexes: {len(existing)}/{len(CALENDAR_EVENT_INDEXES)}")
+        self.logger.info(f"Calendar events without :CalendarEvent label: {unlabeled}")
+
+        if len(existing) == 0 and unlabeled:
+            self.logger.info("\nCalendarEvent schema not found - migration has not been run")
+        elif len(existing) < len(CALENDAR_EVENT_INDEXES) or unlabeled:
+            self.logger.warning("\nPartial CalendarEvent schema detected - migration may be incomplete")
+        else:
+            self.logger.info("\nCalendarEvent schema is fully migrated")
+
+        return True
+
+    def run_rollback(self) -> bool:
+        """Rollback CalendarEvent index changes"""
+        self.logger.info("=" * 80)
+        self.logger.info("ROLLING BACK CALENDAREVENT SCHEMA")
+        self.logger.info("=" * 80)
+
+        if not self.connect():
+            return False
+
+        if not self.drop_indexes():
+            self.logger.error("Rollback failed")
+            return False
+
+        # The label is left in place: graph_manager queries by :CalendarEvent
+        self.logger.info("")
+        self.logger.info(":CalendarEvent labels were NOT removed - graph_manager queries depend on them")
+
+        self.logger.info("")
+        self.logger.info("=" * 80)
+        self.logger.info("ROLLBACK COMPLETED")
+        self.logger.info("=" * 80)
+
+        return True
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+
+def main():
+    """Main script entry point"""
+    parser = argparse.ArgumentParser(
+        description="Add CalendarEvent label and indexes to Roscoe FalkorDB graph",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run migration
+  python add_calendar_event_indexes.py
+
+  # Preview changes without executing
+  python add_calendar_event_indexes.py --dry-run
+
+  # Validate schema status
+  python add_calendar_event_indexes.py --validate
+
+  # Rollback changes
+  python add_calendar_event_indexes.py --rollback
+
+Environment Variables:
+  FALKORDB_HOST    FalkorDB host (default: roscoe-graphdb)
+  FALKORDB_PORT    FalkorDB port (default: 6379)
+        """
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be done without executing changes"
+    )
+
+    parser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Remove CalendarEvent indexes (reverses migration)"
+    )
+
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Validate schema without making changes"
+    )
+
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose debug logging"
+    )
+
+    args = parser.parse_args()
+
+    manager = MigrationManager(dry_run=args.dry_run, verbose=args.verbose)
+
+    try:
+        if args.validate:
+            success = manager.run_validate()
+        elif args.rollback:
+            if args.dry_run:
+                print("ERROR: Cannot use --dry-run with --rollback")
+                sys.exit(1)
+            success = manager.run_rollback()
+        else:
+            success = manager.run_migration()
+
+        if success:
+            print(f"\nLog file: {LOG_FILE}")
+            sys.exit(0)
+        else:
+            print(f"\nMigration failed - check log file: {LOG_FILE}")
+            if manager.errors:
+                print("\nErrors encountered:")
+                for error in manager.errors:
+                    print(f"  - {error}")
+            sys.exit(1)
+
+    except KeyboardInterrupt:
+        print("\n\nMigration interrupted by user")
+        sys.exit(130)
+    except Exception as e:
+        print(f"\nUnexpected error: {e}")
+        print(f"Check log file: {LOG_FILE}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
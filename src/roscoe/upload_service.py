@@ -5,17 +5,40 @@ Allows users to upload documents directly to the agent workspace.
 The agent can then read, analyze (with vision), and save to appropriate case folders.
 
 Runs on port 8125 in the roscoe-uploads container.
+
+Uploads are streamed to disk in fixed-size chunks (the size limit is enforced
+while streaming, not after the write). Large bundles can use the resumable
+session endpoints instead of one POST:
+
+    POST /upload/session                  -> {"upload_id", "offset": 0}
+    PUT  /upload/session/{id}?offset=N    (raw request body = next chunk)
+    GET  /upload/session/{id}             -> {"offset"} to resume after a drop
+    POST /upload/session/{id}/complete    -> same response as POST /upload
+
+Session data is staged on the local disk and moved into the workspace once on
+complete (appending to a file on the gcsfuse mount re-uploads the whole object
+on every close). Sessions idle for UPLOAD_SESSION_TTL_HOURS are swept.
+
+Completed binary uploads are queued for the workspace watcher (PDF conversion,
+media stubs) immediately instead of waiting for the next poll.
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Form
+from fastapi import FastAPI, File, UploadFile, HTTPException, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
 import os
+import json
+import uuid
+import time
 import shutil
+import asyncio
 from datetime import datetime
 from typing import Optional
 
+from roscoe.scripts.workspace_watcher import publish_notification
+
 app = FastAPI(title="Roscoe Upload Service")
 
 # CORS configuration (allow UI to upload files)
@@ -35,7 +58,12 @@ LOCAL_WORKSPACE = Path(os.getenv("LOCAL_WORKSPACE", "/home/aaronwhaley/workspace
 
 UPLOADS_BASE_DIR = os.getenv("UPLOADS_BASE_DIR", "uploads/inbox")
 MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "50"))
+# Resumable sessions are meant for large medical-record bundles
+MAX_SESSION_UPLOAD_MB = int(os.getenv("MAX_SESSION_UPLOAD_MB", "2048"))
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
 UPLOAD_TOKEN = os.getenv("UPLOAD_TOKEN", "")  # Optional auth token
+# Resumable sessions with no activity for this long are discarded
+UPLOAD_SESSION_TTL_HOURS = float(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24"))
 
 # Text file extensions that should be stored locally (faster access)
 TEXT_EXTENSIONS = {
@@ -62,49 +90,31 @@ def get_workspace_for_file(filename: str) -> Path:
 # Default uploads dir (uses GCS for backward compatibility)
 UPLOADS_DIR = GCS_WORKSPACE / UPLOADS_BASE_DIR
 
+# Resumable upload session metadata and staged data (local disk)
+UPLOAD_SESSIONS_DIR = LOCAL_WORKSPACE / ".sync_metadata" / "upload_sessions"
+UPLOAD_SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "roscoe-uploads"}
-
-
-@app.post("/upload")
-async def upload_file(
-    file: UploadFile = File(...),
-    case_name: Optional[str] = Form(None),
-    description: Optional[str] = Form(None),
-    token: Optional[str] = Form(None),
-):
-    """
-    Upload a file to the workspace inbox for agent processing.
+# One lock per session so chunks for the same upload are appended in order
+_session_locks: dict[str, asyncio.Lock] = {}
 
-    Args:
-        file: The file to upload
-        case_name: Optional case folder name to associate with this file
-        description: Optional description of the file
-        token: Optional authentication token (if UPLOAD_TOKEN is set)
 
-    Returns:
-        JSON with upload details including file path
-    """
-    # Verify token if configured
+def _verify_token(token: Optional[str]):
     if UPLOAD_TOKEN and token != UPLOAD_TOKEN:
         raise HTTPException(status_code=401, detail="Invalid upload token")
 
-    # Check file size
-    file_size_mb = 0
-    if file.size:
-        file_size_mb = file.size / (1024 * 1024)
-        if file_size_mb > MAX_UPLOAD_MB:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large: {file_size_mb:.1f}MB (max: {MAX_UPLOAD_MB}MB)"
-            )
 
+def _too_large(size_bytes: int, max_mb: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large: {size_bytes / (1024 * 1024):.1f}MB (max: {max_mb}MB)"
+    )
+
+
+def _plan_upload(filename: Optional[str], case_name: Optional[str]) -> dict:
+    """Work out where an upload is stored (same naming for every upload path)."""
     # Generate unique filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    original_filename = file.filename or "uploaded_file"
+    original_filename = filename or "uploaded_file"
 
     # Sanitize filename (remove dangerous characters)
     safe_filename = "".join(c for c in original_filename if c.isalnum() or c in ".-_ ")
@@ -118,37 +128,337 @@ async def upload_file(
     if case_name:
         # Upload to case folder if specified
         upload_path = workspace / "projects" / case_name / "uploads" / unique_filename
-        upload_path.parent.mkdir(parents=True, exist_ok=True)
     else:
         # Upload to general inbox
         upload_path = workspace / UPLOADS_BASE_DIR / unique_filename
-        upload_path.parent.mkdir(parents=True, exist_ok=True)
+    upload_path.parent.mkdir(parents=True, exist_ok=True)
+
+    return {
+        "timestamp": timestamp,
+        "safe_filename": safe_filename,
+        "unique_filename": unique_filename,
+        "workspace": str(workspace),
+        "storage_type": storage_type,
+        "upload_path": str(upload_path),
+    }
+
 
-    # Save file
+def _partial_path(upload_path: Path) -> Path:
+    """Hidden sibling the data is streamed into (ignored by the watchers until renamed)."""
+    return upload_path.with_name(f".{upload_path.name}.part")
+
+
+async def _append_stream(chunks, dest: Path, written: int, max_bytes: int, max_mb: int) -> int:
+    """
+    Append an async stream of byte chunks to dest without blocking the event loop.
+
+    Stops with 413 as soon as the running total passes max_bytes.
+
+    Returns:
+        Total bytes in dest
+    """
+    f = await run_in_threadpool(open, dest, "ab")
     try:
-        with open(upload_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            written += len(chunk)
+            if written > max_bytes:
+                raise _too_large(written, max_mb)
+            await run_in_threadpool(f.write, chunk)
+    finally:
+        await run_in_threadpool(f.close)
+    return written
+
+
+async def _read_upload_chunks(file: UploadFile):
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _finish_upload(plan: dict, size_bytes: int, case_name: Optional[str], description: Optional[str]) -> JSONResponse:
+    """Queue post-processing for a completed upload and build the response."""
+    workspace = Path(plan["workspace"])
+    upload_path = Path(plan["upload_path"])
+    storage_type = plan["storage_type"]
 
     # Build relative path for agent (relative to the workspace it was saved to)
     relative_path = str(upload_path.relative_to(workspace))
 
+    # Enqueue conversion/indexing on the workspace watcher's work queue so
+    # PDFs/media are processed right away
+    if storage_type == "gcs":
+        try:
+            publish_notification(relative_path)
+        except OSError:
+            pass  # Watcher still picks it up from its own change source
+
     return JSONResponse({
         "success": True,
-        "filename": safe_filename,
-        "unique_filename": unique_filename,
+        "filename": plan["safe_filename"],
+        "unique_filename": plan["unique_filename"],
         "path": f"/{relative_path}",  # Agent uses workspace-relative paths
         "absolute_path": str(upload_path),
-        "size_mb": file_size_mb,
+        "size_mb": size_bytes / (1024 * 1024),
         "case_name": case_name,
         "description": description,
-        "uploaded_at": timestamp,
+        "uploaded_at": plan["timestamp"],
         "storage_type": storage_type,  # "local" for text files, "gcs" for binary
         "message": f"File uploaded successfully ({storage_type}). Agent can access at: /{relative_path}"
     })
 
 
+@app.get("/health")
+async def health_check():
+    """Health check endpoint."""
+    return {"status": "healthy", "service": "roscoe-uploads"}
+
+
+@app.post("/upload")
+async def upload_file(
+    file: UploadFile = File(...),
+    case_name: Optional[str] = Form(None),
+    description: Optional[str] = Form(None),
+    token: Optional[str] = Form(None),
+):
+    """
+    Upload a file to the workspace inbox for agent processing.
+
+    Args:
+        file: The file to upload
+        case_name: Optional case folder name to associate with this file
+        description: Optional description of the file
+        token: Optional authentication token (if UPLOAD_TOKEN is set)
+
+    Returns:
+        JSON with upload details including file path
+    """
+    # Verify token if configured
+    _verify_token(token)
+
+    max_bytes = MAX_UPLOAD_MB * 1024 * 1024
+
+    # Reject early when the client declared the size
+    if file.size and file.size > max_bytes:
+        raise _too_large(file.size, MAX_UPLOAD_MB)
+
+    plan = _plan_upload(file.filename, case_name)
+    upload_path = Path(plan["upload_path"])
+    partial_path = _partial_path(upload_path)
+
+    # Stream to a hidden partial file, then rename into place
+    try:
+        size_bytes = await _append_stream(
+            _read_upload_chunks(file), partial_path, 0, max_bytes, MAX_UPLOAD_MB
+        )
+        os.replace(partial_path, upload_path)
+    except HTTPException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    except Exception as e:
+        partial_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+
+    return _finish_upload(plan, size_bytes, case_name, description)
+
+
+# =============================================================================
+# Resumable (multi-part) uploads
+# =============================================================================
+
+def _session_file(upload_id: str) -> Path:
+    return UPLOAD_SESSIONS_DIR / f"{upload_id}.json"
+
+
+def _session_data(upload_id: str) -> Path:
+    """Local staging file the session's chunks are appended to."""
+    return UPLOAD_SESSIONS_DIR / f"{upload_id}.part"
+
+
+def _discard_session(upload_id: str):
+    _session_data(upload_id).unlink(missing_ok=True)
+    _session_file(upload_id).unlink(missing_ok=True)
+    _session_locks.pop(upload_id, None)
+
+
+def _sweep_expired_sessions():
+    """Discard sessions whose last chunk (or creation) is older than the TTL."""
+    cutoff = time.time() - UPLOAD_SESSION_TTL_HOURS * 3600
+    for session_file in UPLOAD_SESSIONS_DIR.glob("*.json"):
+        upload_id = session_file.stem
+        lock = _session_locks.get(upload_id)
+        if lock is not None and lock.locked():
+            continue
+        try:
+            data = _session_data(upload_id)
+            last_active = max(
+                session_file.stat().st_mtime,
+                data.stat().st_mtime if data.exists() else 0,
+            )
+        except FileNotFoundError:
+            continue
+        if last_active < cutoff:
+            _discard_session(upload_id)
+
+
+def _load_session(upload_id: str) -> dict:
+    try:
+        uuid.UUID(upload_id)
+        return json.loads(_session_file(upload_id).read_text())
+    except (ValueError, OSError):
+        raise HTTPException(status_code=404, detail="Upload session not found")
+
+
+def _session_offset(session: dict) -> int:
+    """Bytes received so far (the staged file is the source of truth)."""
+    try:
+        return _session_data(session["upload_id"]).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+@app.post("/upload/session")
+async def create_upload_session(
+    filename: str = Form(...),
+    total_size: Optional[int] = Form(None),
+    case_name: Optional[str] = Form(None),
+    description: Optional[str] = Form(None),
+    token: Optional[str] = Form(None),
+):
+    """
+    Start a resumable upload.
+
+    Args:
+        filename: Name of the file being uploaded
+        total_size: Expected size in bytes (optional; checked on complete)
+        case_name: Optional case folder name to associate with this file
+        description: Optional description of the file
+        token: Optional authentication token (if UPLOAD_TOKEN is set)
+
+    Returns:
+        JSON with upload_id, current offset and the chunk size to use
+    """
+    _verify_token(token)
+    await run_in_threadpool(_sweep_expired_sessions)
+
+    if total_size is not None and total_size > MAX_SESSION_UPLOAD_MB * 1024 * 1024:
+        raise _too_large(total_size, MAX_SESSION_UPLOAD_MB)
+
+    upload_id = str(uuid.uuid4())
+    session = {
+        **_plan_upload(filename, case_name),
+        "upload_id": upload_id,
+        "total_size": total_size,
+        "case_name": case_name,
+        "description": description,
+    }
+    _session_data(upload_id).touch()
+    _session_file(upload_id).write_text(json.dumps(session))
+
+    return {"upload_id": upload_id, "offset": 0, "chunk_size": UPLOAD_CHUNK_BYTES}
+
+
+@app.get("/upload/session/{upload_id}")
+async def get_upload_session(upload_id: str, token: Optional[str] = None):
+    """Report how many bytes have been received (where to resume from)."""
+    _verify_token(token)
+    session = _load_session(upload_id)
+    return {
+        "upload_id": upload_id,
+        "offset": _session_offset(session),
+        "total_size": session.get("total_size"),
+    }
+
+
+@app.put("/upload/session/{upload_id}")
+async def upload_session_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int,
+    token: Optional[str] = None,
+):
+    """
+    Append the request body to a resumable upload.
+
+    `offset` must equal the bytes already received; on mismatch a 409 with
+    the current offset is returned so the client can resume from there.
+    """
+    _verify_token(token)
+    session = _load_session(upload_id)
+
+    lock = _session_locks.setdefault(upload_id, asyncio.Lock())
+    async with lock:
+        current = _session_offset(session)
+        if offset != current:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Offset mismatch", "offset": current},
+            )
+
+        max_bytes = MAX_SESSION_UPLOAD_MB * 1024 * 1024
+        if session.get("total_size") is not None:
+            max_bytes = min(max_bytes, session["total_size"])
+
+        partial_path = _session_data(upload_id)
+        try:
+            received = await _append_stream(
+                request.stream(), partial_path, current, max_bytes, MAX_SESSION_UPLOAD_MB
+            )
+        except HTTPException:
+            # Drop the rejected chunk so the session stays resumable
+            await run_in_threadpool(os.truncate, partial_path, current)
+            if session.get("total_size") is not None and max_bytes == session["total_size"]:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Upload exceeds declared total_size ({session['total_size']} bytes)"
+                )
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save chunk: {str(e)}")
+
+    return {"upload_id": upload_id, "offset": received}
+
+
+@app.post("/upload/session/{upload_id}/complete")
+async def complete_upload_session(upload_id: str, token: Optional[str] = Form(None)):
+    """Finish a resumable upload: move it into place and queue processing."""
+    _verify_token(token)
+    session = _load_session(upload_id)
+
+    lock = _session_locks.setdefault(upload_id, asyncio.Lock())
+    async with lock:
+        received = _session_offset(session)
+        if session.get("total_size") is not None and received != session["total_size"]:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Upload incomplete", "offset": received},
+            )
+
+        # One copy from local staging into the workspace (a single GCS write)
+        upload_path = Path(session["upload_path"])
+        try:
+            await run_in_threadpool(shutil.move, str(_session_data(upload_id)), str(upload_path))
+        except OSError as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+
+        _session_file(upload_id).unlink(missing_ok=True)
+    _session_locks.pop(upload_id, None)
+
+    return _finish_upload(session, received, session.get("case_name"), session.get("description"))
+
+
+@app.delete("/upload/session/{upload_id}")
+async def abort_upload_session(upload_id: str, token: Optional[str] = None):
+    """Abandon a resumable upload and discard the received data."""
+    _verify_token(token)
+    _load_session(upload_id)
+    _discard_session(upload_id)
+    return {"success": True, "message": f"Upload session {upload_id} aborted"}
+
+
 @app.get("/uploads")
 async def list_uploads(case_name: Optional[str] = None):
     """
@@ -174,7 +484,8 @@ async def list_uploads(case_name: Optional[str] = None):
             continue
 
         for file_path in upload_dir.iterdir():
-            if file_path.is_file():
+            # Skip in-progress (hidden .part) uploads
+            if file_path.is_file() and not file_path.name.startswith('.'):
                 stat = file_path.stat()
                 relative_path = str(file_path.relative_to(workspace))
                 uploads.append({
@@ -205,8 +516,7 @@ async def delete_upload(filename: str, case_name: Optional[str] = None, token: O
         Confirmation message
     """
     # Verify token if configured
-    if UPLOAD_TOKEN and token != UPLOAD_TOKEN:
-        raise HTTPException(status_code=401, detail="Invalid upload token")
+    _verify_token(token)
 
     # Check both workspaces for the file
     file_path = None
@@ -0,0 +1,190 @@
+"""
+Firm-Wide Workflow / SOL Dashboard
+
+Workflow and statute-of-limitations status for EVERY case at once, without
+running GraphWorkflowStateComputer.compute_state per case:
+
+- Two set-oriented queries: every case's phase + accident/SOL fields, and
+  every active LandmarkStatus (case name, landmark id, status)
+- Hard blockers and landmark totals come from the workflow catalog's
+  phase_gate_landmarks / blocking_landmarks (the same rule compute_state
+  uses), resolved from the phase's HAS_LANDMARK edges
+- _calculate_sol and the blocker rule run in a single in-memory pass
+
+The result is a list of flat rows (one per case) that sorts by SOL urgency,
+blockers, phase or name, so firm-wide views (morning brief, scripts) can pick
+SOL-critical and blocked matters across hundreds of cases in one call.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from roscoe.workflow_engine.orchestrator.graph_state_computer import GraphWorkflowStateComputer
+
+
+_CASES_QUERY = """
+MATCH (c)
+WHERE c:Case OR (c:Entity AND c.entity_type = 'Case')
+OPTIONAL MATCH (c)-[r:IN_PHASE]->(p)
+WHERE p:Phase OR (p:Entity AND p.entity_type = 'Phase')
+RETURN c.name as case_name,
+       c.case_type as case_type,
+       c.accident_date as accident_date,
+       c.sol_status as sol_status,
+       c.complaint_filed_date as complaint_filed_date,
+       c.sol_notes as sol_notes,
+       p.name as phase_name,
+       p.display_name as phase_display_name,
+       r.entered_at as phase_entered_at
+"""
+
+_STATUSES_QUERY = """
+MATCH (c)-[:HAS_STATUS]->(ls)-[:FOR_LANDMARK]->(l)
+WHERE (c:Case OR (c:Entity AND c.entity_type = 'Case'))
+  AND (ls:LandmarkStatus OR (ls:Entity AND ls.entity_type = 'LandmarkStatus'))
+  AND ls.archived_at IS NULL
+RETURN c.name as case_name,
+       COALESCE(l.landmark_id, l.name) as landmark_id,
+       ls.status as status
+"""
+
+# Urgency order for SOL statuses (most urgent first)
+SOL_URGENCY = {"critical": 0, "warning": 1, "unknown": 2, "safe": 3, "tolled": 4, "filed": 5, "n/a": 6}
+
+SORT_KEYS = {
+    "sol": lambda row: (
+        SOL_URGENCY.get(row["sol_status"], 2),
+        row["days_remaining"] if row["days_remaining"] is not None else float("inf"),
+        row["case_name"],
+    ),
+    "blockers": lambda row: (-len(row["blocking_landmarks"]), row["case_name"]),
+    "phase": lambda row: (row["phase"] or "", row["case_name"]),
+    "case_name": lambda row: row["case_name"],
+}
+
+
+async def compute_firm_dashboard(
+    sort_by: str = "sol",
+    include_closed: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Workflow and SOL status for every case in the graph.
+
+    Args:
+        sort_by: "sol" (most urgent first), "blockers", "phase" or "case_name"
+        include_closed: Include cases in the closed phase
+
+    Returns:
+        One row per case with case_name, phase, phase_display_name,
+        phase_entered_at, landmarks_complete, landmarks_total,
+        blocking_landmarks (display names), can_advance, accident_date,
+        accident_type, sol_status, sol_deadline, days_remaining
+    """
+    from roscoe.core.graphiti_client import run_cypher_query
+    from roscoe.core.workflow_catalog import get_workflow_catalog
+
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"Unknown sort_by '{sort_by}'. Use one of: {sorted(SORT_KEYS)}")
+
+    catalog = await get_workflow_catalog()
+    cases = await run_cypher_query(_CASES_QUERY)
+    status_rows = await run_cypher_query(_STATUSES_QUERY)
+
+    statuses: Dict[str, Dict[str, Any]] = {}
+    for row in status_rows or []:
+        statuses.setdefault(row.get("case_name"), {})[row.get("landmark_id")] = row.get("status")
+
+    computer = GraphWorkflowStateComputer()
+    phases: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    table: Dict[str, Dict[str, Any]] = {}
+    for case in cases or []:
+        case_name = case.get("case_name")
+        phase_name = case.get("phase_name")
+        # A case node may carry both label schemes; keep the row that has a phase
+        if not case_name or (case_name in table and table[case_name]["phase"]):
+            continue
+        if phase_name == "closed" and not include_closed:
+            continue
+
+        landmarks = phases.get(phase_name)
+        if landmarks is None:
+            landmarks = phases[phase_name] = catalog.phase_gate_landmarks(phase_name)
+
+        case_statuses = statuses.get(case_name, {})
+        blocking = [
+            blocker["display_name"] for blocker in catalog.blocking_landmarks(phase_name, case_statuses)
+        ]
+
+        accident_date = case.get("accident_date")
+        accident_type = case.get("case_type") or "mva"
+        if not accident_date:
+            accident_date, accident_type = computer._parse_case_name(case_name)
+        sol = computer._calculate_sol(
+            accident_date,
+            accident_type,
+            sol_status=case.get("sol_status"),
+            complaint_filed_date=case.get("complaint_filed_date"),
+            sol_notes=case.get("sol_notes"),
+        )
+
+        table[case_name] = {
+            "case_name": case_name,
+            "phase": phase_name,
+            "phase_display_name": case.get("phase_display_name"),
+            "phase_entered_at": case.get("phase_entered_at"),
+            "landmarks_complete": sum(
+                1 for landmark in landmarks if case_statuses.get(landmark["landmark_id"]) == "complete"
+            ),
+            "landmarks_total": len(landmarks),
+            "blocking_landmarks": blocking,
+            "can_advance": bool(phase_name) and not blocking,
+            "accident_date": accident_date,
+            "accident_type": accident_type,
+            "sol_status": sol.get("status"),
+            "sol_deadline": sol.get("deadline"),
+            "days_remaining": sol.get("days_remaining"),
+        }
+
+    return sorted(table.values(), key=SORT_KEYS[sort_by])
+
+
+def sol_attention(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rows whose SOL is critical or in the warning window, most urgent first."""
+    return sorted(
+        (row for row in rows if row["sol_status"] in ("critical", "warning")),
+        key=SORT_KEYS["sol"],
+    )
+
+
+def blocked_cases(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rows with incomplete hard blockers in their current phase, most blockers first."""
+    return sorted(
+        (row for row in rows if row["blocking_landmarks"]),
+        key=SORT_KEYS["blockers"],
+    )
+
+
+def format_firm_dashboard(rows: List[Dict[str, Any]], limit: int = 5) -> str:
+    """Markdown summary of SOL-critical and blocked cases."""
+    lines = []
+    attention = sol_attention(rows)
+    lines.append(f"## ⚖️ Statute of Limitations ({len(attention)} need attention)")
+    if attention:
+        for row in attention[:limit]:
+            icon = "🔴" if row["sol_status"] == "critical" else "🟡"
+            lines.append(
+                f"{icon} {row['case_name']} - {row['days_remaining']} days (deadline {row['sol_deadline']})"
+            )
+    else:
+        lines.append("No cases inside the SOL warning window")
+    lines.append("")
+
+    blocked = blocked_cases(rows)
+    lines.append(f"## 🚫 Blocked Cases ({len(blocked)} of {len(rows)})")
+    if blocked:
+        for row in blocked[:limit]:
+            phase = row["phase_display_name"] or row["phase"]
+            lines.append(f"• {row['case_name']} ({phase}): {', '.join(row['blocking_landmarks'])}")
+    else:
+        lines.append("No cases blocked by hard blockers")
+
+    return "\n".join(lines)
@@ -9,6 +9,8 @@ State is stored as:
 - Case -[HAS_STATUS]-> LandmarkStatus -[FOR_LANDMARK]-> Landmark  (versioned landmark status)
 
 This replaces the inference-based approach with deterministic queries.
+The whole state (workflow + client, claims, providers, liens) is fetched in a
+single round trip by graphiti_client.get_case_workflow_state.
 """
 
 import asyncio
@@ -16,6 +18,9 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 from pydantic import BaseModel, Field
 
+# Case snapshot sections fetched alongside the workflow state
+CASE_DATA_SECTIONS = ["client", "claims", "providers", "liens"]
+
 
 class DerivedWorkflowState(BaseModel):
     """Workflow state derived from deterministic graph queries."""
@@ -176,33 +181,35 @@ class GraphWorkflowStateComputer:
         """
         Compute the workflow state for a case from explicit graph relationships.
 
+        Phase, landmarks, blockers, needed workflows and the case data (client,
+        claims, providers, liens) come back from ONE graph query.
+
         Args:
             case_name: The case folder name
 
         Returns:
             DerivedWorkflowState with all relevant case and workflow data
         """
-        # Always get client and case info first (basic data)
-        client_info = await self._get_client_info(case_name)
-        case_info = await self._get_case_info(case_name)
-
-        # Try to get workflow state from graph
         try:
             from roscoe.core.graphiti_client import get_case_workflow_state
-            state = await get_case_workflow_state(case_name)
+            state = await get_case_workflow_state(case_name, case_sections=CASE_DATA_SECTIONS)
         except Exception as e:
             # Workflow state not available - default to Phase 0
             state = {"error": f"Workflow state not initialized: {str(e)}"}
 
+        case = state.get("case")
+        client_info = self._client_info(case_name, (case or {}).get("client"))
+        case_info = self._case_info(case_name, case)
+        case_data = {
+            "insurance_claims": self._insurance_claims((case or {}).get("claims")),
+            "medical_providers": self._medical_providers((case or {}).get("providers")),
+            "liens": self._liens((case or {}).get("liens")),
+        }
+
         if state.get("error"):
             # No workflow state - create default Phase 0 state with client info
-            return await self._create_default_phase_0_state(case_name, client_info, case_info)
+            return await self._create_default_phase_0_state(case_name, client_info, case_info, case_data)
 
-        # Get additional case data
-        insurance = await self._get_insurance_claims(case_name)
-        providers = await self._get_medical_providers(case_name)
-        liens = await self._get_liens(case_name)
-        
         # Extract phase info
         current_phase = state.get("current_phase", {})
         
@@ -236,9 +243,7 @@ class GraphWorkflowStateComputer:
             workflows_needed=state.get("workflows_needed", []),
             accident_date=case_info.get("accident_date"),
             accident_type=case_info.get("accident_type", "mva"),
-            insurance_claims=insurance,
-            medical_providers=providers,
-            liens=liens,
+            **case_data,
             statute_of_limitations=sol,
             created_at=case_info.get("created_at", datetime.now().isoformat()),
             updated_at=datetime.now().isoformat(),
@@ -248,7 +253,8 @@ class GraphWorkflowStateComputer:
         self,
         case_name: str,
         client_info: Dict[str, Any],
-        case_info: Dict[str, Any]
+        case_info: Dict[str, Any],
+        case_data: Dict[str, List[Dict]]
     ) -> DerivedWorkflowState:
         """
         Create default Phase 0 (Onboarding) state when workflow not initialized.
@@ -256,11 +262,6 @@ class GraphWorkflowStateComputer:
         Uses actual client/case data from graph, defaults to Phase 0.
         Gets Phase 0 landmark definitions from graph even though case has no status nodes.
         """
-        # Get additional case data even without workflow state
-        insurance = await self._get_insurance_claims(case_name)
-        providers = await self._get_medical_providers(case_name)
-        liens = await self._get_liens(case_name)
-
         # Get Phase 0 landmark definitions from graph (even if case has no status for them)
         phase_0_landmarks = []
         try:
@@ -312,43 +313,29 @@ class GraphWorkflowStateComputer:
             workflows_needed=[],
             accident_date=case_info.get("accident_date"),
             accident_type=case_info.get("accident_type", "mva"),
-            insurance_claims=insurance,
-            medical_providers=providers,
-            liens=liens,
+            **case_data,
             statute_of_limitations=sol,
             created_at=case_info.get("created_at", datetime.now().isoformat()),
             updated_at=datetime.now().isoformat(),
         )
     
-    async def _get_case_info(self, case_name: str) -> Dict[str, Any]:
-        """Query graph for case entity info including SOL status."""
-        from roscoe.core.graphiti_client import run_cypher_query
-
-        query = """
-            MATCH (c:Case {name: $case_name})
-            RETURN c.name as name, c.case_type as case_type, c.accident_date as accident_date,
-                   c.sol_status as sol_status, c.complaint_filed_date as complaint_filed_date,
-                   c.sol_notes as sol_notes
-            LIMIT 1
-        """
-        results = await run_cypher_query(query, {"case_name": case_name})
-
-        if results:
-            r = results[0]
+    def _case_info(self, case_name: str, case: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Case entity info including SOL status (case=None if the case node is missing)."""
+        if case is not None:
             # Parse accident date from case name if not in entity
-            accident_date = r.get("accident_date")
-            accident_type = r.get("case_type", "mva")
+            accident_date = case.get("accident_date")
+            accident_type = case.get("case_type") or "mva"
 
             if not accident_date:
                 accident_date, accident_type = self._parse_case_name(case_name)
 
             return {
-                "name": r.get("name", case_name),
+                "name": case_name,
                 "accident_date": accident_date,
                 "accident_type": accident_type,
-                "sol_status": r.get("sol_status"),
-                "complaint_filed_date": r.get("complaint_filed_date"),
-                "sol_notes": r.get("sol_notes"),
+                "sol_status": case.get("sol_status"),
+                "complaint_filed_date": case.get("complaint_filed_date"),
+                "sol_notes": case.get("sol_notes"),
                 "created_at": datetime.now().isoformat(),
             }
 
@@ -388,22 +375,13 @@ class GraphWorkflowStateComputer:
         
         return accident_date, accident_type
     
-    async def _get_client_info(self, case_name: str) -> Dict[str, Any]:
-        """Query graph for client entity via HAS_CLIENT relationship."""
-        from roscoe.core.graphiti_client import run_cypher_query
-
-        query = """
-            MATCH (case:Case {name: $case_name})-[:HAS_CLIENT]->(client:Client)
-            RETURN client.name as name, client.phone as phone, client.email as email
-            LIMIT 1
-        """
-        results = await run_cypher_query(query, {"case_name": case_name})
-        
-        if results:
+    def _client_info(self, case_name: str, client: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Client entity (via HAS_CLIENT), falling back to the name in the case folder."""
+        if client:
             return {
-                "name": results[0].get("name", "Unknown"),
-                "phone": results[0].get("phone"),
-                "email": results[0].get("email"),
+                "name": client.get("name") or "Unknown",
+                "phone": client.get("phone"),
+                "email": client.get("email"),
             }
         
         # Fallback: Extract from case name
@@ -415,34 +393,11 @@ class GraphWorkflowStateComputer:
         
         return {"name": "Unknown"}
     
-    async def _get_insurance_claims(self, case_name: str) -> List[Dict]:
-        """Query graph for all insurance claims on the case using new InsurancePolicy structure."""
-        from roscoe.core.graphiti_client import run_cypher_query
-
-        query = """
-            MATCH (case:Case {name: $case_name})-[:HAS_CLAIM]->(claim)
-            WHERE claim:BIClaim OR claim:PIPClaim OR claim:UMClaim OR claim:UIMClaim OR claim:WCClaim
-            OPTIONAL MATCH (claim)-[:UNDER_POLICY]->(policy:InsurancePolicy)
-            OPTIONAL MATCH (policy)-[:WITH_INSURER]->(insurer:Insurer)
-            OPTIONAL MATCH (claim)-[:HANDLED_BY]->(adjuster:Adjuster)
-            RETURN claim.claim_number as claim_number,
-                   labels(claim)[0] as claim_type,
-                   policy.policy_number as policy_number,
-                   insurer.name as insurer_name,
-                   adjuster.name as adjuster_name,
-                   policy.bi_limit as bi_limit,
-                   policy.pip_limit as pip_limit,
-                   policy.um_limit as um_limit,
-                   policy.uim_limit as uim_limit,
-                   claim.amount_demanded as demand_amount,
-                   claim.amount_offered as current_offer,
-                   claim.status as claim_status
-        """
-        results = await run_cypher_query(query, {"case_name": case_name})
-
+    def _insurance_claims(self, claims: Optional[List[Dict]]) -> List[Dict]:
+        """Format insurance claims (InsurancePolicy structure) from the snapshot section (MedPay excluded)."""
         return [{
             "claim_number": r.get("claim_number"),
-            "type": r.get("claim_type", "Unknown"),
+            "type": (r.get("labels") or ["Unknown"])[0],
             "policy_number": r.get("policy_number"),
             "insurer": r.get("insurer_name"),
             "adjuster": r.get("adjuster_name"),
@@ -450,32 +405,13 @@ class GraphWorkflowStateComputer:
             "pip_limit": r.get("pip_limit"),
             "um_limit": r.get("um_limit"),
             "uim_limit": r.get("uim_limit"),
-            "demand_amount": r.get("demand_amount"),
-            "current_offer": r.get("current_offer"),
-            "status": r.get("claim_status"),
-        } for r in results]
+            "demand_amount": r.get("amount_demanded"),
+            "current_offer": r.get("amount_offered"),
+            "status": r.get("status"),
+        } for r in claims or [] if "MedPayClaim" not in (r.get("labels") or [])]
     
-    async def _get_medical_providers(self, case_name: str) -> List[Dict]:
-        """Query graph for medical providers on the case using new three-tier hierarchy."""
-        from roscoe.core.graphiti_client import run_cypher_query
-
-        query = """
-            MATCH (case:Case {name: $case_name})-[:HAS_CLIENT]->(client:Client)-[:TREATED_AT]->(provider)
-            WHERE provider:Facility OR provider:Location
-            OPTIONAL MATCH (provider)-[:PART_OF]->(parent)
-            WHERE parent:Facility OR parent:HealthSystem
-            OPTIONAL MATCH (parent)-[:PART_OF]->(grandparent:HealthSystem)
-            RETURN provider.name as name,
-                   labels(provider)[0] as provider_type,
-                   provider.specialty as specialty,
-                   provider.phone as phone,
-                   provider.address as address,
-                   parent.name as parent_name,
-                   labels(parent)[0] as parent_type,
-                   grandparent.name as health_system
-        """
-        results = await run_cypher_query(query, {"case_name": case_name})
-
+    def _medical_providers(self, providers: Optional[List[Dict]]) -> List[Dict]:
+        """Format medical providers (three-tier hierarchy) from the snapshot section."""
         return [{
             "name": r.get("name"),
             "type": r.get("provider_type"),
@@ -484,30 +420,17 @@ class GraphWorkflowStateComputer:
             "address": r.get("address"),
             "parent": r.get("parent_name"),
             "health_system": r.get("health_system") or r.get("parent_name") if r.get("parent_type") == "HealthSystem" else None,
-        } for r in results]
+        } for r in providers or []]
     
-    async def _get_liens(self, case_name: str) -> List[Dict]:
-        """Query graph for liens on the case."""
-        from roscoe.core.graphiti_client import run_cypher_query
-        
-        query = """
-            MATCH (case:Case {name: $case_name})-[:HAS_LIEN]->(lien:Lien)
-            OPTIONAL MATCH (lien)-[:HELD_BY]->(holder:LienHolder)
-            RETURN lien.name as lien_name,
-                   holder.name as holder_name,
-                   lien.lien_type as lien_type,
-                   lien.amount as amount,
-                   lien.account_number as account_number
-        """
-        results = await run_cypher_query(query, {"case_name": case_name})
-        
+    def _liens(self, liens: Optional[List[Dict]]) -> List[Dict]:
+        """Format liens from the snapshot section."""
         return [{
             "lien_name": r.get("lien_name"),
             "holder": r.get("holder_name"),
             "lien_type": r.get("lien_type"),
             "amount": r.get("amount"),
             "account_number": r.get("account_number"),
-        } for r in results]
+        } for r in liens or []]
     
     def _calculate_sol(
         self,
@@ -573,24 +496,41 @@ class GraphWorkflowStateComputer:
         }.get(claim_type, 2)
 
         deadline = accident_dt + timedelta(days=sol_years * 365)
-        days_remaining = (deadline - datetime.now()).days
-
-        if days_remaining <= 60:
-            status = "critical"
-        elif days_remaining <= 180:
-            status = "warning"
-        else:
-            status = "safe"
 
         return {
             "base_date": accident_date,
             "years": sol_years,
             "deadline": deadline.strftime("%Y-%m-%d"),
-            "days_remaining": days_remaining,
-            "status": status,
+            **_sol_countdown(deadline),
         }
 
 
+def _sol_countdown(deadline: datetime) -> Dict[str, Any]:
+    """Days remaining until an SOL deadline and the resulting urgency status."""
+    days_remaining = (deadline - datetime.now()).days
+
+    if days_remaining <= 60:
+        status = "critical"
+    elif days_remaining <= 180:
+        status = "warning"
+    else:
+        status = "safe"
+
+    return {"days_remaining": days_remaining, "status": status}
+
+
+def refresh_sol_countdown(sol: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recompute the countdown of a cached SOL dict for today (no graph access).
+
+    Only deadline-based entries change with time; filed/tolled/n/a/unknown
+    statuses are returned as-is.
+    """
+    if not sol.get("deadline"):
+        return sol
+    return {**sol, **_sol_countdown(datetime.fromisoformat(sol["deadline"]))}
+
+
 # =============================================================================
 # State Update Functions
 # =============================================================================
@@ -669,20 +609,10 @@ async def get_case_state_from_graph(case_name: str) -> Dict[str, Any]:
 
 
 def get_case_state_from_graph_sync(case_name: str) -> Dict[str, Any]:
-    """Synchronous wrapper for get_case_state_from_graph."""
-    import asyncio
-    
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, get_case_state_from_graph(case_name))
-                return future.result(timeout=60)
-        else:
-            return asyncio.run(get_case_state_from_graph(case_name))
-    except RuntimeError:
-        return asyncio.run(get_case_state_from_graph(case_name))
+    """Synchronous wrapper for get_case_state_from_graph (runs on the shared background loop)."""
+    from roscoe.core.async_bridge import run_sync
+
+    return run_sync(get_case_state_from_graph(case_name), timeout=60)
 
 
 async def get_workflow_state_prompt(case_name: str) -> str:
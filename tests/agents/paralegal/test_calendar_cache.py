@@ -0,0 +1,120 @@
+"""
+Tests for calendar_cache.py - Synced calendar cache and free/busy engine
+
+Tests verify:
+- Full then incremental sync against the file-backed source
+- Cancelled events are dropped and expired tokens trigger a full resync
+- Interval tree overlap queries and multi-calendar free slots
+"""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from roscoe.agents.paralegal.calendar_cache import (
+    CalendarCache,
+    FileCalendarSource,
+    IntervalTree,
+    find_free_slots,
+    merge_intervals,
+)
+
+TZ = ZoneInfo("America/New_York")
+
+
+def _event(event_id, start, end, **extra):
+    return {
+        "id": event_id,
+        "summary": extra.pop("summary", event_id),
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": end.isoformat()},
+        **extra,
+    }
+
+
+class CountingSource(FileCalendarSource):
+    def __init__(self, path):
+        super().__init__(path)
+        self.calls = []
+
+    def fetch(self, calendar_id, sync_token):
+        self.calls.append(sync_token)
+        return super().fetch(calendar_id, sync_token)
+
+
+def test_incremental_sync_applies_changes(tmp_path):
+    """Only changes since the token are fetched; cancellations remove events."""
+    source = CountingSource(tmp_path / "calendar.json")
+    day = datetime(2025, 3, 3, tzinfo=TZ)
+    source.upsert("primary", _event("a", day.replace(hour=9), day.replace(hour=10)))
+    source.upsert("primary", _event("b", day.replace(hour=11), day.replace(hour=12)))
+
+    cache = CalendarCache(source, cache_dir=tmp_path / "cache", ttl=0)
+    assert [e["id"] for e in cache.events("primary", day, day + timedelta(days=1))] == ["a", "b"]
+
+    source.upsert("primary", {**_event("a", day, day), "status": "cancelled"})
+    source.upsert("primary", _event("c", day.replace(hour=8), day.replace(hour=9), summary="Wilson depo"))
+    assert [e["id"] for e in cache.events("primary", day, day + timedelta(days=1))] == ["c", "b"]
+    assert source.calls == [None, "2"]
+
+    # Persisted state resumes incrementally in a new process
+    fresh = CalendarCache(source, cache_dir=tmp_path / "cache", ttl=0)
+    assert fresh.get("primary", "c")["summary"] == "Wilson depo"
+    assert source.calls[-1] == "4"
+    assert [e["id"] for e in fresh.events("primary", day, day + timedelta(days=1), query="wilson")] == ["c"]
+
+
+def test_expired_token_triggers_full_resync(tmp_path):
+    """A token the source rejects is replaced by a full sync."""
+    source = CountingSource(tmp_path / "calendar.json")
+    day = datetime(2025, 3, 3, tzinfo=TZ)
+    source.upsert("primary", _event("a", day.replace(hour=9), day.replace(hour=10)))
+
+    cache = CalendarCache(source, cache_dir=tmp_path / "cache", ttl=0)
+    cache.sync("primary")
+    cache._calendars["primary"]["sync_token"] = "99"
+
+    assert cache.get("primary", "a") is not None
+    assert source.calls == [None, "99", None]
+
+
+def test_ttl_skips_repeated_syncs(tmp_path):
+    """Reads within the TTL don't go back to the source."""
+    source = CountingSource(tmp_path / "calendar.json")
+    cache = CalendarCache(source, cache_dir=tmp_path / "cache", ttl=60)
+    cache.sync("primary")
+    cache.sync("primary")
+    cache.get("primary", "missing")
+    assert len(source.calls) == 1
+
+
+def test_interval_tree_overlaps():
+    """Overlap queries match a brute-force scan."""
+    intervals = [(s, s + length) for s, length in [(0, 5), (3, 4), (10, 2), (11, 20), (40, 1), (41, 3)]]
+    tree = IntervalTree(intervals)
+    for start in range(0, 50):
+        for end in range(start + 1, start + 6):
+            expected = sorted(i for i in intervals if i[0] < end and i[1] > start)
+            assert sorted(tree.overlapping(start, end)) == expected
+    assert tree.check_slots([(5, 7), (7, 10)]) == [((5, 7), False), ((7, 10), True)]
+
+
+def test_free_slots_intersect_calendars(tmp_path):
+    """Busy time from every calendar is excluded from the free slots."""
+    source = FileCalendarSource(tmp_path / "calendar.json")
+    day = datetime(2025, 3, 3, tzinfo=TZ)  # Monday
+    source.upsert("primary", _event("a", day.replace(hour=9), day.replace(hour=10)))
+    source.upsert("other", _event("b", day.replace(hour=9, minute=30), day.replace(hour=11)))
+
+    cache = CalendarCache(source, cache_dir=tmp_path / "cache", ttl=0)
+    now = day.replace(hour=8)
+    busy = cache.busy_tree(["primary", "other"], now, now + timedelta(days=1))
+    assert list(busy) == merge_intervals([
+        (day.replace(hour=9), day.replace(hour=10)),
+        (day.replace(hour=9, minute=30), day.replace(hour=11)),
+    ])
+
+    slots = find_free_slots(busy, now, 1, timedelta(hours=1), 9, 13)
+    assert slots == [
+        (day.replace(hour=11), day.replace(hour=12)),
+        (day.replace(hour=12), day.replace(hour=13)),
+    ]
@@ -0,0 +1,86 @@
+"""
+Tests for case_cache.py - Case-scoped caches with write-through invalidation
+
+Tests verify:
+- LRU size bound and TTL expiry
+- Hit/miss counters
+- invalidate_case() clears registered caches and runs listeners
+"""
+
+import time
+
+from roscoe.core.case_cache import (
+    CaseCache,
+    get_case_cache,
+    invalidate_case,
+    on_case_invalidated,
+    remove_case_invalidated_listener,
+)
+
+
+def test_lru_bound_evicts_least_recently_used():
+    """Oldest untouched case is evicted once maxsize is exceeded."""
+    cache = CaseCache("test_lru", maxsize=2, ttl=60)
+    cache.set("Case-A", {"a": 1})
+    cache.set("Case-B", {"b": 1})
+    cache.get("Case-A")  # A is now most recently used
+    cache.set("Case-C", {"c": 1})
+
+    assert "Case-A" in cache
+    assert "Case-B" not in cache
+    assert "Case-C" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry_counts_as_miss():
+    """Entries older than the TTL are dropped on read."""
+    cache = CaseCache("test_ttl", maxsize=10, ttl=0.01)
+    cache.set("Case-A", {"a": 1})
+    time.sleep(0.02)
+
+    assert cache.get("Case-A") is None
+    stats = cache.stats()
+    assert stats["hits"] == 0
+    assert stats["misses"] == 1
+
+
+def test_invalidate_case_clears_registered_caches_and_listeners():
+    """invalidate_case(name) drops one case; invalidate_case() drops all."""
+    cache = get_case_cache("test_registry", maxsize=10, ttl=60)
+    cache.set("Case-A", {"a": 1})
+    cache.set("Case-B", {"b": 1})
+
+    seen = []
+    on_case_invalidated(seen.append)
+    try:
+        invalidate_case("Case-A")
+        assert cache.get("Case-A") is None
+        assert cache.get("Case-B") == {"b": 1}
+
+        invalidate_case()
+        assert len(cache) == 0
+        assert seen[-2:] == ["Case-A", None]
+    finally:
+        remove_case_invalidated_listener(seen.append)
+
+
+def test_fill_token_rejects_values_loaded_across_an_invalidation():
+    """A value read before a concurrent write is not cached after it."""
+    cache = CaseCache("test_token", maxsize=2, ttl=60)
+
+    token = cache.fill_token()
+    cache.invalidate("Case-A")  # Write lands while Case-A is being loaded
+    assert cache.set("Case-A", {"stale": True}, token=token) is False
+    assert cache.set("Case-B", {"b": 1}, token=token) is True
+    assert cache.get("Case-A") is None
+
+    token = cache.fill_token()
+    cache.invalidate()
+    assert cache.set("Case-B", {"stale": True}, token=token) is False
+
+    # Invalidations beyond maxsize are forgotten conservatively
+    token = cache.fill_token()
+    for name in ["Case-C", "Case-D", "Case-E"]:
+        cache.invalidate(name)
+    assert cache.set("Case-A", {"a": 1}, token=token) is False
+    assert cache.set("Case-A", {"a": 1}, token=cache.fill_token()) is True
@@ -0,0 +1,84 @@
+"""
+Tests for graph_writer.py - Batched, parameterized graph writes
+
+Tests verify:
+- Writes of the same shape share one UNWIND clause; values are parameters
+- Labels, relationship types and property keys are validated
+- Per-item results report node ids and missing relationship endpoints
+"""
+
+import pytest
+
+from roscoe.core.graph_writer import (
+    EntityWrite,
+    NodeRef,
+    RelationshipWrite,
+    _collect_results,
+    compile_write_batch,
+)
+
+
+def _claim(name):
+    return NodeRef("Entity", {"entity_type": "BIClaim", "name": name})
+
+
+def test_same_shape_writes_share_one_batch():
+    """Values never appear in the query text; one UNWIND per shape."""
+    case = NodeRef("Entity", {"entity_type": "Case", "name": "O'Brien-MVA-1-2-2025"})
+    query, params = compile_write_batch(
+        entities=[
+            EntityWrite(_claim("BIClaim-1"), {"claim_number": "1", "policy_limit": None}),
+            EntityWrite(_claim("BIClaim-2"), {"claim_number": "2"}),
+        ],
+        relationships=[
+            RelationshipWrite("HAS_CLAIM", case, _claim("BIClaim-1")),
+            RelationshipWrite("HAS_CLAIM", case, _claim("BIClaim-2")),
+        ],
+    )
+    assert query.count("UNWIND") == 2
+    assert "O'Brien" not in query and "BIClaim-1" not in query
+    assert [item["i"] for item in params["batch0"]] == [0, 1]
+    assert [item["i"] for item in params["batch1"]] == [2, 3]
+    assert params["batch0"][0]["props"] == {"claim_number": "1"}
+
+    # Same shapes with different values compile to the same query text
+    other, _ = compile_write_batch(
+        entities=[EntityWrite(_claim("BIClaim-9"), {"claim_number": "9"})],
+        relationships=[RelationshipWrite("HAS_CLAIM", case, _claim("BIClaim-9"))],
+    )
+    assert other == query
+
+
+def test_identifiers_are_validated():
+    """Anything interpolated into the query must be a plain identifier."""
+    with pytest.raises(ValueError):
+        compile_write_batch(entities=[EntityWrite(NodeRef("Entity) DETACH DELETE (x", {"name": "a"}))])
+    with pytest.raises(ValueError):
+        compile_write_batch(entities=[EntityWrite(_claim("a"), {"bad key": 1})])
+    with pytest.raises(ValueError):
+        compile_write_batch(relationships=[RelationshipWrite("HAS-CLAIM", _claim("a"), _claim("b"))])
+
+
+def test_per_item_results():
+    """Entities report node ids; relationships report created counts or missing endpoints."""
+    rows = [
+        {"i": 0, "id": 42},
+        {"i": 1, "s": True, "t": True},
+        {"i": 1, "s": True, "t": True},
+        {"i": 2, "s": True, "t": False},
+    ]
+    results = _collect_results(rows, entity_count=1, relationship_count=2)
+    assert results[0].ok and results[0].node_id == 42
+    assert results[1].ok and results[1].created == 2
+    assert not results[2].ok and results[2].error == "target not found"
+
+
+def test_validate_rejects_unwritable_items():
+    """Empty or null identities fail validation instead of compiling a null MERGE."""
+    with pytest.raises(ValueError):
+        EntityWrite(NodeRef("Bill", {})).validate()
+    with pytest.raises(ValueError):
+        EntityWrite(NodeRef("Entity", {"entity_type": "Bill", "name": None}), merge=True).validate()
+    with pytest.raises(ValueError):
+        RelationshipWrite("BILLED_BY", _claim("a"), NodeRef("Facility", {"name": None})).validate()
+    EntityWrite(_claim("a"), {"claim_number": None}).validate()
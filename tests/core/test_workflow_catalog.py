@@ -0,0 +1,100 @@
+"""
+Tests for workflow_catalog.py - In-memory workflow definition catalog
+
+Tests verify:
+- Lookups return the same record shapes as the Cypher queries they replace
+- ACHIEVED_BY / HAS_LANDMARK lookups by landmark_id or name
+- Returned records are copies (callers can't corrupt the catalog)
+"""
+
+from roscoe.core.workflow_catalog import WORKFLOW_GROUP_ID, WorkflowCatalog
+
+
+def _node(node_id, entity_type, **props):
+    return {
+        "id": node_id,
+        "labels": ["Entity"],
+        "props": {"entity_type": entity_type, "group_id": WORKFLOW_GROUP_ID, **props},
+    }
+
+
+def _catalog():
+    nodes = [
+        _node(1, "Phase", name="treatment", order=2, next_phase="demand"),
+        _node(2, "Phase", name="file_setup", order=1, next_phase="treatment"),
+        _node(3, "Landmark", name="Records Received", landmark_id="records_received",
+              phase="treatment", order=2, is_hard_blocker=True),
+        _node(4, "Landmark", name="Treatment Complete", landmark_id="treatment_complete",
+              phase="treatment", order=1),
+        _node(5, "Landmark", name="Bill Received", phase="treatment", parent_landmark="records_received"),
+        _node(6, "WorkflowDef", name="records_request", display_name="Records Request"),
+        _node(7, "WorkflowStep", name="Send request", step_id="send", order=1),
+        _node(8, "WorkflowChecklist", name="records_checklist", path="checklists/records.md"),
+        _node(9, "WorkflowSkill", name="records-skill", path="skills/records", quality_score=0.9),
+    ]
+    edges = [
+        (1, "HAS_LANDMARK", 3), (1, "HAS_LANDMARK", 4), (1, "HAS_LANDMARK", 5),
+        (3, "HAS_SUB_LANDMARK", 5), (3, "ACHIEVED_BY", 6), (1, "HAS_WORKFLOW", 6),
+        (6, "HAS_STEP", 7), (7, "USES_CHECKLIST", 8), (9, "APPLIES_TO_PHASE", 1),
+    ]
+    edge_rows = [{"src": a, "rel": rel, "dst": b} for a, rel, b in edges]
+    return WorkflowCatalog.build("v1", nodes, edge_rows)
+
+
+def test_phase_lookups():
+    """Phases come back in order with their workflows and top-level landmarks."""
+    catalog = _catalog()
+    assert [p["name"] for p in catalog.all_phases()] == ["file_setup", "treatment"]
+    assert catalog.phase("treatment")["next_phase"] == "demand"
+    assert catalog.phase("missing") is None
+    assert [w["name"] for w in catalog.phase_workflows("treatment")] == ["records_request"]
+
+    landmarks = catalog.phase_landmarks("treatment")
+    assert [l["landmark_id"] for l in landmarks] == ["treatment_complete", "records_received"]
+    assert landmarks[1]["sub_landmarks"] == ["Bill Received"]
+    assert catalog.phase_landmark_keys("treatment") == {
+        "records_received", "treatment_complete", "Bill Received",
+    }
+    assert [s["name"] for s in catalog.applicable_skills("treatment")] == ["records-skill"]
+
+
+def test_landmark_and_workflow_lookups():
+    """ACHIEVED_BY matches by landmark_id or name; steps carry their resources."""
+    catalog = _catalog()
+    expected = [{"workflow_name": "records_request", "display_name": "Records Request", "description": None}]
+    assert catalog.achieved_by("records_received") == expected
+    assert catalog.achieved_by("Records Received") == expected
+    assert catalog.landmark_phase("records_received") == "treatment"
+
+    assert catalog.workflow("records_request")["display_name"] == "Records Request"
+    assert [s["step_id"] for s in catalog.workflow_steps("records_request")] == ["send"]
+    resources = catalog.step_resources("records_request", "send")
+    assert resources["checklists"] == [{"name": "records_checklist", "path": "checklists/records.md"}]
+    assert resources["skills"] == []
+
+
+def test_records_are_copies():
+    """Mutating a returned record leaves the catalog untouched."""
+    catalog = _catalog()
+    catalog.phase("treatment")["next_phase"] = "changed"
+    assert catalog.phase("treatment")["next_phase"] == "demand"
+
+
+def test_blocking_landmarks_include_ungrouped_hard_blockers():
+    """A hard blocker linked by HAS_LANDMARK gates the phase even without the definitions group_id."""
+    nodes = [
+        _node(1, "Phase", name="treatment"),
+        _node(2, "Landmark", name="Records Received", landmark_id="records_received", is_hard_blocker=True),
+        {"id": 3, "labels": ["Entity"],
+         "props": {"entity_type": "Landmark", "name": "Client Signed", "is_hard_blocker": True}},
+        _node(4, "Landmark", name="Treatment Complete", landmark_id="treatment_complete"),
+    ]
+    edge_rows = [{"src": 1, "rel": "HAS_LANDMARK", "dst": dst} for dst in (2, 3, 4)]
+    catalog = WorkflowCatalog.build("v1", nodes, edge_rows)
+
+    assert [l["landmark_id"] for l in catalog.landmark_definitions()] == ["records_received", "treatment_complete"]
+    blocking = catalog.blocking_landmarks("treatment", {"records_received": "complete"})
+    assert blocking == [
+        {"landmark_id": "Client Signed", "display_name": "Client Signed", "current_status": "not_started"},
+    ]
+    assert catalog.blocking_landmarks("treatment", {"records_received": "complete", "Client Signed": "complete"}) == []